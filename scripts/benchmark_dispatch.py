@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+"""
+Load benchmark for the per-service worker-pool dispatcher.
+
+Starts a local stub Atlassian server that answers every request after a fixed
+delay, then drives N concurrent "sessions" through a pooled JiraFetcher in two
+modes:
+
+1. inline: the blocking call runs directly in the tool coroutine (old behaviour)
+2. dispatched: the call is handed to a ServiceDispatcher worker pool
+
+For each mode it reports end-to-end call latency (p50/p99) and the event-loop
+lag measured by a heartbeat task, which shows how long other sessions were
+stalled.
+
+Usage:
+    python scripts/benchmark_dispatch.py --sessions 50 --calls 4 --delay-ms 50
+"""
+
+import argparse
+import http.server
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+
+import anyio
+
+# Add the parent directory to the path so we can import the package
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.mcp_atlassian.jira import JiraConfig, JiraFetcher
+from src.mcp_atlassian.servers.dispatch import ServiceDispatcher
+
+
+class StubAtlassianHandler(http.server.BaseHTTPRequestHandler):
+    """Answers every GET with a minimal Jira issue after a fixed delay."""
+
+    delay = 0.05
+
+    def do_GET(self) -> None:  # noqa: N802
+        time.sleep(self.delay)
+        key = self.path.rstrip("/").split("/")[-1].split("?")[0]
+        body = json.dumps({"id": "10000", "key": key, "fields": {}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: str) -> None:
+        return
+
+
+def start_stub_server(delay: float) -> http.server.ThreadingHTTPServer:
+    """Start the stub server on a free local port."""
+    StubAtlassianHandler.delay = delay
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StubAtlassianHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the pct-th percentile of values (nearest rank)."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def run_mode(
+    fetcher: JiraFetcher,
+    dispatcher: ServiceDispatcher | None,
+    sessions: int,
+    calls: int,
+) -> dict[str, float]:
+    """Drive concurrent sessions and collect latency and loop-lag samples."""
+    latencies: list[float] = []
+    lags: list[float] = []
+    done = anyio.Event()
+
+    async def heartbeat() -> None:
+        interval = 0.005
+        while not done.is_set():
+            started = time.perf_counter()
+            await anyio.sleep(interval)
+            lags.append(time.perf_counter() - started - interval)
+
+    async def session(index: int) -> None:
+        # Every session issues its first call when the run starts, so time spent
+        # waiting for a blocked event loop counts towards the call latency
+        issued = started
+        for call in range(calls):
+            key = f"BENCH-{index * calls + call}"
+            if dispatcher is None:
+                fetcher.jira.issue(key)
+            else:
+                await dispatcher.run(fetcher.jira.issue, key)
+            completed = time.perf_counter()
+            latencies.append(completed - issued)
+            issued = completed
+
+    started = time.perf_counter()
+    async with anyio.create_task_group() as outer:
+        outer.start_soon(heartbeat)
+        async with anyio.create_task_group() as tg:
+            for index in range(sessions):
+                tg.start_soon(session, index)
+        done.set()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "loop_lag_p99_ms": percentile(lags or [0.0], 99) * 1000,
+        "throughput_rps": len(latencies) / elapsed,
+    }
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--calls", type=int, default=4, help="Calls per session")
+    parser.add_argument("--delay-ms", type=float, default=50.0)
+    parser.add_argument("--workers", type=int, default=10)
+    args = parser.parse_args()
+
+    server = start_stub_server(args.delay_ms / 1000)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    # The stub server accepts any token
+    fetcher = JiraFetcher(
+        config=JiraConfig(url=url, auth_type="pat", personal_token="bench-token")  # noqa: S106
+    )
+    dispatcher = ServiceDispatcher(
+        "jira", max_workers=args.workers, max_queue=args.sessions * args.calls
+    )
+
+    print(
+        f"{args.sessions} sessions x {args.calls} calls, "
+        f"{args.delay_ms:.0f} ms upstream delay, {args.workers} workers"
+    )
+    for name, mode_dispatcher in (("inline", None), ("dispatched", dispatcher)):
+        stats = anyio.run(run_mode, fetcher, mode_dispatcher, args.sessions, args.calls)
+        print(
+            f"{name:>10}: p50 {stats['p50_ms']:8.1f} ms  "
+            f"p99 {stats['p99_ms']:8.1f} ms  "
+            f"loop lag p99 {stats['loop_lag_p99_ms']:8.1f} ms  "
+            f"{stats['throughput_rps']:7.1f} req/s"
+        )
+
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
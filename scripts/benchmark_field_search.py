@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+"""
+Benchmark for fuzzy Jira field search.
+
+Generates a synthetic field catalog (system fields plus thousands of custom
+fields with realistic names and clause names) and compares two
+implementations of ``search_fields``:
+
+1. full-scan: fuzzy-score every field, then sort the whole list (old behaviour)
+2. indexed: trigram-pruned shortlist scored with a top-k heap (FieldSearchIndex)
+
+For each it reports the mean and p99 query time. It also reports the one-off
+index build time and how often the indexed top-k scores match the full scan.
+
+Usage:
+    python scripts/benchmark_field_search.py --fields 10000 --queries 200
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+
+from thefuzz import fuzz
+
+# Add the parent directory to the path so we can import the package
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.mcp_atlassian.jira.field_registry import FieldSearchIndex
+
+WORDS = (
+    "story points epic link sprint team component release target start due "
+    "customer region severity impact root cause environment browser version "
+    "approval budget cost center owner reviewer risk score rank flagged "
+    "acceptance criteria business value department vendor contract sla"
+).split()
+
+
+def make_catalog(size: int, seed: int) -> list[dict]:
+    """Build a synthetic field catalog with ``size`` custom fields."""
+    rng = random.Random(seed)  # noqa: S311 - reproducible test data
+    fields = [
+        {"id": name, "key": name, "name": name.title(), "clauseNames": [name]}
+        for name in ("summary", "description", "status", "assignee", "labels")
+    ]
+    for i in range(size):
+        field_id = f"customfield_{10000 + i}"
+        name = " ".join(rng.sample(WORDS, rng.randint(1, 3))).title()
+        fields.append(
+            {
+                "id": field_id,
+                "key": field_id,
+                "name": f"{name} {i}" if rng.random() < 0.5 else name,
+                "clauseNames": [f"cf[{10000 + i}]", name],
+            }
+        )
+    return fields
+
+
+def similarity(keyword: str, field: dict) -> int:
+    """The previous scoring: best partial ratio over the field's names."""
+    name_candidates = [
+        field.get("id", ""),
+        field.get("key", ""),
+        field.get("name", ""),
+        *field.get("clauseNames", []),
+    ]
+    return max(
+        fuzz.partial_ratio(keyword.lower(), name.lower()) for name in name_candidates
+    )
+
+
+def full_scan_search(fields: list[dict], keyword: str, limit: int) -> list[dict]:
+    """The previous implementation: score every field and sort."""
+    return sorted(fields, key=lambda f: similarity(keyword, f), reverse=True)[:limit]
+
+
+def make_queries(count: int, seed: int) -> list[str]:
+    """Build keywords: whole words, word pairs, prefixes and typos."""
+    rng = random.Random(seed)  # noqa: S311 - reproducible test data
+    queries = []
+    for _ in range(count):
+        word = rng.choice(WORDS)
+        kind = rng.randrange(4)
+        if kind == 0:
+            queries.append(word)
+        elif kind == 1:
+            queries.append(f"{word} {rng.choice(WORDS)}")
+        elif kind == 2:
+            queries.append(word[: max(3, len(word) - 2)])
+        else:
+            pos = rng.randrange(len(word))
+            queries.append(word[:pos] + "x" + word[pos + 1 :])
+    return queries
+
+
+def time_queries(
+    search: Callable[[str], list[dict]], queries: list[str]
+) -> list[float]:
+    """Run every query and return per-query latencies in milliseconds."""
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        search(query)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label: str, timings: list[float]) -> None:
+    """Print mean and p99 latency."""
+    p99 = statistics.quantiles(timings, n=100)[98] if len(timings) > 1 else timings[0]
+    print(f"{label:<10} mean {statistics.mean(timings):8.2f} ms   p99 {p99:8.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--fields", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    fields = make_catalog(args.fields, args.seed)
+    queries = make_queries(args.queries, args.seed)
+    print(f"Catalog: {len(fields)} fields, {len(queries)} queries, limit {args.limit}")
+
+    start = time.perf_counter()
+    index = FieldSearchIndex(fields)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"Index build: {build_ms:.1f} ms (once per field snapshot)")
+
+    full = time_queries(lambda q: full_scan_search(fields, q, args.limit), queries)
+    indexed = time_queries(lambda q: index.search(q, args.limit), queries)
+    report("full-scan", full)
+    report("indexed", indexed)
+    print(f"Speedup: {statistics.mean(full) / statistics.mean(indexed):.1f}x")
+
+    # Compare result quality. Many fields tie on score, so compare the score
+    # of each rank rather than field ids.
+    same_scores = 0
+    for query in queries:
+        expected = full_scan_search(fields, query, args.limit)
+        actual = index.search(query, args.limit)
+        same_scores += [similarity(query, f) for f in expected] == [
+            similarity(query, f) for f in actual
+        ]
+    identical = same_scores / len(queries)
+    print(f"Queries with identical top-{args.limit} scores: {identical:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+"""
+Benchmark for Confluence storage-format to Markdown conversion.
+
+Generates large synthetic storage-format pages (wide tables, user mentions,
+code macros, lists and links) and compares three ways of running
+``process_html_content``:
+
+1. reparse: html.parser, then ``markdownify`` on ``str(soup)``, which parses
+   the HTML a second time (old behaviour)
+2. html.parser: html.parser, with ``markdownify`` run on the parsed tree
+3. lxml: the lxml parser, with ``markdownify`` run on the parsed tree
+
+For each it reports the mean and p99 CPU time per page and the peak memory
+allocated while converting one page. It also reports how many pages produce
+exactly the same Markdown as the old behaviour.
+
+Usage:
+    python scripts/benchmark_html_parser.py --pages 5 --size-kb 500
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from bs4 import BeautifulSoup
+from markdownify import markdownify as md
+
+# Add the parent directory to the path so we can import the package
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.mcp_atlassian.preprocessing.base import is_lxml_available
+from src.mcp_atlassian.preprocessing.confluence import ConfluencePreprocessor
+
+WORDS = (
+    "deployment pipeline owner status blocked review migration database "
+    "customer incident timeline action item follow up release notes"
+).split()
+
+
+class DirectoryClient:
+    """Confluence client stub answering user lookups from memory."""
+
+    def get_user_details_by_accountid(self, account_id: str) -> dict:
+        return {"displayName": f"User {account_id}"}
+
+    def get_user_details_by_username(self, username: str) -> dict:
+        return {"displayName": f"User {username}"}
+
+
+def text(rng: random.Random, count: int) -> str:
+    """Build a run of words with occasional inline markup and entities."""
+    words = [rng.choice(WORDS) for _ in range(count)]
+    words[0] = f"<strong>{words[0]}</strong>"
+    if count > 3:
+        words[2] = f'<a href="https://example.com/{words[2]}">{words[2]}</a>'
+    return " ".join(words) + " &amp; more&nbsp;text"
+
+
+def mention(rng: random.Random) -> str:
+    """Build a user mention."""
+    return f'<ac:link><ri:user ri:account-id="acc-{rng.randrange(50)}" /></ac:link>'
+
+
+def make_page(size: int, rng: random.Random) -> str:
+    """Build a storage-format page of about ``size`` characters."""
+    parts = ["<h1>Incident review</h1>"]
+    length = 0
+    while length < size:
+        kind = rng.randrange(4)
+        if kind == 0:
+            rows = "".join(
+                f"<tr><td><p>{text(rng, 4)}</p></td><td>{mention(rng)}</td>"
+                f"<td><p>{text(rng, 8)}</p></td></tr>"
+                for _ in range(rng.randint(20, 80))
+            )
+            block = (
+                "<table><tbody><tr><th>Item</th><th>Owner</th><th>Notes</th></tr>"
+                f"{rows}</tbody></table>"
+            )
+        elif kind == 1:
+            block = (
+                '<ac:structured-macro ac:name="code"><ac:parameter ac:name="language">'
+                "python</ac:parameter><ac:plain-text-body><![CDATA["
+                "if a < b and c > d:\n    run(a_b)\n"
+                "]]></ac:plain-text-body></ac:structured-macro>"
+            )
+        elif kind == 2:
+            items = "".join(
+                f"<li>{text(rng, 6)} {mention(rng)}</li>"
+                for _ in range(rng.randint(3, 10))
+            )
+            block = f"<ul>{items}</ul>"
+        else:
+            block = f"<p>{text(rng, 40)}</p>"
+        parts.append(block)
+        length += len(block)
+    return "".join(parts)
+
+
+def reparse_convert(preprocessor: ConfluencePreprocessor, html: str) -> str:
+    """The previous conversion: serialize the tree and let markdownify reparse it."""
+    client = DirectoryClient()
+    soup = BeautifulSoup(html, "html.parser")
+    names = preprocessor._resolve_user_display_names(soup, client)
+    preprocessor._process_user_mentions_in_soup(soup, client, names)
+    preprocessor._process_user_profile_macros_in_soup(soup, client, names)
+    return md(str(soup))
+
+
+def measure(
+    convert: Callable[[str], str], pages: list[str]
+) -> tuple[list[float], float, list[str]]:
+    """Convert every page, returning CPU times (ms), peak memory (MB) and output."""
+    timings = []
+    outputs = []
+    for page in pages:
+        start = time.process_time()
+        outputs.append(convert(page))
+        timings.append((time.process_time() - start) * 1000)
+
+    tracemalloc.start()
+    convert(pages[0])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return timings, peak / (1024 * 1024), outputs
+
+
+def report(label: str, timings: list[float], peak_mb: float) -> None:
+    """Print mean and p99 CPU time and peak memory."""
+    p99 = statistics.quantiles(timings, n=100)[98] if len(timings) > 1 else timings[0]
+    print(
+        f"{label:<12} mean {statistics.mean(timings):8.1f} ms   "
+        f"p99 {p99:8.1f} ms   peak {peak_mb:7.1f} MB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--size-kb", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    # Measure conversion only, never serve a page from the conversion cache
+    os.environ["CONVERSION_CACHE_TTL"] = "0"
+    rng = random.Random(args.seed)  # noqa: S311 - reproducible test data
+    pages = [make_page(args.size_kb * 1024, rng) for _ in range(args.pages)]
+    print(f"Corpus: {len(pages)} pages of ~{args.size_kb} KB")
+
+    client = DirectoryClient()
+    backends = ["html.parser"] + (["lxml"] if is_lxml_available() else [])
+    baseline_preprocessor = ConfluencePreprocessor(base_url="https://example.com")
+    baseline, peak, expected = measure(
+        lambda page: reparse_convert(baseline_preprocessor, page), pages
+    )
+    report("reparse", baseline, peak)
+
+    for backend in backends:
+        preprocessor = ConfluencePreprocessor(
+            base_url="https://example.com", html_parser=backend
+        )
+        timings, peak, outputs = measure(
+            lambda page, p=preprocessor: p.process_html_content(
+                page, confluence_client=client
+            )[1],
+            pages,
+        )
+        report(backend, timings, peak)
+        identical = sum(a == b for a, b in zip(outputs, expected, strict=True))
+        speedup = statistics.mean(baseline) / statistics.mean(timings)
+        print(
+            f"{'':<12} speedup {speedup:.1f}x"
+            f"   identical Markdown {identical}/{len(pages)} pages"
+        )
+    if not is_lxml_available():
+        print("lxml is not installed; install it to benchmark the lxml backend")
+
+
+if __name__ == "__main__":
+    main()
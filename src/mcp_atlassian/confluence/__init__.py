@@ -3,6 +3,7 @@
 This module provides access to Confluence content through the Model Context Protocol.
 """
 
+from .async_api import AsyncApiMixin
 from .client import ConfluenceClient
 from .comments import CommentsMixin
 from .config import ConfluenceConfig
@@ -14,7 +15,13 @@ from .users import UsersMixin
 
 
 class ConfluenceFetcher(
-    SearchMixin, SpacesMixin, PagesMixin, CommentsMixin, LabelsMixin, UsersMixin
+    AsyncApiMixin,
+    SearchMixin,
+    SpacesMixin,
+    PagesMixin,
+    CommentsMixin,
+    LabelsMixin,
+    UsersMixin,
 ):
     """Main entry point for Confluence operations, providing backward compatibility.
 
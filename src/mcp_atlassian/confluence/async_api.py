@@ -0,0 +1,187 @@
+"""Module for native async Confluence read operations."""
+
+import logging
+from functools import partial
+
+import anyio.to_thread
+import requests
+from requests.exceptions import HTTPError
+
+from ..exceptions import MCPAtlassianAuthenticationError
+from ..models.confluence import ConfluenceComment, ConfluencePage
+from ..utils.async_http import AsyncTransport, gather
+from .comments import CommentsMixin
+from .pages import PagesMixin
+from .search import SearchMixin
+
+logger = logging.getLogger("mcp-atlassian")
+
+
+class AsyncApiMixin(SearchMixin, PagesMixin, CommentsMixin):
+    """Mixin providing async variants of the hot Confluence read operations.
+
+    Each ``<name>_async`` method mirrors the synchronous ``<name>`` method and
+    returns the same result, but performs its HTTP requests on the shared
+    async transport. HTML processing can resolve user mentions through the
+    synchronous client, so it runs in a worker thread.
+    """
+
+    _async_transport: AsyncTransport | None = None
+
+    @property
+    def async_transport(self) -> AsyncTransport:
+        """Get the async transport bound to this client's URL and session."""
+        if self._async_transport is None:
+            self._async_transport = AsyncTransport(
+                base_url=self.confluence.url,
+                session=self.confluence._session,
+                service_name="Confluence API",
+            )
+        return self._async_transport
+
+    async def search_async(
+        self, cql: str, limit: int = 10, spaces_filter: str | None = None
+    ) -> list[ConfluencePage]:
+        """
+        Search content using CQL on the async transport.
+
+        Args:
+            cql: Confluence Query Language string
+            limit: Maximum number of results to return
+            spaces_filter: Optional comma-separated list of space keys to filter by,
+                overrides config
+
+        Returns:
+            List of ConfluencePage models containing search results
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the
+                Confluence API (401/403)
+        """
+        try:
+            cql = self._apply_spaces_filter(cql, spaces_filter)
+            results = await self.async_transport.get_json(
+                "rest/api/search", params={"start": 0, "limit": limit, "cql": cql}
+            )
+            return await anyio.to_thread.run_sync(
+                self._build_search_results, results, cql
+            )
+        except MCPAtlassianAuthenticationError:
+            raise
+        except HTTPError as http_err:
+            logger.error(f"HTTP error during search: {http_err}", exc_info=False)
+            raise
+        except requests.RequestException as e:
+            logger.error(f"Network error during search: {str(e)}")
+            return []
+        except (KeyError, ValueError, TypeError) as e:
+            logger.error(f"Error processing search results: {str(e)}")
+            return []
+        except Exception as e:  # noqa: BLE001 - Intentional fallback with logging
+            logger.error(f"Unexpected error during search: {str(e)}")
+            logger.debug("Full exception details for search:", exc_info=True)
+            return []
+
+    async def get_page_content_async(
+        self, page_id: str, *, convert_to_markdown: bool = True
+    ) -> ConfluencePage:
+        """
+        Get content of a specific page on the async transport.
+
+        Pages read through the v2 API (OAuth on Cloud) fall back to the
+        synchronous implementation in a worker thread.
+
+        Args:
+            page_id: The ID of the page to retrieve
+            convert_to_markdown: When True, returns content in markdown format,
+                               otherwise returns raw HTML (keyword-only)
+
+        Returns:
+            ConfluencePage model containing the page content and metadata
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Confluence API (401/403)
+            Exception: If there is an error retrieving the page
+        """
+        if self._v2_adapter:
+            return await anyio.to_thread.run_sync(
+                partial(
+                    self.get_page_content,
+                    page_id,
+                    convert_to_markdown=convert_to_markdown,
+                )
+            )
+        try:
+            page = await self.async_transport.get_json(
+                f"rest/api/content/{page_id}",
+                params={"expand": "body.storage,version,space,children.attachment"},
+            )
+            return await anyio.to_thread.run_sync(
+                self._build_page_content, page, convert_to_markdown
+            )
+        except MCPAtlassianAuthenticationError:
+            raise
+        except HTTPError as http_err:
+            logger.error(f"HTTP error during API call: {http_err}", exc_info=False)
+            raise
+        except Exception as e:
+            logger.error(
+                f"Error retrieving page content for page ID {page_id}: {str(e)}"
+            )
+            raise Exception(f"Error retrieving page content: {str(e)}") from e
+
+    async def get_page_comments_async(
+        self, page_id: str, *, return_markdown: bool = True
+    ) -> list[ConfluenceComment]:
+        """
+        Get all comments for a specific page on the async transport.
+
+        The page (for its space key) and its comments are fetched concurrently.
+
+        Args:
+            page_id: The ID of the page to get comments from
+            return_markdown: When True, returns content in markdown format,
+                           otherwise returns raw HTML (keyword-only)
+
+        Returns:
+            List of ConfluenceComment models containing comment content and metadata
+        """
+        try:
+            page, comments_response = await gather(
+                partial(
+                    self.async_transport.get_json,
+                    f"rest/api/content/{page_id}",
+                    params={"expand": "space"},
+                ),
+                partial(
+                    self.async_transport.get_json,
+                    f"rest/api/content/{page_id}/child/comment",
+                    params={
+                        "id": page_id,
+                        "start": 0,
+                        "limit": 25,
+                        "expand": "body.view.value,version",
+                        "depth": "all",
+                    },
+                ),
+            )
+            space_key = page.get("space", {}).get("key", "")
+            return await anyio.to_thread.run_sync(
+                self._build_comment_models,
+                comments_response,
+                space_key,
+                return_markdown,
+            )
+        except KeyError as e:
+            logger.error(f"Missing key in comment data: {str(e)}")
+            return []
+        except requests.RequestException as e:
+            logger.error(f"Network error when fetching comments: {str(e)}")
+            return []
+        except (ValueError, TypeError) as e:
+            logger.error(f"Error processing comment data: {str(e)}")
+            return []
+        except Exception as e:  # noqa: BLE001 - Intentional fallback with full logging
+            logger.error(f"Unexpected error fetching comments: {str(e)}")
+            logger.debug("Full exception details for comments:", exc_info=True)
+            return []
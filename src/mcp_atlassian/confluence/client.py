@@ -2,12 +2,14 @@
 
 import logging
 import os
+from collections.abc import Callable
 
 from atlassian import Confluence
 from requests import Session
 
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..utils.logging import get_masked_session_headers, log_config_param, mask_sensitive
+from ..utils.metadata_cache import metadata_scope
 from ..utils.oauth import configure_oauth_session
 from ..utils.ssl import configure_ssl_verification
 from .config import ConfluenceConfig
@@ -121,7 +123,9 @@ class ConfluenceClient:
         # Import here to avoid circular imports
         from ..preprocessing.confluence import ConfluencePreprocessor
 
-        self.preprocessor = ConfluencePreprocessor(base_url=self.config.url)
+        self.preprocessor = ConfluencePreprocessor(
+            base_url=self.config.url, cache_scope=metadata_scope(self.config)
+        )
 
         # Test authentication during initialization (in debug mode only)
         if logger.isEnabledFor(logging.DEBUG):
@@ -187,3 +191,51 @@ class ConfluenceClient:
         return self.preprocessor.process_html_content(
             html_content, space_key, self.confluence
         )
+
+    def _deferred_html_content(
+        self,
+        html_content: str,
+        space_key: str,
+        *,
+        convert_to_markdown: bool = True,
+        cache_key: str | None = None,
+    ) -> Callable[[], str]:
+        """Return a loader processing HTML content when it is first needed.
+
+        Args:
+            html_content: Raw HTML content from Confluence
+            space_key: The key of the space containing the content
+            convert_to_markdown: Whether the loader returns markdown or processed HTML
+            cache_key: Optional conversion cache key identifying the content version
+
+        Returns:
+            Callable returning the processed content
+        """
+
+        def load() -> str:
+            processed_html, processed_markdown = self.preprocessor.process_html_content(
+                html_content,
+                space_key=space_key,
+                confluence_client=self.confluence,
+                cache_key=cache_key,
+            )
+            return processed_markdown if convert_to_markdown else processed_html
+
+        return load
+
+    def _content_cache_key(self, content: dict, representation: str) -> str | None:
+        """Identify one version of a content body for the conversion cache.
+
+        Args:
+            content: Raw page or comment data including ``version``
+            representation: The body representation, e.g. "storage" or "view"
+
+        Returns:
+            "<id>:<version>:<representation>", or None if the content has no
+            ID or version number
+        """
+        content_id = content.get("id")
+        version = (content.get("version") or {}).get("number")
+        if not content_id or version is None:
+            return None
+        return f"{content_id}:{version}:{representation}"
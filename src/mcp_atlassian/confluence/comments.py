@@ -37,40 +37,9 @@ class CommentsMixin(ConfluenceClient):
                 content_id=page_id, expand="body.view.value,version", depth="all"
             )
 
-            # Process each comment
-            comment_models = []
-            for comment_data in comments_response.get("results", []):
-                # Get the content based on format
-                body = comment_data["body"]["view"]["value"]
-                processed_html, processed_markdown = (
-                    self.preprocessor.process_html_content(
-                        body, space_key=space_key, confluence_client=self.confluence
-                    )
-                )
-
-                # Create a copy of the comment data to modify
-                modified_comment_data = comment_data.copy()
-
-                # Modify the body value based on the return format
-                if "body" not in modified_comment_data:
-                    modified_comment_data["body"] = {}
-                if "view" not in modified_comment_data["body"]:
-                    modified_comment_data["body"]["view"] = {}
-
-                # Set the appropriate content based on return format
-                modified_comment_data["body"]["view"]["value"] = (
-                    processed_markdown if return_markdown else processed_html
-                )
-
-                # Create the model with the processed content
-                comment_model = ConfluenceComment.from_api_response(
-                    modified_comment_data,
-                    base_url=self.config.url,
-                )
-
-                comment_models.append(comment_model)
-
-            return comment_models
+            return self._build_comment_models(
+                comments_response, space_key, return_markdown
+            )
 
         except KeyError as e:
             logger.error(f"Missing key in comment data: {str(e)}")
@@ -86,6 +55,57 @@ class CommentsMixin(ConfluenceClient):
             logger.debug("Full exception details for comments:", exc_info=True)
             return []
 
+    def _build_comment_models(
+        self, comments_response: dict, space_key: str, return_markdown: bool
+    ) -> list[ConfluenceComment]:
+        """
+        Process a raw page comments response into comment models.
+
+        Args:
+            comments_response: The raw response from the page comments endpoint
+            space_key: Key of the space the page belongs to
+            return_markdown: When True, comment bodies are converted to markdown,
+                otherwise the processed HTML is kept
+
+        Returns:
+            List of ConfluenceComment models containing comment content and metadata
+        """
+        # Process each comment
+        comment_models = []
+        for comment_data in comments_response.get("results", []):
+            # Get the content based on format
+            body = comment_data["body"]["view"]["value"]
+            processed_html, processed_markdown = self.preprocessor.process_html_content(
+                body,
+                space_key=space_key,
+                confluence_client=self.confluence,
+                cache_key=self._content_cache_key(comment_data, "view"),
+            )
+
+            # Create a copy of the comment data to modify
+            modified_comment_data = comment_data.copy()
+
+            # Modify the body value based on the return format
+            if "body" not in modified_comment_data:
+                modified_comment_data["body"] = {}
+            if "view" not in modified_comment_data["body"]:
+                modified_comment_data["body"]["view"] = {}
+
+            # Set the appropriate content based on return format
+            modified_comment_data["body"]["view"]["value"] = (
+                processed_markdown if return_markdown else processed_html
+            )
+
+            # Create the model with the processed content
+            comment_model = ConfluenceComment.from_api_response(
+                modified_comment_data,
+                base_url=self.config.url,
+            )
+
+            comment_models.append(comment_model)
+
+        return comment_models
+
     def add_comment(self, page_id: str, content: str) -> ConfluenceComment | None:
         """
         Add a comment to a Confluence page.
@@ -5,7 +5,7 @@ import os
 from dataclasses import dataclass
 from typing import Literal
 
-from ..utils.env import get_custom_headers, is_env_ssl_verify
+from ..utils.env import get_custom_headers, is_env_ssl_verify, is_env_truthy
 from ..utils.oauth import (
     BYOAccessTokenOAuthConfig,
     OAuthConfig,
@@ -36,6 +36,7 @@ class ConfluenceConfig:
     no_proxy: str | None = None  # Comma-separated list of hosts to bypass proxy
     socks_proxy: str | None = None  # SOCKS proxy URL (optional)
     custom_headers: dict[str, str] | None = None  # Custom HTTP headers
+    async_transport: bool = False  # Serve hot read calls on the async transport
 
     @property
     def is_cloud(self) -> bool:
@@ -127,6 +128,9 @@ class ConfluenceConfig:
         # Custom headers - service-specific only
         custom_headers = get_custom_headers("CONFLUENCE_CUSTOM_HEADERS")
 
+        # Opt-in native async transport for hot read calls
+        async_transport = is_env_truthy("CONFLUENCE_ASYNC_TRANSPORT")
+
         return cls(
             url=url,
             auth_type=auth_type,
@@ -141,6 +145,7 @@ class ConfluenceConfig:
             no_proxy=no_proxy,
             socks_proxy=socks_proxy,
             custom_headers=custom_headers,
+            async_transport=async_transport,
         )
 
     def is_auth_configured(self) -> bool:
@@ -7,6 +7,7 @@ from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..models.confluence import ConfluencePage
+from ..utils.metadata_cache import get_metadata_cache, metadata_scope
 from .client import ConfluenceClient
 from .v2_adapter import ConfluenceV2Adapter
 
@@ -16,17 +17,28 @@ logger = logging.getLogger("mcp-atlassian")
 class PagesMixin(ConfluenceClient):
     """Mixin for Confluence page operations."""
 
+    _v2_adapter_instance: ConfluenceV2Adapter | None = None
+
     @property
     def _v2_adapter(self) -> ConfluenceV2Adapter | None:
         """Get v2 API adapter for OAuth authentication.
 
+        The adapter is created once per client, so the space keys and page
+        versions it learns are reused across operations.
+
         Returns:
             ConfluenceV2Adapter instance if OAuth is configured, None otherwise
         """
         if self.config.auth_type == "oauth" and self.config.is_cloud:
-            return ConfluenceV2Adapter(
-                session=self.confluence._session, base_url=self.confluence.url
-            )
+            if self._v2_adapter_instance is None:
+                self._v2_adapter_instance = ConfluenceV2Adapter(
+                    session=self.confluence._session,
+                    base_url=self.confluence.url,
+                    metadata_scope=(
+                        metadata_scope(self.config) if get_metadata_cache() else None
+                    ),
+                )
+            return self._v2_adapter_instance
         return None
 
     def get_page_content(
@@ -67,25 +79,7 @@ class PagesMixin(ConfluenceClient):
                     expand="body.storage,version,space,children.attachment",
                 )
 
-            space_key = page.get("space", {}).get("key", "")
-            content = page["body"]["storage"]["value"]
-            processed_html, processed_markdown = self.preprocessor.process_html_content(
-                content, space_key=space_key, confluence_client=self.confluence
-            )
-
-            # Use the appropriate content format based on the convert_to_markdown flag
-            page_content = processed_markdown if convert_to_markdown else processed_html
-
-            # Create and return the ConfluencePage model
-            return ConfluencePage.from_api_response(
-                page,
-                base_url=self.config.url,
-                include_body=True,
-                # Override content with our processed version
-                content_override=page_content,
-                content_format="storage" if not convert_to_markdown else "markdown",
-                is_cloud=self.config.is_cloud,
-            )
+            return self._build_page_content(page, convert_to_markdown)
         except HTTPError as http_err:
             if http_err.response is not None and http_err.response.status_code in [
                 401,
@@ -106,6 +100,43 @@ class PagesMixin(ConfluenceClient):
             )
             raise Exception(f"Error retrieving page content: {str(e)}") from e
 
+    def _build_page_content(
+        self, page: dict, convert_to_markdown: bool
+    ) -> ConfluencePage:
+        """
+        Process a raw page response (with ``body.storage``) into a model.
+
+        Args:
+            page: The raw page data
+            convert_to_markdown: When True, the content is converted to markdown,
+                otherwise the processed HTML is kept
+
+        Returns:
+            ConfluencePage model containing the page content and metadata
+        """
+        space_key = page.get("space", {}).get("key", "")
+        content = page["body"]["storage"]["value"]
+        processed_html, processed_markdown = self.preprocessor.process_html_content(
+            content,
+            space_key=space_key,
+            confluence_client=self.confluence,
+            cache_key=self._content_cache_key(page, "storage"),
+        )
+
+        # Use the appropriate content format based on the convert_to_markdown flag
+        page_content = processed_markdown if convert_to_markdown else processed_html
+
+        # Create and return the ConfluencePage model
+        return ConfluencePage.from_api_response(
+            page,
+            base_url=self.config.url,
+            include_body=True,
+            # Override content with our processed version
+            content_override=page_content,
+            content_format="storage" if not convert_to_markdown else "markdown",
+            is_cloud=self.config.is_cloud,
+        )
+
     def get_page_ancestors(self, page_id: str) -> list[ConfluencePage]:
         """
         Get ancestors (parent pages) of a specific page.
@@ -185,7 +216,10 @@ class PagesMixin(ConfluenceClient):
 
             content = page["body"]["storage"]["value"]
             processed_html, processed_markdown = self.preprocessor.process_html_content(
-                content, space_key=space_key, confluence_client=self.confluence
+                content,
+                space_key=space_key,
+                confluence_client=self.confluence,
+                cache_key=self._content_cache_key(page, "storage"),
             )
 
             # Use the appropriate content format based on the convert_to_markdown flag
@@ -244,14 +278,13 @@ class PagesMixin(ConfluenceClient):
 
         page_models = []
         for page in pages:
-            content = page["body"]["storage"]["value"]
-            processed_html, processed_markdown = self.preprocessor.process_html_content(
-                content, space_key=space_key, confluence_client=self.confluence
+            # Process the content in the requested format once it is read
+            content_loader = self._deferred_html_content(
+                page["body"]["storage"]["value"],
+                space_key,
+                convert_to_markdown=convert_to_markdown,
             )
 
-            # Use the appropriate content format based on the convert_to_markdown flag
-            page_content = processed_markdown if convert_to_markdown else processed_html
-
             # Ensure space information is included
             if "space" not in page:
                 page["space"] = {
@@ -264,8 +297,7 @@ class PagesMixin(ConfluenceClient):
                 page,
                 base_url=self.config.url,
                 include_body=True,
-                # Override content with our processed version
-                content_override=page_content,
+                content_loader=content_loader,
                 content_format="storage" if not convert_to_markdown else "markdown",
                 is_cloud=self.config.is_cloud,
             )
@@ -487,24 +519,24 @@ class PagesMixin(ConfluenceClient):
 
             # Process each child page
             for page in child_pages:
-                # Only process content if we have "body" expanded
-                content_override = None
+                # Only process content if we have "body" expanded, and only
+                # once the content is read
+                content_loader = None
                 if "body" in page and convert_to_markdown:
                     content = page.get("body", {}).get("storage", {}).get("value", "")
                     if content:
-                        _, processed_markdown = self.preprocessor.process_html_content(
+                        content_loader = self._deferred_html_content(
                             content,
-                            space_key=space_key,
-                            confluence_client=self.confluence,
+                            space_key,
+                            cache_key=self._content_cache_key(page, "storage"),
                         )
-                        content_override = processed_markdown
 
                 # Create the page model
                 page_model = ConfluencePage.from_api_response(
                     page,
                     base_url=self.config.url,
                     include_body=True,
-                    content_override=content_override,
+                    content_loader=content_loader,
                     content_format="markdown" if convert_to_markdown else "storage",
                 )
 
@@ -38,6 +38,25 @@ class SearchMixin(ConfluenceClient):
             MCPAtlassianAuthenticationError: If authentication fails with the
                 Confluence API (401/403)
         """
+        cql = self._apply_spaces_filter(cql, spaces_filter)
+
+        # Execute the CQL search query
+        results = self.confluence.cql(cql=cql, limit=limit)
+
+        return self._build_search_results(results, cql)
+
+    def _apply_spaces_filter(self, cql: str, spaces_filter: str | None) -> str:
+        """
+        Restrict a CQL query to the configured or requested spaces.
+
+        Args:
+            cql: Confluence Query Language string
+            spaces_filter: Optional comma-separated list of space keys,
+                overrides config
+
+        Returns:
+            The CQL query with the space filter applied, if any
+        """
         # Use spaces_filter parameter if provided, otherwise fall back to config
         filter_to_use = spaces_filter or self.config.spaces_filter
 
@@ -60,9 +79,19 @@ class SearchMixin(ConfluenceClient):
 
             logger.info(f"Applied spaces filter to query: {cql}")
 
-        # Execute the CQL search query
-        results = self.confluence.cql(cql=cql, limit=limit)
+        return cql
+
+    def _build_search_results(self, results: dict, cql: str) -> list[ConfluencePage]:
+        """
+        Convert a raw CQL search response into pages with processed excerpts.
 
+        Args:
+            results: The raw search response
+            cql: The executed CQL query
+
+        Returns:
+            List of ConfluencePage models containing search results
+        """
         # Convert the response to a search result model
         search_result = ConfluenceSearchResult.from_api_response(
             results,
@@ -79,15 +108,11 @@ class SearchMixin(ConfluenceClient):
                 if result_item.get("content", {}).get("id") == page.id:
                     excerpt = result_item.get("excerpt", "")
                     if excerpt:
-                        # Process the excerpt as HTML content
+                        # Process the excerpt as HTML content once it is read
                         space_key = page.space.key if page.space else ""
-                        _, processed_markdown = self.preprocessor.process_html_content(
-                            excerpt,
-                            space_key=space_key,
-                            confluence_client=self.confluence,
+                        page.set_content_loader(
+                            self._deferred_html_content(excerpt, space_key)
                         )
-                        # Create a new page with processed content
-                        page.content = processed_markdown
                     break
 
             processed_pages.append(page)
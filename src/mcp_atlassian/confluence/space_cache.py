@@ -0,0 +1,95 @@
+"""Bidirectional cache of Confluence space keys and IDs.
+
+The v1 API addresses spaces by key, the v2 API by numeric ID, so the v2
+adapter translates between the two around every page it creates, reads or
+updates. Spaces are practically never re-keyed, so both directions are kept
+in one bounded cache with a TTL.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+
+from cachetools import TTLCache
+
+from ..utils.env import get_env_int
+
+DEFAULT_TTL = 3600
+DEFAULT_MAX_SIZE = 256
+
+
+class SpaceCache:
+    """LRU cache with TTL mapping space keys to IDs and IDs to keys.
+
+    The cache belongs to one adapter, so it is scoped to one site and one set
+    of credentials.
+    """
+
+    def __init__(
+        self,
+        ttl: int = DEFAULT_TTL,
+        maxsize: int = DEFAULT_MAX_SIZE,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds a mapping is cached, 0 to disable the cache
+            maxsize: Maximum number of spaces kept
+            timer: Monotonic clock, injectable for tests
+        """
+        self.ttl = ttl
+        self._ids: TTLCache[str, str] = TTLCache(maxsize=maxsize, ttl=ttl, timer=timer)
+        self._keys: TTLCache[str, str] = TTLCache(maxsize=maxsize, ttl=ttl, timer=timer)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "SpaceCache":
+        """Create a cache configured from environment variables.
+
+        Reads ``CONFLUENCE_SPACE_CACHE_TTL`` (seconds) and
+        ``CONFLUENCE_SPACE_CACHE_SIZE``.
+
+        Returns:
+            The configured cache
+        """
+        return cls(
+            ttl=get_env_int("CONFLUENCE_SPACE_CACHE_TTL", DEFAULT_TTL, minimum=0),
+            maxsize=get_env_int(
+                "CONFLUENCE_SPACE_CACHE_SIZE", DEFAULT_MAX_SIZE, minimum=1
+            ),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spaces are cached at all."""
+        return self.ttl > 0
+
+    def get_id(self, space_key: str) -> str | None:
+        """Return the cached ID of a space key."""
+        with self._lock:
+            return self._ids.get(space_key)
+
+    def get_key(self, space_id: str) -> str | None:
+        """Return the cached key of a space ID."""
+        with self._lock:
+            return self._keys.get(str(space_id))
+
+    def put(self, space_key: str, space_id: str) -> None:
+        """Remember that a space key and a space ID belong to the same space."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._ids[space_key] = str(space_id)
+            self._keys[str(space_id)] = space_key
+
+    def invalidate(self, space_key: str | None = None) -> None:
+        """Drop one space, or every space, from the cache."""
+        with self._lock:
+            if space_key is None:
+                self._ids.clear()
+                self._keys.clear()
+                return
+            space_id = self._ids.pop(space_key, None)
+            if space_id is not None:
+                self._keys.pop(space_id, None)
@@ -6,26 +6,67 @@ but still work for API token authentication.
 """
 
 import logging
+import threading
+from functools import partial
 from typing import Any
 
 import requests
+from cachetools import LRUCache
 from requests.exceptions import HTTPError
 
+from ..utils.metadata_cache import get_metadata_cache
+from .space_cache import SpaceCache
+
 logger = logging.getLogger("mcp-atlassian")
 
+# Number of pages whose last seen version number is remembered
+PAGE_VERSION_CACHE_SIZE = 256
+
 
 class ConfluenceV2Adapter:
     """Adapter for Confluence REST API v2 operations when using OAuth."""
 
-    def __init__(self, session: requests.Session, base_url: str) -> None:
+    def __init__(
+        self,
+        session: requests.Session,
+        base_url: str,
+        metadata_scope: str | None = None,
+        space_cache: SpaceCache | None = None,
+    ) -> None:
         """Initialize the v2 adapter.
 
         Args:
             session: Authenticated requests session (OAuth configured)
             base_url: Base URL for the Confluence instance
+            metadata_scope: Scope of this site and user in the persistent
+                metadata cache, None to not persist space IDs
+            space_cache: Cache of space keys and IDs, configured from the
+                environment if omitted
         """
         self.session = session
         self.base_url = base_url
+        self.metadata_scope = metadata_scope
+        self.space_cache = space_cache or SpaceCache.from_env()
+        # Last version number seen per page, used as the base of the next
+        # update; a stale number is detected by the API with a 409 conflict
+        self._page_versions: LRUCache[str, int] = LRUCache(
+            maxsize=PAGE_VERSION_CACHE_SIZE
+        )
+        self._page_versions_lock = threading.Lock()
+
+    def _remember_version(self, page_data: dict[str, Any]) -> None:
+        """Remember the version number of a page from a v2 API response."""
+        page_id = page_data.get("id")
+        version_number = (page_data.get("version") or {}).get("number")
+        if page_id is None or not isinstance(version_number, int):
+            return
+        with self._page_versions_lock:
+            self._page_versions[str(page_id)] = version_number
+
+    def _known_version(self, page_id: str) -> int | None:
+        """Return the last version number seen for a page, if any."""
+        with self._page_versions_lock:
+            return self._page_versions.get(str(page_id))
 
     def _get_space_id(self, space_key: str) -> str:
         """Get space ID from space key using v2 API.
@@ -39,24 +80,41 @@ class ConfluenceV2Adapter:
         Raises:
             ValueError: If space not found or API error
         """
+        cached_id = self.space_cache.get_id(space_key)
+        if cached_id is not None:
+            return cached_id
+
         try:
             # Use v2 spaces endpoint to get space ID
             url = f"{self.base_url}/api/v2/spaces"
             params = {"keys": space_key}
 
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-
-            data = response.json()
+            cache = get_metadata_cache() if self.metadata_scope else None
+            if cache is not None and self.metadata_scope:
+                data = cache.get_json(
+                    self.metadata_scope,
+                    f"space:{space_key}",
+                    self.session,
+                    url,
+                    params=params,
+                )
+            else:
+                response = self.session.get(url, params=params)
+                response.raise_for_status()
+                data = response.json()
             results = data.get("results", [])
 
             if not results:
+                if cache is not None and self.metadata_scope:
+                    # Do not remember missing spaces, they may be created later
+                    cache.invalidate(self.metadata_scope, f"space:{space_key}")
                 raise ValueError(f"Space with key '{space_key}' not found")
 
             space_id = results[0].get("id")
             if not space_id:
                 raise ValueError(f"No ID found for space '{space_key}'")
 
+            self.space_cache.put(space_key, space_id)
             return space_id
 
         except HTTPError as e:
@@ -117,6 +175,7 @@ class ConfluenceV2Adapter:
 
             result = response.json()
             logger.debug(f"Successfully created page '{title}' with v2 API")
+            self._remember_version(result)
 
             # Convert v2 response to v1-compatible format for consistency
             return self._convert_v2_to_v1_format(result, space_key)
@@ -155,6 +214,7 @@ class ConfluenceV2Adapter:
             if version_number is None:
                 raise ValueError(f"No version number found for page '{page_id}'")
 
+            self._remember_version(data)
             return version_number
 
         except HTTPError as e:
@@ -172,9 +232,15 @@ class ConfluenceV2Adapter:
         representation: str = "storage",
         version_comment: str = "",
         status: str = "current",
+        version: int | None = None,
     ) -> dict[str, Any]:
         """Update a page using the v2 API.
 
+        The update is based on the given version, or else on the last version
+        this adapter saw for the page, without fetching the page first. If the
+        page changed in the meantime the API answers 409 Conflict, and the
+        update is retried once on the current version.
+
         Args:
             page_id: The ID of the page to update
             title: The new title of the page
@@ -182,6 +248,8 @@ class ConfluenceV2Adapter:
             representation: Content representation format (default: "storage")
             version_comment: Optional comment for this version
             status: Page status (default: "current")
+            version: Optional current version number of the page, if the
+                caller already fetched it
 
         Returns:
             The updated page data from the API response
@@ -190,35 +258,40 @@ class ConfluenceV2Adapter:
             ValueError: If page update fails
         """
         try:
-            # Get current version and increment it
-            current_version = self._get_page_version(page_id)
-            new_version = current_version + 1
-
-            # Prepare request data for v2 API
-            data = {
-                "id": page_id,
-                "status": status,
-                "title": title,
-                "body": {
-                    "representation": representation,
-                    "value": body,
-                },
-                "version": {
-                    "number": new_version,
-                },
-            }
-
-            # Add version comment if provided
-            if version_comment:
-                data["version"]["message"] = version_comment
-
-            # Make the v2 API call
-            url = f"{self.base_url}/api/v2/pages/{page_id}"
-            response = self.session.put(url, json=data)
-            response.raise_for_status()
+            known_version = version or self._known_version(page_id)
+            if known_version is None:
+                current_version = self._get_page_version(page_id)
+            else:
+                current_version = known_version
+            put_page = partial(
+                self._put_page,
+                page_id,
+                title,
+                body,
+                representation,
+                version_comment,
+                status,
+            )
+            try:
+                response = put_page(current_version + 1)
+            except HTTPError as e:
+                # Only a version that was not just fetched can be stale
+                if (
+                    known_version is None
+                    or e.response is None
+                    or e.response.status_code != 409
+                ):
+                    raise
+                logger.debug(
+                    f"Version {known_version} of page '{page_id}' is stale, "
+                    "retrying on the current version"
+                )
+                current_version = self._get_page_version(page_id)
+                response = put_page(current_version + 1)
 
             result = response.json()
             logger.debug(f"Successfully updated page '{title}' with v2 API")
+            self._remember_version(result)
 
             # Convert v2 response to v1-compatible format for consistency
             # For update, we need to extract space key from the result
@@ -236,6 +309,45 @@ class ConfluenceV2Adapter:
             logger.error(f"Error updating page '{page_id}': {e}")
             raise ValueError(f"Failed to update page '{page_id}': {e}") from e
 
+    def _put_page(
+        self,
+        page_id: str,
+        title: str,
+        body: str,
+        representation: str,
+        version_comment: str,
+        status: str,
+        new_version: int,
+    ) -> requests.Response:
+        """Send a page update as the given new version number.
+
+        Raises:
+            HTTPError: If the API rejects the update
+        """
+        # Prepare request data for v2 API
+        data: dict[str, Any] = {
+            "id": page_id,
+            "status": status,
+            "title": title,
+            "body": {
+                "representation": representation,
+                "value": body,
+            },
+            "version": {
+                "number": new_version,
+            },
+        }
+
+        # Add version comment if provided
+        if version_comment:
+            data["version"]["message"] = version_comment
+
+        # Make the v2 API call
+        url = f"{self.base_url}/api/v2/pages/{page_id}"
+        response = self.session.put(url, json=data)
+        response.raise_for_status()
+        return response
+
     def _get_space_key_from_id(self, space_id: str) -> str:
         """Get space key from space ID using v2 API.
 
@@ -248,6 +360,10 @@ class ConfluenceV2Adapter:
         Raises:
             ValueError: If space not found or API error
         """
+        cached_key = self.space_cache.get_key(space_id)
+        if cached_key is not None:
+            return cached_key
+
         try:
             # Use v2 spaces endpoint to get space key
             url = f"{self.base_url}/api/v2/spaces/{space_id}"
@@ -261,6 +377,7 @@ class ConfluenceV2Adapter:
             if not space_key:
                 raise ValueError(f"No key found for space ID '{space_id}'")
 
+            self.space_cache.put(space_key, space_id)
             return space_key
 
         except HTTPError as e:
@@ -301,6 +418,7 @@ class ConfluenceV2Adapter:
 
             v2_response = response.json()
             logger.debug(f"Successfully retrieved page '{page_id}' with v2 API")
+            self._remember_version(v2_response)
 
             # Get space key from space ID
             space_id = v2_response.get("spaceId")
@@ -359,6 +477,8 @@ class ConfluenceV2Adapter:
             response.raise_for_status()
 
             logger.debug(f"Successfully deleted page '{page_id}' with v2 API")
+            with self._page_versions_lock:
+                self._page_versions.pop(str(page_id), None)
 
             # Check if status code indicates success (204 No Content is typical for deletes)
             if response.status_code in [200, 204]:
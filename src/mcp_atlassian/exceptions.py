@@ -2,3 +2,9 @@ class MCPAtlassianAuthenticationError(Exception):
     """Raised when Atlassian API authentication fails (401/403)."""
 
     pass
+
+
+class MCPAtlassianBackpressureError(Exception):
+    """Raised when a service's worker pool queue is full and a call is rejected."""
+
+    pass
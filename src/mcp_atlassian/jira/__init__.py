@@ -8,6 +8,7 @@ This module provides various Jira API client implementations.
 # Re-export the Jira class for backward compatibility
 from atlassian.jira import Jira
 
+from .async_api import AsyncApiMixin
 from .client import JiraClient
 from .comments import CommentsMixin
 from .config import JiraConfig
@@ -27,6 +28,7 @@ from .attachments import AttachmentsMixin
 
 
 class JiraFetcher(
+    AsyncApiMixin,
     ProjectsMixin,
     FieldsMixin,
     FormattingMixin,
@@ -46,6 +48,7 @@ class JiraFetcher(
     The main Jira client class providing access to all Jira operations.
 
     This class inherits from multiple mixins that provide specific functionality:
+    - AsyncApiMixin: Native async variants of the hot read operations
     - ProjectsMixin: Project-related operations
     - FieldsMixin: Field-related operations
     - FormattingMixin: Content formatting utilities
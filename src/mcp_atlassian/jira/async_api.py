@@ -0,0 +1,310 @@
+"""Module for native async Jira read operations."""
+
+import logging
+from functools import partial
+from typing import Any
+
+import anyio.to_thread
+from requests.exceptions import HTTPError
+
+from ..exceptions import MCPAtlassianAuthenticationError
+from ..models.jira import JiraIssue, JiraSearchResult
+from ..utils.async_http import AsyncTransport, gather
+from .comments import CommentsMixin
+from .issues import IssuesMixin
+from .search import SearchMixin
+from .transitions import TransitionsMixin
+
+logger = logging.getLogger("mcp-jira")
+
+
+class AsyncApiMixin(TransitionsMixin, CommentsMixin, SearchMixin, IssuesMixin):
+    """Mixin providing async variants of the hot Jira read operations.
+
+    Each ``<name>_async`` method mirrors the synchronous ``<name>`` method and
+    returns the same result, but performs its HTTP requests on the shared
+    async transport. Tools reach these methods through
+    :func:`mcp_atlassian.servers.dispatch.dispatch` when ``async_transport`` is
+    enabled in the configuration.
+    """
+
+    _async_transport: AsyncTransport | None = None
+
+    @property
+    def async_transport(self) -> AsyncTransport:
+        """Get the async transport bound to this client's URL and session."""
+        if self._async_transport is None:
+            self._async_transport = AsyncTransport(
+                base_url=self.jira.url,
+                session=self.jira._session,
+                service_name="Jira API",
+            )
+        return self._async_transport
+
+    async def search_issues_async(
+        self,
+        jql: str,
+        fields: list[str] | tuple[str, ...] | set[str] | str | None = None,
+        start: int = 0,
+        limit: int = 50,
+        expand: str | None = None,
+        projects_filter: str | None = None,
+    ) -> JiraSearchResult:
+        """
+        Search for issues using JQL on the async transport.
+
+        See :meth:`SearchMixin.search_issues` for the arguments. On Cloud the
+        total-count request (unless cached or skipped) and the issue pages are
+        fetched concurrently.
+
+        Returns:
+            JiraSearchResult object containing issues and metadata
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+            Exception: If there is an error searching for issues
+        """
+        try:
+            jql = self._apply_projects_filter(jql, projects_filter)
+            fields_param = self._search_fields_param(fields)
+            params: dict[str, Any] = {"jql": jql, "fields": fields_param}
+            if expand is not None:
+                params["expand"] = expand
+
+            if self.config.is_cloud:
+                cached_total = self._get_cached_search_total(jql)
+                fetch_total = None
+                if cached_total is None and self.config.search_total != "skip":
+                    total, issues = await gather(
+                        partial(self._fetch_search_total_async, jql),
+                        partial(self._fetch_enhanced_search_pages, params, limit),
+                    )
+                    fetch_total = partial(int, total)
+                else:
+                    issues = await self._fetch_enhanced_search_pages(params, limit)
+                response: dict[str, Any] = {
+                    "issues": issues,
+                    "total": self._resolve_search_total(
+                        jql, issues, limit, cached_total, fetch_total
+                    ),
+                }
+            else:
+                params.update({"startAt": start, "maxResults": min(limit, 50)})
+                response = await self.async_transport.get_json(
+                    self.jira.resource_url("search"), params=params
+                )
+                if not isinstance(response, dict):
+                    msg = f"Unexpected return value type from Jira search: {type(response)}"
+                    logger.error(msg)
+                    raise TypeError(msg)
+
+            return JiraSearchResult.from_api_response(
+                response, base_url=self.config.url, requested_fields=fields_param
+            )
+        except MCPAtlassianAuthenticationError:
+            raise
+        except HTTPError as http_err:
+            logger.error(f"HTTP error during API call: {http_err}", exc_info=False)
+            raise
+        except Exception as e:
+            logger.error(f"Error searching issues with JQL '{jql}': {str(e)}")
+            raise Exception(f"Error searching issues: {str(e)}") from e
+
+    async def _fetch_search_total_async(self, jql: str) -> int:
+        """Fetch the (exact or approximate) total for a JQL query, or -1."""
+        try:
+            if self.config.search_total == "approximate":
+                response = await self.async_transport.request_json(
+                    "POST",
+                    self.jira.resource_url("search/approximate-count"),
+                    json={"jql": jql},
+                )
+                return int(response["count"])
+            response = await self.async_transport.get_json(
+                self.jira.resource_url("search"),
+                params={"jql": jql, "maxResults": 0},
+            )
+            return int(response["total"])
+        except MCPAtlassianAuthenticationError:
+            raise
+        except Exception as e:
+            logger.error(f"Error fetching metadata for JQL '{jql}': {str(e)}")
+            return -1
+
+    async def _fetch_enhanced_search_pages(
+        self, params: dict[str, Any], limit: int
+    ) -> list[dict[str, Any]]:
+        """Follow ``nextPageToken`` pages of the Cloud enhanced search."""
+        page_params = {**params, "maxResults": limit}
+        issues: list[dict[str, Any]] = []
+        while True:
+            response = await self.async_transport.get_json(
+                self.jira.resource_url("search/jql"), params=page_params
+            )
+            if not response:
+                break
+            issues.extend(response["issues"])
+            next_page_token = response.get("nextPageToken")
+            if not next_page_token or len(issues) >= limit:
+                break
+            page_params["nextPageToken"] = next_page_token
+        return issues
+
+    async def get_issue_async(
+        self,
+        issue_key: str,
+        expand: str | None = None,
+        comment_limit: int | str | None = 10,
+        fields: str | list[str] | tuple[str, ...] | set[str] | None = None,
+        properties: str | list[str] | None = None,
+        update_history: bool = True,
+    ) -> JiraIssue:
+        """
+        Get a Jira issue by key on the async transport.
+
+        See :meth:`IssuesMixin.get_issue` for the arguments. The issue and its
+        comments are fetched concurrently.
+
+        Returns:
+            JiraIssue model with issue data and metadata
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+            Exception: If there is an error retrieving the issue
+        """
+        try:
+            fields_param, properties_param = self._prepare_issue_request(
+                issue_key, expand=expand, fields=fields, properties=properties
+            )
+            params: dict[str, Any] = {
+                "fields": fields_param,
+                "updateHistory": str(update_history).lower(),
+            }
+            if properties_param is not None:
+                params["properties"] = properties_param
+            if expand:
+                params["expand"] = expand
+
+            comment_limit_int = self._normalize_comment_limit(comment_limit)
+            wants_comments = comment_limit_int is None or comment_limit_int > 0
+            requested = fields_param.split(",")
+            fetch_issue = partial(
+                self.async_transport.get_json,
+                f"{self.jira.resource_url('issue')}/{issue_key}",
+                params=params,
+            )
+            comments: list[dict[str, Any]] | None = None
+            if wants_comments and ("comment" in requested or "*all" in requested):
+                # Comments are known to be needed: fetch them alongside the issue
+                issue, comments = await gather(
+                    fetch_issue, partial(self._fetch_issue_comments, issue_key)
+                )
+            else:
+                issue = await fetch_issue()
+
+            if not issue:
+                msg = f"Issue {issue_key} not found"
+                raise ValueError(msg)
+            if not isinstance(issue, dict):
+                msg = f"Unexpected return value type from Jira issue: {type(issue)}"
+                logger.error(msg)
+                raise TypeError(msg)
+
+            fields_data = issue.get("fields", {}) or {}
+            if "comment" in fields_data:
+                if comments is None and wants_comments:
+                    comments = await self._fetch_issue_comments(issue_key)
+                comments = comments or []
+                if comment_limit_int is not None:
+                    comments = comments[:comment_limit_int]
+                fields_data["comment"]["comments"] = comments
+
+            # Epic enrichment may need further (blocking) lookups
+            return await anyio.to_thread.run_sync(
+                partial(self._build_issue_model, issue, requested_fields=fields)
+            )
+        except MCPAtlassianAuthenticationError:
+            raise
+        except HTTPError as http_err:
+            logger.error(f"HTTP error during API call: {http_err}", exc_info=False)
+            raise
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(f"Error retrieving issue {issue_key}: {error_msg}")
+            raise Exception(f"Error retrieving issue {issue_key}: {error_msg}") from e
+
+    async def _fetch_issue_comments(self, issue_key: str) -> list[dict[str, Any]]:
+        """Fetch the raw comments of an issue, or an empty list on error."""
+        try:
+            response = await self.async_transport.get_json(
+                f"{self.jira.resource_url('issue')}/{issue_key}/comment"
+            )
+            return response["comments"]
+        except Exception as e:
+            logger.warning(f"Error getting comments for {issue_key}: {str(e)}")
+            return []
+
+    async def get_issue_comments_async(
+        self, issue_key: str, limit: int = 50
+    ) -> list[dict[str, Any]]:
+        """
+        Get comments for a specific issue on the async transport.
+
+        Args:
+            issue_key: The issue key (e.g. 'PROJ-123')
+            limit: Maximum number of comments to return
+
+        Returns:
+            List of comments with author, creation date, and content
+
+        Raises:
+            Exception: If there is an error getting comments
+        """
+        try:
+            comments = await self.async_transport.get_json(
+                f"{self.jira.resource_url('issue')}/{issue_key}/comment"
+            )
+            return self._process_comments(comments, limit)
+        except Exception as e:
+            logger.error(f"Error getting comments for issue {issue_key}: {str(e)}")
+            raise Exception(f"Error getting comments: {str(e)}") from e
+
+    async def get_available_transitions_async(
+        self, issue_key: str
+    ) -> list[dict[str, Any]]:
+        """
+        Get the available status transitions for an issue on the async transport.
+
+        Args:
+            issue_key: The issue key (e.g. 'PROJ-123')
+
+        Returns:
+            List of available transitions with id, name, and to status details
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+            Exception: If there is an error getting transitions
+        """
+        try:
+            response = await self.async_transport.get_json(
+                f"{self.jira.resource_url('issue')}/{issue_key}/transitions"
+            )
+            # Same shape as ``jira.get_issue_transitions`` returns
+            transitions_data = [
+                {
+                    "name": transition["name"],
+                    "id": int(transition["id"]),
+                    "to": transition["to"]["name"],
+                }
+                for transition in (response or {}).get("transitions", [])
+            ]
+            return self._format_transitions(transitions_data)
+        except MCPAtlassianAuthenticationError:
+            raise
+        except HTTPError as http_err:
+            logger.error(f"HTTP error during API call: {http_err}", exc_info=False)
+            raise
+        except Exception as e:
+            error_msg = f"Error getting transitions for {issue_key}: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(f"Error getting transitions: {str(e)}") from e
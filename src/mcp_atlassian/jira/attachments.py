@@ -2,27 +2,174 @@
 
 import logging
 import os
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from ..models.jira import JiraAttachment
+from ..utils.date import parse_date
+from ..utils.env import get_env_int
 from .client import JiraClient
 from .protocols import AttachmentsOperationsProto
 
 # Configure logging
 logger = logging.getLogger("mcp-jira")
 
+DEFAULT_DOWNLOAD_WORKERS = 4
+DEFAULT_UPLOAD_WORKERS = 4
+DEFAULT_UPLOAD_BATCH_SIZE = 1
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Suffix of a download in progress; it is renamed into place once complete
+PARTIAL_SUFFIX = ".part"
+
+
+def _attachment_mtime(attachment: JiraAttachment) -> float | None:
+    """Return the attachment's creation time as a POSIX timestamp, if known."""
+    try:
+        created = parse_date(attachment.created)
+    except (ValueError, OverflowError, TypeError):
+        return None
+    return created.timestamp() if created else None
+
+
+def _is_up_to_date(path: Path, size: int, mtime: float | None) -> bool:
+    """Return whether a file already holds a complete copy of an attachment."""
+    if not size or mtime is None:
+        return False
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    return stat.st_size == size and abs(stat.st_mtime - mtime) < 1
+
+
+def _match_attachments(file_paths: list[str], attachments: list[Any]) -> list[Any]:
+    """Pair uploaded files with the attachments Jira created for them.
+
+    Attachments are matched by filename, since Jira does not document the
+    order of its response. Attachments whose name matches no file (e.g.
+    renamed by Jira) are paired with the remaining files in order.
+
+    Args:
+        file_paths: Paths of the uploaded files
+        attachments: The created attachments as returned by Jira
+
+    Returns:
+        The attachment of each file, or None for files without one
+    """
+    by_name: dict[str, list[Any]] = {}
+    for attachment in attachments:
+        name = attachment.get("filename") if isinstance(attachment, dict) else None
+        by_name.setdefault(name or "", []).append(attachment)
+
+    matched: list[Any] = []
+    for file_path in file_paths:
+        candidates = by_name.get(os.path.basename(file_path))
+        matched.append(candidates.pop(0) if candidates else None)
+
+    claimed = {id(attachment) for attachment in matched if attachment is not None}
+    leftovers = iter(
+        attachment for attachment in attachments if id(attachment) not in claimed
+    )
+    return [
+        attachment if attachment is not None else next(leftovers, None)
+        for attachment in matched
+    ]
+
+
+class MultipartFileStream:
+    """A ``multipart/form-data`` request body read from disk on demand.
+
+    ``requests`` builds ``files=`` uploads in memory, so uploading a 50 MB file
+    holds the whole file (and the encoded body) in memory. This body reads
+    one chunk at a time while it is sent, and reports its length so the
+    request carries a ``Content-Length`` instead of chunked encoding.
+    Every file is sent as a ``file`` part, which Jira accepts repeatedly in
+    one attachment request. Iterating again re-reads the files, so the body
+    can be resent.
+    """
+
+    def __init__(self, paths: list[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """Initialize the body.
+
+        Args:
+            paths: Absolute paths of the files to send
+            chunk_size: Bytes read from disk at a time
+        """
+        self.paths = paths
+        self.chunk_size = chunk_size
+        self.boundary = uuid.uuid4().hex
+        self._headers = [self._part_header(path) for path in paths]
+        self._closing = f"--{self.boundary}--\r\n".encode()
+
+    @property
+    def content_type(self) -> str:
+        """The Content-Type header value of the body."""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        parts = sum(
+            len(header) + os.path.getsize(path) + 2
+            for header, path in zip(self._headers, self.paths, strict=True)
+        )
+        return parts + len(self._closing)
+
+    def __iter__(self) -> Iterator[bytes]:
+        for header, path in zip(self._headers, self.paths, strict=True):
+            yield header
+            with open(path, "rb") as file:
+                while chunk := file.read(self.chunk_size):
+                    yield chunk
+            yield b"\r\n"
+        yield self._closing
+
+    def _part_header(self, path: str) -> bytes:
+        """Build the boundary and headers preceding a file's content."""
+        filename = os.path.basename(path)
+        quoted = (
+            filename.replace("\\", "\\\\")
+            .replace('"', "%22")
+            .replace("\r", "%0D")
+            .replace("\n", "%0A")
+        )
+        # Like requests, no part Content-Type: Jira detects it from the file
+        return (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{quoted}"\r\n\r\n'
+        ).encode()
+
 
 class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
     """Mixin for Jira attachment operations."""
 
-    def download_attachment(self, url: str, target_path: str) -> bool:
+    def download_attachment(
+        self,
+        url: str,
+        target_path: str,
+        expected_size: int | None = None,
+        mtime: float | None = None,
+        chunk_size: int | None = None,
+        on_chunk: Callable[[int], None] | None = None,
+    ) -> bool:
         """
         Download a Jira attachment to the specified path.
 
+        The content is streamed to ``<target_path>.part`` and renamed into
+        place once complete. A ``.part`` file left by an interrupted download
+        is resumed with an HTTP Range request.
+
         Args:
             url: The URL of the attachment to download
             target_path: The path where the attachment should be saved
+            expected_size: Size in bytes the download must have, if known
+            mtime: Modification time (POSIX timestamp) to set on the file
+            chunk_size: Bytes read per chunk, defaults to
+                ``JIRA_ATTACHMENT_CHUNK_SIZE``
+            on_chunk: Optional callback given the size of each chunk written
 
         Returns:
             True if successful, False otherwise
@@ -31,24 +178,70 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
             logger.error("No URL provided for attachment download")
             return False
 
+        if chunk_size is None:
+            chunk_size = get_env_int(
+                "JIRA_ATTACHMENT_CHUNK_SIZE", DEFAULT_CHUNK_SIZE, minimum=1024
+            )
+
         try:
             # Convert to absolute path if relative
             if not os.path.isabs(target_path):
                 target_path = os.path.abspath(target_path)
+            partial_path = target_path + PARTIAL_SUFFIX
 
             logger.info(f"Downloading attachment from {url} to {target_path}")
 
             # Create the directory if it doesn't exist
             os.makedirs(os.path.dirname(target_path), exist_ok=True)
 
+            try:
+                offset = os.stat(partial_path).st_size
+            except FileNotFoundError:
+                offset = 0
+            if expected_size is not None and offset > expected_size:
+                logger.warning(f"Discarding oversized partial download {partial_path}")
+                offset = 0
+
             # Use the Jira session to download the file
-            response = self.jira._session.get(url, stream=True)
+            if offset:
+                logger.info(f"Resuming download of {target_path} at byte {offset}")
+                response = self.jira._session.get(
+                    url, stream=True, headers={"Range": f"bytes={offset}-"}
+                )
+                if response.status_code == 416:
+                    # The partial file does not match the attachment, start over
+                    response.close()
+                    offset = 0
+                    response = self.jira._session.get(url, stream=True)
+                elif response.status_code != 206:
+                    # The server ignored the range and sends the whole file
+                    offset = 0
+            else:
+                response = self.jira._session.get(url, stream=True)
             response.raise_for_status()
 
             # Write the file to disk
-            with open(target_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
+            written = offset
+            with open(partial_path, "ab" if offset else "wb") as f:
+                for chunk in response.iter_content(chunk_size=chunk_size):
                     f.write(chunk)
+                    written += len(chunk)
+                    if on_chunk is not None:
+                        on_chunk(len(chunk))
+
+            if expected_size is not None and written != expected_size:
+                # A short file is kept so the next attempt resumes it
+                if written > expected_size:
+                    os.remove(partial_path)
+                logger.error(
+                    f"Downloaded {written} bytes for {target_path}, "
+                    f"expected {expected_size}"
+                )
+                return False
+
+            os.replace(partial_path, target_path)
+            if mtime is not None:
+                os.utime(target_path, (mtime, mtime))
 
             # Verify the file was created
             if os.path.exists(target_path):
@@ -71,12 +264,16 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
         """
         Download all attachments for a Jira issue.
 
+        Attachments are downloaded concurrently by up to
+        ``JIRA_ATTACHMENT_DOWNLOAD_WORKERS`` threads. Files already present
+        with the attachment's size and creation time are skipped.
+
         Args:
             issue_key: The Jira issue key (e.g., 'PROJ-123')
             target_dir: The directory where attachments should be saved
 
         Returns:
-            A dictionary with download results
+            A dictionary with download results and aggregate throughput
         """
         # Convert to absolute path if relative
         if not os.path.isabs(target_dir):
@@ -126,6 +323,10 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
         # Download each attachment
         downloaded = []
         failed = []
+        skipped = []
+        pending = []
+
+        used_filenames: set[str] = set()
 
         for attachment in attachments:
             if not attachment.url:
@@ -135,14 +336,71 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
                 )
                 continue
 
-            # Create a safe filename
+            # Create a safe filename, unique among the issue's attachments so
+            # concurrent downloads never share a file
             safe_filename = Path(attachment.filename).name
+            if safe_filename in used_filenames:
+                name = Path(safe_filename)
+                safe_filename = f"{name.stem} ({attachment.id}){name.suffix}"
+            used_filenames.add(safe_filename)
             file_path = target_path / safe_filename
+            mtime = _attachment_mtime(attachment)
 
-            # Download the attachment
-            success = self.download_attachment(attachment.url, str(file_path))
+            if _is_up_to_date(file_path, attachment.size, mtime):
+                logger.info(f"Skipping up-to-date attachment {file_path}")
+                skipped.append(
+                    {
+                        "filename": attachment.filename,
+                        "path": str(file_path),
+                        "size": attachment.size,
+                    }
+                )
+                continue
+            pending.append((attachment, file_path, mtime))
 
-            if success:
+        chunk_size = get_env_int(
+            "JIRA_ATTACHMENT_CHUNK_SIZE", DEFAULT_CHUNK_SIZE, minimum=1024
+        )
+
+        def download(item: tuple[JiraAttachment, Path, float | None]) -> int | None:
+            """Download one attachment, returning the bytes written or None."""
+            attachment, file_path, mtime = item
+            written = 0
+
+            def count(size: int) -> None:
+                nonlocal written
+                written += size
+
+            success = self.download_attachment(
+                attachment.url,
+                str(file_path),
+                expected_size=attachment.size or None,
+                mtime=mtime,
+                chunk_size=chunk_size,
+                on_chunk=count,
+            )
+            return written if success else None
+
+        workers = min(
+            get_env_int(
+                "JIRA_ATTACHMENT_DOWNLOAD_WORKERS", DEFAULT_DOWNLOAD_WORKERS, minimum=1
+            ),
+            len(pending),
+        )
+        started = time.monotonic()
+        if workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="jira-attachment"
+            ) as executor:
+                outcomes = list(executor.map(download, pending))
+        else:
+            outcomes = [download(item) for item in pending]
+        elapsed = time.monotonic() - started
+
+        downloaded_bytes = 0
+        for (attachment, file_path, _), written in zip(pending, outcomes, strict=True):
+            if written is not None:
+                downloaded_bytes += written
                 downloaded.append(
                     {
                         "filename": attachment.filename,
@@ -155,12 +413,24 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
                     {"filename": attachment.filename, "error": "Download failed"}
                 )
 
+        if downloaded:
+            logger.info(
+                f"Downloaded {len(downloaded)} attachments for {issue_key} "
+                f"({downloaded_bytes} bytes in {elapsed:.2f}s)"
+            )
+
         return {
             "success": True,
             "issue_key": issue_key,
             "total": len(attachments),
             "downloaded": downloaded,
             "failed": failed,
+            "skipped": skipped,
+            "bytes_downloaded": downloaded_bytes,
+            "elapsed_seconds": round(elapsed, 3),
+            "throughput_bytes_per_second": (
+                round(downloaded_bytes / elapsed) if elapsed > 0 else 0
+            ),
         }
 
     def upload_attachment(self, issue_key: str, file_path: str) -> dict[str, Any]:
@@ -194,12 +464,10 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
 
             logger.info(f"Uploading attachment from {file_path} to issue {issue_key}")
 
-            # Use the Jira API to upload the file
+            # Stream the file to the Jira API
             filename = os.path.basename(file_path)
-            with open(file_path, "rb") as file:
-                attachment = self.jira.add_attachment(
-                    issue_key=issue_key, filename=file_path
-                )
+            attachments = self._post_attachments(issue_key, [file_path])
+            attachment = attachments[0] if attachments else None
 
             if attachment:
                 file_size = os.path.getsize(file_path)
@@ -233,12 +501,17 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
         """
         Upload multiple attachments to a Jira issue.
 
+        Files are uploaded concurrently by up to
+        ``JIRA_ATTACHMENT_UPLOAD_WORKERS`` threads. With
+        ``JIRA_ATTACHMENT_UPLOAD_BATCH_SIZE`` above 1, that many files share
+        one multipart request.
+
         Args:
             issue_key: The Jira issue key (e.g., 'PROJ-123')
             file_paths: List of paths to files to upload
 
         Returns:
-            A dictionary with upload results
+            A dictionary with per-file upload results and aggregate throughput
         """
         if not issue_key:
             logger.error("No issue key provided for attachment upload")
@@ -250,14 +523,44 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
 
         logger.info(f"Uploading {len(file_paths)} attachments to issue {issue_key}")
 
-        # Upload each attachment
+        batch_size = get_env_int(
+            "JIRA_ATTACHMENT_UPLOAD_BATCH_SIZE", DEFAULT_UPLOAD_BATCH_SIZE, minimum=1
+        )
+        batches = [
+            file_paths[start : start + batch_size]
+            for start in range(0, len(file_paths), batch_size)
+        ]
+
+        def upload(batch: list[str]) -> list[dict[str, Any]]:
+            if len(batch) == 1:
+                return [self.upload_attachment(issue_key, batch[0])]
+            return self._upload_batch(issue_key, batch)
+
+        workers = min(
+            get_env_int(
+                "JIRA_ATTACHMENT_UPLOAD_WORKERS", DEFAULT_UPLOAD_WORKERS, minimum=1
+            ),
+            len(batches),
+        )
+        started = time.monotonic()
+        if workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="jira-attachment"
+            ) as executor:
+                outcomes = list(executor.map(upload, batches))
+        else:
+            outcomes = [upload(batch) for batch in batches]
+        elapsed = time.monotonic() - started
+
+        # Collect the per-file results
         uploaded = []
         failed = []
+        uploaded_bytes = 0
 
-        for file_path in file_paths:
-            result = self.upload_attachment(issue_key, file_path)
-
+        results = [result for outcome in outcomes for result in outcome]
+        for file_path, result in zip(file_paths, results, strict=True):
             if result.get("success"):
+                uploaded_bytes += result.get("size") or 0
                 uploaded.append(
                     {
                         "filename": result.get("filename"),
@@ -279,4 +582,117 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
             "total": len(file_paths),
             "uploaded": uploaded,
             "failed": failed,
+            "bytes_uploaded": uploaded_bytes,
+            "elapsed_seconds": round(elapsed, 3),
+            "throughput_bytes_per_second": (
+                round(uploaded_bytes / elapsed) if elapsed > 0 else 0
+            ),
         }
+
+    def _upload_batch(
+        self, issue_key: str, file_paths: list[str]
+    ) -> list[dict[str, Any]]:
+        """
+        Upload several files to a Jira issue in one multipart request.
+
+        Args:
+            issue_key: The Jira issue key (e.g., 'PROJ-123')
+            file_paths: Paths of the files to upload
+
+        Returns:
+            One result per file, in the order of ``file_paths``, shaped like
+            the result of ``upload_attachment``
+        """
+        results: list[dict[str, Any] | None] = []
+        present: list[str] = []
+        for file_path in file_paths:
+            file_path = os.path.abspath(file_path)
+            if os.path.exists(file_path):
+                results.append(None)
+                present.append(file_path)
+            else:
+                logger.error(f"File not found: {file_path}")
+                results.append(
+                    {"success": False, "error": f"File not found: {file_path}"}
+                )
+        if not present:
+            return [result for result in results if result is not None]
+
+        logger.info(
+            f"Uploading {len(present)} attachments to issue {issue_key} in one request"
+        )
+        try:
+            attachments = self._post_attachments(issue_key, present)
+            error = None
+        except Exception as e:
+            logger.error(f"Error uploading attachments: {str(e)}")
+            attachments, error = [], str(e)
+
+        created = iter(_match_attachments(present, attachments))
+        uploaded = iter(present)
+        batch_results = []
+        for result in results:
+            if result is not None:
+                batch_results.append(result)
+                continue
+            file_path = next(uploaded)
+            filename = os.path.basename(file_path)
+            attachment = next(created)
+            if attachment:
+                batch_results.append(
+                    {
+                        "success": True,
+                        "issue_key": issue_key,
+                        "filename": filename,
+                        "size": os.path.getsize(file_path),
+                        "id": attachment.get("id")
+                        if isinstance(attachment, dict)
+                        else None,
+                    }
+                )
+            else:
+                batch_results.append(
+                    {
+                        "success": False,
+                        "error": error
+                        or f"Failed to upload attachment {filename} to {issue_key}",
+                    }
+                )
+        return batch_results
+
+    def _post_attachments(self, issue_key: str, file_paths: list[str]) -> list[Any]:
+        """
+        Stream files to the issue attachments endpoint.
+
+        Args:
+            issue_key: The Jira issue key (e.g., 'PROJ-123')
+            file_paths: Absolute paths of the files to upload
+
+        Returns:
+            The created attachments as returned by Jira
+
+        Raises:
+            requests.HTTPError: If Jira rejects the upload
+        """
+        body = MultipartFileStream(
+            file_paths,
+            chunk_size=get_env_int(
+                "JIRA_ATTACHMENT_CHUNK_SIZE", DEFAULT_CHUNK_SIZE, minimum=1024
+            ),
+        )
+        url = self.jira.url_joiner(
+            self.jira.url, f"{self.jira.resource_url('issue')}/{issue_key}/attachments"
+        )
+        response = self.jira._session.post(
+            url,
+            data=body,
+            headers={
+                "Accept": "application/json",
+                "Content-Type": body.content_type,
+                "X-Atlassian-Token": "no-check",
+            },
+            timeout=self.jira.timeout,
+        )
+        response.raise_for_status()
+        attachments = response.json()
+        return attachments if isinstance(attachments, list) else [attachments]
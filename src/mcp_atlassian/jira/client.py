@@ -2,6 +2,7 @@
 
 import logging
 import os
+from collections.abc import Callable
 from typing import Any, Literal
 
 from atlassian import Jira
@@ -14,6 +15,7 @@ from mcp_atlassian.utils.logging import (
     log_config_param,
     mask_sensitive,
 )
+from mcp_atlassian.utils.metadata_cache import get_metadata_cache, metadata_scope
 from mcp_atlassian.utils.oauth import configure_oauth_session
 from mcp_atlassian.utils.ssl import configure_ssl_verification
 
@@ -133,7 +135,9 @@ class JiraClient:
             self._apply_custom_headers()
 
         # Initialize the text preprocessor for text processing capabilities
-        self.preprocessor = JiraPreprocessor(base_url=self.config.url)
+        self.preprocessor = JiraPreprocessor(
+            base_url=self.config.url, cache_scope=metadata_scope(self.config)
+        )
         self._field_ids_cache = None
         self._current_user_account_id = None
 
@@ -186,6 +190,30 @@ class JiraClient:
             self.jira._session.headers[header_name] = header_value
             logger.debug(f"Applied custom header: {header_name}")
 
+    def _load_metadata(
+        self, name: str, loader: Callable[[], Any], *, refresh: bool = False
+    ) -> Any:
+        """
+        Load site metadata through the persistent metadata cache, if configured.
+
+        Args:
+            name: Metadata name, unique within the site and user
+            loader: Callable fetching the metadata from Jira
+            refresh: When True, bypass the cached copy and store a fresh one
+
+        Returns:
+            The cached or freshly loaded metadata
+        """
+        cache = get_metadata_cache()
+        if cache is None:
+            return loader()
+        scope = metadata_scope(self.config)
+        if not refresh:
+            return cache.get_or_load(scope, name, loader)
+        value = loader()
+        cache.put(scope, name, value)
+        return value
+
     def _clean_text(self, text: str) -> str:
         """Clean text content by:
         1. Processing user mentions and links
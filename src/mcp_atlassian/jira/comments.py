@@ -31,27 +31,43 @@ class CommentsMixin(JiraClient):
         try:
             comments = self.jira.issue_get_comments(issue_key)
 
-            if not isinstance(comments, dict):
-                msg = f"Unexpected return value type from `jira.issue_get_comments`: {type(comments)}"
-                logger.error(msg)
-                raise TypeError(msg)
-
-            processed_comments = []
-            for comment in comments.get("comments", [])[:limit]:
-                processed_comment = {
-                    "id": comment.get("id"),
-                    "body": self._clean_text(comment.get("body", "")),
-                    "created": str(parse_date(comment.get("created"))),
-                    "updated": str(parse_date(comment.get("updated"))),
-                    "author": comment.get("author", {}).get("displayName", "Unknown"),
-                }
-                processed_comments.append(processed_comment)
-
-            return processed_comments
+            return self._process_comments(comments, limit)
         except Exception as e:
             logger.error(f"Error getting comments for issue {issue_key}: {str(e)}")
             raise Exception(f"Error getting comments: {str(e)}") from e
 
+    def _process_comments(self, comments: Any, limit: int) -> list[dict[str, Any]]:
+        """
+        Convert a raw comments response into simplified comment dictionaries.
+
+        Args:
+            comments: The raw response from the issue comments endpoint
+            limit: Maximum number of comments to return
+
+        Returns:
+            List of comments with author, creation date, and content
+
+        Raises:
+            TypeError: If the response is not a dictionary
+        """
+        if not isinstance(comments, dict):
+            msg = f"Unexpected return value type from `jira.issue_get_comments`: {type(comments)}"
+            logger.error(msg)
+            raise TypeError(msg)
+
+        processed_comments = []
+        for comment in comments.get("comments", [])[:limit]:
+            processed_comment = {
+                "id": comment.get("id"),
+                "body": self._clean_text(comment.get("body", "")),
+                "created": str(parse_date(comment.get("created"))),
+                "updated": str(parse_date(comment.get("updated"))),
+                "author": comment.get("author", {}).get("displayName", "Unknown"),
+            }
+            processed_comments.append(processed_comment)
+
+        return processed_comments
+
     def add_comment(self, issue_key: str, comment: str) -> dict[str, Any]:
         """
         Add a comment to an issue.
@@ -5,7 +5,12 @@ import os
 from dataclasses import dataclass
 from typing import Literal
 
-from ..utils.env import get_custom_headers, is_env_ssl_verify
+from ..utils.env import (
+    get_custom_headers,
+    get_env_int,
+    is_env_ssl_verify,
+    is_env_truthy,
+)
 from ..utils.oauth import (
     BYOAccessTokenOAuthConfig,
     OAuthConfig,
@@ -36,6 +41,10 @@ class JiraConfig:
     no_proxy: str | None = None  # Comma-separated list of hosts to bypass proxy
     socks_proxy: str | None = None  # SOCKS proxy URL (optional)
     custom_headers: dict[str, str] | None = None  # Custom HTTP headers
+    async_transport: bool = False  # Serve hot read calls on the async transport
+    # How Cloud searches obtain the total: "exact", "approximate" or "skip"
+    search_total: Literal["exact", "approximate", "skip"] = "exact"
+    search_total_cache_ttl: int = 0  # Seconds to reuse a query's total, 0 = off
 
     @property
     def is_cloud(self) -> bool:
@@ -127,6 +136,21 @@ class JiraConfig:
         # Custom headers - service-specific only
         custom_headers = get_custom_headers("JIRA_CUSTOM_HEADERS")
 
+        # Opt-in native async transport for hot read calls
+        async_transport = is_env_truthy("JIRA_ASYNC_TRANSPORT")
+
+        # How Cloud searches obtain the total result count
+        search_total = os.getenv("JIRA_SEARCH_TOTAL", "exact").strip().lower()
+        if search_total not in ("exact", "approximate", "skip"):
+            logger = logging.getLogger("mcp-atlassian.jira.config")
+            logger.warning(
+                f"Invalid JIRA_SEARCH_TOTAL value '{search_total}', using 'exact'"
+            )
+            search_total = "exact"
+        search_total_cache_ttl = get_env_int(
+            "JIRA_SEARCH_TOTAL_CACHE_TTL", 0, minimum=0
+        )
+
         return cls(
             url=url,
             auth_type=auth_type,
@@ -141,6 +165,9 @@ class JiraConfig:
             no_proxy=no_proxy,
             socks_proxy=socks_proxy,
             custom_headers=custom_headers,
+            async_transport=async_transport,
+            search_total=search_total,
+            search_total_cache_ttl=search_total_cache_ttl,
         )
 
     def is_auth_configured(self) -> bool:
@@ -0,0 +1,122 @@
+"""Catalog of the issue types and create-screen fields of Jira projects.
+
+Creating an issue looks up the project's issue types (to resolve Epic and
+Subtask type names) and the fields of one issue type (to find required
+fields), often several times for a single tool call. The full ``createmeta``
+expand that used to answer both is one of the largest payloads Jira serves.
+This catalog keeps the issue types of each project and the fields of each
+issue type that was actually needed, fetched from the paginated
+``createmeta/{project}/issuetypes`` endpoints.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from cachetools import TTLCache
+
+from ..utils.env import get_env_int
+
+DEFAULT_TTL = 3600
+DEFAULT_MAX_SIZE = 256
+
+
+def issue_types_name(project_key: str) -> str:
+    """Name of a project's issue types in the persistent metadata cache."""
+    return f"createmeta:{project_key}:issuetypes"
+
+
+def fields_name(project_key: str, issue_type_id: str) -> str:
+    """Name of an issue type's fields in the persistent metadata cache."""
+    return f"createmeta:{project_key}:fields:{issue_type_id}"
+
+
+class CreateMetaCatalog:
+    """LRU cache with TTL of project issue types and issue type fields.
+
+    The catalog belongs to one client, so it is scoped to one site and one
+    set of credentials.
+    """
+
+    def __init__(
+        self,
+        ttl: int = DEFAULT_TTL,
+        maxsize: int = DEFAULT_MAX_SIZE,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the catalog.
+
+        Args:
+            ttl: Seconds metadata is cached, 0 to disable the catalog
+            maxsize: Maximum number of projects and of issue types kept
+            timer: Monotonic clock, injectable for tests
+        """
+        self.ttl = ttl
+        self._issue_types: TTLCache[str, list[dict[str, Any]]] = TTLCache(
+            maxsize=maxsize, ttl=ttl, timer=timer
+        )
+        self._fields: TTLCache[tuple[str, str], list[dict[str, Any]]] = TTLCache(
+            maxsize=maxsize, ttl=ttl, timer=timer
+        )
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "CreateMetaCatalog":
+        """Create a catalog configured from environment variables.
+
+        Reads ``JIRA_CREATEMETA_CACHE_TTL`` (seconds) and
+        ``JIRA_CREATEMETA_CACHE_SIZE``.
+
+        Returns:
+            The configured catalog
+        """
+        return cls(
+            ttl=get_env_int("JIRA_CREATEMETA_CACHE_TTL", DEFAULT_TTL, minimum=0),
+            maxsize=get_env_int(
+                "JIRA_CREATEMETA_CACHE_SIZE", DEFAULT_MAX_SIZE, minimum=1
+            ),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether metadata is cached at all."""
+        return self.ttl > 0
+
+    def get_issue_types(self, project_key: str) -> list[dict[str, Any]] | None:
+        """Return the cached issue types of a project."""
+        with self._lock:
+            return self._issue_types.get(project_key.upper())
+
+    def put_issue_types(
+        self, project_key: str, issue_types: list[dict[str, Any]]
+    ) -> None:
+        """Remember the issue types of a project."""
+        with self._lock:
+            self._issue_types[project_key.upper()] = issue_types
+
+    def get_fields(
+        self, project_key: str, issue_type_id: str
+    ) -> list[dict[str, Any]] | None:
+        """Return the cached create fields of an issue type in a project."""
+        with self._lock:
+            return self._fields.get((project_key.upper(), str(issue_type_id)))
+
+    def put_fields(
+        self, project_key: str, issue_type_id: str, fields: list[dict[str, Any]]
+    ) -> None:
+        """Remember the create fields of an issue type in a project."""
+        with self._lock:
+            self._fields[(project_key.upper(), str(issue_type_id))] = fields
+
+    def invalidate(self, project_key: str | None = None) -> None:
+        """Drop the metadata of one project, or of every project."""
+        with self._lock:
+            if project_key is None:
+                self._issue_types.clear()
+                self._fields.clear()
+                return
+            project = project_key.upper()
+            self._issue_types.pop(project, None)
+            for key in [key for key in self._fields if key[0] == project]:
+                self._fields.pop(key, None)
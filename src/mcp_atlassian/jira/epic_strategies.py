@@ -0,0 +1,224 @@
+"""Cache of the JQL strategies that find the issues of an epic.
+
+How child issues point to their epic depends on the Jira deployment: the
+``parent`` field on team-managed and recent Cloud projects, an "Epic Link"
+custom field on company-managed and Server/Data Center projects, or a
+ScriptRunner JQL function. Finding the one that works costs up to ten
+searches. This cache remembers the strategy that worked for each project,
+the last one that worked anywhere on the site as the first guess for new
+projects, and the strategies the site rejected as invalid JQL. It also
+remembers which keys were verified to be epics.
+
+A strategy that finds nothing for an epic only means the epic is empty once
+it has found the issues of other epics of the same project; until then the
+remaining strategies are tried as well.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+
+from cachetools import TTLCache
+
+from ..utils.env import get_env_int
+
+DEFAULT_TTL = 3600
+DEFAULT_NEGATIVE_TTL = 3600
+DEFAULT_MAX_SIZE = 512
+
+# Key of the site-wide strategy among the per-project ones
+SITE_SCOPE = ""
+
+# Epics a project's strategy must have found issues for before an empty
+# result with it is trusted
+CONFIRMING_EPICS = 2
+
+# Link types tried when epics are related to their issues by issue links
+EPIC_LINK_TYPES = ("relates to", "blocks", "is blocked by", "is part of")
+
+# Epic Link custom field IDs common across Jira instances
+COMMON_EPIC_LINK_FIELDS = (
+    "customfield_10014",
+    "customfield_10008",
+    "customfield_10100",
+    "customfield_10001",
+    "customfield_10002",
+    "customfield_10003",
+    "customfield_10004",
+    "customfield_10005",
+    "customfield_10006",
+    "customfield_10007",
+    "customfield_11703",
+)
+
+
+def strategy_jql(strategy: str, epic_key: str) -> str:
+    """Build the JQL a strategy uses to find the issues of an epic.
+
+    Strategies are ``issueFunction``, ``parent``, ``epicLinkName``,
+    ``issueLink:<link type>`` and ``field:<field ID>``.
+
+    Args:
+        strategy: The strategy name
+        epic_key: The key of the epic
+
+    Returns:
+        The JQL query
+    """
+    kind, _, argument = strategy.partition(":")
+    if kind == "issueFunction":
+        return f'issueFunction in issuesScopedToEpic("{epic_key}")'
+    if kind == "parent":
+        return f'parent = "{epic_key}"'
+    if kind == "epicLinkName":
+        return f'"Epic Link" = "{epic_key}"'
+    if kind == "issueLink":
+        return f'issueLink = "{argument}" and issueLink = "{epic_key}"'
+    return f'"{argument}" = "{epic_key}"'
+
+
+def project_of(issue_key: str) -> str:
+    """Return the project key of an issue key, e.g. ``PROJ`` for ``PROJ-123``."""
+    return issue_key.rpartition("-")[0].upper()
+
+
+class EpicStrategyCache:
+    """LRU cache with TTL of epic issue strategies and verified epics.
+
+    The cache belongs to one client, so it is scoped to one site and one set
+    of credentials.
+    """
+
+    def __init__(
+        self,
+        ttl: int = DEFAULT_TTL,
+        negative_ttl: int = DEFAULT_NEGATIVE_TTL,
+        maxsize: int = DEFAULT_MAX_SIZE,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds a working strategy and a verified epic are cached
+            negative_ttl: Seconds a rejected strategy is skipped, 0 to disable
+            maxsize: Maximum number of projects and of epics kept
+            timer: Monotonic clock, injectable for tests
+        """
+        self.ttl = ttl
+        self._strategies: TTLCache[str, str] = TTLCache(
+            maxsize=maxsize, ttl=ttl, timer=timer
+        )
+        self._confirmations: TTLCache[str, frozenset[str]] = TTLCache(
+            maxsize=maxsize, ttl=ttl, timer=timer
+        )
+        self._epics: TTLCache[str, bool] = TTLCache(
+            maxsize=maxsize, ttl=ttl, timer=timer
+        )
+        self._rejected: TTLCache[str, bool] | None = (
+            TTLCache(maxsize=maxsize, ttl=negative_ttl, timer=timer)
+            if negative_ttl > 0
+            else None
+        )
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "EpicStrategyCache":
+        """Create a cache configured from environment variables.
+
+        Reads ``JIRA_EPIC_STRATEGY_CACHE_TTL`` and
+        ``JIRA_EPIC_STRATEGY_CACHE_NEGATIVE_TTL`` (seconds).
+
+        Returns:
+            The configured cache
+        """
+        return cls(
+            ttl=get_env_int("JIRA_EPIC_STRATEGY_CACHE_TTL", DEFAULT_TTL, minimum=0),
+            negative_ttl=get_env_int(
+                "JIRA_EPIC_STRATEGY_CACHE_NEGATIVE_TTL",
+                DEFAULT_NEGATIVE_TTL,
+                minimum=0,
+            ),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether strategies are cached at all."""
+        return self.ttl > 0
+
+    def get(self, project: str) -> str | None:
+        """Return the strategy that last worked for a project."""
+        with self._lock:
+            return self._strategies.get(project)
+
+    def get_site_default(self) -> str | None:
+        """Return the strategy that last worked for any project of the site."""
+        return self.get(SITE_SCOPE)
+
+    def record_success(
+        self, project: str, strategy: str, epic_key: str | None = None
+    ) -> None:
+        """Remember the strategy that found the issues of an epic in a project.
+
+        Args:
+            project: The project key
+            strategy: The strategy that found the issues
+            epic_key: The epic whose issues were found, confirming the strategy
+        """
+        with self._lock:
+            confirmed: frozenset[str] = frozenset()
+            if self._strategies.get(project) == strategy:
+                confirmed = self._confirmations.get(project, frozenset())
+            if epic_key is not None:
+                confirmed |= {epic_key.upper()}
+            self._strategies[project] = strategy
+            self._strategies[SITE_SCOPE] = strategy
+            self._confirmations[project] = confirmed
+
+    def is_confirmed(self, project: str) -> bool:
+        """Return whether a project's strategy found the issues of enough epics."""
+        with self._lock:
+            confirmed = self._confirmations.get(project, frozenset())
+            return len(confirmed) >= CONFIRMING_EPICS
+
+    def forget(self, project: str) -> None:
+        """Drop the strategy of a project, e.g. after it stopped working."""
+        with self._lock:
+            self._strategies.pop(project, None)
+            self._confirmations.pop(project, None)
+
+    def is_rejected(self, strategy: str) -> bool:
+        """Return whether the site recently rejected a strategy's JQL."""
+        if self._rejected is None:
+            return False
+        with self._lock:
+            return strategy in self._rejected
+
+    def record_rejected(self, strategy: str) -> None:
+        """Remember that the site rejected a strategy's JQL as invalid."""
+        if self._rejected is None:
+            return
+        with self._lock:
+            self._rejected[strategy] = True
+            for project, cached in list(self._strategies.items()):
+                if cached == strategy:
+                    self._strategies.pop(project, None)
+                    self._confirmations.pop(project, None)
+
+    def is_epic(self, issue_key: str) -> bool:
+        """Return whether an issue was recently verified to be an epic."""
+        with self._lock:
+            return issue_key.upper() in self._epics
+
+    def add_epic(self, issue_key: str) -> None:
+        """Remember that an issue is an epic."""
+        with self._lock:
+            self._epics[issue_key.upper()] = True
+
+    def invalidate(self) -> None:
+        """Drop every cached strategy, rejection and verified epic."""
+        with self._lock:
+            self._strategies.clear()
+            self._confirmations.clear()
+            self._epics.clear()
+            if self._rejected is not None:
+                self._rejected.clear()
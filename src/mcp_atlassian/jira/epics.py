@@ -1,10 +1,22 @@
 """Module for Jira epic operations."""
 
+import itertools
 import logging
+from collections.abc import Iterator
 from typing import Any
 
+from requests.exceptions import HTTPError
+
 from ..models.jira import JiraIssue
 from .client import JiraClient
+from .epic_strategies import (
+    COMMON_EPIC_LINK_FIELDS,
+    EPIC_LINK_TYPES,
+    EpicStrategyCache,
+    project_of,
+    strategy_jql,
+)
+from .fields import EPIC_LINK_FIELD_TYPE
 from .protocols import (
     FieldsOperationsProto,
     IssueOperationsProto,
@@ -15,6 +27,15 @@ from .protocols import (
 logger = logging.getLogger("mcp-jira")
 
 
+def _is_invalid_jql(error: Exception) -> bool:
+    """Return whether a search failed because Jira rejected the JQL itself."""
+    while error is not None:
+        if isinstance(error, HTTPError):
+            return error.response is not None and error.response.status_code == 400
+        error = error.__cause__
+    return False
+
+
 class EpicsMixin(
     JiraClient,
     FieldsOperationsProto,
@@ -375,6 +396,11 @@ class EpicsMixin(
                 {"customfield_11703": epic_key},  # Known from previous error
                 {"epic_link": epic_key},  # Sometimes used
             ]
+            # A field that found or linked the project's epic issues comes first
+            cache = self._get_epic_strategy_cache()
+            known = cache.get(project_of(epic_key)) if cache else None
+            if known and known.startswith("field:"):
+                custom_field_attempts.insert(0, {known[6:]: epic_key})
 
             for fields in custom_field_attempts:
                 try:
@@ -386,10 +412,9 @@ class EpicsMixin(
                         f"Successfully linked {issue_key} to {epic_key} using field: {field_id}"
                     )
 
-                    # If we get here, it worked - update our cached field ID
-                    if self._field_ids_cache is None:
-                        self._field_ids_cache = []
-                    self._field_ids_cache.append({"id": field_id, "name": "epic_link"})
+                    # If we get here, it worked - remember the field for the project
+                    if cache is not None and field_id.startswith("customfield_"):
+                        cache.record_success(project_of(epic_key), f"field:{field_id}")
                     return self.get_issue(issue_key)
                 except Exception as e:
                     logger.info(f"Couldn't link using fields {fields}: {str(e)}")
@@ -428,12 +453,119 @@ class EpicsMixin(
                 raise Exception(f"Error linking issue to epic: {str(e)}")
             raise
 
+    _epic_strategy_cache: EpicStrategyCache | None = None
+
+    def _get_epic_strategy_cache(self) -> EpicStrategyCache | None:
+        """
+        Get the cache of epic issue strategies, creating it on first use.
+
+        Returns:
+            The strategy cache, or None when strategy caching is disabled
+        """
+        if self._epic_strategy_cache is None:
+            self._epic_strategy_cache = EpicStrategyCache.from_env()
+        return self._epic_strategy_cache if self._epic_strategy_cache.enabled else None
+
+    def _verify_epic(self, epic_key: str) -> None:
+        """
+        Check that an issue is an Epic.
+
+        Args:
+            epic_key: The key of the issue
+
+        Raises:
+            ValueError: If the issue is not an Epic
+        """
+        epic = self.jira.get_issue(epic_key)
+        if not isinstance(epic, dict):
+            msg = f"Unexpected return value type from `jira.get_issue`: {type(epic)}"
+            logger.error(msg)
+            raise TypeError(msg)
+        fields_data = epic.get("fields", {})
+
+        # Check if the issue is an Epic
+        issuetype_data = fields_data.get("issuetype", {})
+        issue_type_name = issuetype_data.get("name", "")
+
+        # Check if it's an Epic by looking for "epic" in the name (case-insensitive)
+        # This handles localized names like "에픽", "エピック", etc.
+        if "epic" in issue_type_name.lower() or issue_type_name in [
+            "에픽",
+            "エピック",
+        ]:
+            return
+
+        # Try to verify via JQL as a fallback
+        try:
+            verify_jql = f'key = "{epic_key}" AND issuetype = Epic'
+            verify_result = self.search_issues(verify_jql, limit=1)
+            if verify_result and len(verify_result.issues) > 0:
+                return
+        except Exception as e:
+            # If JQL fails, stick with our previous determination
+            logger.debug(f"JQL verification failed: {e}")
+
+        error_msg = (
+            f"Issue {epic_key} is not an Epic, it is a "
+            f"{issue_type_name or 'unknown type'}"
+        )
+        raise ValueError(error_msg)
+
+    def _epic_strategies(self) -> Iterator[str]:
+        """
+        Yield the strategies for finding epic issues, most common first.
+
+        The Epic Link field is only looked up once the strategies before it
+        have been tried.
+        """
+        # Works in many Jira instances with ScriptRunner
+        yield "issueFunction"
+        # Common in team-managed projects and recent Jira Cloud
+        yield "parent"
+        epic_link_field = self._find_epic_link_field(self.get_field_ids_to_epic())
+        if epic_link_field:
+            yield f"field:{epic_link_field}"
+        yield "epicLinkName"
+        for link_type in EPIC_LINK_TYPES:
+            yield f"issueLink:{link_type}"
+        # Last resort: each common Epic Link field ID directly
+        for field_id in COMMON_EPIC_LINK_FIELDS:
+            yield f"field:{field_id}"
+
+    def _search_epic_strategy(
+        self, strategy: str, epic_key: str, start: int, limit: int
+    ) -> list[JiraIssue] | None:
+        """
+        Search the issues of an epic with one strategy.
+
+        Args:
+            strategy: The strategy, see ``epic_strategies.strategy_jql``
+            epic_key: The key of the epic
+            start: Starting index for pagination
+            limit: Maximum number of issues to return
+
+        Returns:
+            The issues found, or None if the strategy found nothing
+        """
+        jql = strategy_jql(strategy, epic_key)
+        logger.info(f"Trying to get epic issues with {strategy}: {jql}")
+        if strategy == "issueFunction":
+            # A valid issueFunction query is authoritative, even without results
+            search_result = self.search_issues(jql, start=start, limit=limit)
+            return search_result.issues if search_result else None
+        return self._get_epic_issues_by_jql(epic_key, jql, start, limit) or None
+
     def get_epic_issues(
         self, epic_key: str, start: int = 0, limit: int = 50
     ) -> list[JiraIssue]:
         """
         Get all issues linked to a specific epic.
 
+        Several JQL strategies are tried in turn. The one that works is cached
+        per project (and as a first guess for the whole site), and strategies
+        the site rejects as invalid JQL are skipped for a while, so repeated
+        lookups take a single search.
+
         Args:
             epic_key: The key of the epic (e.g. 'PROJ-123')
             start: Starting index for pagination
@@ -447,192 +579,56 @@ class EpicsMixin(
             Exception: If there is an error getting epic issues
         """
         try:
-            # First, check if the issue is an Epic
-            epic = self.jira.get_issue(epic_key)
-            if not isinstance(epic, dict):
-                msg = (
-                    f"Unexpected return value type from `jira.get_issue`: {type(epic)}"
-                )
-                logger.error(msg)
-                raise TypeError(msg)
-            fields_data = epic.get("fields", {})
-
-            # Check if the issue is an Epic
-            issuetype_data = fields_data.get("issuetype", {})
-            issue_type_name = issuetype_data.get("name", "")
-
-            # Check if it's an Epic by looking for "epic" in the name (case-insensitive)
-            # This handles localized names like "에픽", "エピック", etc.
-            if "epic" not in issue_type_name.lower() and issue_type_name not in [
-                "에픽",
-                "エピック",
-            ]:
-                # Try to verify via JQL as a fallback
-                is_epic = False
-                try:
-                    verify_jql = f'key = "{epic_key}" AND issuetype = Epic'
-                    verify_result = self.search_issues(verify_jql, limit=1)
-                    if verify_result and len(verify_result.issues) > 0:
-                        is_epic = True
-                except Exception as e:
-                    # If JQL fails, stick with our previous determination
-                    logger.debug(f"JQL verification failed: {e}")
-
-                if not is_epic:
-                    error_msg = (
-                        f"Issue {epic_key} is not an Epic, it is a "
-                        f"{issue_type_name or 'unknown type'}"
-                    )
-                    raise ValueError(error_msg)
+            cache = self._get_epic_strategy_cache()
 
-            # Track which methods we've tried
-            tried_methods = set()
-            issues = []
-
-            # Find the Epic Link field
-            field_ids = self.get_field_ids_to_epic()
-            epic_link_field = self._find_epic_link_field(field_ids)
-
-            # METHOD 1: Try with 'issueFunction in issuesScopedToEpic' - this works in many Jira instances
-            if "issueFunction" not in tried_methods:
-                tried_methods.add("issueFunction")
-                try:
-                    jql = f'issueFunction in issuesScopedToEpic("{epic_key}")'
-                    logger.info(f"Trying to get epic issues with issueFunction: {jql}")
-
-                    search_result = self.search_issues(jql, start=start, limit=limit)
-                    if search_result:
-                        logger.info(
-                            f"Successfully found {len(search_result.issues)} issues for epic {epic_key} using issueFunction"
-                        )
-                        return search_result.issues
-                except Exception as e:
-                    # Log exception but continue with fallback
-                    logger.warning(
-                        f"Error searching epic issues with issueFunction: {str(e)}"
-                    )
-
-            # METHOD 2: Try using parent relationship - common in many Jira setups
-            if "parent" not in tried_methods:
-                tried_methods.add("parent")
-                try:
-                    jql = f'parent = "{epic_key}"'
-                    logger.info(
-                        f"Trying to get epic issues with parent relationship: {jql}"
-                    )
-                    issues = self._get_epic_issues_by_jql(epic_key, jql, start, limit)
-                    if issues:
-                        logger.info(
-                            f"Successfully found {len(issues)} issues for epic {epic_key} using parent relationship"
-                        )
-                        return issues
-                except Exception as parent_error:
-                    logger.warning(
-                        f"Error with parent relationship approach: {str(parent_error)}"
-                    )
+            # First, check if the issue is an Epic
+            if cache is None or not cache.is_epic(epic_key):
+                self._verify_epic(epic_key)
+                if cache is not None:
+                    cache.add_epic(epic_key)
+
+            project = project_of(epic_key)
+            known = cache.get(project) if cache else None
+            site_default = cache.get_site_default() if cache else None
+            candidates = itertools.chain(
+                [strategy for strategy in (known, site_default) if strategy],
+                self._epic_strategies(),
+            )
 
-            # METHOD 3: If we found an Epic Link field, try using it
-            if epic_link_field and "epicLinkField" not in tried_methods:
-                tried_methods.add("epicLinkField")
+            tried: set[str] = set()
+            for strategy in candidates:
+                if strategy in tried or (cache and cache.is_rejected(strategy)):
+                    continue
+                tried.add(strategy)
                 try:
-                    jql = f'"{epic_link_field}" = "{epic_key}"'
-                    logger.info(
-                        f"Trying to get epic issues with epic link field: {jql}"
+                    issues = self._search_epic_strategy(
+                        strategy, epic_key, start, limit
                     )
-                    issues = self._get_epic_issues_by_jql(epic_key, jql, start, limit)
-                    if issues:
-                        logger.info(
-                            f"Successfully found {len(issues)} issues for epic {epic_key} using epic link field {epic_link_field}"
-                        )
-                        return issues
                 except Exception as e:
-                    logger.warning(
-                        f"Error using epic link field {epic_link_field}: {str(e)}"
-                    )
+                    logger.warning(f"Error searching epic issues with {strategy}: {e}")
+                    if cache is not None:
+                        if _is_invalid_jql(e):
+                            cache.record_rejected(strategy)
+                        elif strategy == known:
+                            cache.forget(project)
+                    continue
 
-            # METHOD 4: Try using 'Epic Link' as a textual field name
-            if "epicLinkName" not in tried_methods:
-                tried_methods.add("epicLinkName")
-                try:
-                    jql = f'"Epic Link" = "{epic_key}"'
+                if issues is not None:
                     logger.info(
-                        f"Trying to get epic issues with 'Epic Link' field name: {jql}"
+                        f"Successfully found {len(issues)} issues for epic {epic_key} using {strategy}"
                     )
-                    issues = self._get_epic_issues_by_jql(epic_key, jql, start, limit)
-                    if issues:
-                        logger.info(
-                            f"Successfully found {len(issues)} issues for epic {epic_key} using 'Epic Link' field name"
-                        )
-                        return issues
-                except Exception as e:
-                    logger.warning(f"Error using 'Epic Link' field name: {str(e)}")
-
-            # METHOD 5: Try using issue links with a specific link type
-            if "issueLinks" not in tried_methods:
-                tried_methods.add("issueLinks")
-                try:
-                    # Try to find issues linked to this epic with standard link types
-                    link_types = ["relates to", "blocks", "is blocked by", "is part of"]
-                    for link_type in link_types:
-                        jql = f'issueLink = "{link_type}" and issueLink = "{epic_key}"'
-                        logger.info(
-                            f"Trying to get epic issues with issue links: {jql}"
-                        )
-                        try:
-                            issues = self._get_epic_issues_by_jql(
-                                epic_key, jql, start, limit
-                            )
-                            if issues:
-                                logger.info(
-                                    f"Successfully found {len(issues)} issues for epic {epic_key} using issue links with type '{link_type}'"
-                                )
-                                return issues
-                        except Exception:
-                            # Just try the next link type
-                            continue
-                except Exception as e:
-                    logger.warning(f"Error using issue links approach: {str(e)}")
-
-            # METHOD 6: Last resort - try each common Epic Link field ID directly
-            if "commonFields" not in tried_methods:
-                tried_methods.add("commonFields")
-                common_epic_fields = [
-                    "customfield_10014",
-                    "customfield_10008",
-                    "customfield_10100",
-                    "customfield_10001",
-                    "customfield_10002",
-                    "customfield_10003",
-                    "customfield_10004",
-                    "customfield_10005",
-                    "customfield_10006",
-                    "customfield_10007",
-                    "customfield_11703",
-                ]
-
-                for field_id in common_epic_fields:
-                    try:
-                        jql = f'"{field_id}" = "{epic_key}"'
-                        logger.info(
-                            f"Trying to get epic issues with common field ID: {jql}"
-                        )
-                        issues = self._get_epic_issues_by_jql(
-                            epic_key, jql, start, limit
-                        )
-                        if issues:
-                            logger.info(
-                                f"Successfully found {len(issues)} issues for epic {epic_key} using field ID {field_id}"
-                            )
-                            # Cache this successful field ID for future use
-                            if self._field_ids_cache is None:
-                                self._field_ids_cache = []
-                            self._field_ids_cache.append(
-                                {"id": field_id, "name": "epic_link"}
-                            )
-                            return issues
-                    except Exception:
-                        # Just try the next field ID
-                        continue
+                    if cache is not None:
+                        cache.record_success(project, strategy, epic_key)
+                    return issues
+
+                if (
+                    strategy == known
+                    and cache is not None
+                    and cache.is_confirmed(project)
+                ):
+                    # The strategy this project uses found nothing: the epic is empty
+                    logger.info(f"No issues found for epic {epic_key} using {strategy}")
+                    return []
 
             # If we've tried everything and found no issues, return an empty list
             logger.warning(
@@ -739,16 +735,18 @@ class EpicsMixin(
         except Exception as e:
             logger.warning(f"Error detecting epic link field from issues: {str(e)}")
 
-        # As a last resort, look for any customfield that starts with customfield_
-        # and has "epic" in its schema name or description
+        # As a last resort, inspect the cached field definitions: first the
+        # Jira Software epic link type, then any custom field with "epic" in
+        # its schema type, name or description
         try:
-            all_fields = self.jira.get_all_fields()
-            if not isinstance(all_fields, list):
-                msg = f"Unexpected return value type from `jira.get_all_fields`: {type(all_fields)}"
-                logger.error(msg)
-                raise TypeError(msg)
+            epic_link_ids = self.get_field_ids_by_custom_type(EPIC_LINK_FIELD_TYPE)
+            if epic_link_ids:
+                logger.info(
+                    f"Found Epic Link field by schema inspection: {epic_link_ids[0]}"
+                )
+                return epic_link_ids[0]
 
-            for field in all_fields:
+            for field in self.get_fields():
                 field_id = field.get("id", "")
                 schema = field.get("schema", {})
                 custom_type = schema.get("custom", "")
@@ -0,0 +1,375 @@
+"""Shared, per-site registry of Jira field definitions.
+
+Field definitions (``GET /rest/api/2/field``) are identical for every user of
+a Jira site and can be large (thousands of custom fields), so they are fetched
+once per TTL per site and shared by all fetchers instead of being downloaded
+again by every short-lived fetcher.
+"""
+
+import heapq
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any
+
+from cachetools import LRUCache
+from thefuzz import fuzz
+
+from ..utils.env import get_env_int
+
+logger = logging.getLogger("mcp-jira")
+
+DEFAULT_TTL = 3600
+DEFAULT_STALE_TTL = 86400
+DEFAULT_MAX_SITES = 64
+
+# Minimum number of fields scored by fuzzy matching after trigram pruning
+MIN_SHORTLIST = 100
+# Shortlist size relative to the requested number of results
+SHORTLIST_FACTOR = 20
+
+FieldLoader = Callable[[], Any]
+
+
+def _trigrams(text: str) -> set[str]:
+    """Return the set of character trigrams of a string."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class FieldSearchIndex:
+    """Trigram inverted index for fuzzy field search.
+
+    Matching every keyword against every field's id, key, name and clause
+    names is slow on sites with thousands of custom fields. This index prunes
+    the catalog to the fields sharing the most trigrams with the keyword and
+    only runs fuzzy scoring on that shortlist.
+    """
+
+    def __init__(self, fields: list[dict[str, Any]]) -> None:
+        """Build the index.
+
+        Args:
+            fields: Field definitions as returned by ``jira.get_all_fields()``
+        """
+        self.fields = fields
+        self._candidates: list[tuple[str, ...]] = []
+        # Flattened candidate names: owning field position and trigram count
+        self._owners: list[int] = []
+        self._gram_counts: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+        for position, field_def in enumerate(fields):
+            names = [
+                field_def.get("id", ""),
+                field_def.get("key", ""),
+                field_def.get("name", ""),
+                *field_def.get("clauseNames", []),
+            ]
+            candidates = tuple(dict.fromkeys(name.lower() for name in names if name))
+            self._candidates.append(candidates)
+            for candidate in candidates:
+                grams = _trigrams(candidate)
+                candidate_id = len(self._owners)
+                self._owners.append(position)
+                self._gram_counts.append(len(grams))
+                for gram in grams:
+                    self._postings.setdefault(gram, []).append(candidate_id)
+
+    def _score(self, keyword: str, position: int) -> int:
+        """Best fuzzy partial match between the keyword and a field's names."""
+        return max(
+            (fuzz.partial_ratio(keyword, name) for name in self._candidates[position]),
+            default=0,
+        )
+
+    def _shortlist(self, keyword: str, size: int) -> list[int]:
+        """Positions of the fields whose names best overlap the keyword's trigrams.
+
+        Overlap is measured against the smaller trigram set, mirroring
+        ``partial_ratio``, which matches the shorter string inside the longer
+        one: a short field name contained in a long keyword ranks as high as a
+        long field name containing the keyword.
+        """
+        grams = _trigrams(keyword)
+        hits: dict[int, int] = {}
+        for gram in grams:
+            for candidate_id in self._postings.get(gram, ()):
+                hits[candidate_id] = hits.get(candidate_id, 0) + 1
+
+        overlaps: dict[int, float] = {}
+        for candidate_id, shared in hits.items():
+            overlap = shared / min(len(grams), self._gram_counts[candidate_id])
+            position = self._owners[candidate_id]
+            if overlap > overlaps.get(position, 0.0):
+                overlaps[position] = overlap
+        if len(overlaps) <= size:
+            return sorted(overlaps)
+        return sorted(heapq.nlargest(size, overlaps, key=overlaps.__getitem__))
+
+    def search(self, keyword: str, limit: int = 10) -> list[dict[str, Any]]:
+        """Return the fields that best match the keyword.
+
+        Keywords shorter than a trigram, and keywords whose shortlist cannot
+        fill ``limit`` results, are scored against the whole catalog.
+
+        Args:
+            keyword: The search keyword
+            limit: Maximum number of results to return
+
+        Returns:
+            Matching field definitions, best match first
+        """
+        if limit <= 0:
+            return []
+        keyword = keyword.lower()
+        positions: list[int] | range = range(len(self.fields))
+        if len(keyword) >= 3:
+            shortlist = self._shortlist(
+                keyword, max(MIN_SHORTLIST, limit * SHORTLIST_FACTOR)
+            )
+            if len(shortlist) >= limit:
+                positions = shortlist
+
+        # Positions are in catalog order, so ties keep the catalog order
+        best = heapq.nlargest(
+            limit, positions, key=lambda position: self._score(keyword, position)
+        )
+        return [self.fields[position] for position in best]
+
+
+@dataclass(frozen=True)
+class FieldIndex:
+    """An immutable snapshot of a site's fields with prebuilt lookup indexes.
+
+    Attributes:
+        fields: The field definitions as returned by Jira
+        name_to_id: Lowercase field name -> field ID, plus each ID mapped to itself
+        by_id: Field ID -> field definition
+        clause_to_id: Lowercase JQL clause name -> field ID
+        custom_type_to_ids: Custom field type (``schema.custom``) -> field IDs
+        fetched_at: Monotonic time at which the fields were fetched
+    """
+
+    fields: list[dict[str, Any]]
+    name_to_id: dict[str, str] = field(default_factory=dict)
+    by_id: dict[str, dict[str, Any]] = field(default_factory=dict)
+    clause_to_id: dict[str, str] = field(default_factory=dict)
+    custom_type_to_ids: dict[str, list[str]] = field(default_factory=dict)
+    fetched_at: float = 0.0
+
+    @cached_property
+    def search(self) -> FieldSearchIndex:
+        """Fuzzy search index, built on first use once per snapshot."""
+        return FieldSearchIndex(self.fields)
+
+    @classmethod
+    def build(cls, fields: list[dict[str, Any]], fetched_at: float) -> "FieldIndex":
+        """Build the lookup indexes for a list of field definitions.
+
+        Args:
+            fields: Field definitions as returned by ``jira.get_all_fields()``
+            fetched_at: Monotonic time at which the fields were fetched
+
+        Returns:
+            The populated index
+        """
+        name_map: dict[str, str] = {}
+        id_map: dict[str, str] = {}
+        by_id: dict[str, dict[str, Any]] = {}
+        clause_to_id: dict[str, str] = {}
+        custom_type_to_ids: dict[str, list[str]] = {}
+        for field_def in fields:
+            field_id = field_def.get("id")
+            if not field_id:
+                continue
+            id_map[field_id] = field_id
+            by_id.setdefault(field_id, field_def)
+            field_name = field_def.get("name")
+            if field_name:
+                # First definition wins on name collisions
+                name_map.setdefault(field_name.lower(), field_id)
+            for clause_name in field_def.get("clauseNames") or []:
+                clause_to_id.setdefault(clause_name.lower(), field_id)
+            custom_type = (field_def.get("schema") or {}).get("custom")
+            if custom_type:
+                custom_type_to_ids.setdefault(custom_type, []).append(field_id)
+
+        return cls(
+            fields=fields,
+            name_to_id=name_map | id_map,
+            by_id=by_id,
+            clause_to_id=clause_to_id,
+            custom_type_to_ids=custom_type_to_ids,
+            fetched_at=fetched_at,
+        )
+
+
+class FieldRegistry:
+    """Process-wide cache of :class:`FieldIndex` snapshots keyed by Jira URL.
+
+    Entries younger than ``ttl`` are served directly. Entries older than
+    ``ttl`` but younger than ``ttl + stale_ttl`` are still served, while a
+    single background thread refreshes them (stale-while-revalidate). Missing
+    or expired entries are loaded synchronously, with concurrent callers for
+    the same site waiting on one request. A ``ttl`` of 0 disables sharing.
+    """
+
+    def __init__(
+        self,
+        ttl: int = DEFAULT_TTL,
+        stale_ttl: int = DEFAULT_STALE_TTL,
+        max_sites: int = DEFAULT_MAX_SITES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            ttl: Seconds a snapshot is considered fresh
+            stale_ttl: Seconds past ``ttl`` a snapshot may still be served
+                while it is refreshed in the background
+            max_sites: Maximum number of sites kept (least recently used evicted)
+            clock: Monotonic clock, injectable for tests
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._entries: LRUCache[str, FieldIndex] = LRUCache(maxsize=max_sites)
+        self._lock = threading.Lock()
+        self._load_locks: dict[str, threading.Lock] = {}
+        self._refreshing: set[str] = set()
+
+    @classmethod
+    def from_env(cls) -> "FieldRegistry":
+        """Create a registry configured from environment variables.
+
+        Reads ``JIRA_FIELDS_CACHE_TTL`` and ``JIRA_FIELDS_CACHE_STALE_TTL``
+        (seconds).
+
+        Returns:
+            The configured registry
+        """
+        return cls(
+            ttl=get_env_int("JIRA_FIELDS_CACHE_TTL", DEFAULT_TTL, minimum=0),
+            stale_ttl=get_env_int(
+                "JIRA_FIELDS_CACHE_STALE_TTL", DEFAULT_STALE_TTL, minimum=0
+            ),
+        )
+
+    def get(
+        self, key: str, loader: FieldLoader, *, refresh: bool = False
+    ) -> FieldIndex:
+        """Get the field index for a site, loading it if needed.
+
+        Args:
+            key: The site key (the Jira base URL)
+            loader: Callable returning the site's field definitions
+            refresh: When True, bypass the cache and reload synchronously
+
+        Returns:
+            The site's field index
+
+        Raises:
+            TypeError: If the loader does not return a list
+            Exception: Any error raised by the loader on a synchronous load
+        """
+        if self.ttl <= 0:
+            return self._load(loader)
+
+        if not refresh:
+            index = self._lookup(key, loader)
+            if index is not None:
+                return index
+
+        with self._load_lock(key):
+            if not refresh:
+                # Another caller may have loaded the site while we waited
+                index = self._lookup(key, loader)
+                if index is not None:
+                    return index
+            index = self._load(loader)
+            with self._lock:
+                self._entries[key] = index
+            return index
+
+    def peek(self, key: str) -> FieldIndex | None:
+        """Return the cached index for a site without loading or refreshing it."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Drop the cached fields for one site, or for all sites.
+
+        Args:
+            key: The site key to invalidate, or None to clear every site
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+        logger.debug(f"Invalidated Jira field cache for {key or 'all sites'}")
+
+    def _lookup(self, key: str, loader: FieldLoader) -> FieldIndex | None:
+        """Return a servable cached index, scheduling a refresh if it is stale."""
+        with self._lock:
+            index = self._entries.get(key)
+            if index is None:
+                return None
+            age = self._clock() - index.fetched_at
+            if age < self.ttl:
+                return index
+            if age >= self.ttl + self.stale_ttl:
+                return None
+            if key in self._refreshing:
+                return index
+            self._refreshing.add(key)
+
+        threading.Thread(
+            target=self._refresh,
+            args=(key, loader),
+            name=f"jira-fields-refresh-{key}",
+            daemon=True,
+        ).start()
+        return index
+
+    def _refresh(self, key: str, loader: FieldLoader) -> None:
+        """Reload a stale site in the background, keeping the old snapshot on error."""
+        try:
+            index = self._load(loader)
+            with self._lock:
+                self._entries[key] = index
+            logger.debug(f"Refreshed Jira field cache for {key}")
+        except Exception as e:  # noqa: BLE001 - Stale data stays usable
+            logger.warning(f"Background refresh of Jira fields for {key} failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _load(self, loader: FieldLoader) -> FieldIndex:
+        """Call the loader and index its result."""
+        fields = loader()
+        if not isinstance(fields, list):
+            msg = f"Unexpected return value type from `jira.get_all_fields`: {type(fields)}"
+            logger.error(msg)
+            raise TypeError(msg)
+        index = FieldIndex.build(fields, fetched_at=self._clock())
+        logger.debug(f"Indexed {len(fields)} Jira fields")
+        return index
+
+    def _load_lock(self, key: str) -> threading.Lock:
+        """Get the lock serializing synchronous loads of one site."""
+        with self._lock:
+            return self._load_locks.setdefault(key, threading.Lock())
+
+
+_registry: FieldRegistry | None = None
+
+
+def get_field_registry() -> FieldRegistry:
+    """Get the process-wide field registry, creating it from the environment."""
+    global _registry
+    if _registry is None:
+        _registry = FieldRegistry.from_env()
+    return _registry
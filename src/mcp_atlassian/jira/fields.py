@@ -3,13 +3,16 @@
 import logging
 from typing import Any
 
-from thefuzz import fuzz
-
 from .client import JiraClient
+from .field_registry import FieldIndex, get_field_registry
 from .protocols import EpicOperationsProto, UsersOperationsProto
 
 logger = logging.getLogger("mcp-jira")
 
+# Custom field types (``schema.custom``) of the Jira Software epic fields
+EPIC_LINK_FIELD_TYPE = "com.pyxis.greenhopper.jira:gh-epic-link"
+EPIC_NAME_FIELD_TYPE = "com.pyxis.greenhopper.jira:gh-epic-label"
+
 
 class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
     """Mixin for Jira field operations.
@@ -20,11 +23,16 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
     """
 
     _field_name_to_id_map: dict[str, str] | None = None  # Cache for name -> id mapping
+    _field_index: FieldIndex | None = None  # Shared registry snapshot
 
     def get_fields(self, refresh: bool = False) -> list[dict[str, Any]]:
         """
         Get all available fields from Jira.
 
+        Fields are shared across fetchers for the same Jira URL through the
+        process-wide field registry, so they are downloaded once per TTL per
+        site rather than once per fetcher.
+
         Args:
             refresh: When True, forces a refresh from the server instead of using cache
 
@@ -32,63 +40,95 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             List of field definitions
         """
         try:
-            # Use cached field data if available and refresh is not requested
-            if self._field_ids_cache is not None and not refresh:
-                return self._field_ids_cache
-
-            if refresh:
-                self._field_name_to_id_map = (
-                    None  # Clear name map cache if refreshing fields
+            registry = get_field_registry()
+            # Fields set on the instance directly, or with sharing disabled,
+            # are served as they are; a registry snapshot is re-checked so
+            # refreshes and invalidations reach long-lived fetchers
+            index = self._field_index
+            if (
+                self._field_ids_cache is not None
+                and not refresh
+                and (
+                    index is None
+                    or index.fields is not self._field_ids_cache
+                    or registry.ttl <= 0
                 )
+            ):
+                return self._field_ids_cache
 
-            # Fetch fields from Jira API
-            fields = self.jira.get_all_fields()
-            if not isinstance(fields, list):
-                msg = f"Unexpected return value type from `jira.get_all_fields`: {type(fields)}"
-                logger.error(msg)
-                raise TypeError(msg)
-
-            # Cache the fields
-            self._field_ids_cache = fields
-
-            # Regenerate the name map upon fetching new fields
-            self._generate_field_map(force_regenerate=True)
+            # Only a cold start may use the persisted catalog; refreshes of a
+            # cached site go to Jira and update the persisted copy
+            persisted_ok = not refresh and registry.peek(self.jira.url) is None
+            index = registry.get(
+                self.jira.url,
+                lambda: self._load_metadata(
+                    "fields", self.jira.get_all_fields, refresh=not persisted_ok
+                ),
+                refresh=refresh,
+            )
 
-            # Log available fields for debugging
-            self._log_available_fields(fields)
+            if index is not self._field_index:
+                # Cache the fields and their prebuilt name map on the instance
+                self._field_index = index
+                self._field_ids_cache = index.fields
+                self._field_name_to_id_map = index.name_to_id
 
-            return fields
+            return index.fields
 
         except Exception as e:
             logger.error(f"Error getting Jira fields: {str(e)}")
             return []
 
+    def invalidate_field_cache(self) -> None:
+        """Drop the cached fields for this Jira site.
+
+        Clears both this fetcher's cache and the shared registry entry, so the
+        next lookup from any fetcher for the same site fetches fresh fields.
+        """
+        get_field_registry().invalidate(self.jira.url)
+        self._field_index = None
+        self._field_ids_cache = None
+        self._field_name_to_id_map = None
+
+    def _get_field_index(self, fields: list[dict[str, Any]]) -> FieldIndex | None:
+        """Return the prebuilt index if it was built from ``fields``."""
+        index = self._field_index
+        if index is not None and index.fields is fields:
+            return index
+        return None
+
+    def get_field_ids_by_custom_type(self, custom_type: str) -> list[str]:
+        """
+        Get the IDs of the fields of a custom field type.
+
+        Args:
+            custom_type: The custom field type (``schema.custom``), e.g.
+                ``com.pyxis.greenhopper.jira:gh-epic-link``
+
+        Returns:
+            The matching field IDs, in field list order
+        """
+        fields = self.get_fields()
+        index = self._get_field_index(fields) or FieldIndex.build(fields, 0.0)
+        return index.custom_type_to_ids.get(custom_type, [])
+
     def _generate_field_map(self, force_regenerate: bool = False) -> dict[str, str]:
         """Generates and caches a map of lowercase field names to field IDs."""
         if self._field_name_to_id_map is not None and not force_regenerate:
+            if self._field_index is not None:
+                # Picks up a newer shared snapshot along with its name map
+                self.get_fields()
             return self._field_name_to_id_map
 
         # Ensure fields are loaded into cache first
-        fields = (
-            self.get_fields()
-        )  # Uses cache if available unless force_regenerate was True
+        fields = self.get_fields(refresh=force_regenerate)
         if not fields:
             self._field_name_to_id_map = {}
             return {}
 
-        name_map: dict[str, str] = {}
-        id_map: dict[str, str] = {}  # Also map ID to ID for consistency
-        for field in fields:
-            field_id = field.get("id")
-            field_name = field.get("name")
-            if field_id:
-                id_map[field_id] = field_id  # Map ID to itself
-                if field_name:
-                    # Store lowercase name -> ID. Handle potential name collisions if necessary.
-                    name_map.setdefault(field_name.lower(), field_id)
-
-        # Combine maps, ensuring IDs can also be looked up directly
-        self._field_name_to_id_map = name_map | id_map
+        # Reuse the registry's prebuilt map unless the fields were set directly
+        index = self._get_field_index(fields) or FieldIndex.build(fields, 0.0)
+        self._field_name_to_id_map = index.name_to_id
         logger.debug(
             f"Generated/Updated field name map: {len(self._field_name_to_id_map)} entries"
         )
@@ -118,6 +158,10 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             # Fallback: Check if the input IS an ID (using original casing)
             elif field_name in field_map:  # Checks the id_map part
                 return field_map[field_name]
+            elif self._field_index is not None and (
+                normalized_name in self._field_index.clause_to_id
+            ):  # JQL clause names such as "cf[10010]"
+                return self._field_index.clause_to_id[normalized_name]
             else:
                 logger.warning(f"Field '{field_name}' not found in generated map.")
                 return None
@@ -142,9 +186,14 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
         try:
             fields = self.get_fields(refresh=refresh)
 
-            for field in fields:
-                if field.get("id") == field_id:
-                    return field
+            index = self._get_field_index(fields)
+            if index is not None:
+                if field_id in index.by_id:
+                    return index.by_id[field_id]
+            else:
+                for field in fields:
+                    if field.get("id") == field_id:
+                        return field
 
             logger.warning(f"Field with ID '{field_id}' not found")
             return None
@@ -181,6 +230,10 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
         """
         Get required fields for creating an issue of a specific type in a project.
 
+        The issue types and field metadata come from the createmeta catalog,
+        so they expire with it and are refreshed by
+        ``refresh_project_createmeta``.
+
         Args:
             issue_type: The issue type (e.g., 'Bug', 'Story', 'Epic')
             project_key: The project key (e.g., 'PROJ')
@@ -188,18 +241,6 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
         Returns:
             Dictionary mapping required field names to their definitions
         """
-        # Initialize cache if it doesn't exist
-        if not hasattr(self, "_required_fields_cache"):
-            self._required_fields_cache = {}
-
-        # Check cache first
-        cache_key = (project_key, issue_type)
-        if cache_key in self._required_fields_cache:
-            logger.debug(
-                f"Returning cached required fields for {issue_type} in {project_key}"
-            )
-            return self._required_fields_cache[cache_key]
-
         try:
             # Step 1: Get the ID for the given issue type name within the project
             if not hasattr(self, "get_project_issue_types"):
@@ -221,26 +262,27 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
                 )
                 return {}
 
-            # Step 2: Call the correct API method to get field metadata
-            meta = self.jira.issue_createmeta_fieldtypes(
-                project=project_key, issue_type_id=issue_type_id
-            )
+            # Step 2: Get the field metadata of that issue type only
+            if hasattr(self, "get_issue_type_fields"):
+                field_metas = self.get_issue_type_fields(project_key, issue_type_id)
+            else:
+                meta = self.jira.issue_createmeta_fieldtypes(
+                    project=project_key, issue_type_id=issue_type_id
+                )
+                field_metas = meta.get("fields") if isinstance(meta, dict) else None
 
             required_fields = {}
-            # Step 3: Parse the response and extract required fields
-            if isinstance(meta, dict) and "fields" in meta:
-                if isinstance(meta["fields"], list):
-                    for field_meta in meta["fields"]:
-                        if isinstance(field_meta, dict) and field_meta.get(
-                            "required", False
-                        ):
-                            field_id = field_meta.get("fieldId")
-                            if field_id:
-                                required_fields[field_id] = field_meta
-                else:
-                    logger.warning(
-                        "Unexpected format for 'fields' in createmeta response."
-                    )
+            # Step 3: Extract the required fields
+            if isinstance(field_metas, list):
+                for field_meta in field_metas:
+                    if isinstance(field_meta, dict) and field_meta.get(
+                        "required", False
+                    ):
+                        field_id = field_meta.get("fieldId")
+                        if field_id:
+                            required_fields[field_id] = field_meta
+            elif field_metas is not None:
+                logger.warning("Unexpected format for 'fields' in createmeta response.")
 
             if not required_fields:
                 logger.warning(
@@ -248,11 +290,9 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
                     f"in project '{project_key}'"
                 )
 
-            # Cache the result before returning
-            self._required_fields_cache[cache_key] = required_fields
             logger.debug(
-                f"Cached required fields for {issue_type} in {project_key}: "
-                f"{len(required_fields)} fields"
+                f"Found {len(required_fields)} required fields for {issue_type} "
+                f"in {project_key}"
             )
 
             return required_fields
@@ -316,7 +356,6 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
                     field_name == "epic link"
                     or field_name == "epic"
                     or "epic link" in field_name
-                    or field_custom == "com.pyxis.greenhopper.jira:gh-epic-link"
                     or field_id == "customfield_10014"
                 ):  # Common in Jira Cloud
                     field_ids["epic_link"] = field_id
@@ -329,7 +368,6 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
                     field_name == "epic name"
                     or field_name == "epic title"
                     or "epic name" in field_name
-                    or field_custom == "com.pyxis.greenhopper.jira:gh-epic-label"
                     or field_id == "customfield_10011"
                 ):  # Common in Jira Cloud
                     field_ids["epic_name"] = field_id
@@ -378,6 +416,18 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
                         f"Found potential Epic-related field: {field_id} ({original_name})"
                     )
 
+            # Fields of the Jira Software epic types take precedence over
+            # name matches
+            index = self._get_field_index(fields) or FieldIndex.build(fields, 0.0)
+            epic_link_ids = index.custom_type_to_ids.get(EPIC_LINK_FIELD_TYPE)
+            if epic_link_ids:
+                field_ids["epic_link"] = field_ids["Epic Link"] = epic_link_ids[0]
+                logger.debug(f"Found Epic Link field by type: {epic_link_ids[0]}")
+            epic_name_ids = index.custom_type_to_ids.get(EPIC_NAME_FIELD_TYPE)
+            if epic_name_ids:
+                field_ids["epic_name"] = field_ids["Epic Name"] = epic_name_ids[0]
+                logger.debug(f"Found Epic Name field by type: {epic_name_ids[0]}")
+
             # If we couldn't find certain key fields, try alternative approaches
             if "epic_name" not in field_ids or "epic_link" not in field_ids:
                 logger.debug(
@@ -482,6 +532,9 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
         """
         Search fields using fuzzy matching.
 
+        Candidates are pruned with a trigram index built once per field
+        snapshot, so only a shortlist is fuzzy-scored.
+
         Args:
             keyword: The search keyword
             limit: Maximum number of results to return (default: 10)
@@ -498,28 +551,9 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             if not keyword:
                 return fields[:limit]
 
-            def similarity(keyword: str, field: dict) -> int:
-                """Calculate similarity score between keyword and field."""
-                name_candidates = [
-                    field.get("id", ""),
-                    field.get("key", ""),
-                    field.get("name", ""),
-                    *field.get("clauseNames", []),
-                ]
-
-                # Calculate the fuzzy match score
-                return max(
-                    fuzz.partial_ratio(keyword.lower(), name.lower())
-                    for name in name_candidates
-                )
-
-            # Sort by similarity
-            sorted_fields = sorted(
-                fields, key=lambda x: similarity(keyword, x), reverse=True
-            )
-
-            # Return the top limit results
-            return sorted_fields[:limit]
+            # Prune with the snapshot's trigram index, then fuzzy-score the shortlist
+            index = self._get_field_index(fields) or FieldIndex.build(fields, 0.0)
+            return index.search.search(keyword, limit)
 
         except Exception as e:
             logger.error(f"Error searching fields: {str(e)}")
@@ -39,11 +39,12 @@ class FormattingMixin(
         """
         super().__init__(*args, **kwargs)
 
-        # Use the JiraPreprocessor with the base URL from the client
+        # Use the JiraPreprocessor with the base URL and cache scope from the client
         base_url = ""
         if hasattr(self, "config") and hasattr(self.config, "url"):
             base_url = self.config.url
-        self.preprocessor = JiraPreprocessor(base_url=base_url)
+        cache_scope = getattr(getattr(self, "preprocessor", None), "cache_scope", "")
+        self.preprocessor = JiraPreprocessor(base_url=base_url, cache_scope=cache_scope)
 
     def markdown_to_jira(self, markdown_text: str) -> str:
         """
@@ -2,6 +2,7 @@
 
 import logging
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from requests.exceptions import HTTPError
@@ -18,11 +19,19 @@ from .protocols import (
     FieldsOperationsProto,
     IssueOperationsProto,
     ProjectsOperationsProto,
+    SearchOperationsProto,
     UsersOperationsProto,
 )
 
 logger = logging.getLogger("mcp-jira")
 
+# Issues fetched per ``key in (...)`` search; the Server/DC page size cap
+BATCH_GET_CHUNK_SIZE = 50
+# Concurrent requests (chunk searches and comment fetches) per batch
+BATCH_GET_MAX_WORKERS = 8
+# Issues per bulk create request, Jira's limit for /issue/bulk
+BATCH_CREATE_CHUNK_SIZE = 50
+
 
 class IssuesMixin(
     JiraClient,
@@ -31,6 +40,7 @@ class IssuesMixin(
     FieldsOperationsProto,
     IssueOperationsProto,
     ProjectsOperationsProto,
+    SearchOperationsProto,
     UsersOperationsProto,
 ):
     """Mixin for Jira issue operations."""
@@ -63,87 +73,14 @@ class IssuesMixin(
             Exception: If there is an error retrieving the issue
         """
         try:
-            # Obtain the projects filter from the config.
-            # These should NOT be overridden by the request.
-            filter_to_use = self.config.projects_filter
-
-            # Apply projects filter if present
-            if filter_to_use:
-                # Split projects filter by commas and handle possible whitespace
-                projects = [p.strip() for p in filter_to_use.split(",")]
-
-                # Obtain the project key from issue_key
-                issue_key_project = issue_key.split("-")[0]
-
-                if issue_key_project not in projects:
-                    # If the project key not in the filter, return an empty issue
-                    msg = (
-                        "Issue with project prefix "
-                        f"'{issue_key_project}' are restricted by configuration"
-                    )
-                    raise ValueError(msg)
-
-            # Determine fields_param: use provided fields or default from constant
-            fields_param = fields
-            if fields_param is None:
-                fields_param = ",".join(DEFAULT_READ_JIRA_FIELDS)
-            elif isinstance(fields_param, list | tuple | set):
-                fields_param = ",".join(fields_param)
-
-            # Ensure necessary fields are included based on special parameters
-            if (
-                fields_param == ",".join(DEFAULT_READ_JIRA_FIELDS)
-                or fields_param == "*all"
-            ):
-                # Default fields are being used - preserve the order
-                default_fields_list = (
-                    fields_param.split(",")
-                    if fields_param != "*all"
-                    else list(DEFAULT_READ_JIRA_FIELDS)
-                )
-                additional_fields = []
-
-                # Add appropriate fields based on expand parameter
-                if expand:
-                    expand_params = expand.split(",")
-                    if (
-                        "changelog" in expand_params
-                        and "changelog" not in default_fields_list
-                        and "changelog" not in additional_fields
-                    ):
-                        additional_fields.append("changelog")
-                    if (
-                        "renderedFields" in expand_params
-                        and "rendered" not in default_fields_list
-                        and "rendered" not in additional_fields
-                    ):
-                        additional_fields.append("rendered")
-
-                # Add appropriate fields based on properties parameter
-                if (
-                    properties
-                    and "properties" not in default_fields_list
-                    and "properties" not in additional_fields
-                ):
-                    additional_fields.append("properties")
-
-                # Combine default fields with additional fields, preserving order
-                if additional_fields:
-                    fields_param = ",".join(default_fields_list + additional_fields)
-            # Handle non-default fields string
-
-            # Build expand parameter if provided
-            expand_param = expand
-
-            # Convert properties to proper format if it's a list
-            properties_param = properties
-            if properties and isinstance(properties, list | tuple | set):
-                properties_param = ",".join(properties)
+            fields_param, properties_param = self._prepare_issue_request(
+                issue_key, expand=expand, fields=fields, properties=properties
+            )
 
             # Get the issue data with all parameters
             issue = self.jira.get_issue(
                 issue_key,
-                expand=expand_param,
+                expand=expand,
                 fields=fields_param,
                 properties=properties_param,
                 update_history=update_history,
@@ -170,45 +107,7 @@ class IssuesMixin(
                 # Add comments to the issue data for processing by the model
                 fields_data["comment"]["comments"] = comments
 
-            # Extract epic information
-            try:
-                epic_info = self._extract_epic_information(issue)
-            except Exception as e:
-                logger.warning(f"Error extracting epic information: {str(e)}")
-                epic_info = {"epic_key": None, "epic_name": None}
-
-            # If this is linked to an epic, add the epic information to the fields
-            if epic_info.get("epic_key"):
-                try:
-                    # Get field IDs for epic fields
-                    field_ids = self.get_field_ids_to_epic()
-
-                    # Add epic link field if it doesn't exist
-                    if (
-                        "epic_link" in field_ids
-                        and field_ids["epic_link"] not in fields_data
-                    ):
-                        fields_data[field_ids["epic_link"]] = epic_info["epic_key"]
-
-                    # Add epic name field if it doesn't exist
-                    if (
-                        epic_info.get("epic_name")
-                        and "epic_name" in field_ids
-                        and field_ids["epic_name"] not in fields_data
-                    ):
-                        fields_data[field_ids["epic_name"]] = epic_info["epic_name"]
-                except Exception as e:
-                    logger.warning(f"Error setting epic fields: {str(e)}")
-
-            # Update the issue data with the fields
-            issue["fields"] = fields_data
-
-            # Create and return the JiraIssue model, passing requested_fields
-            return JiraIssue.from_api_response(
-                issue,
-                base_url=self.config.url if hasattr(self, "config") else None,
-                requested_fields=fields,
-            )
+            return self._build_issue_model(issue, requested_fields=fields)
         except HTTPError as http_err:
             if http_err.response is not None and http_err.response.status_code in [
                 401,
@@ -228,6 +127,295 @@ class IssuesMixin(
             logger.error(f"Error retrieving issue {issue_key}: {error_msg}")
             raise Exception(f"Error retrieving issue {issue_key}: {error_msg}") from e
 
+    def batch_get_issues(
+        self,
+        issue_keys: list[str],
+        expand: str | None = None,
+        comment_limit: int | str | None = 10,
+        fields: str | list[str] | tuple[str, ...] | set[str] | None = None,
+        max_workers: int = BATCH_GET_MAX_WORKERS,
+    ) -> list[JiraIssue | Exception]:
+        """
+        Get multiple Jira issues by key.
+
+        Issues are fetched with one ``key in (...)`` search per chunk of
+        keys, and their comments are fetched concurrently, so N issues cost
+        a few round trips instead of 2N. Keys a search cannot resolve (e.g.
+        moved issues, or keys that do not exist) are fetched individually.
+
+        Args:
+            issue_keys: The issue keys (e.g., ['PROJ-1', 'PROJ-2'])
+            expand: Fields to expand in the response
+            comment_limit: Maximum number of comments per issue, or "all"
+            fields: Fields to return (comma-separated string, list, tuple, set, or "*all")
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            One entry per input key, in input order: the JiraIssue, or the
+            exception raised while retrieving it
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+        """
+        results: dict[str, JiraIssue | Exception] = {}
+        fields_param: str | None = None
+        pending: list[str] = []
+        for key in dict.fromkeys(issue_keys):
+            try:
+                fields_param, _ = self._prepare_issue_request(
+                    key, expand=expand, fields=fields
+                )
+                pending.append(key)
+            except ValueError as e:
+                results[key] = e
+
+        if pending and fields_param is not None:
+            comment_limit_int = self._normalize_comment_limit(comment_limit)
+            chunks = [
+                pending[i : i + BATCH_GET_CHUNK_SIZE]
+                for i in range(0, len(pending), BATCH_GET_CHUNK_SIZE)
+            ]
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(max_workers, len(pending))),
+                thread_name_prefix="jira-batch-get",
+            ) as pool:
+                found: dict[str, dict[str, Any]] = {}
+                for chunk_found in pool.map(
+                    lambda chunk: self._search_issues_by_key(
+                        chunk, fields_param, expand
+                    ),
+                    chunks,
+                ):
+                    found.update(chunk_found)
+
+                def load(key: str) -> JiraIssue:
+                    issue = found.get(key.upper())
+                    if issue is None:
+                        return self.get_issue(
+                            key,
+                            expand=expand,
+                            comment_limit=comment_limit,
+                            fields=fields,
+                            update_history=False,
+                        )
+                    fields_data = issue.get("fields", {}) or {}
+                    if "comment" in fields_data:
+                        fields_data["comment"]["comments"] = (
+                            self._get_issue_comments_if_needed(
+                                issue["key"], comment_limit_int
+                            )
+                        )
+                    return self._build_issue_model(issue, requested_fields=fields)
+
+                futures = {key: pool.submit(load, key) for key in pending}
+                for key, future in futures.items():
+                    try:
+                        results[key] = future.result()
+                    except MCPAtlassianAuthenticationError:
+                        raise
+                    except Exception as e:
+                        logger.warning(f"Error retrieving issue {key}: {str(e)}")
+                        results[key] = e
+
+        return [results[key] for key in issue_keys]
+
+    def _search_issues_by_key(
+        self, issue_keys: list[str], fields_param: str, expand: str | None
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Fetch raw issues with a single ``key in (...)`` search.
+
+        Args:
+            issue_keys: Up to one page of issue keys
+            fields_param: Comma-separated fields to return
+            expand: Fields to expand in the response
+
+        Jira rejects the whole query when one key does not exist, so a
+        rejected search is split in half and each half retried, narrowing
+        the failure down to the keys that cannot be resolved.
+
+        Returns:
+            Raw issues by upper-cased key and by ID. Keys missing from the
+            result (a rejected single-key search) are left to be fetched
+            individually.
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+        """
+        quoted = ", ".join(f'"{key}"' for key in issue_keys)
+        try:
+            issues, _ = self._fetch_search_page(
+                f"key in ({quoted})", fields_param, expand, len(issue_keys), None
+            )
+        except MCPAtlassianAuthenticationError:
+            raise
+        except Exception as e:
+            logger.debug(f"Batch search for {len(issue_keys)} issues failed: {e}")
+            if len(issue_keys) == 1:
+                return {}
+            middle = len(issue_keys) // 2
+            return self._search_issues_by_key(
+                issue_keys[:middle], fields_param, expand
+            ) | self._search_issues_by_key(issue_keys[middle:], fields_param, expand)
+
+        found: dict[str, dict[str, Any]] = {}
+        for issue in issues:
+            found[str(issue.get("key", "")).upper()] = issue
+            found[str(issue.get("id", ""))] = issue
+        return found
+
+    def _prepare_issue_request(
+        self,
+        issue_key: str,
+        expand: str | None = None,
+        fields: str | list[str] | tuple[str, ...] | set[str] | None = None,
+        properties: str | list[str] | None = None,
+    ) -> tuple[str, str | None]:
+        """
+        Check the projects filter and build the fields/properties parameters.
+
+        Args:
+            issue_key: The issue key (e.g., PROJECT-123)
+            expand: Fields to expand in the response
+            fields: Fields to return (comma-separated string, list, tuple, set, or "*all")
+            properties: Issue properties to return (comma-separated string or list)
+
+        Returns:
+            Tuple of (fields parameter, properties parameter)
+
+        Raises:
+            ValueError: If the issue's project is excluded by the projects filter
+        """
+        # Obtain the projects filter from the config.
+        # These should NOT be overridden by the request.
+        filter_to_use = self.config.projects_filter
+
+        # Apply projects filter if present
+        if filter_to_use:
+            # Split projects filter by commas and handle possible whitespace
+            projects = [p.strip() for p in filter_to_use.split(",")]
+
+            # Obtain the project key from issue_key
+            issue_key_project = issue_key.split("-")[0]
+
+            if issue_key_project not in projects:
+                # If the project key not in the filter, return an empty issue
+                msg = (
+                    "Issue with project prefix "
+                    f"'{issue_key_project}' are restricted by configuration"
+                )
+                raise ValueError(msg)
+
+        # Determine fields_param: use provided fields or default from constant
+        fields_param = fields
+        if fields_param is None:
+            fields_param = ",".join(DEFAULT_READ_JIRA_FIELDS)
+        elif isinstance(fields_param, list | tuple | set):
+            fields_param = ",".join(fields_param)
+
+        # Ensure necessary fields are included based on special parameters
+        if fields_param == ",".join(DEFAULT_READ_JIRA_FIELDS) or fields_param == "*all":
+            # Default fields are being used - preserve the order
+            default_fields_list = (
+                fields_param.split(",")
+                if fields_param != "*all"
+                else list(DEFAULT_READ_JIRA_FIELDS)
+            )
+            additional_fields = []
+
+            # Add appropriate fields based on expand parameter
+            if expand:
+                expand_params = expand.split(",")
+                if (
+                    "changelog" in expand_params
+                    and "changelog" not in default_fields_list
+                    and "changelog" not in additional_fields
+                ):
+                    additional_fields.append("changelog")
+                if (
+                    "renderedFields" in expand_params
+                    and "rendered" not in default_fields_list
+                    and "rendered" not in additional_fields
+                ):
+                    additional_fields.append("rendered")
+
+            # Add appropriate fields based on properties parameter
+            if (
+                properties
+                and "properties" not in default_fields_list
+                and "properties" not in additional_fields
+            ):
+                additional_fields.append("properties")
+
+            # Combine default fields with additional fields, preserving order
+            if additional_fields:
+                fields_param = ",".join(default_fields_list + additional_fields)
+        # Handle non-default fields string
+
+        # Convert properties to proper format if it's a list
+        properties_param = properties
+        if properties and isinstance(properties, list | tuple | set):
+            properties_param = ",".join(properties)
+
+        return fields_param, properties_param
+
+    def _build_issue_model(
+        self,
+        issue: dict[str, Any],
+        requested_fields: str | list[str] | tuple[str, ...] | set[str] | None = None,
+    ) -> JiraIssue:
+        """
+        Add epic information to raw issue data and convert it to a model.
+
+        Args:
+            issue: The raw issue data, with comments already attached
+            requested_fields: The fields requested by the caller
+
+        Returns:
+            JiraIssue model with issue data and metadata
+        """
+        fields_data = issue.get("fields", {}) or {}
+
+        # Extract epic information
+        try:
+            epic_info = self._extract_epic_information(issue)
+        except Exception as e:
+            logger.warning(f"Error extracting epic information: {str(e)}")
+            epic_info = {"epic_key": None, "epic_name": None}
+
+        # If this is linked to an epic, add the epic information to the fields
+        if epic_info.get("epic_key"):
+            try:
+                # Get field IDs for epic fields
+                field_ids = self.get_field_ids_to_epic()
+
+                # Add epic link field if it doesn't exist
+                if (
+                    "epic_link" in field_ids
+                    and field_ids["epic_link"] not in fields_data
+                ):
+                    fields_data[field_ids["epic_link"]] = epic_info["epic_key"]
+
+                # Add epic name field if it doesn't exist
+                if (
+                    epic_info.get("epic_name")
+                    and "epic_name" in field_ids
+                    and field_ids["epic_name"] not in fields_data
+                ):
+                    fields_data[field_ids["epic_name"]] = epic_info["epic_name"]
+            except Exception as e:
+                logger.warning(f"Error setting epic fields: {str(e)}")
+
+        # Update the issue data with the fields
+        issue["fields"] = fields_data
+
+        # Create and return the JiraIssue model, passing requested_fields
+        return JiraIssue.from_api_response(
+            issue,
+            base_url=self.config.url if hasattr(self, "config") else None,
+            requested_fields=requested_fields,
+        )
+
     def _normalize_comment_limit(self, comment_limit: int | str | None) -> int | None:
         """
         Normalize the comment limit to an integer or None.
@@ -1363,10 +1551,22 @@ class IssuesMixin(
         Raises:
             ValueError: If any required fields are missing or invalid
             MCPAtlassianAuthenticationError: If authentication fails
+            Exception: If a chunk after the first fails; the message lists the
+                issues already created and the ones that were not
         """
         if not issues:
             return []
 
+        # Resolve each distinct assignee once per batch, concurrently
+        assignee_ids = self._get_account_ids(
+            [
+                issue_data["assignee"]
+                for issue_data in issues
+                if isinstance(issue_data.get("assignee"), str)
+                and issue_data["assignee"]
+            ]
+        )
+
         # Prepare issues for bulk creation
         issue_updates = []
         for issue_data in issues:
@@ -1396,14 +1596,9 @@ class IssuesMixin(
                 if description:
                     fields["description"] = description
 
-                # Add assignee if provided
-                if assignee:
-                    try:
-                        # _get_account_id now returns the correct identifier (accountId for cloud, name for server)
-                        assignee_identifier = self._get_account_id(assignee)
-                        self._add_assignee_to_fields(fields, assignee_identifier)
-                    except ValueError as e:
-                        logger.warning(f"Could not assign issue: {str(e)}")
+                # Add assignee if provided and resolved
+                if assignee and assignee_ids.get(assignee) is not None:
+                    self._add_assignee_to_fields(fields, assignee_ids[assignee])
 
                 # Add components if provided
                 if components:
@@ -1439,51 +1634,87 @@ class IssuesMixin(
         if validate_only:
             return []
 
-        try:
-            # Call Jira's bulk create endpoint
-            response = self.jira.create_issues(issue_updates)
-            if not isinstance(response, dict):
-                msg = f"Unexpected return value type from `jira.create_issues`: {type(response)}"
-                logger.error(msg)
-                raise TypeError(msg)
+        # Create in chunks of Jira's bulk limit. Each chunk's issues are
+        # fetched back with one search, in the background while the next
+        # chunk is being created.
+        created_keys: list[str] = []
+        with ThreadPoolExecutor(
+            max_workers=BATCH_GET_MAX_WORKERS, thread_name_prefix="jira-batch-create"
+        ) as pool:
+            searches = []
+            for i in range(0, len(issue_updates), BATCH_CREATE_CHUNK_SIZE):
+                chunk = issue_updates[i : i + BATCH_CREATE_CHUNK_SIZE]
+                try:
+                    # Call Jira's bulk create endpoint
+                    response = self.jira.create_issues(chunk)
+                    if not isinstance(response, dict):
+                        msg = f"Unexpected return value type from `jira.create_issues`: {type(response)}"
+                        logger.error(msg)
+                        raise TypeError(msg)
+                except Exception as e:
+                    logger.error(f"Error in bulk issue creation: {str(e)}")
+                    if not created_keys or isinstance(
+                        e, MCPAtlassianAuthenticationError
+                    ):
+                        raise
+                    # Issues from earlier chunks already exist, so name them
+                    # rather than let a retry create them twice
+                    for search in searches:
+                        search.cancel()
+                    msg = (
+                        f"Error creating issues {i + 1}-{len(issue_updates)} of "
+                        f"{len(issue_updates)}: {str(e)}. Issues already created: "
+                        f"{', '.join(created_keys)}"
+                    )
+                    raise Exception(msg) from e
 
-            # Process results
-            created_issues = []
-            for issue_info in response.get("issues", []):
-                issue_key = issue_info.get("key")
-                if issue_key:
-                    try:
-                        # Fetch the full issue data
-                        issue_data = self.jira.get_issue(issue_key)
-                        if not isinstance(issue_data, dict):
-                            msg = f"Unexpected return value type from `jira.get_issue`: {type(issue_data)}"
-                            logger.error(msg)
-                            raise TypeError(msg)
+                # Log any errors from the bulk creation
+                for error in response.get("errors", []):
+                    logger.error(f"Bulk creation error: {error}")
 
-                        created_issues.append(
-                            JiraIssue.from_api_response(
-                                issue_data,
-                                base_url=self.config.url
-                                if hasattr(self, "config")
-                                else None,
-                            )
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Error fetching created issue {issue_key}: {str(e)}"
-                        )
+                keys = [
+                    issue_info["key"]
+                    for issue_info in response.get("issues", [])
+                    if issue_info.get("key")
+                ]
+                if keys:
+                    created_keys.extend(keys)
+                    searches.append(
+                        pool.submit(self._search_issues_by_key, keys, "*all", None)
+                    )
 
-            # Log any errors from the bulk creation
-            errors = response.get("errors", [])
-            if errors:
-                for error in errors:
-                    logger.error(f"Bulk creation error: {error}")
+            found: dict[str, dict[str, Any]] = {}
+            for search in searches:
+                found.update(search.result())
 
-            return created_issues
+            # The search index can lag behind creation: fetch missing issues
+            # individually
+            fetches = {
+                key: pool.submit(self.jira.get_issue, key)
+                for key in created_keys
+                if key.upper() not in found
+            }
 
-        except Exception as e:
-            logger.error(f"Error in bulk issue creation: {str(e)}")
-            raise
+            created_issues = []
+            base_url = self.config.url if hasattr(self, "config") else None
+            for issue_key in created_keys:
+                try:
+                    if issue_key in fetches:
+                        issue_data = fetches[issue_key].result()
+                    else:
+                        issue_data = found[issue_key.upper()]
+                    if not isinstance(issue_data, dict):
+                        msg = f"Unexpected return value type from `jira.get_issue`: {type(issue_data)}"
+                        logger.error(msg)
+                        raise TypeError(msg)
+
+                    created_issues.append(
+                        JiraIssue.from_api_response(issue_data, base_url=base_url)
+                    )
+                except Exception as e:
+                    logger.error(f"Error fetching created issue {issue_key}: {str(e)}")
+
+        return created_issues
 
     def batch_get_changelogs(
         self, issue_ids_or_keys: list[str], fields: list[str] | None = None
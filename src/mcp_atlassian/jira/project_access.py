@@ -0,0 +1,100 @@
+"""Cache of the projects each user can browse.
+
+Finding the projects a user can access takes one permission probe per
+project, which is thousands of requests on large Server/Data Center sites.
+The answer is remembered per user and per version of the project set, so a
+project being created, deleted or renamed invalidates it without waiting for
+the TTL.
+"""
+
+import hashlib
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from cachetools import TTLCache
+
+from ..utils.env import get_env_int
+
+DEFAULT_TTL = 600
+DEFAULT_MAX_SIZE = 128
+
+
+def project_set_version(projects: Iterable[dict[str, Any]]) -> str:
+    """Fingerprint a set of projects by their IDs and keys.
+
+    Args:
+        projects: Project data dictionaries
+
+    Returns:
+        A digest that changes whenever a project is added, removed or rekeyed
+    """
+    entries = sorted(
+        f"{project.get('id', '')}:{project.get('key', '')}" for project in projects
+    )
+    return hashlib.sha256("\n".join(entries).encode("utf-8")).hexdigest()
+
+
+class ProjectAccessCache:
+    """LRU cache with TTL of the project keys each user can browse."""
+
+    def __init__(
+        self,
+        ttl: int = DEFAULT_TTL,
+        maxsize: int = DEFAULT_MAX_SIZE,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an answer is cached, 0 to disable the cache
+            maxsize: Maximum number of users and project set versions kept
+            timer: Monotonic clock, injectable for tests
+        """
+        self.ttl = ttl
+        self._entries: TTLCache[tuple[str, str], frozenset[str]] = TTLCache(
+            maxsize=maxsize, ttl=ttl, timer=timer
+        )
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "ProjectAccessCache":
+        """Create a cache configured from environment variables.
+
+        Reads ``JIRA_PROJECT_ACCESS_CACHE_TTL`` (seconds) and
+        ``JIRA_PROJECT_ACCESS_CACHE_SIZE``.
+
+        Returns:
+            The configured cache
+        """
+        return cls(
+            ttl=get_env_int("JIRA_PROJECT_ACCESS_CACHE_TTL", DEFAULT_TTL, minimum=0),
+            maxsize=get_env_int(
+                "JIRA_PROJECT_ACCESS_CACHE_SIZE", DEFAULT_MAX_SIZE, minimum=1
+            ),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether answers are cached at all."""
+        return self.ttl > 0
+
+    def get(self, username: str, version: str) -> frozenset[str] | None:
+        """Return the keys of the projects a user can browse, if known."""
+        with self._lock:
+            return self._entries.get((username, version))
+
+    def put(self, username: str, version: str, project_keys: Iterable[str]) -> None:
+        """Remember the keys of the projects a user can browse."""
+        with self._lock:
+            self._entries[(username, version)] = frozenset(project_keys)
+
+    def invalidate(self, username: str | None = None) -> None:
+        """Drop the answers of one user, or of every user."""
+        with self._lock:
+            if username is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == username]:
+                self._entries.pop(key, None)
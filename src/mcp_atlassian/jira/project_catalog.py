@@ -0,0 +1,151 @@
+"""Catalog of the projects visible to a Jira client.
+
+Listing projects downloads every project of the site, and several tools and
+helpers list them again for each call. The catalog keeps each listing, with
+a key to project index, for one client, so per site and per principal. Expired
+listings are kept until they are replaced, so they can be revalidated with
+their ``ETag`` instead of downloaded again when the site sends one.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from cachetools import LRUCache, TTLCache
+
+from ..utils.env import get_env_int
+
+DEFAULT_TTL = 300
+DEFAULT_MAX_SIZE = 32
+
+# A listing scope: whether archived projects are included, and the project
+# keys it is restricted to (empty for every project)
+ListingScope = tuple[bool, tuple[str, ...]]
+
+
+@dataclass
+class ProjectListing:
+    """A list of projects, indexed by key."""
+
+    projects: list[dict[str, Any]]
+    etag: str | None = None
+    fetched_at: float = 0.0
+    index: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not self.index:
+            self.index = {
+                str(project["key"]).upper(): project
+                for project in self.projects
+                if isinstance(project, dict) and project.get("key")
+            }
+
+
+class ProjectCatalog:
+    """Project listings and project details with a TTL."""
+
+    def __init__(
+        self,
+        ttl: int = DEFAULT_TTL,
+        maxsize: int = DEFAULT_MAX_SIZE,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the catalog.
+
+        Args:
+            ttl: Seconds a listing or project is fresh, 0 to disable the catalog
+            maxsize: Maximum number of listings, and of projects, kept
+            timer: Monotonic clock, injectable for tests
+        """
+        self.ttl = ttl
+        self._timer = timer
+        self._listings: LRUCache[ListingScope, ProjectListing] = LRUCache(
+            maxsize=maxsize
+        )
+        self._projects: TTLCache[str, dict[str, Any]] = TTLCache(
+            maxsize=maxsize, ttl=ttl, timer=timer
+        )
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "ProjectCatalog":
+        """Create a catalog configured from environment variables.
+
+        Reads ``JIRA_PROJECT_CACHE_TTL`` (seconds) and ``JIRA_PROJECT_CACHE_SIZE``.
+
+        Returns:
+            The configured catalog
+        """
+        return cls(
+            ttl=get_env_int("JIRA_PROJECT_CACHE_TTL", DEFAULT_TTL, minimum=0),
+            maxsize=get_env_int("JIRA_PROJECT_CACHE_SIZE", DEFAULT_MAX_SIZE, minimum=1),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether projects are cached at all."""
+        return self.ttl > 0
+
+    def get_listing(self, scope: ListingScope) -> tuple[ProjectListing | None, bool]:
+        """Return the listing of a scope and whether it is still fresh.
+
+        Args:
+            scope: The listing scope
+
+        Returns:
+            The listing, or None if there is none, and True if it is fresh
+        """
+        with self._lock:
+            listing = self._listings.get(scope)
+        if listing is None:
+            return None, False
+        return listing, self._timer() - listing.fetched_at < self.ttl
+
+    def put_listing(
+        self,
+        scope: ListingScope,
+        projects: list[dict[str, Any]],
+        etag: str | None = None,
+    ) -> ProjectListing:
+        """Remember the listing of a scope."""
+        listing = ProjectListing(projects, etag=etag, fetched_at=self._timer())
+        with self._lock:
+            self._listings[scope] = listing
+        return listing
+
+    def revalidated(self, scope: ListingScope) -> ProjectListing | None:
+        """Mark the listing of a scope as fresh after the site confirmed it."""
+        with self._lock:
+            listing = self._listings.get(scope)
+            if listing is not None:
+                listing.fetched_at = self._timer()
+        return listing
+
+    def find(self, project_key: str) -> dict[str, Any] | None:
+        """Return a project from the fresh listings, without fetching it."""
+        key = project_key.upper()
+        now = self._timer()
+        with self._lock:
+            listings = list(self._listings.values())
+        for listing in listings:
+            if now - listing.fetched_at < self.ttl and key in listing.index:
+                return listing.index[key]
+        return None
+
+    def get_project(self, project_key: str) -> dict[str, Any] | None:
+        """Return the cached details of a project."""
+        with self._lock:
+            return self._projects.get(project_key.upper())
+
+    def put_project(self, project_key: str, project: dict[str, Any]) -> None:
+        """Remember the details of a project."""
+        with self._lock:
+            self._projects[project_key.upper()] = project
+
+    def invalidate(self) -> None:
+        """Drop every listing and project."""
+        with self._lock:
+            self._listings.clear()
+            self._projects.clear()
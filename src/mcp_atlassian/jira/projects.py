@@ -1,16 +1,30 @@
 """Module for Jira project operations."""
 
 import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
+from requests.exceptions import HTTPError
+
+from ..exceptions import MCPAtlassianAuthenticationError
 from ..models import JiraProject
 from ..models.jira.search import JiraSearchResult
 from ..models.jira.version import JiraVersion
+from ..utils.metadata_cache import get_metadata_cache, metadata_scope
 from .client import JiraClient
+from .createmeta import CreateMetaCatalog, fields_name, issue_types_name
+from .project_access import ProjectAccessCache, project_set_version
+from .project_catalog import ProjectCatalog, ProjectListing
 from .protocols import SearchOperationsProto
 
 logger = logging.getLogger("mcp-jira")
 
+# Concurrent browse permission checks when listing a user's projects
+PERMISSION_PROBE_MAX_WORKERS = 8
+# Project keys per project/search request
+PROJECT_SEARCH_MAX_KEYS = 50
+
 
 class ProjectsMixin(JiraClient, SearchOperationsProto):
     """Mixin for Jira project operations.
@@ -19,45 +33,181 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
     including project details, components, versions, and other project-related operations.
     """
 
-    def get_all_projects(self, include_archived: bool = False) -> list[dict[str, Any]]:
+    _project_catalog: ProjectCatalog | None = None
+
+    def _get_project_catalog(self) -> ProjectCatalog | None:
+        """
+        Get the catalog of projects visible to this client, creating it on first use.
+
+        Returns:
+            The catalog, or None when it is disabled
+        """
+        if self._project_catalog is None:
+            self._project_catalog = ProjectCatalog.from_env()
+        return self._project_catalog if self._project_catalog.enabled else None
+
+    def get_all_projects(
+        self,
+        include_archived: bool = False,
+        projects_filter: str | None = None,
+        *,
+        refresh: bool = False,
+    ) -> list[dict[str, Any]]:
         """
         Get all projects visible to the current user.
 
         Args:
             include_archived: Whether to include archived projects
+            projects_filter: Optional comma-separated list of project keys to
+                restrict the projects to, overrides config
+            refresh: When True, bypass the cached projects (keyword-only)
 
         Returns:
             List of project data dictionaries
         """
         try:
-            params = {}
-            if include_archived:
-                params["includeArchived"] = "true"
+            filter_to_use = projects_filter or self.config.projects_filter
+            keys = tuple(
+                sorted(
+                    {
+                        key.strip().upper()
+                        for key in (filter_to_use or "").split(",")
+                        if key.strip()
+                    }
+                )
+            )
+            # Only Cloud can restrict a listing to some keys
+            scope = (include_archived, keys if self.config.is_cloud else ())
+
+            catalog = self._get_project_catalog()
+            listing, fresh = catalog.get_listing(scope) if catalog else (None, False)
+            if listing is None or not fresh or refresh:
+                etag = listing.etag if listing is not None and not refresh else None
+                fetched = self._fetch_projects(include_archived, scope[1], etag)
+                if fetched is None:
+                    listing = catalog.revalidated(scope) if catalog else listing
+                elif catalog is not None:
+                    listing = catalog.put_listing(scope, *fetched)
+                else:
+                    listing = ProjectListing(*fetched)
+            if listing is None:
+                return []
 
-            projects = self.jira.projects(included_archived=include_archived)
-            return projects if isinstance(projects, list) else []
+            projects = listing.projects
+            if keys:
+                projects = [
+                    project
+                    for project in projects
+                    if str(project.get("key", "")).upper() in keys
+                ]
+            return [dict(project) for project in projects]
 
         except Exception as e:
             logger.error(f"Error getting all projects: {str(e)}")
             return []
 
-    def get_project(self, project_key: str) -> dict[str, Any] | None:
+    def _fetch_projects(
+        self, include_archived: bool, keys: tuple[str, ...], etag: str | None = None
+    ) -> tuple[list[dict[str, Any]], str | None] | None:
+        """
+        Fetch a listing of projects.
+
+        Args:
+            include_archived: Whether to include archived projects
+            keys: Keys to restrict the listing to (Cloud only), empty for all
+            etag: ETag of the listing fetched before, to revalidate it
+
+        Returns:
+            The projects and the ETag of the response, or None if the listing
+            fetched before is unchanged
+        """
+        if keys:
+            return self._search_projects_by_keys(include_archived, keys), None
+        if self.config.is_cloud:
+            projects = self.jira.projects(included_archived=include_archived)
+            return (projects if isinstance(projects, list) else []), None
+
+        # Server/Data Center returns every project at once, which can be
+        # revalidated if the site (or a proxy in front of it) sends an ETag
+        params = {"includeArchived": "true"} if include_archived else {}
+        response = self.jira.get(
+            self.jira.resource_url("project"),
+            params=params,
+            headers={"If-None-Match": etag} if etag else None,
+            advanced_mode=True,
+        )
+        if etag and response.status_code == 304:
+            logger.debug("Project listing not modified")
+            return None
+        response.raise_for_status()
+        projects = response.json()
+        return (projects if isinstance(projects, list) else []), response.headers.get(
+            "ETag"
+        )
+
+    def _search_projects_by_keys(
+        self, include_archived: bool, keys: tuple[str, ...]
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch only the projects with the given keys from ``project/search``.
+
+        Args:
+            include_archived: Whether to include archived projects
+            keys: The project keys
+
+        Returns:
+            List of project data dictionaries
+        """
+        projects: list[dict[str, Any]] = []
+        for start in range(0, len(keys), PROJECT_SEARCH_MAX_KEYS):
+            params: dict[str, Any] = {
+                "keys": list(keys[start : start + PROJECT_SEARCH_MAX_KEYS]),
+                "maxResults": PROJECT_SEARCH_MAX_KEYS,
+            }
+            if include_archived:
+                params["includeArchived"] = "true"
+            while True:
+                page = self.jira.get(
+                    self.jira.resource_url("project/search"), params=params
+                )
+                if not isinstance(page, dict):
+                    msg = f"Unexpected return value type from project search: {type(page)}"
+                    logger.error(msg)
+                    raise TypeError(msg)
+                values = page.get("values") or []
+                projects.extend(values)
+                if page.get("isLast", True) or not values:
+                    break
+                params["startAt"] = params.get("startAt", 0) + len(values)
+        return projects
+
+    def get_project(
+        self, project_key: str, *, refresh: bool = False
+    ) -> dict[str, Any] | None:
         """
         Get project information by key.
 
         Args:
             project_key: The project key (e.g. 'PROJ')
+            refresh: When True, bypass the cached project (keyword-only)
 
         Returns:
             Project data or None if not found
         """
+        catalog = self._get_project_catalog()
+        if catalog is not None and not refresh:
+            cached = catalog.get_project(project_key)
+            if cached is not None:
+                return dict(cached)
         try:
             project_data = self.jira.project(project_key)
             if not isinstance(project_data, dict):
                 msg = f"Unexpected return value type from `jira.project`: {type(project_data)}"
                 logger.error(msg)
                 raise TypeError(msg)
-            return project_data
+            if catalog is not None:
+                catalog.put_project(project_key, project_data)
+            return dict(project_data)
         except Exception as e:
             logger.warning(f"Error getting project {project_key}: {e}")
             return None
@@ -89,6 +239,9 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
             True if the project exists, False otherwise
         """
         try:
+            catalog = self._get_project_catalog()
+            if catalog is not None and catalog.find(project_key) is not None:
+                return True
             project = self.get_project(project_key)
             return project is not None
 
@@ -239,30 +392,46 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
             )
             return None
 
-    def get_project_issue_types(self, project_key: str) -> list[dict[str, Any]]:
+    _createmeta_catalog: CreateMetaCatalog | None = None
+
+    def _get_createmeta_catalog(self) -> CreateMetaCatalog | None:
+        """
+        Get the catalog of project issue types and fields, creating it on first use.
+
+        Returns:
+            The catalog, or None when it is disabled
+        """
+        if self._createmeta_catalog is None:
+            self._createmeta_catalog = CreateMetaCatalog.from_env()
+        return self._createmeta_catalog if self._createmeta_catalog.enabled else None
+
+    def get_project_issue_types(
+        self, project_key: str, *, refresh: bool = False
+    ) -> list[dict[str, Any]]:
         """
         Get all issue types available for a project.
 
         Args:
             project_key: The project key
+            refresh: When True, bypass the cached issue types (keyword-only)
 
         Returns:
             List of issue type data dictionaries
         """
         try:
-            meta = self.jira.issue_createmeta(project=project_key)
-            if not isinstance(meta, dict):
-                msg = f"Unexpected return value type from `jira.issue_createmeta`: {type(meta)}"
-                logger.error(msg)
-                raise TypeError(msg)
-
-            issue_types = []
-            # Extract issue types from createmeta response
-            if "projects" in meta and len(meta["projects"]) > 0:
-                project_data = meta["projects"][0]
-                if "issuetypes" in project_data:
-                    issue_types = project_data["issuetypes"]
-
+            catalog = self._get_createmeta_catalog()
+            if catalog is not None and not refresh:
+                cached = catalog.get_issue_types(project_key)
+                if cached is not None:
+                    return cached
+
+            issue_types = self._load_metadata(
+                issue_types_name(project_key),
+                lambda: self._fetch_createmeta_issue_types(project_key),
+                refresh=refresh,
+            )
+            if catalog is not None:
+                catalog.put_issue_types(project_key, issue_types)
             return issue_types
 
         except Exception as e:
@@ -271,6 +440,177 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
             )
             return []
 
+    def get_issue_type_fields(
+        self, project_key: str, issue_type_id: str, *, refresh: bool = False
+    ) -> list[dict[str, Any]]:
+        """
+        Get the fields available when creating an issue of a type in a project.
+
+        Args:
+            project_key: The project key
+            issue_type_id: The ID of the issue type
+            refresh: When True, bypass the cached fields (keyword-only)
+
+        Returns:
+            List of field metadata dictionaries, each with a ``fieldId``
+
+        Raises:
+            Exception: If the field metadata cannot be fetched
+        """
+        catalog = self._get_createmeta_catalog()
+        if catalog is not None and not refresh:
+            cached = catalog.get_fields(project_key, issue_type_id)
+            if cached is not None:
+                return cached
+
+        fields = self._load_metadata(
+            fields_name(project_key, issue_type_id),
+            lambda: self._fetch_createmeta_fields(project_key, issue_type_id),
+            refresh=refresh,
+        )
+        if catalog is not None:
+            catalog.put_fields(project_key, issue_type_id, fields)
+        return fields
+
+    def refresh_project_createmeta(self, project_key: str) -> None:
+        """
+        Forget the cached issue types and fields of a project.
+
+        Use after the project's issue type or field configuration changed.
+
+        Args:
+            project_key: The project key
+        """
+        catalog = self._get_createmeta_catalog()
+        if catalog is not None:
+            catalog.invalidate(project_key)
+        cache = get_metadata_cache()
+        if cache is None:
+            return
+        scope = metadata_scope(self.config)
+        entry = cache.get(scope, issue_types_name(project_key))
+        if entry is not None and isinstance(entry.value, list):
+            for issue_type in entry.value:
+                if isinstance(issue_type, dict) and issue_type.get("id"):
+                    cache.invalidate(scope, fields_name(project_key, issue_type["id"]))
+        cache.invalidate(scope, issue_types_name(project_key))
+
+    def _fetch_createmeta_issue_types(self, project_key: str) -> list[dict[str, Any]]:
+        """
+        Fetch the issue types of a project from the paginated createmeta API.
+
+        Falls back to the legacy createmeta endpoint on Jira versions without it.
+
+        Args:
+            project_key: The project key
+
+        Returns:
+            List of issue type data dictionaries
+        """
+        try:
+            return self._fetch_createmeta_pages(
+                lambda start: self.jira.issue_createmeta_issuetypes(
+                    project_key, **({"start": start} if start else {})
+                ),
+                "issueTypes",
+            )
+        except HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                raise
+            logger.debug("Paginated createmeta not available, using legacy endpoint")
+
+        meta = self.jira.issue_createmeta(
+            project=project_key, expand="projects.issuetypes"
+        )
+        if not isinstance(meta, dict):
+            msg = f"Unexpected return value type from `jira.issue_createmeta`: {type(meta)}"
+            logger.error(msg)
+            raise TypeError(msg)
+        projects = meta.get("projects") or [{}]
+        return projects[0].get("issuetypes", [])
+
+    def _fetch_createmeta_fields(
+        self, project_key: str, issue_type_id: str
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch the create fields of one issue type from the paginated createmeta API.
+
+        Falls back to the legacy createmeta endpoint on Jira versions without it.
+
+        Args:
+            project_key: The project key
+            issue_type_id: The ID of the issue type
+
+        Returns:
+            List of field metadata dictionaries, each with a ``fieldId``
+        """
+        try:
+            return self._fetch_createmeta_pages(
+                lambda start: self.jira.issue_createmeta_fieldtypes(
+                    project=project_key,
+                    issue_type_id=issue_type_id,
+                    **({"start": start} if start else {}),
+                ),
+                "fields",
+            )
+        except HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                raise
+            logger.debug("Paginated createmeta not available, using legacy endpoint")
+
+        # The legacy endpoint can still be narrowed to the one issue type
+        meta = self.jira.get(
+            self.jira.resource_url("issue/createmeta"),
+            params={
+                "projectKeys": project_key,
+                "issuetypeIds": issue_type_id,
+                "expand": "projects.issuetypes.fields",
+            },
+        )
+        if not isinstance(meta, dict):
+            msg = f"Unexpected return value type from createmeta: {type(meta)}"
+            logger.error(msg)
+            raise TypeError(msg)
+        projects = meta.get("projects") or [{}]
+        issue_types = projects[0].get("issuetypes") or [{}]
+        return [
+            {**field_meta, "fieldId": field_meta.get("fieldId", field_id)}
+            for field_id, field_meta in (issue_types[0].get("fields") or {}).items()
+        ]
+
+    @staticmethod
+    def _fetch_createmeta_pages(
+        fetch_page: Callable[[int], Any], items_key: str
+    ) -> list[dict[str, Any]]:
+        """
+        Collect every page of a createmeta listing.
+
+        Cloud returns the items under ``items_key``, Server/Data Center under
+        ``values``.
+
+        Args:
+            fetch_page: Callable fetching the page starting at an offset
+            items_key: Key of the items in Cloud responses
+
+        Returns:
+            The items of all pages
+        """
+        items: list[dict[str, Any]] = []
+        while True:
+            page = fetch_page(len(items))
+            if not isinstance(page, dict):
+                msg = f"Unexpected createmeta response type: {type(page)}"
+                raise TypeError(msg)
+            page_items = page.get(items_key, page.get("values")) or []
+            items.extend(page_items)
+            total = page.get("total")
+            if (
+                not page_items
+                or page.get("isLast", True if total is None else False)
+                or (isinstance(total, int) and len(items) >= total)
+            ):
+                return items
+
     def get_project_issues_count(self, project_key: str) -> int:
         """
         Get the total number of issues in a project.
@@ -382,58 +722,138 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
             logger.error(f"Error getting project leads: {str(e)}")
             return {}
 
-    def get_user_accessible_projects(self, username: str) -> list[dict[str, Any]]:
+    _project_access_cache: ProjectAccessCache | None = None
+
+    def _get_project_access_cache(self) -> ProjectAccessCache | None:
+        """
+        Get the cache of the projects users can browse, creating it on first use.
+
+        Returns:
+            The cache, or None when it is disabled
+        """
+        if self._project_access_cache is None:
+            self._project_access_cache = ProjectAccessCache.from_env()
+        return (
+            self._project_access_cache if self._project_access_cache.enabled else None
+        )
+
+    def get_user_accessible_projects(
+        self, username: str, max_workers: int = PERMISSION_PROBE_MAX_WORKERS
+    ) -> list[dict[str, Any]]:
         """
         Get projects that a specific user can access.
 
+        Browse permission is probed for several projects concurrently, and the
+        answer is cached per user until the set of projects changes. Answers
+        with a failed probe are not cached.
+
         Args:
             username: The username to check access for
+            max_workers: Maximum number of concurrent permission probes
 
         Returns:
             List of accessible project data dictionaries
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails
         """
         try:
             # This requires admin permissions
             # For non-admins, a different approach might be needed
-            all_projects = self.get_all_projects()
-            accessible_projects = []
-
-            for project in all_projects:
-                project_key = project.get("key")
-                if not project_key:
-                    continue
-
-                try:
-                    # Check if user has browse permission for this project
-                    browse_users = (
-                        self.jira.get_users_with_browse_permission_to_a_project(
-                            username=username, project_key=project_key, limit=1
-                        )
-                    )
-
-                    # If the user is in the list, they have access
-                    user_has_access = False
-                    if isinstance(browse_users, list):
-                        for user in browse_users:
-                            if isinstance(user, dict) and user.get("name") == username:
-                                user_has_access = True
-                                break
-
-                    if user_has_access:
-                        accessible_projects.append(project)
-
-                except Exception:
-                    # Skip projects that cause errors
-                    continue
-
-            return accessible_projects
-
+            all_projects = [
+                project for project in self.get_all_projects() if project.get("key")
+            ]
+            cache = self._get_project_access_cache()
+            version = project_set_version(all_projects)
+            accessible_keys = cache.get(username, version) if cache else None
+
+            if accessible_keys is None:
+                accessible_keys, complete = self._probe_browse_permissions(
+                    username, [project["key"] for project in all_projects], max_workers
+                )
+                if cache is not None and complete:
+                    cache.put(username, version, accessible_keys)
+
+            return [
+                project for project in all_projects if project["key"] in accessible_keys
+            ]
+
+        except MCPAtlassianAuthenticationError:
+            raise
         except Exception as e:
             logger.error(
                 f"Error getting accessible projects for user {username}: {str(e)}"
             )
             return []
 
+    def _probe_browse_permissions(
+        self, username: str, project_keys: list[str], max_workers: int
+    ) -> tuple[set[str], bool]:
+        """
+        Check concurrently which projects a user has browse permission for.
+
+        Projects whose check fails, including a 403 on a single project, are
+        skipped. When the credentials are rejected (401), the checks still
+        queued are cancelled.
+
+        Args:
+            username: The username to check access for
+            project_keys: Keys of the projects to check
+            max_workers: Maximum number of concurrent checks
+
+        Returns:
+            Keys of the projects the user can browse, and whether every
+            check completed
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails (401)
+        """
+
+        def has_access(project_key: str) -> bool | None:
+            try:
+                browse_users = self.jira.get_users_with_browse_permission_to_a_project(
+                    username=username, project_key=project_key, limit=1
+                )
+            except HTTPError as http_err:
+                if (
+                    http_err.response is not None
+                    and http_err.response.status_code == 401
+                ):
+                    raise MCPAtlassianAuthenticationError(
+                        "Authentication failed for Jira API (401)."
+                    ) from http_err
+                logger.debug(f"Could not check access to {project_key}: {http_err}")
+                return None
+            except Exception as e:
+                # Skip projects that cause errors
+                logger.debug(f"Could not check access to {project_key}: {e}")
+                return None
+            return isinstance(browse_users, list) and any(
+                isinstance(user, dict) and user.get("name") == username
+                for user in browse_users
+            )
+
+        accessible: set[str] = set()
+        complete = True
+        if not project_keys:
+            return accessible, complete
+        pool = ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(project_keys))),
+            thread_name_prefix="jira-permission-probe",
+        )
+        try:
+            futures = {pool.submit(has_access, key): key for key in project_keys}
+            for future in as_completed(futures):
+                result = future.result()
+                if result is None:
+                    complete = False
+                elif result:
+                    accessible.add(futures[future])
+        finally:
+            # Cancels the probes still queued if one of them raised
+            pool.shutdown(wait=True, cancel_futures=True)
+        return accessible, complete
+
     def create_project_version(
         self,
         project_key: str,
@@ -65,6 +65,29 @@ class SearchOperationsProto(Protocol):
     ) -> JiraSearchResult:
         """Search for issues using JQL."""
 
+    @abstractmethod
+    def _fetch_search_page(
+        self,
+        jql: str,
+        fields_param: str,
+        expand: str | None,
+        page_size: int,
+        cursor: int | str | None,
+    ) -> tuple[list[dict], int | str | None]:
+        """
+        Fetch one page of raw search results.
+
+        Args:
+            jql: JQL query string
+            fields_param: Comma-separated fields to return
+            expand: Optional items to expand
+            page_size: Number of issues to request
+            cursor: ``nextPageToken`` on Cloud or the ``startAt`` offset on Server/DC
+
+        Returns:
+            The page's raw issues and the cursor of the next page, or None
+        """
+
 
 class EpicOperationsProto(Protocol):
     """Protocol defining epic operations interface."""
@@ -145,6 +168,30 @@ class FieldsOperationsProto(Protocol):
         Get field definition by ID.
         """
 
+    @abstractmethod
+    def get_fields(self, refresh: bool = False) -> list[dict[str, Any]]:
+        """
+        Get all available fields from Jira.
+
+        Args:
+            refresh: When True, forces a refresh from the server instead of using cache
+
+        Returns:
+            List of field definitions
+        """
+
+    @abstractmethod
+    def get_field_ids_by_custom_type(self, custom_type: str) -> list[str]:
+        """
+        Get the IDs of the fields of a custom field type.
+
+        Args:
+            custom_type: The custom field type (``schema.custom``)
+
+        Returns:
+            The matching field IDs, in field list order
+        """
+
     @abstractmethod
     def get_field_ids_to_epic(self) -> dict[str, str]:
         """
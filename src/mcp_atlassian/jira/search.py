@@ -1,22 +1,43 @@
 """Module for Jira search operations."""
 
 import logging
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
 
 import requests
+from cachetools import TTLCache
 from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
-from ..models.jira import JiraSearchResult
+from ..models.jira import JiraIssue, JiraSearchResult
 from .client import JiraClient
 from .constants import DEFAULT_READ_JIRA_FIELDS
 from .protocols import IssueOperationsProto
 
 logger = logging.getLogger("mcp-jira")
 
+# Workers fetching search totals and read-ahead pages alongside the main request
+SEARCH_EXECUTOR_WORKERS = 8
+
+_search_executor: ThreadPoolExecutor | None = None
+
+
+def _get_search_executor() -> ThreadPoolExecutor:
+    """Get the shared executor for concurrent search requests."""
+    global _search_executor
+    if _search_executor is None:
+        _search_executor = ThreadPoolExecutor(
+            max_workers=SEARCH_EXECUTOR_WORKERS, thread_name_prefix="jira-search"
+        )
+    return _search_executor
+
 
 class SearchMixin(JiraClient, IssueOperationsProto):
     """Mixin for Jira search operations."""
 
+    _search_total_cache: TTLCache | None = None  # JQL -> total, per principal
+
     def search_issues(
         self,
         jql: str,
@@ -47,82 +68,44 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             Exception: If there is an error searching for issues
         """
         try:
-            # Use projects_filter parameter if provided, otherwise fall back to config
-            filter_to_use = projects_filter or self.config.projects_filter
-
-            # Apply projects filter if present
-            if filter_to_use:
-                # Split projects filter by commas and handle possible whitespace
-                projects = [p.strip() for p in filter_to_use.split(",")]
-
-                # Build the project filter query part
-                if len(projects) == 1:
-                    project_query = f'project = "{projects[0]}"'
-                else:
-                    quoted_projects = [f'"{p}"' for p in projects]
-                    projects_list = ", ".join(quoted_projects)
-                    project_query = f"project IN ({projects_list})"
-
-                # Add the project filter to existing query
-                if not jql:
-                    # Empty JQL - just use project filter
-                    jql = project_query
-                elif jql.strip().upper().startswith("ORDER BY"):
-                    # JQL starts with ORDER BY - prepend project filter
-                    jql = f"{project_query} {jql}"
-                elif "project = " not in jql and "project IN" not in jql:
-                    # Only add if not already filtering by project
-                    jql = f"({jql}) AND {project_query}"
-
-                logger.info(f"Applied projects filter to query: {jql}")
-
-            # Convert fields to proper format if it's a list/tuple/set
-            fields_param: str | None
-            if fields is None:  # Use default if None
-                fields_param = ",".join(DEFAULT_READ_JIRA_FIELDS)
-            elif isinstance(fields, list | tuple | set):
-                fields_param = ",".join(fields)
-            else:
-                fields_param = fields
+            jql = self._apply_projects_filter(jql, projects_filter)
+            fields_param = self._search_fields_param(fields)
 
             if self.config.is_cloud:
-                actual_total = -1
-                try:
-                    # Call 1: Get metadata (including total) using standard search API
-                    metadata_params = {"jql": jql, "maxResults": 0}
-                    metadata_response = self.jira.get(
-                        self.jira.resource_url("search"), params=metadata_params
+                # The total is fetched concurrently with the issues (or taken
+                # from the cache, or skipped) so the search costs one round trip
+                cached_total = self._get_cached_search_total(jql)
+                total_future: Future[int] | None = None
+                if cached_total is None and self.config.search_total != "skip":
+                    total_future = _get_search_executor().submit(
+                        self._fetch_search_total, jql
                     )
 
-                    if (
-                        isinstance(metadata_response, dict)
-                        and "total" in metadata_response
-                    ):
-                        try:
-                            actual_total = int(metadata_response["total"])
-                        except (ValueError, TypeError):
-                            logger.warning(
-                                f"Could not parse 'total' from metadata response for JQL: {jql}. Received: {metadata_response.get('total')}"
-                            )
-                    else:
-                        logger.warning(
-                            f"Could not retrieve total count from metadata response for JQL: {jql}. Response type: {type(metadata_response)}"
-                        )
-                except Exception as meta_err:
-                    logger.error(
-                        f"Error fetching metadata for JQL '{jql}': {str(meta_err)}"
+                try:
+                    issues_response_list = self.jira.enhanced_jql_get_list_of_tickets(
+                        jql, fields=fields_param, limit=limit, expand=expand
                     )
-
-                # Call 2: Get the actual issues using the enhanced method
-                issues_response_list = self.jira.enhanced_jql_get_list_of_tickets(
-                    jql, fields=fields_param, limit=limit, expand=expand
-                )
+                except Exception:
+                    if total_future is not None:
+                        total_future.cancel()
+                    raise
 
                 if not isinstance(issues_response_list, list):
                     msg = f"Unexpected return value type from `jira.enhanced_jql_get_list_of_tickets`: {type(issues_response_list)}"
                     logger.error(msg)
                     raise TypeError(msg)
 
+                # A short page is the complete result, so its count is not needed
+                if total_future is not None and len(issues_response_list) < limit:
+                    total_future.cancel()
+                actual_total = self._resolve_search_total(
+                    jql,
+                    issues_response_list,
+                    limit,
+                    cached_total,
+                    total_future.result if total_future is not None else None,
+                )
+
                 response_dict_for_model = {
                     "issues": issues_response_list,
                     "total": actual_total,
@@ -172,6 +155,355 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             logger.error(f"Error searching issues with JQL '{jql}': {str(e)}")
             raise Exception(f"Error searching issues: {str(e)}") from e
 
+    def iter_issues(
+        self,
+        jql: str,
+        fields: list[str] | tuple[str, ...] | set[str] | str | None = None,
+        page_size: int = 50,
+        *,
+        start: int = 0,
+        max_issues: int | None = None,
+        expand: str | None = None,
+        projects_filter: str | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[JiraIssue]:
+        """
+        Stream the issues matching a JQL query one at a time.
+
+        See :meth:`iter_issue_pages` for the arguments.
+
+        Yields:
+            JiraIssue models in search order
+        """
+        for page in self.iter_issue_pages(
+            jql,
+            fields,
+            page_size,
+            start=start,
+            max_issues=max_issues,
+            expand=expand,
+            projects_filter=projects_filter,
+            prefetch=prefetch,
+        ):
+            yield from page
+
+    def iter_issue_pages(
+        self,
+        jql: str,
+        fields: list[str] | tuple[str, ...] | set[str] | str | None = None,
+        page_size: int = 50,
+        *,
+        start: int = 0,
+        max_issues: int | None = None,
+        expand: str | None = None,
+        projects_filter: str | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[list[JiraIssue]]:
+        """
+        Stream the issues matching a JQL query page by page.
+
+        Pages are followed with ``nextPageToken`` on Cloud and ``startAt`` on
+        Server/DC. Only the current page (and, with prefetch, the next one) is
+        held in memory. With prefetch, the next page is requested while the
+        current page is converted and consumed.
+
+        Args:
+            jql: JQL query string
+            fields: Fields to return (comma-separated string, list, tuple, set, or "*all")
+            page_size: Number of issues requested per page
+            start: Starting index (Server/DC only; Cloud always starts from
+                the first issue)
+            max_issues: Stop after this many issues (None for all)
+            expand: Optional items to expand (comma-separated)
+            projects_filter: Optional comma-separated list of project keys to filter by, overrides config
+            prefetch: Whether to request the next page while the current one is consumed
+
+        Yields:
+            Lists of JiraIssue models, one per page
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+            HTTPError: If a page request fails
+        """
+        jql = self._apply_projects_filter(jql, projects_filter)
+        fields_param = self._search_fields_param(fields)
+        remaining = max_issues
+        cursor: int | str | None = None if self.config.is_cloud else start
+
+        def fetch(cursor: int | str | None) -> tuple[list[dict], int | str | None]:
+            size = page_size if remaining is None else min(page_size, remaining)
+            return self._fetch_search_page(jql, fields_param, expand, size, cursor)
+
+        pending: Future | None = None
+        try:
+            issues, cursor = fetch(cursor)
+            while True:
+                if remaining is not None:
+                    issues = issues[:remaining]
+                    remaining -= len(issues)
+                has_more = bool(issues) and cursor is not None and remaining != 0
+                if has_more and prefetch:
+                    pending = _get_search_executor().submit(fetch, cursor)
+
+                yield [
+                    JiraIssue.from_api_response(
+                        issue, base_url=self.config.url, requested_fields=fields_param
+                    )
+                    for issue in issues
+                ]
+
+                if not has_more:
+                    return
+                if pending is not None:
+                    issues, cursor = pending.result()
+                    pending = None
+                else:
+                    issues, cursor = fetch(cursor)
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    def _fetch_search_page(
+        self,
+        jql: str,
+        fields_param: str,
+        expand: str | None,
+        page_size: int,
+        cursor: int | str | None,
+    ) -> tuple[list[dict], int | str | None]:
+        """
+        Fetch one page of raw search results.
+
+        Args:
+            jql: JQL query string (with any project filter applied)
+            fields_param: Comma-separated fields to return
+            expand: Optional items to expand
+            page_size: Number of issues to request
+            cursor: ``nextPageToken`` on Cloud (None for the first page) or
+                the ``startAt`` offset on Server/DC
+
+        Returns:
+            The page's raw issues and the cursor of the next page, or None
+            if this is the last page
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+            HTTPError: If the request fails
+            TypeError: If the response is not a JSON object
+        """
+        try:
+            if self.config.is_cloud:
+                params: dict[str, Any] = {
+                    "jql": jql,
+                    "fields": fields_param,
+                    "maxResults": page_size,
+                }
+                if expand is not None:
+                    params["expand"] = expand
+                if cursor is not None:
+                    params["nextPageToken"] = cursor
+                response = self.jira.get(
+                    self.jira.resource_url("search/jql"), params=params
+                )
+            else:
+                response = self.jira.jql(
+                    jql,
+                    fields=fields_param,
+                    start=cursor,
+                    limit=page_size,
+                    expand=expand,
+                )
+        except HTTPError as http_err:
+            if http_err.response is not None and http_err.response.status_code in [
+                401,
+                403,
+            ]:
+                error_msg = (
+                    f"Authentication failed for Jira API ({http_err.response.status_code}). "
+                    "Token may be expired or invalid. Please verify credentials."
+                )
+                logger.error(error_msg)
+                raise MCPAtlassianAuthenticationError(error_msg) from http_err
+            logger.error(f"HTTP error during API call: {http_err}", exc_info=False)
+            raise
+
+        if not isinstance(response, dict):
+            msg = f"Unexpected return value type from Jira search: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)
+
+        issues = response.get("issues") or []
+        if self.config.is_cloud:
+            return issues, response.get("nextPageToken")
+
+        next_start = int(cursor or 0) + len(issues)
+        total = response.get("total")
+        if isinstance(total, int):
+            is_last = next_start >= total
+        else:
+            # Without a total, a short page is the last one. Servers may cap
+            # maxResults, so this is only a fallback.
+            is_last = len(issues) < page_size
+        if not issues or is_last:
+            return issues, None
+        return issues, next_start
+
+    def _fetch_search_total(self, jql: str) -> int:
+        """
+        Fetch the number of issues matching a JQL query on Jira Cloud.
+
+        Uses the approximate-count endpoint when ``search_total`` is
+        "approximate", otherwise a ``maxResults=0`` search.
+
+        Args:
+            jql: JQL query string
+
+        Returns:
+            The total, or -1 if it could not be retrieved
+        """
+        try:
+            if self.config.search_total == "approximate":
+                response = self.jira.approximate_issue_count(jql)
+                total_key = "count"
+            else:
+                response = self.jira.get(
+                    self.jira.resource_url("search"),
+                    params={"jql": jql, "maxResults": 0},
+                )
+                total_key = "total"
+
+            if isinstance(response, dict) and total_key in response:
+                try:
+                    return int(response[total_key])
+                except (ValueError, TypeError):
+                    logger.warning(
+                        f"Could not parse '{total_key}' from metadata response for JQL: {jql}. Received: {response.get(total_key)}"
+                    )
+            else:
+                logger.warning(
+                    f"Could not retrieve total count from metadata response for JQL: {jql}. Response type: {type(response)}"
+                )
+        except Exception as meta_err:
+            logger.error(f"Error fetching metadata for JQL '{jql}': {str(meta_err)}")
+        return -1
+
+    def _resolve_search_total(
+        self,
+        jql: str,
+        issues: list,
+        limit: int,
+        cached_total: int | None,
+        fetch_total: Callable[[], int] | None,
+    ) -> int:
+        """
+        Determine the total for a Cloud search once its issues are fetched.
+
+        A page with fewer issues than requested is the complete result, so its
+        length is the exact total. Totals are cached when caching is enabled.
+
+        Args:
+            jql: JQL query string (the cache key)
+            issues: The issues returned for the query
+            limit: The number of issues requested
+            cached_total: A total from the cache, if any
+            fetch_total: Returns the fetched total, if a count was requested
+
+        Returns:
+            The total, or -1 if it is unknown
+        """
+        if len(issues) < limit:
+            total = len(issues)
+        elif cached_total is not None:
+            return cached_total
+        elif fetch_total is not None:
+            total = fetch_total()
+        else:
+            return -1
+
+        if total >= 0 and self._search_total_cache is not None:
+            self._search_total_cache[jql] = total
+        return total
+
+    def _get_cached_search_total(self, jql: str) -> int | None:
+        """
+        Get the cached total for a JQL query, if totals are cached.
+
+        Args:
+            jql: JQL query string
+
+        Returns:
+            The cached total, or None on a miss or when caching is disabled
+        """
+        ttl = self.config.search_total_cache_ttl
+        if ttl <= 0:
+            return None
+        if self._search_total_cache is None:
+            self._search_total_cache = TTLCache(maxsize=256, ttl=ttl)
+        return self._search_total_cache.get(jql)
+
+    def _apply_projects_filter(self, jql: str, projects_filter: str | None) -> str:
+        """
+        Restrict a JQL query to the configured or requested projects.
+
+        Args:
+            jql: JQL query string
+            projects_filter: Optional comma-separated list of project keys,
+                overrides config
+
+        Returns:
+            The JQL query with the project filter applied, if any
+        """
+        # Use projects_filter parameter if provided, otherwise fall back to config
+        filter_to_use = projects_filter or self.config.projects_filter
+
+        # Apply projects filter if present
+        if filter_to_use:
+            # Split projects filter by commas and handle possible whitespace
+            projects = [p.strip() for p in filter_to_use.split(",")]
+
+            # Build the project filter query part
+            if len(projects) == 1:
+                project_query = f'project = "{projects[0]}"'
+            else:
+                quoted_projects = [f'"{p}"' for p in projects]
+                projects_list = ", ".join(quoted_projects)
+                project_query = f"project IN ({projects_list})"
+
+            # Add the project filter to existing query
+            if not jql:
+                # Empty JQL - just use project filter
+                jql = project_query
+            elif jql.strip().upper().startswith("ORDER BY"):
+                # JQL starts with ORDER BY - prepend project filter
+                jql = f"{project_query} {jql}"
+            elif "project = " not in jql and "project IN" not in jql:
+                # Only add if not already filtering by project
+                jql = f"({jql}) AND {project_query}"
+
+            logger.info(f"Applied projects filter to query: {jql}")
+
+        return jql
+
+    @staticmethod
+    def _search_fields_param(
+        fields: list[str] | tuple[str, ...] | set[str] | str | None,
+    ) -> str:
+        """
+        Convert requested search fields to the comma-separated API format.
+
+        Args:
+            fields: Fields to return (comma-separated string, list, tuple, set,
+                "*all" or None for the defaults)
+
+        Returns:
+            Comma-separated fields string
+        """
+        if fields is None:  # Use default if None
+            return ",".join(DEFAULT_READ_JIRA_FIELDS)
+        if isinstance(fields, list | tuple | set):
+            return ",".join(fields)
+        return fields
+
     def get_board_issues(
         self,
         board_id: str,
@@ -32,38 +32,7 @@ class TransitionsMixin(JiraClient, IssueOperationsProto, UsersOperationsProto):
         """
         try:
             transitions_data = self.jira.get_issue_transitions(issue_key)
-            result: list[dict[str, Any]] = []
-
-            for transition in transitions_data:
-                # Skip non-dict transitions
-                if not isinstance(transition, dict):
-                    continue
-
-                # Extract the essential information
-                transition_info = {
-                    "id": transition.get("id", ""),
-                    "name": transition.get("name", ""),
-                }
-
-                # Handle "to" field in different formats
-                to_status = None
-                # Option 1: 'to' field with sub-fields
-                if "to" in transition and isinstance(transition["to"], dict):
-                    to_status = transition["to"].get("name")
-                # Option 2: 'to_status' field directly
-                elif "to_status" in transition:
-                    to_status = transition.get("to_status")
-                # Option 3: 'status' field directly (sometimes used in tests)
-                elif "status" in transition:
-                    to_status = transition.get("status")
-
-                # Add to_status if found in any format
-                if to_status:
-                    transition_info["to_status"] = to_status
-
-                result.append(transition_info)
-
-            return result
+            return self._format_transitions(transitions_data)
         except HTTPError as http_err:
             if http_err.response is not None and http_err.response.status_code in [
                 401,
@@ -83,6 +52,51 @@ class TransitionsMixin(JiraClient, IssueOperationsProto, UsersOperationsProto):
             logger.error(error_msg)
             raise Exception(f"Error getting transitions: {str(e)}") from e
 
+    def _format_transitions(
+        self, transitions_data: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        Normalize transitions to dictionaries with id, name and to_status.
+
+        Args:
+            transitions_data: Transitions as returned by ``jira.get_issue_transitions``
+
+        Returns:
+            List of available transitions with id, name, and to status details
+        """
+        result: list[dict[str, Any]] = []
+
+        for transition in transitions_data:
+            # Skip non-dict transitions
+            if not isinstance(transition, dict):
+                continue
+
+            # Extract the essential information
+            transition_info = {
+                "id": transition.get("id", ""),
+                "name": transition.get("name", ""),
+            }
+
+            # Handle "to" field in different formats
+            to_status = None
+            # Option 1: 'to' field with sub-fields
+            if "to" in transition and isinstance(transition["to"], dict):
+                to_status = transition["to"].get("name")
+            # Option 2: 'to_status' field directly
+            elif "to_status" in transition:
+                to_status = transition.get("to_status")
+            # Option 3: 'status' field directly (sometimes used in tests)
+            elif "status" in transition:
+                to_status = transition.get("status")
+
+            # Add to_status if found in any format
+            if to_status:
+                transition_info["to_status"] = to_status
+
+            result.append(transition_info)
+
+        return result
+
     def get_transitions(self, issue_key: str) -> list[dict[str, Any]]:
         """
         Get the raw transitions data for an issue.
@@ -0,0 +1,139 @@
+"""Cache of resolved Jira users.
+
+Resolving a username, email or display name to an account ID costs one or
+two user searches. Tools that assign or mention the same handful of people
+repeatedly resolve them once per TTL instead. Every identifier known for a
+user (account ID, username, key, email and the strings it was looked up by)
+points to the same record, and users that could not be found are remembered
+for a shorter time.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from cachetools import TTLCache
+
+from ..utils.env import get_env_int
+
+DEFAULT_TTL = 3600
+DEFAULT_NEGATIVE_TTL = 300
+DEFAULT_MAX_SIZE = 1024
+
+# User fields that identify a user, in addition to lookup aliases
+IDENTITY_FIELDS = ("accountId", "name", "key", "emailAddress")
+
+
+def _normalize(identifier: str) -> str:
+    """Normalize an identifier for case-insensitive lookups."""
+    return identifier.strip().casefold()
+
+
+class UserDirectory:
+    """LRU cache with TTL of user records, keyed by all of their identifiers.
+
+    The directory belongs to one client, so it is scoped to one site and one
+    set of credentials: users hidden from one principal are never served to
+    another.
+    """
+
+    def __init__(
+        self,
+        ttl: int = DEFAULT_TTL,
+        negative_ttl: int = DEFAULT_NEGATIVE_TTL,
+        maxsize: int = DEFAULT_MAX_SIZE,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the directory.
+
+        Args:
+            ttl: Seconds a resolved user is cached
+            negative_ttl: Seconds an unknown identifier is remembered, 0 to disable
+            maxsize: Maximum number of identifiers kept (least recently used evicted)
+            timer: Monotonic clock, injectable for tests
+        """
+        self.ttl = ttl
+        self._users: TTLCache[str, dict[str, Any]] = TTLCache(
+            maxsize=maxsize, ttl=ttl, timer=timer
+        )
+        self._missing: TTLCache[str, bool] | None = (
+            TTLCache(maxsize=maxsize, ttl=negative_ttl, timer=timer)
+            if negative_ttl > 0
+            else None
+        )
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "UserDirectory":
+        """Create a directory configured from environment variables.
+
+        Reads ``JIRA_USER_CACHE_TTL``, ``JIRA_USER_CACHE_NEGATIVE_TTL``
+        (seconds) and ``JIRA_USER_CACHE_SIZE``.
+
+        Returns:
+            The configured directory
+        """
+        return cls(
+            ttl=get_env_int("JIRA_USER_CACHE_TTL", DEFAULT_TTL, minimum=0),
+            negative_ttl=get_env_int(
+                "JIRA_USER_CACHE_NEGATIVE_TTL", DEFAULT_NEGATIVE_TTL, minimum=0
+            ),
+            maxsize=get_env_int("JIRA_USER_CACHE_SIZE", DEFAULT_MAX_SIZE, minimum=1),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether resolved users are cached at all."""
+        return self.ttl > 0
+
+    def get(self, identifier: str) -> dict[str, Any] | None:
+        """Return the cached user for an identifier.
+
+        Args:
+            identifier: Account ID, username, key, email or a previous lookup string
+
+        Returns:
+            The raw user record, or None if it is not cached
+        """
+        with self._lock:
+            return self._users.get(_normalize(identifier))
+
+    def is_missing(self, identifier: str) -> bool:
+        """Return whether an identifier recently failed to resolve."""
+        if self._missing is None:
+            return False
+        with self._lock:
+            return _normalize(identifier) in self._missing
+
+    def add(self, user: dict[str, Any], *aliases: str) -> None:
+        """Cache a user under its identifiers and the given aliases.
+
+        Args:
+            user: The raw user record as returned by Jira
+            *aliases: Extra strings the user was resolved from, e.g. a display name
+        """
+        keys = [
+            _normalize(value)
+            for value in (*(user.get(field) for field in IDENTITY_FIELDS), *aliases)
+            if isinstance(value, str) and value.strip()
+        ]
+        with self._lock:
+            for key in keys:
+                self._users[key] = user
+                if self._missing is not None:
+                    self._missing.pop(key, None)
+
+    def add_missing(self, identifier: str) -> None:
+        """Remember that an identifier did not resolve to a user."""
+        if self._missing is None:
+            return
+        with self._lock:
+            self._missing[_normalize(identifier)] = True
+
+    def invalidate(self) -> None:
+        """Drop every cached user and unknown identifier."""
+        with self._lock:
+            self._users.clear()
+            if self._missing is not None:
+                self._missing.clear()
@@ -2,7 +2,8 @@
 
 import logging
 import re
-from typing import TYPE_CHECKING, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import requests
 from requests.exceptions import HTTPError
@@ -11,6 +12,7 @@ from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.models.jira.common import JiraUser
 
 from .client import JiraClient
+from .user_directory import UserDirectory
 
 if TYPE_CHECKING:
     from mcp_atlassian.models.jira.common import JiraUser
@@ -19,10 +21,46 @@ JiraUserType = TypeVar("JiraUserType", bound="JiraUser")
 
 logger = logging.getLogger("mcp-jira")
 
+# Concurrent lookups when resolving several users at once
+USER_LOOKUP_MAX_WORKERS = 8
+
 
 class UsersMixin(JiraClient):
     """Mixin for Jira user operations."""
 
+    _user_directory: UserDirectory | None = None
+
+    def _get_user_directory(self) -> UserDirectory | None:
+        """
+        Get the cache of resolved users, creating it on first use.
+
+        Returns:
+            The user directory, or None when user caching is disabled
+        """
+        if self._user_directory is None:
+            self._user_directory = UserDirectory.from_env()
+        return self._user_directory if self._user_directory.enabled else None
+
+    def _user_identifier(self, user: dict[str, Any]) -> str | None:
+        """
+        Get the identifier Jira expects in user fields for a user record.
+
+        Args:
+            user: The raw user record
+
+        Returns:
+            The accountId on Cloud, the name (or key) on Server/DC, or None
+        """
+        if self.config.is_cloud:
+            return user.get("accountId")
+        return user.get("name") or user.get("key")
+
+    def _remember_user(self, user: dict[str, Any], *aliases: str) -> None:
+        """Cache a resolved user under its identifiers and the given aliases."""
+        directory = self._get_user_directory()
+        if directory is not None:
+            directory.add(user, *aliases)
+
     def get_current_user_account_id(self) -> str:
         """
         Get the account ID of the current user.
@@ -105,16 +143,32 @@ class UsersMixin(JiraClient):
         if assignee.startswith("5") and len(assignee) >= 10:
             return assignee
 
-        account_id = self._lookup_user_directly(assignee)
-        if account_id:
-            return account_id
-
-        account_id = self._lookup_user_by_permissions(assignee)
-        if account_id:
-            return account_id
-
         error_msg = f"Could not find account ID for user: {assignee}"
-        raise ValueError(error_msg)
+        directory = self._get_user_directory()
+        if directory is not None:
+            cached_user = directory.get(assignee)
+            if cached_user is not None:
+                cached_id = self._user_identifier(cached_user)
+                if cached_id:
+                    return cached_id
+            elif directory.is_missing(assignee):
+                raise ValueError(error_msg)
+
+        account_id = self._lookup_user_directly(
+            assignee
+        ) or self._lookup_user_by_permissions(assignee)
+        if directory is None:
+            if account_id:
+                return account_id
+            raise ValueError(error_msg)
+
+        if not account_id:
+            directory.add_missing(assignee)
+            raise ValueError(error_msg)
+        if directory.get(assignee) is None:
+            id_field = "accountId" if self.config.is_cloud else "name"
+            directory.add({id_field: account_id}, assignee)
+        return account_id
 
     def _lookup_user_directly(self, username: str) -> str | None:
         """
@@ -145,6 +199,8 @@ class UsersMixin(JiraClient):
                     or user.get("name", "").lower() == username.lower()
                     or user.get("emailAddress", "").lower() == username.lower()
                 ):
+                    if self._user_identifier(user):
+                        self._remember_user(user, username)
                     if self.config.is_cloud:
                         if "accountId" in user:
                             return user["accountId"]
@@ -196,6 +252,8 @@ class UsersMixin(JiraClient):
             if response.status_code == 200:
                 data = response.json()
                 for user in data.get("users", []):
+                    if self._user_identifier(user):
+                        self._remember_user(user, username)
                     if self.config.is_cloud:
                         if "accountId" in user:
                             return user["accountId"]
@@ -314,6 +372,12 @@ class UsersMixin(JiraClient):
             MCPAtlassianAuthenticationError: If authentication fails.
             Exception: For other API errors.
         """
+        directory = self._get_user_directory()
+        if directory is not None:
+            cached_user = directory.get(identifier)
+            if cached_user is not None and "displayName" in cached_user:
+                return JiraUser.from_api_response(cached_user)
+
         api_kwargs = self._determine_user_api_params(identifier)
 
         try:
@@ -324,12 +388,15 @@ class UsersMixin(JiraClient):
                     f"User lookup for '{identifier}' returned unexpected type: {type(user_data)}. Data: {user_data}"
                 )
                 raise ValueError(f"User '{identifier}' not found or lookup failed.")
+            self._remember_user(user_data, identifier)
             return JiraUser.from_api_response(user_data)
         except HTTPError as http_err:
             if http_err.response is not None:
                 response_text = http_err.response.text[:200]
                 status_code = http_err.response.status_code
                 if status_code == 404:
+                    if directory is not None:
+                        directory.add_missing(identifier)
                     raise ValueError(f"User '{identifier}' not found.") from http_err
                 elif status_code in [401, 403]:
                     logger.error(
@@ -359,3 +426,34 @@ class UsersMixin(JiraClient):
             raise Exception(
                 f"Error processing user profile for '{identifier}': {str(e)}"
             ) from e
+
+    def _get_account_ids(self, identifiers: list[str]) -> dict[str, str | None]:
+        """
+        Resolve many users to the identifiers Jira expects in user fields.
+
+        Each distinct identifier is resolved once, concurrently, with the same
+        lookups (and user cache) as :meth:`_get_account_id`.
+
+        Args:
+            identifiers: Usernames, emails, display names or account IDs
+
+        Returns:
+            A mapping of each identifier to its account ID (or name on
+            Server/DC), or None if the user could not be found
+        """
+
+        def lookup(identifier: str) -> str | None:
+            try:
+                return self._get_account_id(identifier)
+            except ValueError as e:
+                logger.warning(f"Could not resolve user: {str(e)}")
+                return None
+
+        pending = list(dict.fromkeys(identifiers))
+        if len(pending) <= 1:
+            return {identifier: lookup(identifier) for identifier in pending}
+        with ThreadPoolExecutor(
+            max_workers=min(USER_LOOKUP_MAX_WORKERS, len(pending)),
+            thread_name_prefix="jira-user-lookup",
+        ) as pool:
+            return dict(zip(pending, pool.map(lookup, pending), strict=True))
@@ -5,9 +5,10 @@ This module provides Pydantic models for Confluence pages and their versions.
 
 import logging
 import warnings
+from collections.abc import Callable
 from typing import Any
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr, computed_field
 
 from ..base import ApiModel, TimestampMixin
 from ..constants import (
@@ -77,7 +78,8 @@ class ConfluencePage(ApiModel, TimestampMixin):
     Model representing a Confluence page.
 
     This model includes the content, metadata, and version information
-    for a Confluence page.
+    for a Confluence page. The content can be given as a loader, which
+    converts the raw body the first time the content is read.
     """
 
     id: str = CONFLUENCE_DEFAULT_ID
@@ -85,7 +87,6 @@ class ConfluencePage(ApiModel, TimestampMixin):
     type: str = "page"  # "page", "blogpost", etc.
     status: str = "current"
     space: ConfluenceSpace | None = None
-    content: str = EMPTY_STRING
     content_format: str = "view"  # "view", "storage", etc.
     created: str = EMPTY_STRING
     updated: str = EMPTY_STRING
@@ -96,6 +97,56 @@ class ConfluencePage(ApiModel, TimestampMixin):
     attachments: list[ConfluenceAttachment] = Field(default_factory=list)
     url: str | None = None
 
+    _content: str = PrivateAttr(default=EMPTY_STRING)
+    _content_loader: Callable[[], str] | None = PrivateAttr(default=None)
+
+    def __init__(
+        self,
+        content: str = EMPTY_STRING,
+        content_loader: Callable[[], str] | None = None,
+        **data: Any,
+    ) -> None:
+        """
+        Initialize the page.
+
+        Args:
+            content: The page content
+            content_loader: Optional callable producing the content on first
+                access, used instead of ``content``
+            **data: The other model fields
+        """
+        super().__init__(**data)
+        self._content = content
+        self._content_loader = content_loader
+
+    @computed_field(repr=False)  # type: ignore[prop-decorator]
+    @property
+    def content(self) -> str:
+        """The page content, loaded on first access and then memoized."""
+        if self._content_loader is not None:
+            self._content = self._content_loader()
+            self._content_loader = None
+        return self._content
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content = value
+        self._content_loader = None
+
+    def set_content_loader(self, loader: Callable[[], str]) -> None:
+        """
+        Replace the content with one produced by ``loader`` on first access.
+
+        Args:
+            loader: Callable returning the content
+        """
+        self._content_loader = loader
+
+    @property
+    def is_content_loaded(self) -> bool:
+        """Whether the content has been computed (or was given directly)."""
+        return self._content_loader is None
+
     @property
     def page_content(self) -> str:
         """
@@ -121,6 +172,8 @@ class ConfluencePage(ApiModel, TimestampMixin):
                 base_url: Base URL for constructing page URLs
                 include_body: Whether to include body content
                 content_override: Override the content value
+                content_loader: Callable producing the content on first access,
+                    e.g. a deferred Markdown conversion of the body
                 content_format: Override the content format
                 is_cloud: Whether this is a cloud instance (affects URL format)
 
@@ -149,9 +202,13 @@ class ConfluencePage(ApiModel, TimestampMixin):
         content_format = kwargs.get("content_format", "view")
         include_body = kwargs.get("include_body", True)
 
-        # Allow content override to be provided directly
+        content_loader = None
+
+        # Allow content override to be provided directly, or deferred
         if content_override := kwargs.get("content_override"):
             content = content_override
+        elif kwargs.get("content_loader"):
+            content_loader = kwargs["content_loader"]
         elif include_body and "body" in data:
             body = data.get("body", {})
             if content_format in body:
@@ -218,6 +275,7 @@ class ConfluencePage(ApiModel, TimestampMixin):
             status=data.get("status", "current"),
             space=space,
             content=content,
+            content_loader=content_loader,
             content_format=content_format,
             created=created,
             updated=updated,
@@ -229,8 +287,16 @@ class ConfluencePage(ApiModel, TimestampMixin):
             url=url,
         )
 
-    def to_simplified_dict(self) -> dict[str, Any]:
-        """Convert to simplified dictionary for API response."""
+    def to_simplified_dict(self, include_content: bool = True) -> dict[str, Any]:
+        """Convert to simplified dictionary for API response.
+
+        Args:
+            include_content: Whether to include the content, which runs a
+                pending content loader
+
+        Returns:
+            Dictionary with the page fields
+        """
         result = {
             "id": self.id,
             "title": self.title,
@@ -257,8 +323,8 @@ class ConfluencePage(ApiModel, TimestampMixin):
             attachment.to_simplified_dict() for attachment in self.attachments
         ]
 
-        # Add content if it's not empty
-        if self.content and self.content_format:
+        # Add content if it's requested and not empty
+        if include_content and self.content and self.content_format:
             result["content"] = {"value": self.content, "format": self.content_format}
 
         # Add ancestors if there are any
@@ -1,15 +1,44 @@
 """Base preprocessing module."""
 
+import html
+import importlib.util
 import logging
+import os
 import re
+import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Protocol
 
-from bs4 import BeautifulSoup, Tag
-from markdownify import markdownify as md
+from bs4 import BeautifulSoup, CData, Tag
+from cachetools import TTLCache
+from markdownify import MarkdownConverter
+
+from ..utils.env import get_env_int
+from .conversion_cache import ConversionCache, content_key
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Account IDs per /rest/api/user/bulk request
+USER_BULK_CHUNK_SIZE = 100
+# Concurrent lookups for users that cannot be fetched in bulk
+USER_LOOKUP_MAX_WORKERS = 8
+USER_NAME_CACHE_SIZE = 1024
+
+# Bumped whenever process_html_content produces different output
+HTML_CONVERSION_VERSION = "2"
+# Shorter content is cheaper to convert than to cache
+CONVERSION_CACHE_MIN_LENGTH = 256
+
+HTML_PARSERS = ("lxml", "html.parser")
+# lxml's HTML parser turns CDATA sections (code macro bodies) into comments,
+# so they are parsed as placeholder elements and turned back into CDATA
+CDATA_PATTERN = re.compile(r"<!\[CDATA\[([\s\S]*?)\]\]>")
+CDATA_PLACEHOLDER = "mcp-cdata"
+
+# A mentioned user: ("account-id", accountId) or ("userkey", userkey)
+UserRef = tuple[str, str]
+
 
 class ConfluenceClient(Protocol):
     """Protocol for Confluence client."""
@@ -23,46 +52,123 @@ class ConfluenceClient(Protocol):
         ...
 
 
+def is_lxml_available() -> bool:
+    """Check whether the optional ``lxml`` package is installed."""
+    return importlib.util.find_spec("lxml") is not None
+
+
+def get_html_parser() -> str:
+    """
+    Get the BeautifulSoup parser backend for HTML content.
+
+    ``HTML_PARSER`` selects "lxml" or "html.parser"; the default ("auto")
+    uses lxml when it is installed and falls back to "html.parser".
+
+    Returns:
+        The parser name
+    """
+    parser = os.getenv("HTML_PARSER", "auto").strip().lower()
+    if parser == "lxml" and not is_lxml_available():
+        logger.warning("HTML_PARSER=lxml but lxml is not installed, using html.parser")
+        return "html.parser"
+    if parser in HTML_PARSERS:
+        return parser
+    if parser != "auto":
+        logger.warning(f"Invalid HTML_PARSER value '{parser}', using 'auto'")
+    return "lxml" if is_lxml_available() else "html.parser"
+
+
 class BasePreprocessor:
     """Base class for text preprocessing operations."""
 
-    def __init__(self, base_url: str = "") -> None:
+    def __init__(
+        self,
+        base_url: str = "",
+        html_parser: str | None = None,
+        cache_scope: str = "",
+    ) -> None:
         """
         Initialize the base text preprocessor.
 
         Args:
             base_url: Base URL for API server
+            html_parser: BeautifulSoup parser backend ("lxml" or "html.parser"),
+                defaults to :func:`get_html_parser`
+            cache_scope: Site and principal of the client, scoping the
+                conversion results persisted to disk
         """
         self.base_url = base_url.rstrip("/") if base_url else ""
+        self.html_parser = html_parser or get_html_parser()
+        self.cache_scope = cache_scope
+        self._user_name_cache: TTLCache[UserRef, str] | None = None
+        self._user_name_lock = threading.Lock()
+        self._conversion_cache: ConversionCache | None = None
 
     def process_html_content(
         self,
         html_content: str,
         space_key: str = "",
         confluence_client: ConfluenceClient | None = None,
+        cache_key: str | None = None,
     ) -> tuple[str, str]:
         """
         Process HTML content to replace user refs and page links.
 
+        Results are cached by a hash of the content, or by ``cache_key`` when
+        the caller can identify the content version without hashing it.
+
         Args:
             html_content: The HTML content to process
             space_key: Optional space key for context
             confluence_client: Optional Confluence client for user lookups
+            cache_key: Optional identifier of this exact content, e.g. a page ID
+                and version number
 
         Returns:
             Tuple of (processed_html, processed_markdown)
         """
+        cache = self.get_conversion_cache()
+        if cache is None or (
+            cache_key is None and len(html_content) < CONVERSION_CACHE_MIN_LENGTH
+        ):
+            return self._process_html_content(html_content, confluence_client)
+
+        key = content_key(
+            "html",
+            HTML_CONVERSION_VERSION,
+            self.html_parser,
+            self.base_url,
+            "client" if confluence_client is not None else "",
+            f"id:{cache_key}" if cache_key is not None else f"body:{html_content}",
+        )
+        processed_html, processed_markdown = cache.get_or_convert(
+            key, lambda: self._process_html_content(html_content, confluence_client)
+        )
+        return processed_html, processed_markdown
+
+    def _process_html_content(
+        self,
+        html_content: str,
+        confluence_client: ConfluenceClient | None = None,
+    ) -> tuple[str, str]:
+        """Parse HTML, substitute user references and convert it to Markdown."""
         try:
             # Parse the HTML content
-            soup = BeautifulSoup(html_content, "html.parser")
-
-            # Process user mentions
-            self._process_user_mentions_in_soup(soup, confluence_client)
-            self._process_user_profile_macros_in_soup(soup, confluence_client)
-
-            # Convert to string and markdown
-            processed_html = str(soup)
-            processed_markdown = md(processed_html)
+            soup = self._parse_html(html_content)
+
+            # Resolve every mentioned user at once, then substitute them
+            display_names = self._resolve_user_display_names(soup, confluence_client)
+            self._process_user_mentions_in_soup(soup, confluence_client, display_names)
+            self._process_user_profile_macros_in_soup(
+                soup, confluence_client, display_names
+            )
+            # Merge the substituted names into their neighbouring text, as a
+            # fresh parse of the processed HTML would
+            soup.smooth()
+
+            # Convert to string and markdown, reusing the parsed tree
+            processed_html = self._serialize_html(soup)
+            processed_markdown = MarkdownConverter().convert_soup(soup)
 
             return processed_html, processed_markdown
 
@@ -71,7 +177,10 @@ class BasePreprocessor:
             raise
 
     def _process_user_mentions_in_soup(
-        self, soup: BeautifulSoup, confluence_client: ConfluenceClient | None = None
+        self,
+        soup: BeautifulSoup,
+        confluence_client: ConfluenceClient | None = None,
+        display_names: dict[UserRef, str] | None = None,
     ) -> None:
         """
         Process user mentions in BeautifulSoup object.
@@ -79,34 +188,47 @@ class BasePreprocessor:
         Args:
             soup: BeautifulSoup object containing HTML
             confluence_client: Optional Confluence client for user lookups
+            display_names: Display names already resolved for the soup's users;
+                resolved here when not provided
         """
+        if display_names is None:
+            display_names = self._resolve_user_display_names(soup, confluence_client)
+
         # Find all ac:link elements that might contain user mentions
         user_mentions = soup.find_all("ac:link")
 
         for user_element in user_mentions:
-            user_ref = user_element.find("ri:user")
-            if user_ref and user_ref.get("ri:account-id"):
-                # Case 1: Direct user reference without link-body
-                account_id = user_ref.get("ri:account-id")
-                if isinstance(account_id, str):
-                    self._replace_user_mention(
-                        user_element, account_id, confluence_client
-                    )
-                    continue
-
-            # Case 2: User reference with link-body containing @
-            link_body = user_element.find("ac:link-body")
-            if link_body and "@" in link_body.get_text(strip=True):
-                user_ref = user_element.find("ri:user")
-                if user_ref and user_ref.get("ri:account-id"):
-                    account_id = user_ref.get("ri:account-id")
-                    if isinstance(account_id, str):
-                        self._replace_user_mention(
-                            user_element, account_id, confluence_client
-                        )
+            account_id = self._get_mention_account_id(user_element)
+            if account_id:
+                self._replace_user_mention(
+                    user_element,
+                    account_id,
+                    display_names.get(("account-id", account_id)),
+                )
+
+    def _get_mention_account_id(self, user_element: Tag) -> str | None:
+        """
+        Get the account ID of a user mention.
+
+        Args:
+            user_element: An ac:link element
+
+        Returns:
+            The mentioned user's account ID, or None if it is not a user mention
+        """
+        # Direct user reference, with or without a link-body containing @
+        user_ref = user_element.find("ri:user")
+        if user_ref and user_ref.get("ri:account-id"):
+            account_id = user_ref.get("ri:account-id")
+            if isinstance(account_id, str):
+                return account_id
+        return None
 
     def _process_user_profile_macros_in_soup(
-        self, soup: BeautifulSoup, confluence_client: ConfluenceClient | None = None
+        self,
+        soup: BeautifulSoup,
+        confluence_client: ConfluenceClient | None = None,
+        display_names: dict[UserRef, str] | None = None,
     ) -> None:
         """
         Process Confluence User Profile macros in BeautifulSoup object.
@@ -116,7 +238,12 @@ class BasePreprocessor:
         Args:
             soup: BeautifulSoup object containing HTML
             confluence_client: Optional Confluence client for user lookups
+            display_names: Display names already resolved for the soup's users;
+                resolved here when not provided
         """
+        if display_names is None:
+            display_names = self._resolve_user_display_names(soup, confluence_client)
+
         profile_macros = soup.find_all(
             "ac:structured-macro", attrs={"ac:name": "profile"}
         )
@@ -145,22 +272,10 @@ class BasePreprocessor:
             display_name = None
 
             if confluence_client and user_identifier_for_log:
-                try:
-                    if account_id and isinstance(account_id, str):
-                        user_details = confluence_client.get_user_details_by_accountid(
-                            account_id
-                        )
-                        display_name = user_details.get("displayName")
-                    elif userkey and isinstance(userkey, str):
-                        # For Confluence Server/DC, userkey might be the username
-                        user_details = confluence_client.get_user_details_by_username(
-                            userkey
-                        )
-                        display_name = user_details.get("displayName")
-                except Exception as e:
-                    logger.warning(
-                        f"Error fetching user details for profile macro (user: {user_identifier_for_log}): {e}"
-                    )
+                if account_id and isinstance(account_id, str):
+                    display_name = display_names.get(("account-id", account_id))
+                elif userkey and isinstance(userkey, str):
+                    display_name = display_names.get(("userkey", userkey))
             elif not confluence_client:
                 logger.warning(
                     "Confluence client not available for User Profile Macro processing."
@@ -180,10 +295,7 @@ class BasePreprocessor:
                 logger.debug(f"Using fallback for user profile macro: {fallback_text}")
 
     def _replace_user_mention(
-        self,
-        user_element: Tag,
-        account_id: str,
-        confluence_client: ConfluenceClient | None = None,
+        self, user_element: Tag, account_id: str, display_name: str | None
     ) -> None:
         """
         Replace a user mention with the user's display name.
@@ -191,25 +303,189 @@ class BasePreprocessor:
         Args:
             user_element: The HTML element containing the user mention
             account_id: The user's account ID
+            display_name: The user's display name, or None if it could not be
+                resolved
+        """
+        if display_name:
+            user_element.replace_with(f"@{display_name}")
+        else:
+            self._use_fallback_user_mention(user_element, account_id)
+
+    def _collect_user_refs(self, soup: BeautifulSoup) -> list[UserRef]:
+        """
+        Collect the unique users referenced by mentions and profile macros.
+
+        Args:
+            soup: BeautifulSoup object containing HTML
+
+        Returns:
+            The referenced users, in document order
+        """
+        refs: dict[UserRef, None] = {}
+        for user_element in soup.find_all("ac:link"):
+            account_id = self._get_mention_account_id(user_element)
+            if account_id:
+                refs["account-id", account_id] = None
+        for macro_element in soup.find_all(
+            "ac:structured-macro", attrs={"ac:name": "profile"}
+        ):
+            user_param = macro_element.find("ac:parameter", attrs={"ac:name": "user"})
+            user_ref = user_param.find("ri:user") if user_param else None
+            if not user_ref:
+                continue
+            for kind in ("account-id", "userkey"):
+                identifier = user_ref.get(f"ri:{kind}")
+                if identifier and isinstance(identifier, str):
+                    refs[kind, identifier] = None
+                    break
+        return list(refs)
+
+    def _resolve_user_display_names(
+        self, soup: BeautifulSoup, confluence_client: ConfluenceClient | None
+    ) -> dict[UserRef, str]:
+        """
+        Resolve the display names of all users referenced in a soup.
+
+        Names are served from a TTL cache shared by all content processed by
+        this preprocessor. Missing account IDs are fetched with one bulk
+        request per chunk where the client supports it, and remaining users
+        are looked up concurrently.
+
+        Args:
+            soup: BeautifulSoup object containing HTML
             confluence_client: Optional Confluence client for user lookups
+
+        Returns:
+            Display names by user reference; users that could not be resolved
+            are omitted
         """
-        try:
-            # Only attempt to get user details if we have a valid confluence client
-            if confluence_client is not None:
-                user_details = confluence_client.get_user_details_by_accountid(
-                    account_id
+        if confluence_client is None:
+            return {}
+        refs = self._collect_user_refs(soup)
+        if not refs:
+            return {}
+
+        cache = self._get_user_name_cache()
+        names: dict[UserRef, str] = {}
+        if cache is not None:
+            with self._user_name_lock:
+                names = {ref: cache[ref] for ref in refs if ref in cache}
+        pending = [ref for ref in refs if ref not in names]
+
+        account_ids = [
+            identifier for kind, identifier in pending if kind == "account-id"
+        ]
+        if len(account_ids) > 1:
+            for start in range(0, len(account_ids), USER_BULK_CHUNK_SIZE):
+                names.update(
+                    self._get_display_names_bulk(
+                        account_ids[start : start + USER_BULK_CHUNK_SIZE],
+                        confluence_client,
+                    )
                 )
-                display_name = user_details.get("displayName", "")
-                if display_name:
-                    new_text = f"@{display_name}"
-                    user_element.replace_with(new_text)
-                    return
-            # If we don't have a confluence client or couldn't get user details,
-            # use fallback
-            self._use_fallback_user_mention(user_element, account_id)
+            pending = [ref for ref in pending if ref not in names]
+
+        def lookup(ref: UserRef) -> str | None:
+            kind, identifier = ref
+            try:
+                if kind == "account-id":
+                    details = confluence_client.get_user_details_by_accountid(
+                        identifier
+                    )
+                else:
+                    # For Confluence Server/DC, userkey might be the username
+                    details = confluence_client.get_user_details_by_username(identifier)
+                return details.get("displayName") or None
+            except Exception as e:
+                logger.warning(f"Error fetching user details for {identifier}: {e}")
+                return None
+
+        if len(pending) == 1:
+            resolved = [lookup(pending[0])]
+        elif pending:
+            with ThreadPoolExecutor(
+                max_workers=min(USER_LOOKUP_MAX_WORKERS, len(pending)),
+                thread_name_prefix="confluence-user-lookup",
+            ) as pool:
+                resolved = list(pool.map(lookup, pending))
+        else:
+            resolved = []
+        names.update(
+            (ref, name) for ref, name in zip(pending, resolved, strict=True) if name
+        )
+
+        if cache is not None:
+            with self._user_name_lock:
+                cache.update(names)
+        return names
+
+    def _get_display_names_bulk(
+        self, account_ids: list[str], confluence_client: ConfluenceClient
+    ) -> dict[UserRef, str]:
+        """
+        Fetch display names with a single Confluence Cloud bulk user request.
+
+        Args:
+            account_ids: Up to one chunk of account IDs
+            confluence_client: Confluence client for the request
+
+        Returns:
+            Display names by user reference. Empty if the client cannot make
+            the request or it fails, leaving the users to be looked up
+            individually.
+        """
+        get = getattr(confluence_client, "get", None)
+        if not callable(get):
+            return {}
+        try:
+            response = get(
+                "rest/api/user/bulk",
+                params={"accountId": ",".join(account_ids), "limit": len(account_ids)},
+            )
         except Exception as e:
-            logger.warning(f"Error processing user mention: {str(e)}")
-            self._use_fallback_user_mention(user_element, account_id)
+            logger.debug(f"Bulk user lookup failed: {e}")
+            return {}
+        if not isinstance(response, dict):
+            return {}
+
+        return {
+            ("account-id", user["accountId"]): user["displayName"]
+            for user in response.get("results", [])
+            if isinstance(user, dict)
+            and user.get("accountId") in account_ids
+            and user.get("displayName")
+        }
+
+    def _get_user_name_cache(self) -> "TTLCache[UserRef, str] | None":
+        """
+        Get the display name cache, creating it on first use.
+
+        The TTL is read from ``CONFLUENCE_USER_CACHE_TTL`` (seconds, default
+        3600); 0 disables caching.
+
+        Returns:
+            The cache, or None when caching is disabled
+        """
+        if self._user_name_cache is None:
+            ttl = get_env_int("CONFLUENCE_USER_CACHE_TTL", 3600, minimum=0)
+            if ttl <= 0:
+                return None
+            self._user_name_cache = TTLCache(maxsize=USER_NAME_CACHE_SIZE, ttl=ttl)
+        return self._user_name_cache
+
+    def get_conversion_cache(self) -> ConversionCache | None:
+        """
+        Get the conversion cache, creating it on first use.
+
+        It is configured by ``CONVERSION_CACHE_SIZE``, ``CONVERSION_CACHE_TTL``
+        (seconds, default 3600; 0 disables caching) and ``CONVERSION_CACHE_DIR``.
+
+        Returns:
+            The cache, or None when caching is disabled
+        """
+        if self._conversion_cache is None:
+            self._conversion_cache = ConversionCache.from_env(scope=self.cache_scope)
+        return self._conversion_cache if self._conversion_cache.enabled else None
 
     def _use_fallback_user_mention(self, user_element: Tag, account_id: str) -> None:
         """
@@ -223,15 +499,41 @@ class BasePreprocessor:
         new_text = f"@user_{account_id}"
         user_element.replace_with(new_text)
 
+    def _parse_html(self, html_content: str) -> BeautifulSoup:
+        """Parse HTML with the configured parser backend."""
+        if self.html_parser != "lxml" or "<![CDATA[" not in html_content:
+            return BeautifulSoup(html_content, self.html_parser)
+        html_content = CDATA_PATTERN.sub(
+            lambda match: (
+                f"<{CDATA_PLACEHOLDER}>"
+                f"{html.escape(match.group(1), quote=False)}</{CDATA_PLACEHOLDER}>"
+            ),
+            html_content,
+        )
+        soup = BeautifulSoup(html_content, self.html_parser)
+        for placeholder in soup.find_all(CDATA_PLACEHOLDER):
+            placeholder.replace_with(CData(placeholder.get_text()))
+        return soup
+
+    def _serialize_html(self, soup: BeautifulSoup) -> str:
+        """Serialize a parsed fragment without the document wrapper lxml adds."""
+        if self.html_parser != "lxml" or soup.html is None:
+            return str(soup)
+        return "".join(
+            part.decode_contents() for part in (soup.head, soup.body) if part
+        )
+
     def _convert_html_to_markdown(self, text: str) -> str:
         """Convert HTML content to markdown if needed."""
         if re.search(r"<[^>]+>", text):
             try:
                 with warnings.catch_warnings():
                     warnings.filterwarnings("ignore", category=UserWarning)
-                    soup = BeautifulSoup(f"<div>{text}</div>", "html.parser")
-                    html = str(soup.div.decode_contents()) if soup.div else text
-                    text = md(html)
+                    # The wrapper keeps unclosed trailing tags inside the fragment
+                    soup = self._parse_html(f"<div>{text}</div>")
+                    if soup.div:
+                        soup.div.unwrap()
+                    text = MarkdownConverter().convert_soup(soup)
             except Exception as e:
                 logger.warning(f"Error converting HTML to markdown: {str(e)}")
         return text
@@ -21,14 +21,21 @@ logger = logging.getLogger("mcp-atlassian")
 class ConfluencePreprocessor(BasePreprocessor):
     """Handles text preprocessing for Confluence content."""
 
-    def __init__(self, base_url: str) -> None:
+    def __init__(
+        self, base_url: str, html_parser: str | None = None, cache_scope: str = ""
+    ) -> None:
         """
         Initialize the Confluence text preprocessor.
 
         Args:
             base_url: Base URL for Confluence API
+            html_parser: BeautifulSoup parser backend, defaults to HTML_PARSER
+            cache_scope: Site and principal of the client, scoping the
+                conversion results persisted to disk
         """
-        super().__init__(base_url=base_url)
+        super().__init__(
+            base_url=base_url, html_parser=html_parser, cache_scope=cache_scope
+        )
 
     def markdown_to_confluence_storage(
         self, markdown_content: str, *, enable_heading_anchors: bool = False
@@ -0,0 +1,223 @@
+"""Content-addressed cache of converted content.
+
+Converting a Confluence storage body (HTML parse, mention resolution and
+``markdownify``) or a Jira description (markup passes) is repeated on every
+read of the same content. This cache keeps converted results keyed by a hash
+of the raw content, the converter version and the site, so unchanged content
+is converted once. Confluence callers can key by page ID and version number
+instead, which skips hashing the body entirely.
+
+Entries live in a bounded in-memory LRU with a TTL, optionally backed by a
+directory on disk that survives restarts. The directory may be shared by
+clients of several users, so its entries are also keyed by the scope (site
+and principal) of the cache.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from cachetools import TTLCache
+
+from ..utils.env import get_env_int
+
+logger = logging.getLogger("mcp-atlassian")
+
+DEFAULT_MAX_SIZE = 256
+DEFAULT_TTL = 3600
+
+
+def content_key(*parts: str) -> str:
+    """Build a cache key from content and the context it was converted in.
+
+    Args:
+        *parts: Converter version, site URL, raw content or explicit IDs
+
+    Returns:
+        A hex digest identifying the combination
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    for part in parts:
+        digest.update(part.encode("utf-8", "surrogatepass"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class ConversionCache:
+    """LRU cache with TTL of conversion results, optionally persisted to disk.
+
+    Values must be JSON serializable when a directory is configured. The
+    in-memory layer is checked first; disk hits are promoted to memory.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAX_SIZE,
+        ttl: int = DEFAULT_TTL,
+        directory: str | Path | None = None,
+        timer: Callable[[], float] = time.monotonic,
+        scope: str = "",
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of results kept in memory
+            ttl: Seconds a result is served, 0 to disable caching
+            directory: Optional directory persisting results across restarts
+            timer: Monotonic clock for the in-memory layer, injectable for tests
+            scope: Site and principal the results are converted for, keeping
+                their files on disk apart from other users' results
+        """
+        self.ttl = ttl
+        self.scope = scope
+        self.directory = Path(directory).expanduser() if directory else None
+        self._entries: TTLCache[str, Any] = TTLCache(
+            maxsize=maxsize, ttl=max(ttl, 1), timer=timer
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls, scope: str = "") -> "ConversionCache":
+        """Create a cache configured from environment variables.
+
+        Reads ``CONVERSION_CACHE_SIZE``, ``CONVERSION_CACHE_TTL`` (seconds)
+        and ``CONVERSION_CACHE_DIR``.
+
+        Args:
+            scope: Site and principal the results are converted for
+
+        Returns:
+            The configured cache
+        """
+        return cls(
+            maxsize=get_env_int("CONVERSION_CACHE_SIZE", DEFAULT_MAX_SIZE, minimum=1),
+            ttl=get_env_int("CONVERSION_CACHE_TTL", DEFAULT_TTL, minimum=0),
+            directory=os.getenv("CONVERSION_CACHE_DIR") or None,
+            scope=scope,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether results are cached at all."""
+        return self.ttl > 0
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached result for a key.
+
+        Args:
+            key: A key built with :func:`content_key`
+
+        Returns:
+            The cached result, or None on a miss
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self.hits += 1
+                return value
+
+        value = self._read(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries[key] = value
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Cache a result.
+
+        Args:
+            key: A key built with :func:`content_key`
+            value: The conversion result
+        """
+        with self._lock:
+            self._entries[key] = value
+        self._write(key, value)
+
+    def get_or_convert(self, key: str, convert: Callable[[], Any]) -> Any:
+        """Return the cached result for a key, converting and caching on a miss.
+
+        Args:
+            key: A key built with :func:`content_key`
+            convert: Callable producing the result
+
+        Returns:
+            The cached or freshly converted result
+        """
+        value = self.get(key)
+        if value is None:
+            value = convert()
+            self.put(key, value)
+        return value
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit and miss counters.
+
+        Returns:
+            Dictionary with ``hits``, ``misses``, ``hit_rate`` and ``size``
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+            }
+
+    def clear(self) -> None:
+        """Drop every in-memory result and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _path(self, directory: Path, key: str) -> Path:
+        """Path of a key's file in this scope, sharded by its first two hex digits."""
+        if self.scope:
+            key = content_key(self.scope, key)
+        return directory / key[:2] / f"{key}.json"
+
+    def _read(self, key: str) -> Any | None:
+        """Read a result from disk, ignoring missing, expired or corrupt files."""
+        if self.directory is None:
+            return None
+        path = self._path(self.directory, key)
+        try:
+            if time.time() - path.stat().st_mtime >= self.ttl:
+                return None
+            with path.open(encoding="utf-8") as file:
+                return json.load(file)["value"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable conversion cache entry {path}: {e}")
+            return None
+
+    def _write(self, key: str, value: Any) -> None:
+        """Write a result to disk atomically; failures only disable persistence."""
+        if self.directory is None:
+            return
+        path = self._path(self.directory, key)
+        temp_path = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump({"value": value}, file)
+            os.replace(temp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not persist conversion cache entry {path}: {e}")
+            if temp_path is not None and os.path.exists(temp_path):
+                os.unlink(temp_path)
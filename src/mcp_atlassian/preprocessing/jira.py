@@ -1,26 +1,60 @@
 """Jira-specific text preprocessing module."""
 
 import logging
+import os
 import re
-from typing import Any
+from typing import Any, Literal
 
-from .base import BasePreprocessor
+from .base import CONVERSION_CACHE_MIN_LENGTH, BasePreprocessor
+from .conversion_cache import content_key
+from .jira_markup import JiraMarkupConverter
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Bumped whenever the legacy clean_jira_text produces different output
+LEGACY_MARKUP_VERSION = 1
+
+SMART_LINK_PATTERN = re.compile(r"\[(.*?)\|(.*?)\|smart-link\]")
+ISSUE_BROWSE_PATTERN = re.compile(r"browse/([A-Z]+-\d+)")
+CONFLUENCE_PAGE_PATTERN = re.compile(r"wiki/spaces/.+?/pages/\d+/(.+?)(?:\?|$)")
+
 
 class JiraPreprocessor(BasePreprocessor):
     """Handles text preprocessing for Jira content."""
 
-    def __init__(self, base_url: str = "", **kwargs: Any) -> None:
+    def __init__(
+        self,
+        base_url: str = "",
+        converter: Literal["legacy", "compiled"] | None = None,
+        **kwargs: Any,
+    ) -> None:
         """
         Initialize the Jira text preprocessor.
 
         Args:
             base_url: Base URL for Jira API
+            converter: Jira markup to Markdown converter: "legacy" (sequential
+                regex passes) or "compiled" (JiraMarkupConverter). Defaults to
+                the JIRA_MARKUP_CONVERTER environment variable, else "legacy".
             **kwargs: Additional arguments for the base class
         """
         super().__init__(base_url=base_url, **kwargs)
+        if converter is None:
+            converter = os.getenv("JIRA_MARKUP_CONVERTER", "legacy").strip().lower()
+        if converter not in ("legacy", "compiled"):
+            logger.warning(
+                f"Invalid JIRA_MARKUP_CONVERTER value '{converter}', using 'legacy'"
+            )
+            converter = "legacy"
+        self.markup_converter: JiraMarkupConverter | None = (
+            JiraMarkupConverter() if converter == "compiled" else None
+        )
+        # Identifies the conversion in cache keys
+        self.converter_version = (
+            f"compiled-{JiraMarkupConverter.VERSION}"
+            if self.markup_converter
+            else f"legacy-{LEGACY_MARKUP_VERSION}"
+        )
 
     def clean_jira_text(self, text: str) -> str:
         """
@@ -28,10 +62,20 @@ class JiraPreprocessor(BasePreprocessor):
         1. Processing user mentions and links
         2. Converting Jira markup to markdown
         3. Converting HTML/wiki markup to markdown
+
+        Results for longer texts are cached by a hash of the text.
         """
         if not text:
             return ""
 
+        cache = self.get_conversion_cache()
+        if cache is None or len(text) < CONVERSION_CACHE_MIN_LENGTH:
+            return self._clean_jira_text(text)
+        key = content_key("jira", self.converter_version, self.base_url, text)
+        return cache.get_or_convert(key, lambda: self._clean_jira_text(text))
+
+    def _clean_jira_text(self, text: str) -> str:
+        """Convert mentions, smart links, markup and HTML to Markdown."""
         # Process user mentions
         mention_pattern = r"\[~accountid:(.*?)\]"
         text = self._process_mentions(text, mention_pattern)
@@ -58,48 +102,39 @@ class JiraPreprocessor(BasePreprocessor):
         Returns:
             Text with mentions replaced with display names
         """
-        mentions = re.findall(pattern, text)
-        for account_id in mentions:
-            try:
-                # Note: This is a placeholder - actual user fetching should be injected
-                display_name = f"User:{account_id}"
-                text = text.replace(f"[~accountid:{account_id}]", display_name)
-            except Exception as e:
-                logger.error(f"Error processing mention for {account_id}: {str(e)}")
-        return text
+
+        def replace(match: re.Match) -> str:
+            # Note: This is a placeholder - actual user fetching should be injected
+            return f"User:{match.group(1)}"
+
+        return re.sub(pattern, replace, text)
 
     def _process_smart_links(self, text: str) -> str:
         """Process Jira/Confluence smart links."""
-        # Pattern matches: [text|url|smart-link]
-        link_pattern = r"\[(.*?)\|(.*?)\|smart-link\]"
-        matches = re.finditer(link_pattern, text)
 
-        for match in matches:
-            full_match = match.group(0)
+        # Pattern matches: [text|url|smart-link]
+        def replace(match: re.Match) -> str:
             link_text = match.group(1)
             link_url = match.group(2)
 
             # Extract issue key if it's a Jira issue link
-            issue_key_match = re.search(r"browse/([A-Z]+-\d+)", link_url)
+            issue_key_match = ISSUE_BROWSE_PATTERN.search(link_url)
             # Check if it's a Confluence wiki link
-            confluence_match = re.search(
-                r"wiki/spaces/.+?/pages/\d+/(.+?)(?:\?|$)", link_url
-            )
+            confluence_match = CONFLUENCE_PAGE_PATTERN.search(link_url)
 
             if issue_key_match:
                 issue_key = issue_key_match.group(1)
                 clean_url = f"{self.base_url}/browse/{issue_key}"
-                text = text.replace(full_match, f"[{issue_key}]({clean_url})")
-            elif confluence_match:
+                return f"[{issue_key}]({clean_url})"
+            if confluence_match:
                 url_title = confluence_match.group(1)
                 readable_title = url_title.replace("+", " ")
                 readable_title = re.sub(r"^[A-Z]+-\d+\s+", "", readable_title)
-                text = text.replace(full_match, f"[{readable_title}]({link_url})")
-            else:
-                clean_url = link_url.split("?")[0]
-                text = text.replace(full_match, f"[{link_text}]({clean_url})")
+                return f"[{readable_title}]({link_url})"
+            clean_url = link_url.split("?")[0]
+            return f"[{link_text}]({clean_url})"
 
-        return text
+        return SMART_LINK_PATTERN.sub(replace, text)
 
     def jira_to_markdown(self, input_text: str) -> str:
         """
@@ -113,6 +148,8 @@ class JiraPreprocessor(BasePreprocessor):
         """
         if not input_text:
             return ""
+        if self.markup_converter is not None:
+            return self.markup_converter.convert(input_text)
 
         # Block quotes
         output = re.sub(r"^bq\.(.*?)$", r"> \1\n", input_text, flags=re.MULTILINE)
@@ -207,23 +244,19 @@ class JiraPreprocessor(BasePreprocessor):
         )
 
         # Convert Jira table headers (||) to markdown table format
-        lines = output.split("\n")
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-
+        lines = []
+        for line in output.split("\n"):
             if "||" in line:
                 # Replace Jira table headers
-                lines[i] = lines[i].replace("||", "|")
+                line = line.replace("||", "|")
+                lines.append(line)
 
                 # Add a separator line for markdown tables
-                header_cells = lines[i].count("|") - 1
+                header_cells = line.count("|") - 1
                 if header_cells > 0:
-                    separator_line = "|" + "---|" * header_cells
-                    lines.insert(i + 1, separator_line)
-                    i += 1  # Skip the newly inserted line in next iteration
-
-            i += 1
+                    lines.append("|" + "---|" * header_cells)
+            else:
+                lines.append(line)
 
         # Rejoin the lines
         output = "\n".join(lines)
@@ -2,13 +2,15 @@
 
 import json
 import logging
-from typing import Annotated
+from typing import Annotated, Any
 
 from fastmcp import Context, FastMCP
 from pydantic import BeforeValidator, Field
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
+from mcp_atlassian.models.confluence import ConfluencePage
 from mcp_atlassian.servers.dependencies import get_confluence_fetcher
+from mcp_atlassian.servers.dispatch import dispatch
 from mcp_atlassian.utils.decorators import (
     check_write_access,
 )
@@ -21,6 +23,13 @@ confluence_mcp = FastMCP(
 )
 
 
+def _simplify_pages(
+    pages: list[ConfluencePage], include_content: bool = True
+) -> list[dict[str, Any]]:
+    """Serialize pages, converting their deferred content on the calling thread."""
+    return [page.to_simplified_dict(include_content=include_content) for page in pages]
+
+
 @confluence_mcp.tool(tags={"confluence", "read"})
 async def search(
     ctx: Context,
@@ -92,21 +101,36 @@ async def search(
             logger.info(
                 f"Converting simple search term to CQL using siteSearch: {query}"
             )
-            pages = confluence_fetcher.search(
-                query, limit=limit, spaces_filter=spaces_filter
+            pages = await dispatch(
+                ctx,
+                "confluence",
+                confluence_fetcher.search,
+                query,
+                limit=limit,
+                spaces_filter=spaces_filter,
             )
         except Exception as e:
             logger.warning(f"siteSearch failed ('{e}'), falling back to text search.")
             query = f'text ~ "{original_query}"'
             logger.info(f"Falling back to text search with CQL: {query}")
-            pages = confluence_fetcher.search(
-                query, limit=limit, spaces_filter=spaces_filter
+            pages = await dispatch(
+                ctx,
+                "confluence",
+                confluence_fetcher.search,
+                query,
+                limit=limit,
+                spaces_filter=spaces_filter,
             )
     else:
-        pages = confluence_fetcher.search(
-            query, limit=limit, spaces_filter=spaces_filter
+        pages = await dispatch(
+            ctx,
+            "confluence",
+            confluence_fetcher.search,
+            query,
+            limit=limit,
+            spaces_filter=spaces_filter,
         )
-    search_results = [page.to_simplified_dict() for page in pages]
+    search_results = await dispatch(ctx, "confluence", _simplify_pages, pages)
     return json.dumps(search_results, indent=2, ensure_ascii=False)
 
 
@@ -184,8 +208,12 @@ async def get_page(
                 "page_id was provided; title and space_key parameters will be ignored."
             )
         try:
-            page_object = confluence_fetcher.get_page_content(
-                page_id, convert_to_markdown=convert_to_markdown
+            page_object = await dispatch(
+                ctx,
+                "confluence",
+                confluence_fetcher.get_page_content,
+                page_id,
+                convert_to_markdown=convert_to_markdown,
             )
         except Exception as e:
             logger.error(f"Error fetching page by ID '{page_id}': {e}")
@@ -195,8 +223,13 @@ async def get_page(
                 ensure_ascii=False,
             )
     elif title and space_key:
-        page_object = confluence_fetcher.get_page_by_title(
-            space_key, title, convert_to_markdown=convert_to_markdown
+        page_object = await dispatch(
+            ctx,
+            "confluence",
+            confluence_fetcher.get_page_by_title,
+            space_key,
+            title,
+            convert_to_markdown=convert_to_markdown,
         )
         if not page_object:
             return json.dumps(
@@ -289,14 +322,19 @@ async def get_page_children(
         expand = f"{expand},body.storage" if expand else "body.storage"
 
     try:
-        pages = confluence_fetcher.get_page_children(
+        pages = await dispatch(
+            ctx,
+            "confluence",
+            confluence_fetcher.get_page_children,
             page_id=parent_id,
             start=start,
             limit=limit,
             expand=expand,
             convert_to_markdown=convert_to_markdown,
         )
-        child_pages = [page.to_simplified_dict() for page in pages]
+        child_pages = await dispatch(
+            ctx, "confluence", _simplify_pages, pages, include_content
+        )
         result = {
             "parent_id": parent_id,
             "count": len(child_pages),
@@ -338,7 +376,9 @@ async def get_comments(
         JSON string representing a list of comment objects.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    comments = confluence_fetcher.get_page_comments(page_id)
+    comments = await dispatch(
+        ctx, "confluence", confluence_fetcher.get_page_comments, page_id
+    )
     formatted_comments = [comment.to_simplified_dict() for comment in comments]
     return json.dumps(formatted_comments, indent=2, ensure_ascii=False)
 
@@ -367,7 +407,9 @@ async def get_labels(
         JSON string representing a list of label objects.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    labels = confluence_fetcher.get_page_labels(page_id)
+    labels = await dispatch(
+        ctx, "confluence", confluence_fetcher.get_page_labels, page_id
+    )
     formatted_labels = [label.to_simplified_dict() for label in labels]
     return json.dumps(formatted_labels, indent=2, ensure_ascii=False)
 
@@ -393,7 +435,9 @@ async def add_label(
         ValueError: If in read-only mode or Confluence client is unavailable.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    labels = confluence_fetcher.add_page_label(page_id, name)
+    labels = await dispatch(
+        ctx, "confluence", confluence_fetcher.add_page_label, page_id, name
+    )
     formatted_labels = [label.to_simplified_dict() for label in labels]
     return json.dumps(formatted_labels, indent=2, ensure_ascii=False)
 
@@ -471,7 +515,10 @@ async def create_page(
         is_markdown = False
         content_representation = content_format  # Pass 'wiki' or 'storage' directly
 
-    page = confluence_fetcher.create_page(
+    page = await dispatch(
+        ctx,
+        "confluence",
+        confluence_fetcher.create_page,
         space_key=space_key,
         title=title,
         body=content,
@@ -563,7 +610,10 @@ async def update_page(
         is_markdown = False
         content_representation = content_format  # Pass 'wiki' or 'storage' directly
 
-    updated_page = confluence_fetcher.update_page(
+    updated_page = await dispatch(
+        ctx,
+        "confluence",
+        confluence_fetcher.update_page,
         page_id=page_id,
         title=title,
         body=content,
@@ -604,7 +654,9 @@ async def delete_page(
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
     try:
-        result = confluence_fetcher.delete_page(page_id=page_id)
+        result = await dispatch(
+            ctx, "confluence", confluence_fetcher.delete_page, page_id=page_id
+        )
         if result:
             response = {
                 "success": True,
@@ -652,7 +704,13 @@ async def add_comment(
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
     try:
-        comment = confluence_fetcher.add_comment(page_id=page_id, content=content)
+        comment = await dispatch(
+            ctx,
+            "confluence",
+            confluence_fetcher.add_comment,
+            page_id=page_id,
+            content=content,
+        )
         if comment:
             comment_data = comment.to_simplified_dict()
             response = {
@@ -722,7 +780,9 @@ async def search_user(
         logger.info(f"Converting simple search term to user CQL: {query}")
 
     try:
-        user_results = confluence_fetcher.search_user(query, limit=limit)
+        user_results = await dispatch(
+            ctx, "confluence", confluence_fetcher.search_user, query, limit=limit
+        )
         search_results = [user.to_simplified_dict() for user in user_results]
         return json.dumps(search_results, indent=2, ensure_ascii=False)
     except MCPAtlassianAuthenticationError as e:
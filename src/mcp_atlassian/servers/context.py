@@ -6,6 +6,9 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from mcp_atlassian.confluence.config import ConfluenceConfig
     from mcp_atlassian.jira.config import JiraConfig
+    from mcp_atlassian.servers.dispatch import ServiceDispatcher
+    from mcp_atlassian.servers.fetcher_pool import FetcherPool
+    from mcp_atlassian.servers.token_cache import TokenValidationCache
 
 
 @dataclass(frozen=True)
@@ -14,9 +17,15 @@ class MainAppContext:
     Context holding fully configured Jira and Confluence configurations
     loaded from environment variables at server startup.
     These configurations include any global/default authentication details.
+    The optional fetcher pool holds long-lived fetchers shared across requests,
+    and the dispatchers run blocking fetcher calls on per-service worker pools.
+    The optional token cache remembers validated user tokens in multi-user mode.
     """
 
     full_jira_config: JiraConfig | None = None
     full_confluence_config: ConfluenceConfig | None = None
     read_only: bool = False
     enabled_tools: list[str] | None = None
+    fetcher_pool: FetcherPool | None = None
+    dispatchers: dict[str, ServiceDispatcher] | None = None
+    token_cache: TokenValidationCache | None = None
@@ -16,6 +16,9 @@ from starlette.requests import Request
 from mcp_atlassian.confluence import ConfluenceConfig, ConfluenceFetcher
 from mcp_atlassian.jira import JiraConfig, JiraFetcher
 from mcp_atlassian.servers.context import MainAppContext
+from mcp_atlassian.servers.dispatch import dispatch
+from mcp_atlassian.servers.fetcher_pool import fetcher_key
+from mcp_atlassian.servers.token_cache import token_cache_key
 from mcp_atlassian.utils.oauth import OAuthConfig
 
 if TYPE_CHECKING:
@@ -154,6 +157,54 @@ def _create_user_config_for_fetcher(
         raise TypeError(f"Unsupported base_config type: {type(base_config)}")
 
 
+def _get_pooled_fetcher(
+    app_ctx: MainAppContext,
+    service: str,
+    config: JiraConfig | ConfluenceConfig,
+    fetcher_cls: type[Any],
+) -> Any:
+    """Return a long-lived fetcher for a config from the lifespan fetcher pool.
+
+    Falls back to building a fresh fetcher when no pool is configured.
+
+    Args:
+        app_ctx: The application lifespan context.
+        service: Service name used in the pool key ('jira' or 'confluence').
+        config: Configuration the fetcher is built from.
+        fetcher_cls: JiraFetcher or ConfluenceFetcher.
+
+    Returns:
+        A fetcher instance for the given configuration.
+    """
+    pool = app_ctx.fetcher_pool
+    if pool is None:
+        return fetcher_cls(config=config)
+    return pool.get_or_create(
+        fetcher_key(service, config), lambda: fetcher_cls(config=config)
+    )
+
+
+def _discard_pooled_fetcher(
+    app_ctx: MainAppContext, service: str, config: JiraConfig | ConfluenceConfig
+) -> None:
+    """Drop a fetcher from the lifespan pool, e.g. after failed validation."""
+    if app_ctx.fetcher_pool is not None:
+        app_ctx.fetcher_pool.discard(fetcher_key(service, config))
+
+
+def _set_derived_email(
+    request: Request, user_email: str | None, current_user_data: Any
+) -> None:
+    """Record the email Confluence reported for a user who did not provide one."""
+    if (
+        not user_email
+        and current_user_data
+        and isinstance(current_user_data, dict)
+        and current_user_data.get("email")
+    ):
+        request.state.user_atlassian_email = current_user_data["email"]
+
+
 async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
     """Returns a JiraFetcher instance appropriate for the current request context.
 
@@ -209,6 +260,22 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
                     "Jira global configuration (URL, SSL) is not available from lifespan context."
                 )
 
+            token_cache = app_lifespan_ctx.token_cache
+            cache_key = token_cache_key(
+                "jira",
+                app_lifespan_ctx.full_jira_config.url,
+                user_auth_type,
+                user_token,
+                user_cloud_id,
+            )
+            validated = token_cache.get(cache_key) if token_cache is not None else None
+            if validated is not None:
+                logger.debug(
+                    f"get_jira_fetcher: Reusing validated Jira token for user ID: {validated.identity}"
+                )
+                request.state.jira_fetcher = validated.fetcher
+                return validated.fetcher
+
             cloud_id_info = f" with cloudId {user_cloud_id}" if user_cloud_id else ""
             logger.info(
                 f"Creating user-specific JiraFetcher (type: {user_auth_type}) for user {user_email or 'unknown'} (token ...{str(user_token)[-8:]}){cloud_id_info}"
@@ -220,14 +287,27 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
                 cloud_id=user_cloud_id,
             )
             try:
-                user_jira_fetcher = JiraFetcher(config=user_specific_config)
-                current_user_id = user_jira_fetcher.get_current_user_account_id()
+                user_jira_fetcher = await dispatch(
+                    ctx,
+                    "jira",
+                    _get_pooled_fetcher,
+                    app_lifespan_ctx,
+                    "jira",
+                    user_specific_config,
+                    JiraFetcher,
+                )
+                current_user_id = await dispatch(
+                    ctx, "jira", user_jira_fetcher.get_current_user_account_id
+                )
                 logger.debug(
                     f"get_jira_fetcher: Validated Jira token for user ID: {current_user_id}"
                 )
+                if token_cache is not None:
+                    token_cache.put(cache_key, user_jira_fetcher, current_user_id)
                 request.state.jira_fetcher = user_jira_fetcher
                 return user_jira_fetcher
             except Exception as e:
+                _discard_pooled_fetcher(app_lifespan_ctx, "jira", user_specific_config)
                 logger.error(
                     f"get_jira_fetcher: Failed to create/validate user-specific JiraFetcher: {e}",
                     exc_info=True,
@@ -253,7 +333,15 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
             "get_jira_fetcher: Using global JiraFetcher from lifespan_context. "
             f"Global config auth_type: {app_lifespan_ctx_global.full_jira_config.auth_type}"
         )
-        return JiraFetcher(config=app_lifespan_ctx_global.full_jira_config)
+        return await dispatch(
+            ctx,
+            "jira",
+            _get_pooled_fetcher,
+            app_lifespan_ctx_global,
+            "jira",
+            app_lifespan_ctx_global.full_jira_config,
+            JiraFetcher,
+        )
     logger.error("Jira configuration could not be resolved.")
     raise ValueError(
         "Jira client (fetcher) not available. Ensure server is configured correctly."
@@ -316,6 +404,23 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
                     "Confluence global configuration (URL, SSL) is not available from lifespan context."
                 )
 
+            token_cache = app_lifespan_ctx.token_cache
+            cache_key = token_cache_key(
+                "confluence",
+                app_lifespan_ctx.full_confluence_config.url,
+                user_auth_type,
+                user_token,
+                user_cloud_id,
+            )
+            validated = token_cache.get(cache_key) if token_cache is not None else None
+            if validated is not None:
+                logger.debug(
+                    "get_confluence_fetcher: Reusing validated Confluence token."
+                )
+                request.state.confluence_fetcher = validated.fetcher
+                _set_derived_email(request, user_email, validated.identity)
+                return validated.fetcher
+
             cloud_id_info = f" with cloudId {user_cloud_id}" if user_cloud_id else ""
             logger.info(
                 f"Creating user-specific ConfluenceFetcher (type: {user_auth_type}) for user {user_email or 'unknown'} (token ...{str(user_token)[-8:]}){cloud_id_info}"
@@ -327,8 +432,18 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
                 cloud_id=user_cloud_id,
             )
             try:
-                user_confluence_fetcher = ConfluenceFetcher(config=user_specific_config)
-                current_user_data = user_confluence_fetcher.get_current_user_info()
+                user_confluence_fetcher = await dispatch(
+                    ctx,
+                    "confluence",
+                    _get_pooled_fetcher,
+                    app_lifespan_ctx,
+                    "confluence",
+                    user_specific_config,
+                    ConfluenceFetcher,
+                )
+                current_user_data = await dispatch(
+                    ctx, "confluence", user_confluence_fetcher.get_current_user_info
+                )
                 # Try to get email from Confluence if not provided (can happen with PAT)
                 derived_email = (
                     current_user_data.get("email")
@@ -343,17 +458,17 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
                 logger.debug(
                     f"get_confluence_fetcher: Validated Confluence token. User context: Email='{user_email or derived_email}', DisplayName='{display_name}'"
                 )
+                if token_cache is not None:
+                    token_cache.put(
+                        cache_key, user_confluence_fetcher, current_user_data
+                    )
                 request.state.confluence_fetcher = user_confluence_fetcher
-                if (
-                    not user_email
-                    and derived_email
-                    and current_user_data
-                    and isinstance(current_user_data, dict)
-                    and current_user_data.get("email")
-                ):
-                    request.state.user_atlassian_email = current_user_data["email"]
+                _set_derived_email(request, user_email, current_user_data)
                 return user_confluence_fetcher
             except Exception as e:
+                _discard_pooled_fetcher(
+                    app_lifespan_ctx, "confluence", user_specific_config
+                )
                 logger.error(
                     f"get_confluence_fetcher: Failed to create/validate user-specific ConfluenceFetcher: {e}"
                 )
@@ -377,7 +492,15 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
             "get_confluence_fetcher: Using global ConfluenceFetcher from lifespan_context. "
             f"Global config auth_type: {app_lifespan_ctx_global.full_confluence_config.auth_type}"
         )
-        return ConfluenceFetcher(config=app_lifespan_ctx_global.full_confluence_config)
+        return await dispatch(
+            ctx,
+            "confluence",
+            _get_pooled_fetcher,
+            app_lifespan_ctx_global,
+            "confluence",
+            app_lifespan_ctx_global.full_confluence_config,
+            ConfluenceFetcher,
+        )
     logger.error("Confluence configuration could not be resolved.")
     raise ValueError(
         "Confluence client (fetcher) not available. Ensure server is configured correctly."
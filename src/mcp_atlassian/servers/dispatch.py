@@ -0,0 +1,225 @@
+"""Worker-pool dispatch for blocking Jira and Confluence calls.
+
+The fetchers are built on ``requests`` and block the calling thread. Tool
+coroutines hand those calls to a per-service worker pool so that one slow
+upstream response does not stall every other session on the event loop.
+When a fetcher is configured with ``async_transport`` and implements a native
+``<method>_async`` variant, that coroutine is awaited instead.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import logging
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import anyio
+import anyio.lowlevel
+import anyio.to_thread
+
+from mcp_atlassian.exceptions import MCPAtlassianBackpressureError
+from mcp_atlassian.servers.token_cache import is_unauthorized
+from mcp_atlassian.utils.env import get_env_int
+
+if TYPE_CHECKING:
+    from fastmcp import Context
+
+    from mcp_atlassian.servers.context import MainAppContext
+
+logger = logging.getLogger("mcp-atlassian.servers.dispatch")
+
+DEFAULT_MAX_WORKERS = 10
+DEFAULT_MAX_QUEUE = 100
+
+T = TypeVar("T")
+
+
+class ServiceDispatcher:
+    """Bounded worker pool for one Atlassian service.
+
+    At most ``max_workers`` calls run concurrently; up to ``max_queue`` more
+    wait for a free worker. Calls beyond that are rejected immediately with
+    :class:`MCPAtlassianBackpressureError` instead of piling up.
+    """
+
+    def __init__(
+        self,
+        service: str,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+    ) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            service: Service name used in logs and errors.
+            max_workers: Maximum number of concurrently running calls.
+            max_queue: Maximum number of calls waiting for a worker.
+        """
+        self.service = service
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self._limiter: anyio.CapacityLimiter | None = None
+        self._limiter_loop: object | None = None
+        self._pending = 0
+
+    @classmethod
+    def from_env(cls, service: str) -> ServiceDispatcher:
+        """Create a dispatcher sized from ``<SERVICE>_MAX_WORKERS``/``_MAX_QUEUE``.
+
+        Args:
+            service: Service name, e.g. ``"jira"``.
+
+        Returns:
+            A configured ServiceDispatcher.
+        """
+        prefix = service.upper()
+        return cls(
+            service,
+            max_workers=get_env_int(f"{prefix}_MAX_WORKERS", DEFAULT_MAX_WORKERS, 1),
+            max_queue=get_env_int(f"{prefix}_MAX_QUEUE", DEFAULT_MAX_QUEUE, 0),
+        )
+
+    @property
+    def pending(self) -> int:
+        """Number of calls currently running or waiting for a worker."""
+        return self._pending
+
+    async def run(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Run a blocking callable on the worker pool.
+
+        Args:
+            func: The blocking callable, usually a fetcher method.
+            *args: Positional arguments for ``func``.
+            **kwargs: Keyword arguments for ``func``.
+
+        Returns:
+            The callable's return value.
+
+        Raises:
+            MCPAtlassianBackpressureError: If the queue is full.
+        """
+        if self._pending >= self.max_workers + self.max_queue:
+            logger.warning(
+                f"{self.service} worker pool saturated "
+                f"({self._pending} pending); rejecting call"
+            )
+            raise MCPAtlassianBackpressureError(
+                f"Too many concurrent {self.service} requests "
+                f"({self._pending} in progress). Please retry shortly."
+            )
+        loop_token = anyio.lowlevel.current_token()
+        if self._limiter is None or self._limiter_loop is not loop_token:
+            # Limiters are bound to an event loop, so create one per loop
+            self._limiter = anyio.CapacityLimiter(self.max_workers)
+            self._limiter_loop = loop_token
+        self._pending += 1
+        try:
+            return await anyio.to_thread.run_sync(
+                functools.partial(func, *args, **kwargs), limiter=self._limiter
+            )
+        finally:
+            self._pending -= 1
+
+
+_fallback_dispatchers: dict[str, ServiceDispatcher] = {}
+
+
+def create_dispatchers() -> dict[str, ServiceDispatcher]:
+    """Create the Jira and Confluence dispatchers from environment settings."""
+    return {
+        service: ServiceDispatcher.from_env(service)
+        for service in ("jira", "confluence")
+    }
+
+
+def _get_app_context(ctx: Context) -> MainAppContext | None:
+    """Return the application lifespan context of a request, if any."""
+    try:
+        lifespan_ctx_dict = ctx.request_context.lifespan_context
+    except (AttributeError, ValueError):
+        return None
+    if not isinstance(lifespan_ctx_dict, dict):
+        return None
+    return lifespan_ctx_dict.get("app_lifespan_context")
+
+
+def get_dispatcher(ctx: Context, service: str) -> ServiceDispatcher:
+    """Return the dispatcher for a service from the lifespan context.
+
+    Falls back to a process-wide dispatcher when the lifespan context does not
+    carry one (for example in tests with a custom lifespan).
+
+    Args:
+        ctx: The FastMCP context.
+        service: Service name, e.g. ``"jira"``.
+
+    Returns:
+        The ServiceDispatcher for the service.
+    """
+    dispatchers = getattr(_get_app_context(ctx), "dispatchers", None)
+    if isinstance(dispatchers, dict) and service in dispatchers:
+        return dispatchers[service]
+    if service not in _fallback_dispatchers:
+        _fallback_dispatchers[service] = ServiceDispatcher.from_env(service)
+    return _fallback_dispatchers[service]
+
+
+def get_native_async(func: Callable[..., Any]) -> Callable[..., Any] | None:
+    """Return the native async variant of a fetcher method, if enabled.
+
+    Args:
+        func: A bound fetcher method, e.g. ``jira.get_issue``.
+
+    Returns:
+        The bound ``<name>_async`` coroutine method when the fetcher's config
+        enables ``async_transport`` and the method exists, otherwise None.
+    """
+    owner = getattr(func, "__self__", None)
+    config = getattr(owner, "config", None)
+    if getattr(config, "async_transport", False) is not True:
+        return None
+    native = getattr(owner, f"{func.__name__}_async", None)
+    if native is None or not inspect.iscoroutinefunction(native):
+        return None
+    return native
+
+
+async def dispatch(
+    ctx: Context, service: str, func: Callable[..., T], /, *args: Any, **kwargs: Any
+) -> T:
+    """Run a blocking fetcher call on the service's worker pool.
+
+    Calls with a native async variant (see :func:`get_native_async`) bypass
+    the worker pool and are awaited directly. When a call fails because the
+    fetcher's credentials were rejected, cached validations of the fetcher's
+    token are dropped so the next request validates it again.
+
+    Args:
+        ctx: The FastMCP context.
+        service: Service name, e.g. ``"jira"``.
+        func: The blocking callable.
+        *args: Positional arguments for ``func``.
+        **kwargs: Keyword arguments for ``func``.
+
+    Returns:
+        The callable's return value.
+    """
+    native = get_native_async(func)
+    try:
+        if native is not None:
+            return await native(*args, **kwargs)
+        return await get_dispatcher(ctx, service).run(func, *args, **kwargs)
+    except Exception as e:
+        if is_unauthorized(e):
+            _invalidate_token(ctx, func)
+        raise
+
+
+def _invalidate_token(ctx: Context, func: Callable[..., Any]) -> None:
+    """Drop cached validations of the fetcher a rejected call was made with."""
+    token_cache = getattr(_get_app_context(ctx), "token_cache", None)
+    fetcher = getattr(func, "__self__", None)
+    if token_cache is not None and fetcher is not None:
+        token_cache.invalidate_fetcher(fetcher)
@@ -0,0 +1,256 @@
+"""Lifespan-owned pool of long-lived Jira and Confluence fetchers.
+
+Building a fetcher creates a new ``requests.Session`` (and therefore a new
+TCP/TLS connection), a new preprocessor and empty metadata caches. The pool
+keeps fetchers alive between tool calls so those costs are paid once per
+configuration instead of once per call.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from mcp_atlassian.utils.env import get_env_int
+from mcp_atlassian.utils.oauth import OAuthConfig
+
+if TYPE_CHECKING:
+    from mcp_atlassian.confluence.config import ConfluenceConfig
+    from mcp_atlassian.jira.config import JiraConfig
+
+logger = logging.getLogger("mcp-atlassian.servers.fetcher_pool")
+
+DEFAULT_POOL_MAX_SIZE = 32
+DEFAULT_POOL_IDLE_TTL = 900  # seconds
+
+FetcherT = TypeVar("FetcherT")
+
+
+def _digest(value: str | None) -> str:
+    """Return a SHA-256 hex digest of a value, or an empty string for None."""
+    if not value:
+        return ""
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def fetcher_key(service: str, config: JiraConfig | ConfluenceConfig) -> str:
+    """Build a pool key from the identity of a service configuration.
+
+    Everything that changes how the underlying client is built (URL, auth
+    type, credentials, proxies, SSL and custom headers) is part of the key.
+    The key is a digest, so raw tokens never appear in it or in logs.
+
+    Args:
+        service: Service name, e.g. ``"jira"`` or ``"confluence"``.
+        config: The configuration the fetcher is built from.
+
+    Returns:
+        A stable string key for the configuration.
+    """
+    oauth_config = config.oauth_config
+    oauth_identity = ""
+    if oauth_config:
+        if isinstance(oauth_config, OAuthConfig) and oauth_config.refresh_token:
+            # Refreshable tokens rotate, so key on the OAuth app instead
+            oauth_identity = f"app:{oauth_config.client_id}"
+        else:
+            oauth_identity = f"token:{_digest(oauth_config.access_token)}"
+        oauth_identity += f"@{oauth_config.cloud_id or ''}"
+
+    parts = [
+        service,
+        config.url or "",
+        config.auth_type,
+        config.username or "",
+        _digest(config.api_token),
+        _digest(config.personal_token),
+        oauth_identity,
+        str(config.ssl_verify),
+        config.http_proxy or "",
+        config.https_proxy or "",
+        config.no_proxy or "",
+        config.socks_proxy or "",
+        repr(sorted((config.custom_headers or {}).items())),
+    ]
+    return f"{service}:{_digest('|'.join(parts))[:32]}"
+
+
+def close_fetcher(fetcher: Any) -> None:
+    """Close the HTTP session held by a fetcher, ignoring errors.
+
+    Args:
+        fetcher: A JiraFetcher or ConfluenceFetcher instance.
+    """
+    for client_attr in ("jira", "confluence"):
+        client = getattr(fetcher, client_attr, None)
+        session = getattr(client, "_session", None)
+        if session is not None and hasattr(session, "close"):
+            try:
+                session.close()
+            except Exception as e:  # noqa: BLE001 - cleanup must not raise
+                logger.debug(f"Error closing {client_attr} session: {e}")
+
+
+def _is_reusable(fetcher: Any) -> bool:
+    """Check whether a pooled fetcher can still be handed out.
+
+    Fetchers authenticated with a refreshable OAuth token carry the access
+    token in their session headers; once it expires the fetcher is rebuilt so
+    that construction refreshes the token.
+    """
+    config = getattr(fetcher, "config", None)
+    oauth_config = getattr(config, "oauth_config", None)
+    if isinstance(oauth_config, OAuthConfig) and oauth_config.refresh_token:
+        return not oauth_config.is_token_expired
+    return True
+
+
+@dataclass
+class _PoolEntry:
+    fetcher: Any
+    last_used: float
+
+
+class FetcherPool:
+    """Bounded registry of fetchers keyed by configuration identity.
+
+    Entries are evicted least-recently-used first when the pool is full, and
+    entries that have not been used for ``idle_ttl`` seconds are dropped on
+    the next access. Evicted fetchers have their HTTP sessions closed.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_POOL_MAX_SIZE,
+        idle_ttl: float = DEFAULT_POOL_IDLE_TTL,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_size: Maximum number of fetchers kept alive.
+            idle_ttl: Seconds after which an unused fetcher is evicted.
+        """
+        self.max_size = max(1, max_size)
+        self.idle_ttl = idle_ttl
+        self._entries: OrderedDict[str, _PoolEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> FetcherPool:
+        """Create a pool sized from environment variables.
+
+        Reads ``FETCHER_POOL_MAX_SIZE`` and ``FETCHER_POOL_IDLE_TTL``.
+
+        Returns:
+            A configured FetcherPool.
+        """
+        return cls(
+            max_size=get_env_int("FETCHER_POOL_MAX_SIZE", DEFAULT_POOL_MAX_SIZE, 1),
+            idle_ttl=get_env_int("FETCHER_POOL_IDLE_TTL", DEFAULT_POOL_IDLE_TTL, 0),
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get_or_create(self, key: str, factory: Callable[[], FetcherT]) -> FetcherT:
+        """Return the pooled fetcher for a key, creating it if needed.
+
+        Args:
+            key: Pool key, usually from :func:`fetcher_key`.
+            factory: Callable that builds a new fetcher.
+
+        Returns:
+            The pooled (or newly created) fetcher.
+        """
+        stale: list[Any] = []
+        with self._lock:
+            stale.extend(self._pop_idle(time.monotonic()))
+            entry = self._entries.get(key)
+            if entry is not None:
+                if _is_reusable(entry.fetcher):
+                    entry.last_used = time.monotonic()
+                    self._entries.move_to_end(key)
+                    fetcher = entry.fetcher
+                else:
+                    del self._entries[key]
+                    stale.append(entry.fetcher)
+                    entry = None
+        self._close_all(stale)
+        if entry is not None:
+            logger.debug(f"Reusing pooled fetcher {key}")
+            return fetcher
+
+        # Build outside the lock: construction can perform network I/O
+        new_fetcher = factory()
+        stale = []
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                # Another caller won the race; keep theirs
+                stale.append(new_fetcher)
+                existing.last_used = time.monotonic()
+                self._entries.move_to_end(key)
+                new_fetcher = existing.fetcher
+            else:
+                self._entries[key] = _PoolEntry(new_fetcher, time.monotonic())
+                while len(self._entries) > self.max_size:
+                    _, evicted = self._entries.popitem(last=False)
+                    stale.append(evicted.fetcher)
+        self._close_all(stale)
+        logger.debug(f"Pooled fetcher {key} (pool size: {len(self._entries)})")
+        return new_fetcher
+
+    def discard(self, key: str) -> None:
+        """Remove a fetcher from the pool and close it.
+
+        Args:
+            key: Pool key of the fetcher to drop.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is not None:
+            close_fetcher(entry.fetcher)
+
+    def evict_idle(self) -> int:
+        """Evict fetchers that have been idle longer than ``idle_ttl``.
+
+        Returns:
+            Number of evicted fetchers.
+        """
+        with self._lock:
+            stale = self._pop_idle(time.monotonic())
+        self._close_all(stale)
+        return len(stale)
+
+    def close(self) -> None:
+        """Close every pooled fetcher and empty the pool."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        self._close_all([entry.fetcher for entry in entries])
+        logger.debug(f"Closed {len(entries)} pooled fetcher(s)")
+
+    def _pop_idle(self, now: float) -> list[Any]:
+        """Remove idle entries; must be called with the lock held."""
+        if self.idle_ttl <= 0:
+            return []
+        idle_keys = [
+            key
+            for key, entry in self._entries.items()
+            if now - entry.last_used > self.idle_ttl
+        ]
+        return [self._entries.pop(key).fetcher for key in idle_keys]
+
+    @staticmethod
+    def _close_all(fetchers: list[Any]) -> None:
+        for fetcher in fetchers:
+            close_fetcher(fetcher)
@@ -1,9 +1,11 @@
 """Jira FastMCP server instance and tool definitions."""
 
+import contextlib
 import json
 import logging
 from typing import Annotated, Any
 
+import anyio
 from fastmcp import Context, FastMCP
 from pydantic import Field
 from requests.exceptions import HTTPError
@@ -12,6 +14,7 @@ from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.jira.constants import DEFAULT_READ_JIRA_FIELDS
 from mcp_atlassian.models.jira.common import JiraUser
 from mcp_atlassian.servers.dependencies import get_jira_fetcher
+from mcp_atlassian.servers.dispatch import dispatch
 from mcp_atlassian.utils.decorators import check_write_access
 
 logger = logging.getLogger(__name__)
@@ -47,7 +50,9 @@ async def get_user_profile(
     """
     jira = await get_jira_fetcher(ctx)
     try:
-        user: JiraUser = jira.get_user_profile_by_identifier(user_identifier)
+        user: JiraUser = await dispatch(
+            ctx, "jira", jira.get_user_profile_by_identifier, user_identifier
+        )
         result = user.to_simplified_dict()
         response_data = {"success": True, "user": result}
     except Exception as e:
@@ -151,7 +156,10 @@ async def get_issue(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    issue = jira.get_issue(
+    issue = await dispatch(
+        ctx,
+        "jira",
+        jira.get_issue,
         issue_key=issue_key,
         fields=fields_list,
         expand=expand,
@@ -163,6 +171,85 @@ async def get_issue(
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
+@jira_mcp.tool(tags={"jira", "read"})
+async def batch_get_issues(
+    ctx: Context,
+    issue_keys: Annotated[
+        list[str],
+        Field(
+            description="List of Jira issue keys, e.g. ['PROJ-123', 'PROJ-124']",
+            min_length=1,
+            max_length=500,
+        ),
+    ],
+    fields: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Comma-separated list of fields to return (e.g., 'summary,status,customfield_10010'). "
+                "Use '*all' for all fields (including custom fields), or omit for essential fields only."
+            ),
+            default=",".join(DEFAULT_READ_JIRA_FIELDS),
+        ),
+    ] = ",".join(DEFAULT_READ_JIRA_FIELDS),
+    expand: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Fields to expand. Examples: 'renderedFields', 'transitions', 'changelog'"
+            ),
+            default=None,
+        ),
+    ] = None,
+    comment_limit: Annotated[
+        int,
+        Field(
+            description="Maximum number of comments to include per issue (0 for no comments)",
+            default=10,
+            ge=0,
+            le=100,
+        ),
+    ] = 10,
+) -> str:
+    """Get details of multiple Jira issues in a few requests.
+
+    Args:
+        ctx: The FastMCP context.
+        issue_keys: List of issue keys.
+        fields: Comma-separated list of fields to return, '*all' for all fields, or omitted for essentials.
+        expand: Optional fields to expand.
+        comment_limit: Maximum number of comments per issue.
+
+    Returns:
+        JSON string with one entry per requested key, in input order: the
+        issue, or an object with the key and an error message.
+
+    Raises:
+        ValueError: If the Jira client is not configured or available.
+    """
+    jira = await get_jira_fetcher(ctx)
+    fields_list: str | list[str] | None = fields
+    if fields and fields != "*all":
+        fields_list = [f.strip() for f in fields.split(",")]
+
+    issues = await dispatch(
+        ctx,
+        "jira",
+        jira.batch_get_issues,
+        issue_keys=issue_keys,
+        fields=fields_list,
+        expand=expand,
+        comment_limit=comment_limit,
+    )
+    results = [
+        {"key": key, "error": str(issue)}
+        if isinstance(issue, Exception)
+        else issue.to_simplified_dict()
+        for key, issue in zip(issue_keys, issues, strict=True)
+    ]
+    return json.dumps(results, indent=2, ensure_ascii=False)
+
+
 @jira_mcp.tool(tags={"jira", "read"})
 async def search(
     ctx: Context,
@@ -238,7 +325,10 @@ async def search(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    search_result = jira.search_issues(
+    search_result = await dispatch(
+        ctx,
+        "jira",
+        jira.search_issues,
         jql=jql,
         fields=fields_list,
         limit=limit,
@@ -250,6 +340,122 @@ async def search(
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
+@jira_mcp.tool(tags={"jira", "read"})
+async def search_all(
+    ctx: Context,
+    jql: Annotated[
+        str,
+        Field(
+            description=(
+                "JQL query string (Jira Query Language). Use this tool instead of "
+                "jira_search when more than 50 results are needed."
+            )
+        ),
+    ],
+    fields: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Comma-separated fields to return in the results. "
+                "Use '*all' for all fields, or specify individual fields like 'summary,status,assignee,priority'"
+            ),
+            default=",".join(DEFAULT_READ_JIRA_FIELDS),
+        ),
+    ] = ",".join(DEFAULT_READ_JIRA_FIELDS),
+    max_results: Annotated[
+        int,
+        Field(
+            description="Maximum number of issues to return (1-5000)",
+            default=500,
+            ge=1,
+            le=5000,
+        ),
+    ] = 500,
+    page_size: Annotated[
+        int,
+        Field(
+            description="Number of issues fetched per request (1-100)",
+            default=50,
+            ge=1,
+            le=100,
+        ),
+    ] = 50,
+    projects_filter: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Comma-separated list of project keys to filter results by. "
+                "Overrides the environment variable JIRA_PROJECTS_FILTER if provided."
+            ),
+            default=None,
+        ),
+    ] = None,
+) -> str:
+    """Retrieve a large set of Jira issues matching a JQL query.
+
+    Pages are streamed from Jira one at a time, with the next page fetched
+    while the current one is processed, and progress is reported per page.
+
+    Args:
+        ctx: The FastMCP context.
+        jql: JQL query string.
+        fields: Comma-separated fields to return.
+        max_results: Maximum number of issues to return.
+        page_size: Number of issues fetched per request.
+        projects_filter: Comma-separated list of project keys to filter by.
+
+    Returns:
+        JSON string with the returned issue count and the issues.
+    """
+    jira = await get_jira_fetcher(ctx)
+    fields_list: str | list[str] | None = fields
+    if fields and fields != "*all":
+        fields_list = [f.strip() for f in fields.split(",")]
+
+    pages = jira.iter_issue_pages(
+        jql,
+        fields=fields_list,
+        page_size=page_size,
+        max_issues=max_results,
+        projects_filter=projects_filter,
+        prefetch=False,
+    )
+    issues: list[dict[str, Any]] = []
+    failures: list[Exception] = []
+    # Unbuffered, so exactly one page is fetched ahead of the one processed
+    send, receive = anyio.create_memory_object_stream[list[Any]](0)
+
+    async def read_ahead() -> None:
+        # Pages are fetched and converted on the dispatcher's workers, so
+        # read-ahead counts against the service's worker and queue limits
+        async with send:
+            try:
+                while (
+                    page := await dispatch(ctx, "jira", next, pages, None)
+                ) is not None:
+                    await send.send(page)
+            except Exception as e:  # noqa: BLE001 - re-raised below
+                failures.append(e)
+
+    try:
+        async with anyio.create_task_group() as tg, receive:
+            tg.start_soon(read_ahead)
+            # Only simplified issues are kept between pages
+            async for page in receive:
+                issues.extend(issue.to_simplified_dict() for issue in page)
+                await ctx.report_progress(len(issues), max_results)
+        if failures:
+            raise failures[0]
+    finally:
+        # Closed here rather than dispatched: a dispatch refused under
+        # backpressure would hide the error being propagated
+        with contextlib.suppress(ValueError):  # a cancelled page still running
+            pages.close()
+
+    result = {"returned": len(issues), "max_results": max_results, "issues": issues}
+    return json.dumps(result, indent=2, ensure_ascii=False)
+
+
 @jira_mcp.tool(tags={"jira", "read"})
 async def search_fields(
     ctx: Context,
@@ -280,7 +486,9 @@ async def search_fields(
         JSON string representing a list of matching field definitions.
     """
     jira = await get_jira_fetcher(ctx)
-    result = jira.search_fields(keyword, limit=limit, refresh=refresh)
+    result = await dispatch(
+        ctx, "jira", jira.search_fields, keyword, limit=limit, refresh=refresh
+    )
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
@@ -309,8 +517,13 @@ async def get_project_issues(
         JSON string representing the search results including pagination info.
     """
     jira = await get_jira_fetcher(ctx)
-    search_result = jira.get_project_issues(
-        project_key=project_key, start=start_at, limit=limit
+    search_result = await dispatch(
+        ctx,
+        "jira",
+        jira.get_project_issues,
+        project_key=project_key,
+        start=start_at,
+        limit=limit,
     )
     result = search_result.to_simplified_dict()
     return json.dumps(result, indent=2, ensure_ascii=False)
@@ -332,7 +545,7 @@ async def get_transitions(
     """
     jira = await get_jira_fetcher(ctx)
     # Underlying method returns list[dict] in the desired format
-    transitions = jira.get_available_transitions(issue_key)
+    transitions = await dispatch(ctx, "jira", jira.get_available_transitions, issue_key)
     return json.dumps(transitions, indent=2, ensure_ascii=False)
 
 
@@ -351,7 +564,7 @@ async def get_worklog(
         JSON string representing the worklog entries.
     """
     jira = await get_jira_fetcher(ctx)
-    worklogs = jira.get_worklogs(issue_key)
+    worklogs = await dispatch(ctx, "jira", jira.get_worklogs, issue_key)
     result = {"worklogs": worklogs}
     return json.dumps(result, indent=2, ensure_ascii=False)
 
@@ -366,6 +579,9 @@ async def download_attachments(
 ) -> str:
     """Download attachments from a Jira issue.
 
+    Attachments are downloaded concurrently; files already present with the
+    same size and creation time are skipped.
+
     Args:
         ctx: The FastMCP context.
         issue_key: Jira issue key.
@@ -375,7 +591,13 @@ async def download_attachments(
         JSON string indicating the result of the download operation.
     """
     jira = await get_jira_fetcher(ctx)
-    result = jira.download_issue_attachments(issue_key=issue_key, target_dir=target_dir)
+    result = await dispatch(
+        ctx,
+        "jira",
+        jira.download_issue_attachments,
+        issue_key=issue_key,
+        target_dir=target_dir,
+    )
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
@@ -418,7 +640,10 @@ async def get_agile_boards(
         JSON string representing a list of board objects.
     """
     jira = await get_jira_fetcher(ctx)
-    boards = jira.get_all_agile_boards_model(
+    boards = await dispatch(
+        ctx,
+        "jira",
+        jira.get_all_agile_boards_model,
         board_name=board_name,
         project_key=project_key,
         board_type=board_type,
@@ -494,7 +719,10 @@ async def get_board_issues(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    search_result = jira.get_board_issues(
+    search_result = await dispatch(
+        ctx,
+        "jira",
+        jira.get_board_issues,
         board_id=board_id,
         jql=jql,
         fields=fields_list,
@@ -536,8 +764,14 @@ async def get_sprints_from_board(
         JSON string representing a list of sprint objects.
     """
     jira = await get_jira_fetcher(ctx)
-    sprints = jira.get_all_sprints_from_board_model(
-        board_id=board_id, state=state, start=start_at, limit=limit
+    sprints = await dispatch(
+        ctx,
+        "jira",
+        jira.get_all_sprints_from_board_model,
+        board_id=board_id,
+        state=state,
+        start=start_at,
+        limit=limit,
     )
     result = [sprint.to_simplified_dict() for sprint in sprints]
     return json.dumps(result, indent=2, ensure_ascii=False)
@@ -584,8 +818,14 @@ async def get_sprint_issues(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    search_result = jira.get_sprint_issues(
-        sprint_id=sprint_id, fields=fields_list, start=start_at, limit=limit
+    search_result = await dispatch(
+        ctx,
+        "jira",
+        jira.get_sprint_issues,
+        sprint_id=sprint_id,
+        fields=fields_list,
+        start=start_at,
+        limit=limit,
     )
     result = search_result.to_simplified_dict()
     return json.dumps(result, indent=2, ensure_ascii=False)
@@ -602,7 +842,7 @@ async def get_link_types(ctx: Context) -> str:
         JSON string representing a list of issue link type objects.
     """
     jira = await get_jira_fetcher(ctx)
-    link_types = jira.get_issue_link_types()
+    link_types = await dispatch(ctx, "jira", jira.get_issue_link_types)
     formatted_link_types = [link_type.to_simplified_dict() for link_type in link_types]
     return json.dumps(formatted_link_types, indent=2, ensure_ascii=False)
 
@@ -695,7 +935,10 @@ async def create_issue(
     if not isinstance(extra_fields, dict):
         raise ValueError("additional_fields must be a dictionary.")
 
-    issue = jira.create_issue(
+    issue = await dispatch(
+        ctx,
+        "jira",
+        jira.create_issue,
         project_key=project_key,
         summary=summary,
         issue_type=issue_type,
@@ -767,7 +1010,9 @@ async def batch_create_issues(
         raise ValueError(f"Invalid input for issues: {e}") from e
 
     # Create issues in batch
-    created_issues = jira.batch_create_issues(issues_list, validate_only=validate_only)
+    created_issues = await dispatch(
+        ctx, "jira", jira.batch_create_issues, issues_list, validate_only=validate_only
+    )
 
     message = (
         "Issues validated successfully"
@@ -833,8 +1078,12 @@ async def batch_get_changelogs(
         )
 
     # Call the underlying method
-    issues_with_changelogs = jira.batch_get_changelogs(
-        issue_ids_or_keys=issue_ids_or_keys, fields=fields
+    issues_with_changelogs = await dispatch(
+        ctx,
+        "jira",
+        jira.batch_get_changelogs,
+        issue_ids_or_keys=issue_ids_or_keys,
+        fields=fields,
     )
 
     # Format the response
@@ -937,7 +1186,9 @@ async def update_issue(
         all_updates["attachments"] = attachment_paths
 
     try:
-        issue = jira.update_issue(issue_key=issue_key, **all_updates)
+        issue = await dispatch(
+            ctx, "jira", jira.update_issue, issue_key=issue_key, **all_updates
+        )
         result = issue.to_simplified_dict()
         if (
             hasattr(issue, "custom_fields")
@@ -973,7 +1224,7 @@ async def delete_issue(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    deleted = jira.delete_issue(issue_key)
+    deleted = await dispatch(ctx, "jira", jira.delete_issue, issue_key)
     result = {"message": f"Issue {issue_key} has been deleted successfully."}
     # The underlying method raises on failure, so if we reach here, it's success.
     return json.dumps(result, indent=2, ensure_ascii=False)
@@ -1001,7 +1252,7 @@ async def add_comment(
     """
     jira = await get_jira_fetcher(ctx)
     # add_comment returns dict
-    result = jira.add_comment(issue_key, comment)
+    result = await dispatch(ctx, "jira", jira.add_comment, issue_key, comment)
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
@@ -1060,7 +1311,10 @@ async def add_worklog(
     """
     jira = await get_jira_fetcher(ctx)
     # add_worklog returns dict
-    worklog_result = jira.add_worklog(
+    worklog_result = await dispatch(
+        ctx,
+        "jira",
+        jira.add_worklog,
         issue_key=issue_key,
         time_spent=time_spent,
         comment=comment,
@@ -1097,7 +1351,7 @@ async def link_to_epic(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    issue = jira.link_issue_to_epic(issue_key, epic_key)
+    issue = await dispatch(ctx, "jira", jira.link_issue_to_epic, issue_key, epic_key)
     result = {
         "message": f"Issue {issue_key} has been linked to epic {epic_key}.",
         "issue": issue.to_simplified_dict(),
@@ -1169,7 +1423,7 @@ async def create_issue_link(
                 logger.warning("Invalid comment_visibility dictionary structure.")
         link_data["comment"] = comment_obj
 
-    result = jira.create_issue_link(link_data)
+    result = await dispatch(ctx, "jira", jira.create_issue_link, link_data)
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
@@ -1251,7 +1505,9 @@ async def create_remote_issue_link(
     if relationship:
         link_data["relationship"] = relationship
 
-    result = jira.create_remote_issue_link(issue_key, link_data)
+    result = await dispatch(
+        ctx, "jira", jira.create_remote_issue_link, issue_key, link_data
+    )
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
@@ -1277,7 +1533,9 @@ async def remove_issue_link(
     if not link_id:
         raise ValueError("link_id is required")
 
-    result = jira.remove_issue_link(link_id)  # Returns dict on success
+    result = await dispatch(
+        ctx, "jira", jira.remove_issue_link, link_id
+    )  # Returns dict on success
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
@@ -1340,7 +1598,10 @@ async def transition_issue(
     if not isinstance(update_fields, dict):
         raise ValueError("fields must be a dictionary.")
 
-    issue = jira.transition_issue(
+    issue = await dispatch(
+        ctx,
+        "jira",
+        jira.transition_issue,
         issue_key=issue_key,
         transition_id=transition_id,
         fields=update_fields,
@@ -1389,7 +1650,10 @@ async def create_sprint(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    sprint = jira.create_sprint(
+    sprint = await dispatch(
+        ctx,
+        "jira",
+        jira.create_sprint,
         board_id=board_id,
         sprint_name=sprint_name,
         start_date=start_date,
@@ -1439,7 +1703,10 @@ async def update_sprint(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    sprint = jira.update_sprint(
+    sprint = await dispatch(
+        ctx,
+        "jira",
+        jira.update_sprint,
         sprint_id=sprint_id,
         sprint_name=sprint_name,
         state=state,
@@ -1464,7 +1731,7 @@ async def get_project_versions(
 ) -> str:
     """Get all fix versions for a specific Jira project."""
     jira = await get_jira_fetcher(ctx)
-    versions = jira.get_project_versions(project_key)
+    versions = await dispatch(ctx, "jira", jira.get_project_versions, project_key)
     return json.dumps(versions, indent=2, ensure_ascii=False)
 
 
@@ -1487,15 +1754,17 @@ async def get_all_projects(
 
     Returns:
         JSON string representing a list of project objects accessible to the user.
-        Project keys are always returned in uppercase.
-        If JIRA_PROJECTS_FILTER is configured, only returns projects matching those keys.
+        If JIRA_PROJECTS_FILTER is configured, only returns projects matching those
+        keys (case-insensitive).
 
     Raises:
         ValueError: If the Jira client is not configured or available.
     """
     try:
         jira = await get_jira_fetcher(ctx)
-        projects = jira.get_all_projects(include_archived=include_archived)
+        projects = await dispatch(
+            ctx, "jira", jira.get_all_projects, include_archived=include_archived
+        )
     except (MCPAtlassianAuthenticationError, HTTPError, OSError, ValueError) as e:
         error_message = ""
         log_level = logging.ERROR
@@ -1513,23 +1782,6 @@ async def get_all_projects(
         logger.log(log_level, f"get_all_projects failed: {error_message}")
         return json.dumps(error_result, indent=2, ensure_ascii=False)
 
-    # Ensure all project keys are uppercase
-    for project in projects:
-        if "key" in project:
-            project["key"] = project["key"].upper()
-
-    # Apply project filter if configured
-    if jira.config.projects_filter:
-        # Split projects filter by commas and handle possible whitespace
-        allowed_project_keys = {
-            p.strip().upper() for p in jira.config.projects_filter.split(",")
-        }
-        projects = [
-            project
-            for project in projects
-            if project.get("key") in allowed_project_keys
-        ]
-
     return json.dumps(projects, indent=2, ensure_ascii=False)
 
 
@@ -1564,7 +1816,10 @@ async def create_version(
     """
     jira = await get_jira_fetcher(ctx)
     try:
-        version = jira.create_project_version(
+        version = await dispatch(
+            ctx,
+            "jira",
+            jira.create_project_version,
             project_key=project_key,
             name=name,
             start_date=start_date,
@@ -1638,7 +1893,10 @@ async def batch_create_versions(
             )
             continue
         try:
-            version = jira.create_project_version(
+            version = await dispatch(
+                ctx,
+                "jira",
+                jira.create_project_version,
                 project_key=project_key,
                 name=v["name"],
                 start_date=v.get("startDate"),
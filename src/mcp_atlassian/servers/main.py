@@ -5,7 +5,6 @@ from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from typing import Any, Literal, Optional
 
-from cachetools import TTLCache
 from fastmcp import FastMCP
 from fastmcp.tools import Tool as FastMCPTool
 from mcp.types import Tool as MCPTool
@@ -15,18 +14,22 @@ from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoin
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
-from mcp_atlassian.confluence import ConfluenceFetcher
 from mcp_atlassian.confluence.config import ConfluenceConfig
-from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.config import JiraConfig
+from mcp_atlassian.utils.async_http import close_async_clients
 from mcp_atlassian.utils.environment import get_available_services
 from mcp_atlassian.utils.io import is_read_only_mode
 from mcp_atlassian.utils.logging import mask_sensitive
+from mcp_atlassian.utils.metadata_cache import MetadataCache, configure_metadata_cache
+from mcp_atlassian.utils.oauth_refresh import get_token_refresher
 from mcp_atlassian.utils.tools import get_enabled_tools, should_include_tool
 
 from .confluence import confluence_mcp
 from .context import MainAppContext
+from .dispatch import create_dispatchers
+from .fetcher_pool import FetcherPool
 from .jira import jira_mcp
+from .token_cache import TokenValidationCache
 
 logger = logging.getLogger("mcp-atlassian.server.main")
 
@@ -75,11 +78,26 @@ async def main_lifespan(app: FastMCP[MainAppContext]) -> AsyncIterator[dict]:
         except Exception as e:
             logger.error(f"Failed to load Confluence configuration: {e}", exc_info=True)
 
+    # Warm start: metadata fetched by previous processes, revalidated lazily
+    metadata_cache = MetadataCache.from_env()
+    if metadata_cache is not None:
+        metadata_cache.load()
+    configure_metadata_cache(metadata_cache)
+
+    # Renew server-managed OAuth tokens before they expire, off the request path
+    token_refresher = get_token_refresher()
+    token_refresher.start()
+
+    fetcher_pool = FetcherPool.from_env()
+    token_cache = TokenValidationCache.from_env()
     app_context = MainAppContext(
         full_jira_config=loaded_jira_config,
         full_confluence_config=loaded_confluence_config,
         read_only=read_only,
         enabled_tools=enabled_tools,
+        fetcher_pool=fetcher_pool,
+        dispatchers=create_dispatchers(),
+        token_cache=token_cache,
     )
     logger.info(f"Read-only mode: {'ENABLED' if read_only else 'DISABLED'}")
     logger.info(f"Enabled tools filter: {enabled_tools or 'All tools enabled'}")
@@ -91,13 +109,16 @@ async def main_lifespan(app: FastMCP[MainAppContext]) -> AsyncIterator[dict]:
         raise
     finally:
         logger.info("Main Atlassian MCP server lifespan shutting down...")
-        # Perform any necessary cleanup here
         try:
-            # Close any open connections if needed
             if loaded_jira_config:
                 logger.debug("Cleaning up Jira resources...")
             if loaded_confluence_config:
                 logger.debug("Cleaning up Confluence resources...")
+            logger.info(f"Token validation cache: {token_cache.stats()}")
+            token_refresher.stop()
+            fetcher_pool.close()
+            await close_async_clients()
+            configure_metadata_cache(None)
         except Exception as e:
             logger.error(f"Error during cleanup: {e}", exc_info=True)
         logger.info("Main Atlassian MCP server lifespan shutdown complete.")
@@ -201,11 +222,6 @@ class AtlassianMCP(FastMCP[MainAppContext]):
         return app
 
 
-token_validation_cache: TTLCache[
-    int, tuple[bool, str | None, JiraFetcher | None, ConfluenceFetcher | None]
-] = TTLCache(maxsize=100, ttl=300)
-
-
 class UserTokenMiddleware(BaseHTTPMiddleware):
     """Middleware to extract Atlassian user tokens/credentials from Authorization headers."""
 
@@ -0,0 +1,211 @@
+"""Cache of validated user tokens for multi-user HTTP transports.
+
+In multi-user mode every MCP request carries the user's own OAuth token or
+PAT, and the fetcher built for it is validated with a ``/myself`` call before
+a tool runs. This cache remembers, per token, the validated fetcher and the
+identity the validation returned, so that round trip is paid once per TTL
+instead of once per request. An entry is dropped as soon as the token is
+rejected with a 401.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import logging
+import secrets
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from cachetools import TTLCache
+from requests.exceptions import HTTPError
+
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
+from mcp_atlassian.utils.env import get_env_int
+
+logger = logging.getLogger("mcp-atlassian.servers.token_cache")
+
+DEFAULT_TOKEN_CACHE_TTL = 300  # seconds
+DEFAULT_TOKEN_CACHE_SIZE = 100
+
+# Keys are only compared within this process, so a per-process secret keeps
+# them useless to anyone reading memory or logs
+_KEY_SECRET = secrets.token_bytes(32)
+
+
+def token_cache_key(
+    service: str,
+    url: str | None,
+    auth_type: str,
+    token: str,
+    cloud_id: str | None = None,
+) -> str:
+    """Build the cache key of a user token.
+
+    Args:
+        service: Service name, e.g. ``"jira"`` or ``"confluence"``.
+        url: Base URL of the service.
+        auth_type: The authentication type ('oauth' or 'pat').
+        token: The user's access token or PAT.
+        cloud_id: Cloud ID the token is used with, if any.
+
+    Returns:
+        A keyed SHA-256 hex digest; the token cannot be recovered from it.
+    """
+    parts = [service, url or "", auth_type, cloud_id or "", token]
+    message = "\x00".join(str(part) for part in parts).encode("utf-8")
+    return hmac.new(_KEY_SECRET, message, hashlib.sha256).hexdigest()
+
+
+def is_unauthorized(error: BaseException) -> bool:
+    """Check whether an error, or one of its causes, is a rejected credential.
+
+    Args:
+        error: The exception raised by a fetcher call.
+
+    Returns:
+        True for authentication errors and HTTP 401 responses.
+    """
+    current: BaseException | None = error
+    while current is not None:
+        if isinstance(current, MCPAtlassianAuthenticationError):
+            return True
+        if isinstance(current, HTTPError):
+            response = current.response
+            if response is not None and response.status_code == 401:
+                return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+@dataclass
+class ValidatedToken:
+    """A fetcher whose token was validated and the identity it belongs to."""
+
+    fetcher: Any
+    identity: Any = None
+
+
+class TokenValidationCache:
+    """LRU cache with TTL of validated user fetchers, with hit-rate metrics."""
+
+    def __init__(
+        self,
+        ttl: int = DEFAULT_TOKEN_CACHE_TTL,
+        max_size: int = DEFAULT_TOKEN_CACHE_SIZE,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds a validation is trusted, 0 to disable the cache.
+            max_size: Maximum number of tokens kept.
+            timer: Monotonic clock, injectable for tests.
+        """
+        self.ttl = ttl
+        self._entries: TTLCache[str, ValidatedToken] = TTLCache(
+            maxsize=max(1, max_size), ttl=ttl, timer=timer
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_env(cls) -> TokenValidationCache:
+        """Create a cache from ``TOKEN_VALIDATION_CACHE_TTL``/``_SIZE``.
+
+        Returns:
+            A configured TokenValidationCache.
+        """
+        return cls(
+            ttl=get_env_int("TOKEN_VALIDATION_CACHE_TTL", DEFAULT_TOKEN_CACHE_TTL, 0),
+            max_size=get_env_int(
+                "TOKEN_VALIDATION_CACHE_SIZE", DEFAULT_TOKEN_CACHE_SIZE, 1
+            ),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether validations are cached at all."""
+        return self.ttl > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> ValidatedToken | None:
+        """Return the validated fetcher of a token, counting hits and misses.
+
+        Args:
+            key: Key from :func:`token_cache_key`.
+
+        Returns:
+            The cached validation, or None if the token must be validated.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def put(self, key: str, fetcher: Any, identity: Any = None) -> None:
+        """Remember that a token was validated.
+
+        Args:
+            key: Key from :func:`token_cache_key`.
+            fetcher: The fetcher built for the token.
+            identity: What the validation returned, e.g. the account ID.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = ValidatedToken(fetcher, identity)
+
+    def invalidate(self, key: str) -> None:
+        """Forget a token, e.g. after it was rejected."""
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def invalidate_fetcher(self, fetcher: Any) -> int:
+        """Forget every token validated with a fetcher.
+
+        Args:
+            fetcher: A fetcher whose credentials were rejected.
+
+        Returns:
+            Number of forgotten tokens.
+        """
+        with self._lock:
+            keys = [
+                key for key, entry in self._entries.items() if entry.fetcher is fetcher
+            ]
+            for key in keys:
+                del self._entries[key]
+            self.invalidations += len(keys)
+        if keys:
+            logger.debug(f"Invalidated {len(keys)} cached token validation(s)")
+        return len(keys)
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit, miss and invalidation counts and the hit rate.
+
+        Returns:
+            A dictionary of metrics.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
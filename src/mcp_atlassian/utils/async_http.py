@@ -0,0 +1,293 @@
+"""Native async HTTP transport for hot Jira and Confluence REST calls.
+
+The fetchers are built on ``atlassian-python-api`` and ``requests``, so every
+call occupies a worker thread while it waits on the network. When a service is
+configured with ``async_transport=True`` the most frequently used read calls are
+instead issued on a process-wide :class:`httpx.AsyncClient`, which multiplexes
+many in-flight requests over a bounded keep-alive connection pool (HTTP/2 when
+the optional ``h2`` package is installed).
+
+Credentials, SSL verification and proxies are taken from the fetcher's
+``requests.Session`` at request time, so both transports always authenticate
+the same way.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+from urllib.parse import urlsplit
+
+import anyio
+import anyio.lowlevel
+import httpx
+import requests
+from requests import Session
+
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
+
+from .env import get_env_int
+
+logger = logging.getLogger("mcp-atlassian.utils.async_http")
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0  # seconds
+DEFAULT_TIMEOUT = 75.0  # seconds, matches atlassian-python-api
+
+# Headers that belong to the requests transport and must not be forwarded
+_TRANSPORT_HEADERS = frozenset(
+    {"accept-encoding", "connection", "content-length", "user-agent"}
+)
+
+_clients: dict[tuple[Any, str | None], httpx.AsyncClient] = {}
+_host_limiters: dict[str, tuple[object, anyio.CapacityLimiter]] = {}
+
+
+def is_http2_available() -> bool:
+    """Check whether the optional ``h2`` package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def get_async_client(
+    *, verify: bool | str = True, proxy: str | None = None
+) -> httpx.AsyncClient:
+    """Return the shared AsyncClient for a verify/proxy combination.
+
+    httpx fixes SSL verification and proxies per client, so one client is kept
+    per distinct combination; everything else (auth, headers) is per request.
+
+    Args:
+        verify: SSL verification flag or CA bundle path.
+        proxy: Optional proxy URL.
+
+    Returns:
+        The shared httpx.AsyncClient.
+    """
+    key = (verify, proxy)
+    client = _clients.get(key)
+    if client is None or client.is_closed:
+        limits = httpx.Limits(
+            max_connections=get_env_int(
+                "ATLASSIAN_HTTP_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS, 1
+            ),
+            max_keepalive_connections=get_env_int(
+                "ATLASSIAN_HTTP_MAX_KEEPALIVE_CONNECTIONS",
+                DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+                0,
+            ),
+            keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+        )
+        http2 = is_http2_available()
+        client = httpx.AsyncClient(
+            verify=verify,
+            proxy=proxy,
+            http2=http2,
+            limits=limits,
+            timeout=DEFAULT_TIMEOUT,
+        )
+        _clients[key] = client
+        logger.debug(
+            f"Created shared async HTTP client (http2={http2}, "
+            f"max_connections={limits.max_connections})"
+        )
+    return client
+
+
+def _to_requests_response(response: httpx.Response) -> requests.Response:
+    """Copy an httpx response into a requests response for error reporting."""
+    converted = requests.Response()
+    converted.status_code = response.status_code
+    converted.reason = response.reason_phrase
+    converted.url = str(response.url)
+    converted.headers.update(response.headers)
+    converted._content = response.content
+    converted.encoding = response.encoding
+    return converted
+
+
+def _get_host_limiter(host: str) -> anyio.CapacityLimiter:
+    """Return the limiter capping concurrent requests to one host."""
+    loop_token = anyio.lowlevel.current_token()
+    entry = _host_limiters.get(host)
+    if entry is None or entry[0] is not loop_token:
+        # Limiters are bound to an event loop, so create one per loop
+        limiter = anyio.CapacityLimiter(
+            get_env_int(
+                "ATLASSIAN_HTTP_MAX_CONNECTIONS_PER_HOST",
+                DEFAULT_MAX_CONNECTIONS_PER_HOST,
+                1,
+            )
+        )
+        entry = (loop_token, limiter)
+        _host_limiters[host] = entry
+    return entry[1]
+
+
+async def gather(*calls: Callable[[], Awaitable[Any]]) -> list[Any]:
+    """Run coroutine functions concurrently and return their results in order.
+
+    Unlike a bare task group, the first failure is re-raised as-is rather than
+    wrapped in an exception group, so callers keep their usual ``except``
+    clauses. The remaining calls are cancelled.
+
+    Args:
+        *calls: Zero-argument coroutine functions.
+
+    Returns:
+        The results, in the order of ``calls``.
+    """
+    results: list[Any] = [None] * len(calls)
+    errors: list[Exception] = []
+
+    async def run(index: int, call: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            results[index] = await call()
+        except Exception as e:  # noqa: BLE001 - re-raised below
+            errors.append(e)
+            tg.cancel_scope.cancel()
+
+    async with anyio.create_task_group() as tg:
+        for index, call in enumerate(calls):
+            tg.start_soon(run, index, call)
+    if errors:
+        raise errors[0]
+    return results
+
+
+async def close_async_clients() -> None:
+    """Close every shared AsyncClient. Called on server shutdown."""
+    clients = list(_clients.values())
+    _clients.clear()
+    _host_limiters.clear()
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception as e:  # noqa: BLE001 - cleanup must not raise
+            logger.debug(f"Error closing async HTTP client: {e}")
+
+
+class AsyncTransport:
+    """Async REST transport bound to one fetcher's base URL and session."""
+
+    def __init__(
+        self,
+        base_url: str,
+        session: Session,
+        service_name: str,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            base_url: Base URL of the REST API (the fetcher client's ``url``).
+            session: The fetcher's requests session, used for auth and headers.
+            service_name: Service name for error messages, e.g. ``"Jira API"``.
+            client: Optional AsyncClient to use instead of the shared one.
+        """
+        self.base_url = base_url.rstrip("/")
+        self.session = session
+        self.service_name = service_name
+        self._client = client
+        self._host = urlsplit(self.base_url).netloc
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The AsyncClient used for requests."""
+        if self._client is not None:
+            return self._client
+        proxies = self.session.proxies or {}
+        proxy = proxies.get("https") or proxies.get("http") or proxies.get("socks")
+        return get_async_client(verify=self.session.verify, proxy=proxy)
+
+    def _build_headers(self) -> dict[str, str]:
+        """Copy auth and custom headers from the requests session."""
+        headers = {
+            name: value
+            for name, value in self.session.headers.items()
+            if name.lower() not in _TRANSPORT_HEADERS and value is not None
+        }
+        headers.setdefault("Accept", "application/json")
+        return headers
+
+    def _build_auth(self) -> httpx.Auth | None:
+        """Translate the session's basic auth tuple, if any."""
+        auth = self.session.auth
+        if isinstance(auth, tuple) and len(auth) == 2:
+            return httpx.BasicAuth(str(auth[0]), str(auth[1]))
+        return None
+
+    async def request_json(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+    ) -> Any:
+        """Send a request and return the decoded JSON body.
+
+        Args:
+            method: HTTP method.
+            path: Path relative to the base URL, e.g. ``"rest/api/2/search"``.
+            params: Optional query parameters.
+            json: Optional JSON body.
+
+        Returns:
+            The decoded JSON response, or None for an empty body.
+
+        Errors are raised as the ``requests`` exceptions the synchronous
+        transport raises, so callers handle both transports alike.
+
+        Raises:
+            MCPAtlassianAuthenticationError: If the API returns 401/403.
+            requests.HTTPError: For other error responses.
+            requests.Timeout: If the request timed out.
+            requests.ConnectionError: For other network errors.
+        """
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        try:
+            async with _get_host_limiter(self._host):
+                response = await self.client.request(
+                    method,
+                    url,
+                    params=params,
+                    json=json,
+                    headers=self._build_headers(),
+                    auth=self._build_auth(),
+                )
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(str(e)) from e
+        if response.status_code in (401, 403):
+            error_msg = (
+                f"Authentication failed for {self.service_name} "
+                f"({response.status_code}). "
+                "Token may be expired or invalid. Please verify credentials."
+            )
+            logger.error(error_msg)
+            raise MCPAtlassianAuthenticationError(error_msg)
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise requests.HTTPError(
+                str(e), response=_to_requests_response(response)
+            ) from e
+        if not response.content:
+            return None
+        return response.json()
+
+    async def get_json(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """Send a GET request and return the decoded JSON body.
+
+        Args:
+            path: Path relative to the base URL.
+            params: Optional query parameters.
+
+        Returns:
+            The decoded JSON response, or None for an empty body.
+        """
+        return await self.request_json("GET", path, params=params)
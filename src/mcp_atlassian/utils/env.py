@@ -91,3 +91,29 @@ def get_custom_headers(env_var_name: str) -> dict[str, str]:
             headers[key] = value
 
     return headers
+
+
+def get_env_int(env_var_name: str, default: int, minimum: int | None = None) -> int:
+    """Read an integer setting from an environment variable.
+
+    Invalid values fall back to the default so a typo in a tuning knob never
+    prevents the server from starting.
+
+    Args:
+        env_var_name: Name of the environment variable to read
+        default: Value used when the variable is unset or invalid
+        minimum: Optional lower bound; smaller values are clamped to it
+
+    Returns:
+        The parsed integer value
+    """
+    raw_value = os.getenv(env_var_name)
+    if raw_value is None or not raw_value.strip():
+        return default
+    try:
+        value = int(raw_value.strip())
+    except ValueError:
+        return default
+    if minimum is not None and value < minimum:
+        return minimum
+    return value
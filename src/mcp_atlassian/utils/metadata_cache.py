@@ -0,0 +1,346 @@
+"""Persistent cache of site metadata for warm starts.
+
+Field catalogs, issue types, link types and space IDs change rarely but are
+rediscovered by every new server process. When ``METADATA_CACHE_DIR`` is
+set, this cache keeps them in a directory of JSON files so a fresh process
+(e.g. a newly scaled pod) starts with the metadata its predecessors fetched.
+
+Entries are grouped by scope: a hash of the site URL and the authenticated
+principal, so metadata visible to one user is never served to another and
+no credential is written to disk. The directory is loaded once at startup;
+entries older than the TTL are revalidated lazily on their next use, with a
+conditional request when the API returned an ``ETag`` or ``Last-Modified``.
+Scopes of per-user OAuth access tokens change with every token, so they are
+only kept in memory, and scope files left unused for a week are deleted.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import requests
+
+from .env import get_env_int
+
+logger = logging.getLogger("mcp-atlassian")
+
+DEFAULT_TTL = 86400
+
+# Scopes of a bare access token, which are kept in memory only
+EPHEMERAL_SCOPE_PREFIX = "token-"
+MAX_EPHEMERAL_SCOPES = 64
+# Seconds after which an unused scope file is deleted at startup
+PRUNE_AFTER = 7 * 86400
+
+
+def metadata_scope(config: Any) -> str:
+    """Build the cache scope of a Jira or Confluence configuration.
+
+    The principal is the username for basic auth, the token for personal
+    access tokens, and the OAuth app and site for server-managed OAuth
+    (whose access token rotates). Everything is hashed. A bare OAuth access
+    token, e.g. a per-user token, yields a scope starting with
+    ``EPHEMERAL_SCOPE_PREFIX`` that is not persisted.
+
+    Args:
+        config: A ``JiraConfig`` or ``ConfluenceConfig``
+
+    Returns:
+        A hex digest identifying the site and principal
+    """
+    prefix = ""
+    oauth_config = getattr(config, "oauth_config", None)
+    if config.auth_type == "oauth" and oauth_config is not None:
+        if getattr(oauth_config, "refresh_token", None):
+            client_id = getattr(oauth_config, "client_id", "")
+            principal = f"oauth:{client_id}:{oauth_config.cloud_id}"
+        else:
+            prefix = EPHEMERAL_SCOPE_PREFIX
+            principal = f"oauth-token:{oauth_config.access_token}"
+    elif config.auth_type == "pat":
+        principal = f"pat:{config.personal_token}"
+    else:
+        principal = f"basic:{config.username}"
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (config.url.rstrip("/"), principal):
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\x00")
+    return prefix + digest.hexdigest()
+
+
+@dataclass
+class MetadataEntry:
+    """A cached piece of metadata and the validators to revalidate it.
+
+    Attributes:
+        value: The JSON-serializable metadata
+        stored_at: Wall-clock time at which it was fetched or revalidated
+        etag: ``ETag`` response header, if the API sent one
+        last_modified: ``Last-Modified`` response header, if the API sent one
+    """
+
+    value: Any
+    stored_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers making a request return 304 if the metadata is unchanged."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class MetadataCache:
+    """Directory of JSON metadata files, mirrored in memory.
+
+    Each scope is one file, ``<directory>/<scope>.json``, mapping metadata
+    names to entries. Files are rewritten atomically on every change. Token
+    scopes have no file, and only the latest ``MAX_EPHEMERAL_SCOPES`` are kept.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        ttl: int = DEFAULT_TTL,
+        timer: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding the metadata files
+            ttl: Seconds an entry is served without revalidation
+            timer: Wall clock, injectable for tests
+        """
+        self.directory = Path(directory).expanduser()
+        self.ttl = ttl
+        self._timer = timer
+        self._scopes: dict[str, dict[str, MetadataEntry]] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "MetadataCache | None":
+        """Create a cache configured from environment variables.
+
+        Reads ``METADATA_CACHE_DIR`` and ``METADATA_CACHE_TTL`` (seconds).
+
+        Returns:
+            The configured cache, or None when no directory is configured
+        """
+        directory = os.getenv("METADATA_CACHE_DIR")
+        if not directory:
+            return None
+        return cls(
+            directory, ttl=get_env_int("METADATA_CACHE_TTL", DEFAULT_TTL, minimum=0)
+        )
+
+    def load(self) -> int:
+        """Read every scope file in the directory into memory.
+
+        Unreadable files are skipped, they are rewritten on the next change.
+        Files not written for ``PRUNE_AFTER`` seconds are deleted instead.
+
+        Returns:
+            The number of entries loaded
+        """
+        loaded = 0
+        for path in sorted(self.directory.glob("*.json")):
+            try:
+                if self._timer() - path.stat().st_mtime >= PRUNE_AFTER:
+                    path.unlink()
+                    logger.debug(f"Pruned unused metadata cache file {path}")
+                    continue
+                with path.open(encoding="utf-8") as file:
+                    data = json.load(file)
+                entries = {name: MetadataEntry(**entry) for name, entry in data.items()}
+            except (OSError, ValueError, TypeError, AttributeError) as e:
+                logger.warning(f"Ignoring unreadable metadata cache file {path}: {e}")
+                continue
+            with self._lock:
+                self._scopes[path.stem] = entries
+            loaded += len(entries)
+        logger.info(f"Loaded {loaded} cached metadata entries from {self.directory}")
+        return loaded
+
+    def get(self, scope: str, name: str) -> MetadataEntry | None:
+        """Return an entry, fresh or not.
+
+        Args:
+            scope: Scope from :func:`metadata_scope`
+            name: Metadata name, e.g. ``fields`` or ``space_id:DEV``
+
+        Returns:
+            The entry, or None if it was never cached
+        """
+        with self._lock:
+            return self._scopes.get(scope, {}).get(name)
+
+    def is_fresh(self, entry: MetadataEntry) -> bool:
+        """Return whether an entry can be served without revalidation."""
+        return self._timer() - entry.stored_at < self.ttl
+
+    def put(
+        self,
+        scope: str,
+        name: str,
+        value: Any,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store metadata and persist its scope.
+
+        Args:
+            scope: Scope from :func:`metadata_scope`
+            name: Metadata name
+            value: JSON-serializable metadata
+            etag: ``ETag`` response header, if any
+            last_modified: ``Last-Modified`` response header, if any
+        """
+        entry = MetadataEntry(value, self._timer(), etag, last_modified)
+        with self._lock:
+            if scope not in self._scopes and scope.startswith(EPHEMERAL_SCOPE_PREFIX):
+                token_scopes = [
+                    key
+                    for key in self._scopes
+                    if key.startswith(EPHEMERAL_SCOPE_PREFIX)
+                ]
+                excess = len(token_scopes) - MAX_EPHEMERAL_SCOPES + 1
+                for stale in token_scopes[: max(excess, 0)]:
+                    del self._scopes[stale]
+            self._scopes.setdefault(scope, {})[name] = entry
+        self._write(scope)
+
+    def touch(self, scope: str, name: str) -> None:
+        """Mark an entry as revalidated, e.g. after a 304 response."""
+        with self._lock:
+            entry = self._scopes.get(scope, {}).get(name)
+            if entry is None:
+                return
+            entry.stored_at = self._timer()
+        self._write(scope)
+
+    def invalidate(self, scope: str, name: str | None = None) -> None:
+        """Drop one entry, or a whole scope, from memory and disk."""
+        with self._lock:
+            entries = self._scopes.get(scope)
+            if entries is None:
+                return
+            if name is None:
+                entries.clear()
+            else:
+                entries.pop(name, None)
+        self._write(scope)
+
+    def get_or_load(self, scope: str, name: str, loader: Callable[[], Any]) -> Any:
+        """Return fresh cached metadata, calling the loader when it is stale.
+
+        Args:
+            scope: Scope from :func:`metadata_scope`
+            name: Metadata name
+            loader: Callable fetching the metadata from the API
+
+        Returns:
+            The cached or freshly loaded metadata
+        """
+        entry = self.get(scope, name)
+        if entry is not None and self.is_fresh(entry):
+            return entry.value
+        value = loader()
+        self.put(scope, name, value)
+        return value
+
+    def get_json(
+        self,
+        scope: str,
+        name: str,
+        session: requests.Session,
+        url: str,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """Return the JSON body of a GET request, revalidating conditionally.
+
+        A fresh entry is served without a request. A stale entry with
+        validators is revalidated with ``If-None-Match``/``If-Modified-Since``
+        and reused on 304.
+
+        Args:
+            scope: Scope from :func:`metadata_scope`
+            name: Metadata name
+            session: Authenticated session
+            url: Absolute URL of the resource
+            params: Optional query parameters
+
+        Returns:
+            The response JSON
+
+        Raises:
+            requests.HTTPError: If the request fails
+        """
+        entry = self.get(scope, name)
+        if entry is not None and self.is_fresh(entry):
+            return entry.value
+        headers = entry.conditional_headers() if entry is not None else {}
+        response = session.get(url, params=params, headers=headers or None)
+        if entry is not None and response.status_code == 304:
+            self.touch(scope, name)
+            return entry.value
+        response.raise_for_status()
+        value = response.json()
+        self.put(
+            scope,
+            name,
+            value,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return value
+
+    def _write(self, scope: str) -> None:
+        """Write a scope file atomically; failures only disable persistence."""
+        if scope.startswith(EPHEMERAL_SCOPE_PREFIX):
+            return
+        path = self.directory / f"{scope}.json"
+        # Serialized so the last write always carries the latest snapshot
+        with self._write_lock:
+            with self._lock:
+                data = {
+                    name: vars(entry).copy()
+                    for name, entry in self._scopes.get(scope, {}).items()
+                }
+            temp_path = None
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as file:
+                    json.dump(data, file)
+                os.replace(temp_path, path)
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning(f"Could not persist metadata cache {path}: {e}")
+                if temp_path is not None and os.path.exists(temp_path):
+                    os.unlink(temp_path)
+
+
+_cache: MetadataCache | None = None
+
+
+def configure_metadata_cache(cache: MetadataCache | None) -> None:
+    """Install the process-wide metadata cache, or None to disable it."""
+    global _cache
+    _cache = cache
+
+
+def get_metadata_cache() -> MetadataCache | None:
+    """Get the process-wide metadata cache, if one is configured."""
+    return _cache
@@ -20,6 +20,8 @@ from typing import Any, Optional
 import keyring
 import requests
 
+from .oauth_refresh import client_lock, get_token_refresher
+
 # Configure logging
 logger = logging.getLogger("mcp-atlassian.oauth")
 
@@ -191,6 +193,14 @@ class OAuthConfig:
             logger.error("No refresh token available")
             return False
 
+        # One refresh at a time per app: refresh tokens may rotate, and the
+        # token files and keyring entries are per app
+        with client_lock(self.client_id):
+            return self._refresh_access_token()
+
+    def _refresh_access_token(self) -> bool:
+        """Redeem the refresh token; must hold the client lock."""
+        previous_refresh_token = self.refresh_token
         try:
             payload = {
                 "grant_type": "refresh_token",
@@ -214,6 +224,9 @@ class OAuthConfig:
             # Save the tokens
             self._save_tokens()
 
+            # Hand the new token to live sessions of the same grant
+            get_token_refresher().publish(self, previous_refresh_token)
+
             return True
         except Exception as e:
             logger.error(f"Failed to refresh access token: {e}")
@@ -227,7 +240,11 @@ class OAuthConfig:
         """
         if not self.is_token_expired:
             return True
-        return self.refresh_access_token()
+        with client_lock(self.client_id):
+            # Another request may have refreshed it while we waited
+            if not self.is_token_expired:
+                return True
+            return self.refresh_access_token()
 
     def _get_cloud_id(self) -> None:
         """Get the cloud ID for the Atlassian instance.
@@ -530,5 +547,7 @@ def configure_oauth_session(
         )
         return False
     session.headers["Authorization"] = f"Bearer {oauth_config.access_token}"
+    # Renewed tokens are swapped into this session without rebuilding it
+    get_token_refresher().register(oauth_config, session)
     logger.info("Successfully configured OAuth session for Atlassian Cloud API")
     return True
@@ -0,0 +1,282 @@
+"""Background renewal of OAuth access tokens.
+
+Without it an access token is only refreshed when a client is constructed
+after the token expired, which puts a blocking call to the token endpoint in
+the request path, and concurrent requests can each redeem the same refresh
+token. This module serializes refreshes per OAuth app with a lock, shares
+every new token with the other live configurations of the same grant, swaps
+the ``Authorization`` header of their sessions in place, and can renew tokens
+from a background thread once a fraction of their lifetime has elapsed.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import requests
+
+from .env import get_env_int
+
+if TYPE_CHECKING:
+    from .oauth import OAuthConfig
+
+logger = logging.getLogger("mcp-atlassian.oauth")
+
+DEFAULT_REFRESH_AT_PERCENT = 80
+RETRY_DELAY = 30.0  # seconds before retrying a failed background refresh
+MAX_WAIT = 60.0  # seconds the background thread sleeps at most
+
+_client_locks: dict[str, threading.RLock] = {}
+_client_locks_guard = threading.Lock()
+
+
+def client_lock(client_id: str) -> threading.RLock:
+    """Return the lock serializing token refreshes of an OAuth app.
+
+    Args:
+        client_id: The OAuth client ID
+
+    Returns:
+        A reentrant lock shared by every configuration of the app
+    """
+    with _client_locks_guard:
+        lock = _client_locks.get(client_id)
+        if lock is None:
+            lock = _client_locks[client_id] = threading.RLock()
+        return lock
+
+
+class _Registration:
+    """A live OAuth configuration and the sessions authenticated with it."""
+
+    def __init__(self, oauth_config: OAuthConfig) -> None:
+        self.config_ref = weakref.ref(oauth_config)
+        self.sessions: weakref.WeakSet[requests.Session] = weakref.WeakSet()
+        self.deadline: float | None = None
+        self.scheduled_token: str | None = None
+
+
+class OAuthTokenRefresher:
+    """Registry of live OAuth configurations with optional background renewal.
+
+    Configurations and sessions are held weakly, so clients that are dropped
+    are forgotten without unregistering.
+    """
+
+    def __init__(
+        self,
+        refresh_at_percent: int = DEFAULT_REFRESH_AT_PERCENT,
+        timer: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the refresher.
+
+        Args:
+            refresh_at_percent: Percentage of a token's remaining lifetime
+                after which it is renewed in the background, 0 to disable
+                background renewal
+            timer: Wall clock, injectable for tests
+        """
+        self.refresh_at_percent = min(refresh_at_percent, 100)
+        self._timer = timer
+        self._registrations: dict[int, _Registration] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_env(cls) -> OAuthTokenRefresher:
+        """Create a refresher configured from ``OAUTH_REFRESH_AT_PERCENT``.
+
+        Returns:
+            The configured refresher
+        """
+        return cls(
+            refresh_at_percent=get_env_int(
+                "OAUTH_REFRESH_AT_PERCENT", DEFAULT_REFRESH_AT_PERCENT, minimum=0
+            )
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether tokens are renewed in the background."""
+        return self.refresh_at_percent > 0
+
+    def register(self, oauth_config: OAuthConfig, session: requests.Session) -> None:
+        """Keep a session's ``Authorization`` header in sync with its config.
+
+        Args:
+            oauth_config: A configuration with a refresh token
+            session: The session authenticated with it
+        """
+        with self._lock:
+            self._prune()
+            registration = self._registrations.get(id(oauth_config))
+            if registration is None or registration.config_ref() is not oauth_config:
+                registration = _Registration(oauth_config)
+                self._registrations[id(oauth_config)] = registration
+            elif registration.scheduled_token == oauth_config.access_token:
+                # Already scheduled: rescheduling would push its renewal out
+                registration.sessions.add(session)
+                return
+            registration.sessions.add(session)
+            self._schedule(registration, oauth_config)
+        self._wakeup.set()
+
+    def publish(self, oauth_config: OAuthConfig, previous_refresh_token: str) -> None:
+        """Share a refreshed token with every live holder of the same grant.
+
+        Configurations of the same app still holding the refresh token that
+        was just redeemed adopt the new tokens, and the sessions of all of
+        them get the new ``Authorization`` header.
+
+        Args:
+            oauth_config: The configuration that was refreshed
+            previous_refresh_token: The refresh token it redeemed
+        """
+        grant_tokens = {previous_refresh_token, oauth_config.refresh_token}
+        sessions: list[requests.Session] = []
+        with self._lock:
+            for registration in self._registrations.values():
+                config = registration.config_ref()
+                if (
+                    config is None
+                    or config.client_id != oauth_config.client_id
+                    or config.refresh_token not in grant_tokens
+                ):
+                    continue
+                if config is not oauth_config:
+                    config.access_token = oauth_config.access_token
+                    config.refresh_token = oauth_config.refresh_token
+                    config.expires_at = oauth_config.expires_at
+                sessions.extend(registration.sessions)
+                self._schedule(registration, config)
+        for session in sessions:
+            session.headers["Authorization"] = f"Bearer {oauth_config.access_token}"
+        if sessions:
+            logger.debug(f"Swapped the OAuth token of {len(sessions)} live session(s)")
+        self._wakeup.set()
+
+    def refresh_due(self) -> int:
+        """Renew every token whose renewal time has passed.
+
+        Returns:
+            The number of tokens renewed
+        """
+        now = self._timer()
+        with self._lock:
+            self._prune()
+            due = [
+                registration
+                for registration in self._registrations.values()
+                if registration.deadline is not None and registration.deadline <= now
+            ]
+        refreshed = 0
+        for registration in due:
+            config = registration.config_ref()
+            if config is None:
+                continue
+            with client_lock(config.client_id):
+                if config.access_token != registration.scheduled_token:
+                    # Already renewed, e.g. through a sibling configuration
+                    with self._lock:
+                        self._schedule(registration, config)
+                    continue
+                logger.debug(f"Renewing OAuth token of client {config.client_id}")
+                if config.refresh_access_token():
+                    refreshed += 1
+                    continue
+            logger.warning(
+                f"Background OAuth token renewal failed, retrying in {RETRY_DELAY}s"
+            )
+            with self._lock:
+                registration.deadline = self._timer() + RETRY_DELAY
+        return refreshed
+
+    def next_deadline(self) -> float | None:
+        """Return the earliest time a live token is due for renewal, if any."""
+        with self._lock:
+            self._prune()
+            deadlines = [
+                registration.deadline
+                for registration in self._registrations.values()
+                if registration.deadline is not None
+            ]
+        return min(deadlines, default=None)
+
+    def start(self) -> None:
+        """Start renewing tokens in a background thread, if enabled."""
+        if not self.enabled or (self._thread and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="oauth-token-refresher", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"Background OAuth token renewal started "
+            f"(at {self.refresh_at_percent}% of token lifetime)"
+        )
+
+    def stop(self) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.refresh_due()
+            except Exception as e:  # noqa: BLE001 - the thread must survive
+                logger.error(f"Error renewing OAuth tokens: {e}")
+            deadline = self.next_deadline()
+            wait = MAX_WAIT
+            if deadline is not None:
+                wait = min(max(deadline - self._timer(), 0.0), MAX_WAIT)
+            self._wakeup.wait(wait)
+            self._wakeup.clear()
+
+    def _schedule(self, registration: _Registration, config: OAuthConfig) -> None:
+        """Compute the renewal time of a config; must hold the lock."""
+        registration.scheduled_token = config.access_token
+        expires_at = config.expires_at
+        if (
+            not self.enabled
+            or not config.refresh_token
+            or not isinstance(expires_at, int | float)
+        ):
+            registration.deadline = None
+            return
+        now = self._timer()
+        remaining = max(expires_at - now, 0.0)
+        registration.deadline = now + remaining * self.refresh_at_percent / 100
+
+    def _prune(self) -> None:
+        """Forget configurations that were garbage collected; must hold the lock."""
+        for key in [
+            key
+            for key, registration in self._registrations.items()
+            if registration.config_ref() is None
+        ]:
+            del self._registrations[key]
+
+
+_refresher: OAuthTokenRefresher | None = None
+_refresher_lock = threading.Lock()
+
+
+def get_token_refresher() -> OAuthTokenRefresher:
+    """Get the process-wide token refresher, configured from the environment."""
+    global _refresher
+    with _refresher_lock:
+        if _refresher is None:
+            _refresher = OAuthTokenRefresher.from_env()
+        return _refresher
@@ -316,6 +316,21 @@ def parametrized_auth_env(request):
         raise ValueError(f"Unknown auth type: {auth_type}")
 
 
+@pytest.fixture(autouse=True)
+def reset_jira_field_registry():
+    """
+    Clear the process-wide Jira field registry around each test.
+
+    Field definitions are shared per Jira URL, and tests reuse the same URLs
+    with different mocked fields, so cached fields must not leak between tests.
+    """
+    from mcp_atlassian.jira.field_registry import get_field_registry
+
+    get_field_registry().invalidate()
+    yield
+    get_field_registry().invalidate()
+
+
 # ============================================================================
 # Session Validation and Health Checks
 # ============================================================================
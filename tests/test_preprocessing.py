@@ -233,6 +233,88 @@ For more information, see [our website|https://example.com].
     assert "[our website](https://example.com)" in converted
 
 
+JIRA_MARKUP_SAMPLES = [
+    "h1. Heading 1",
+    "h2. Heading 2",
+    "*bold text*",
+    "_italic text_",
+    "{{code}}",
+    "{code}\nmultiline code\n{code}",
+    "* Item 1",
+    "# Item 1",
+    """
+h1. Project Overview
+
+h2. Introduction
+This project aims to *improve* the user experience.
+
+h3. Features
+* Feature 1
+* Feature 2
+
+h3. Code Example
+{code:python}
+def hello():
+    print("Hello World")
+{code}
+
+For more information, see [our website|https://example.com].
+""",
+    "bq. Quoted text",
+    "Some ??citation?? with +inserted+, ^super^ and ~sub~ text",
+    "!image.png|alt=Diagram! !chart.png|width=300! !icon.png!",
+    "See [the docs|https://example.com/docs] for *details*",
+    "||Header 1||Header 2||\n|Cell 1|Cell 2|",
+    "{quote}\nFirst line\nSecond line\n{quote}",
+    "{noformat}\nraw text\n{noformat}",
+    "# First\n## Nested\n- Dash",
+    "Hello [~accountid:123456]!",
+]
+
+
+@pytest.mark.parametrize("markup", JIRA_MARKUP_SAMPLES)
+def test_compiled_jira_to_markdown_parity(markup):
+    """The compiled converter matches the sequential converter."""
+    legacy = JiraPreprocessor(converter="legacy")
+    compiled = JiraPreprocessor(converter="compiled")
+
+    assert compiled.jira_to_markdown(markup) == legacy.jira_to_markdown(markup)
+    assert compiled.clean_jira_text(markup) == legacy.clean_jira_text(markup)
+
+
+def test_compiled_jira_to_markdown_protects_code():
+    """Markup inside code and monospace regions is left untouched."""
+    compiled = JiraPreprocessor(converter="compiled")
+
+    converted = compiled.jira_to_markdown(
+        "{code:python}x = a_b_c * 2 ** 3{code} and {{snake_case_name}}"
+    )
+
+    assert converted == "```python\nx = a_b_c * 2 ** 3\n``` and `snake_case_name`"
+
+
+def test_compiled_jira_to_markdown_fixes_overlapping_markup():
+    """Nested bullets and colored text no longer leak regex artifacts."""
+    compiled = JiraPreprocessor(converter="compiled")
+
+    assert compiled.jira_to_markdown("** Nested") == "  - Nested"
+    assert compiled.jira_to_markdown("{color:red}*hot*{color}") == (
+        '<span style="color:red">**hot**</span>'
+    )
+
+
+def test_jira_markup_converter_selection(monkeypatch):
+    """The converter is chosen explicitly or from JIRA_MARKUP_CONVERTER."""
+    assert JiraPreprocessor().markup_converter is None
+
+    monkeypatch.setenv("JIRA_MARKUP_CONVERTER", "compiled")
+    assert JiraPreprocessor().markup_converter is not None
+    assert JiraPreprocessor(converter="legacy").markup_converter is None
+
+    monkeypatch.setenv("JIRA_MARKUP_CONVERTER", "bogus")
+    assert JiraPreprocessor().markup_converter is None
+
+
 def test_markdown_to_jira(preprocessor_with_jira):
     """Test conversion of Markdown to Jira markup."""
     # Test headers
@@ -416,6 +498,238 @@ def test_process_user_profile_macro_multiple():
     assert "@Test User Two" in processed_markdown
 
 
+def _mentions_html(account_ids):
+    return "".join(
+        f'<p><ac:link><ri:user ri:account-id="{account_id}" /></ac:link></p>'
+        for account_id in account_ids
+    )
+
+
+def test_user_mentions_are_resolved_once_per_user():
+    """Repeated mentions cost one lookup per distinct user, across calls."""
+    from unittest.mock import MagicMock
+
+    client = MagicMock(spec=["get_user_details_by_accountid"])
+    client.get_user_details_by_accountid.side_effect = lambda account_id: {
+        "displayName": f"Name {account_id}"
+    }
+    preprocessor = ConfluencePreprocessor(base_url="https://example.atlassian.net")
+    html = _mentions_html([f"user{i % 8}" for i in range(40)])
+
+    processed_html, _ = preprocessor.process_html_content(
+        html, confluence_client=client
+    )
+    preprocessor.process_html_content(html, confluence_client=client)
+
+    assert processed_html.count("@Name user3") == 5
+    assert client.get_user_details_by_accountid.call_count == 8
+
+
+def test_user_mentions_use_bulk_lookup():
+    """Clients with a bulk endpoint resolve all account IDs in one request."""
+    from unittest.mock import MagicMock
+
+    client = MagicMock()
+    client.get.return_value = {
+        "results": [{"accountId": "a1", "displayName": "Ann"}],
+    }
+    client.get_user_details_by_accountid.return_value = {"displayName": "Bob"}
+    preprocessor = ConfluencePreprocessor(base_url="https://example.atlassian.net")
+
+    processed_html, _ = preprocessor.process_html_content(
+        _mentions_html(["a1", "b2", "a1"]), confluence_client=client
+    )
+
+    client.get.assert_called_once_with(
+        "rest/api/user/bulk", params={"accountId": "a1,b2", "limit": 2}
+    )
+    # Users missing from the bulk response are looked up individually
+    client.get_user_details_by_accountid.assert_called_once_with("b2")
+    assert processed_html.count("@Ann") == 2
+    assert "@Bob" in processed_html
+
+
+def test_user_mention_cache_can_be_disabled(monkeypatch):
+    """CONFLUENCE_USER_CACHE_TTL=0 resolves users again on every call."""
+    monkeypatch.setenv("CONFLUENCE_USER_CACHE_TTL", "0")
+    client = MockConfluenceClient()
+    calls = []
+    client.get_user_details_by_accountid = lambda account_id: (
+        calls.append(account_id) or {"displayName": "Ann"}
+    )
+    preprocessor = ConfluencePreprocessor(base_url="https://example.atlassian.net")
+
+    for _ in range(2):
+        preprocessor.process_html_content(
+            _mentions_html(["a1"]), confluence_client=client
+        )
+
+    assert calls == ["a1", "a1"]
+
+
+def test_html_conversion_is_cached_by_content():
+    """Unchanged bodies are converted once; the cache counts hits and misses."""
+    from unittest.mock import MagicMock
+
+    client = MagicMock(spec=["get_user_details_by_accountid"])
+    client.get_user_details_by_accountid.return_value = {"displayName": "Ann"}
+    preprocessor = ConfluencePreprocessor(base_url="https://example.atlassian.net")
+    html = _mentions_html(["a1"]) + "<p>Long paragraph.</p>" * 20
+
+    first = preprocessor.process_html_content(html, confluence_client=client)
+    second = preprocessor.process_html_content(html, confluence_client=client)
+    preprocessor.process_html_content(html + "<p>Edited</p>", confluence_client=client)
+
+    assert first == second
+    assert client.get_user_details_by_accountid.call_count == 1
+    stats = preprocessor.get_conversion_cache().stats()
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+
+
+def test_html_conversion_cache_key_skips_hashing():
+    """A page ID and version identify the body, whatever its content."""
+    preprocessor = ConfluencePreprocessor(base_url="https://example.atlassian.net")
+
+    preprocessor.process_html_content("<p>v1</p>", cache_key="123:1:storage")
+    cached = preprocessor.process_html_content(
+        "<p>ignored</p>", cache_key="123:1:storage"
+    )
+    updated = preprocessor.process_html_content("<p>v2</p>", cache_key="123:2:storage")
+
+    assert cached[1].strip() == "v1"
+    assert updated[1].strip() == "v2"
+
+
+def test_jira_text_conversion_is_cached(monkeypatch):
+    """Long Jira texts are converted once per converter."""
+    preprocessor = JiraPreprocessor(base_url="https://example.atlassian.net")
+    calls = []
+    convert = preprocessor.jira_to_markdown
+    monkeypatch.setattr(
+        preprocessor,
+        "jira_to_markdown",
+        lambda text: calls.append(text) or convert(text),
+    )
+    text = "h1. Title\n" + "Some *bold* text. " * 20
+
+    first = preprocessor.clean_jira_text(text)
+    second = preprocessor.clean_jira_text(text)
+    preprocessor.clean_jira_text("*short*")
+    preprocessor.clean_jira_text("*short*")
+
+    assert first == second
+    assert first.startswith("# Title")
+    # Short texts bypass the cache
+    assert len(calls) == 3
+
+
+def test_conversion_cache_persists_to_disk(monkeypatch, tmp_path):
+    """With CONVERSION_CACHE_DIR, results survive a new preprocessor."""
+    monkeypatch.setenv("CONVERSION_CACHE_DIR", str(tmp_path))
+    html = "<p>Persisted paragraph.</p>" * 20
+
+    expected = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net"
+    ).process_html_content(html)
+    preprocessor = ConfluencePreprocessor(base_url="https://example.atlassian.net")
+    monkeypatch.setattr(
+        preprocessor,
+        "_process_html_content",
+        lambda *args: pytest.fail("converted again"),
+    )
+
+    assert preprocessor.process_html_content(html) == expected
+    assert preprocessor.get_conversion_cache().stats()["hits"] == 1
+    assert list(tmp_path.glob("*/*.json"))
+
+
+def test_conversion_cache_disk_entries_are_scoped(monkeypatch, tmp_path):
+    """Results persisted for one principal are not served to another."""
+    monkeypatch.setenv("CONVERSION_CACHE_DIR", str(tmp_path))
+    html = "<p>Restricted paragraph.</p>"
+
+    ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", cache_scope="alice"
+    ).process_html_content(html, cache_key="1:1:storage")
+    preprocessor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", cache_scope="bob"
+    )
+    calls = []
+    monkeypatch.setattr(
+        preprocessor,
+        "_process_html_content",
+        lambda *args: calls.append(args) or ("<p>x</p>", "x"),
+    )
+
+    preprocessor.process_html_content(html, cache_key="1:1:storage")
+
+    assert len(calls) == 1
+    assert len(list(tmp_path.glob("*/*.json"))) == 2
+
+
+def test_conversion_cache_can_be_disabled(monkeypatch):
+    """CONVERSION_CACHE_TTL=0 converts content on every call."""
+    monkeypatch.setenv("CONVERSION_CACHE_TTL", "0")
+    preprocessor = ConfluencePreprocessor(base_url="https://example.atlassian.net")
+
+    preprocessor.process_html_content("<p>x</p>", cache_key="1:1:storage")
+
+    assert preprocessor.get_conversion_cache() is None
+
+
+def test_conversion_cache_expires_entries():
+    """Entries older than the TTL are misses, in memory and on disk."""
+    from mcp_atlassian.preprocessing.conversion_cache import ConversionCache
+
+    now = [0.0]
+    cache = ConversionCache(maxsize=4, ttl=10, timer=lambda: now[0])
+    cache.put("key", "value")
+    assert cache.get("key") == "value"
+
+    now[0] += 11
+    assert cache.get("key") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5, "size": 0}
+
+
+@pytest.mark.parametrize("html_parser", ["html.parser", "lxml"])
+def test_process_html_content_parser_backends(html_parser):
+    """Both parser backends keep code macros as CDATA and return a bare fragment."""
+    if html_parser == "lxml":
+        pytest.importorskip("lxml")
+    preprocessor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", html_parser=html_parser
+    )
+    html = (
+        '<p>Owner: <ac:link><ri:user ri:account-id="a1" /></ac:link></p>'
+        '<ac:structured-macro ac:name="code"><ac:plain-text-body>'
+        "<![CDATA[if a < b:\n    run()]]></ac:plain-text-body></ac:structured-macro>"
+    )
+
+    processed_html, processed_markdown = preprocessor.process_html_content(
+        html, confluence_client=MockConfluenceClient()
+    )
+
+    assert processed_html.startswith("<p>Owner: @Test User a1</p>")
+    assert "<body>" not in processed_html
+    assert "<![CDATA[if a < b:\n    run()]]>" in processed_html
+    assert "if a < b:" in processed_markdown
+    assert "@Test User a1" in processed_markdown
+
+
+def test_html_parser_selection(monkeypatch):
+    """HTML_PARSER picks the backend; auto prefers lxml when installed."""
+    from mcp_atlassian.preprocessing.base import get_html_parser, is_lxml_available
+
+    monkeypatch.setenv("HTML_PARSER", "html.parser")
+    assert get_html_parser() == "html.parser"
+
+    monkeypatch.setenv("HTML_PARSER", "auto")
+    assert get_html_parser() == ("lxml" if is_lxml_available() else "html.parser")
+
+    monkeypatch.setenv("HTML_PARSER", "bogus")
+    assert get_html_parser() in ("lxml", "html.parser")
+
+
 def test_markdown_to_confluence_no_automatic_anchors():
     """Test that heading_anchors=False prevents automatic anchor generation (regression for issue #488)."""
     from mcp_atlassian.preprocessing.confluence import ConfluencePreprocessor
@@ -0,0 +1,126 @@
+"""Tests for the native async Confluence read operations."""
+
+import httpx
+import pytest
+
+from mcp_atlassian.confluence import ConfluenceConfig, ConfluenceFetcher
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
+from mcp_atlassian.utils.async_http import AsyncTransport
+
+pytestmark = pytest.mark.anyio
+
+PAGE = {
+    "id": "123",
+    "type": "page",
+    "title": "Async page",
+    "space": {"key": "DEV", "name": "Development"},
+    "version": {"number": 3},
+    "body": {"storage": {"value": "<p>Hello <strong>world</strong></p>"}},
+}
+
+
+def _make_fetcher(routes, requests_seen=None):
+    """Build a fetcher whose async transport is served by ``routes``."""
+    fetcher = ConfluenceFetcher(
+        config=ConfluenceConfig(
+            url="https://wiki.example.com",
+            auth_type="pat",
+            personal_token="token",
+            async_transport=True,
+        )
+    )
+
+    def handler(request):
+        if requests_seen is not None:
+            requests_seen.append(request)
+        for path, response in routes.items():
+            if request.url.path.endswith(path):
+                if isinstance(response, int):
+                    return httpx.Response(response)
+                return httpx.Response(200, json=response)
+        return httpx.Response(404)
+
+    fetcher._async_transport = AsyncTransport(
+        base_url=fetcher.confluence.url,
+        session=fetcher.confluence._session,
+        service_name="Confluence API",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    return fetcher
+
+
+async def test_get_page_content_async():
+    """The page is fetched and converted to markdown."""
+    seen = []
+    fetcher = _make_fetcher({"/content/123": PAGE}, seen)
+
+    page = await fetcher.get_page_content_async("123")
+
+    assert page.title == "Async page"
+    assert "**world**" in page.content
+    assert seen[0].url.params["expand"] == (
+        "body.storage,version,space,children.attachment"
+    )
+
+
+async def test_get_page_content_async_auth_error():
+    """Authentication failures are raised unchanged."""
+    fetcher = _make_fetcher({"/content/123": 401})
+
+    with pytest.raises(MCPAtlassianAuthenticationError):
+        await fetcher.get_page_content_async("123")
+
+
+async def test_search_async():
+    """CQL results are returned with processed excerpts."""
+    seen = []
+    fetcher = _make_fetcher(
+        {
+            "/rest/api/search": {
+                "results": [
+                    {
+                        "content": {"id": "123", "type": "page", "title": "Hit"},
+                        "excerpt": "<b>match</b>",
+                    }
+                ]
+            }
+        },
+        seen,
+    )
+
+    pages = await fetcher.search_async("text ~ match", limit=5, spaces_filter="DEV")
+
+    assert [page.id for page in pages] == ["123"]
+    assert "match" in pages[0].content
+    assert seen[0].url.params["cql"] == "(text ~ match) AND (space = DEV)"
+    assert seen[0].url.params["limit"] == "5"
+
+
+async def test_get_page_comments_async():
+    """The page and its comments are fetched and processed."""
+    fetcher = _make_fetcher(
+        {
+            "/content/123": PAGE,
+            "/content/123/child/comment": {
+                "results": [
+                    {
+                        "id": "c1",
+                        "body": {"view": {"value": "<p>Nice</p>"}},
+                        "version": {"number": 1},
+                        "author": {"displayName": "Ann"},
+                    }
+                ]
+            },
+        }
+    )
+
+    comments = await fetcher.get_page_comments_async("123")
+
+    assert [comment.body.strip() for comment in comments] == ["Nice"]
+
+
+async def test_get_page_comments_async_network_error():
+    """HTTP errors yield an empty list like the synchronous implementation."""
+    fetcher = _make_fetcher({"/content/123": 500})
+
+    assert await fetcher.get_page_comments_async("123") == []
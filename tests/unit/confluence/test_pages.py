@@ -546,13 +546,15 @@ class TestPagesMixin:
             page_id=parent_id, expand="body.storage", convert_to_markdown=True
         )
 
-        # Assert
+        # Assert: content is only processed once it is read
         assert len(results) == 1
+        pages_mixin.preprocessor.process_html_content.assert_not_called()
         assert results[0].content == "Processed Markdown"
         pages_mixin.preprocessor.process_html_content.assert_called_once_with(
             "<p>This is some content</p>",
             space_key="DEMO",
             confluence_client=pages_mixin.confluence,
+            cache_key="789012:1:storage",
         )
 
     def test_get_page_children_empty(self, pages_mixin):
@@ -1074,6 +1076,7 @@ class TestPagesOAuthMixin:
                 "<p>OAuth page content</p>",
                 space_key="PROJ",
                 confluence_client=oauth_pages_mixin.confluence,
+                cache_key=f"{page_id}:3:storage",
             )
 
             # Verify result is a ConfluencePage with correct data
@@ -1108,3 +1111,14 @@ class TestPagesOAuthMixin:
 
             # Verify result
             assert result is True
+
+    def test_v2_adapter_is_reused(self, oauth_pages_mixin):
+        """Test the v2 adapter is created once per client."""
+        with patch(
+            "mcp_atlassian.confluence.pages.ConfluenceV2Adapter"
+        ) as mock_v2_adapter_class:
+            first = oauth_pages_mixin._v2_adapter
+            second = oauth_pages_mixin._v2_adapter
+
+        assert first is second
+        mock_v2_adapter_class.assert_called_once()
@@ -6,7 +6,13 @@ import pytest
 import requests
 from requests.exceptions import HTTPError
 
+from mcp_atlassian.confluence.space_cache import SpaceCache
 from mcp_atlassian.confluence.v2_adapter import ConfluenceV2Adapter
+from mcp_atlassian.utils.metadata_cache import (
+    MetadataCache,
+    configure_metadata_cache,
+    get_metadata_cache,
+)
 
 
 class TestConfluenceV2Adapter:
@@ -135,3 +141,133 @@ class TestConfluenceV2Adapter:
 
         # Verify we still get a result
         assert result["id"] == "123456"
+
+    def test_space_id_persisted_in_metadata_cache(self, mock_session, tmp_path):
+        """Test space IDs are served from the metadata cache when configured."""
+        mock_response = Mock(status_code=200, headers={})
+        mock_response.json.return_value = {"results": [{"id": "789"}]}
+        mock_session.get.return_value = mock_response
+        configure_metadata_cache(MetadataCache(tmp_path))
+        try:
+            adapter = ConfluenceV2Adapter(
+                session=mock_session,
+                base_url="https://example.atlassian.net/wiki",
+                metadata_scope="scope",
+            )
+            assert adapter._get_space_id("TEST") == "789"
+            assert adapter._get_space_id("TEST") == "789"
+
+            # Missing spaces are not remembered
+            mock_response.json.return_value = {"results": []}
+            with pytest.raises(ValueError, match="not found"):
+                adapter._get_space_id("NEW")
+            assert get_metadata_cache().get("scope", "space:NEW") is None
+        finally:
+            configure_metadata_cache(None)
+
+        assert mock_session.get.call_count == 2
+
+    def test_space_key_and_id_cached_both_ways(self, v2_adapter, mock_session):
+        """Test a space looked up by key is not looked up again by ID."""
+        mock_response = Mock(status_code=200, headers={})
+        mock_response.json.return_value = {"results": [{"id": "789"}]}
+        mock_session.get.return_value = mock_response
+
+        assert v2_adapter._get_space_id("TEST") == "789"
+        assert v2_adapter._get_space_id("TEST") == "789"
+        assert v2_adapter._get_space_key_from_id("789") == "TEST"
+
+        mock_session.get.assert_called_once()
+
+    def test_space_cache_disabled(self, mock_session):
+        """Test spaces are looked up every time when the cache TTL is 0."""
+        mock_response = Mock(status_code=200, headers={})
+        mock_response.json.return_value = {"results": [{"id": "789"}]}
+        mock_session.get.return_value = mock_response
+        adapter = ConfluenceV2Adapter(
+            session=mock_session,
+            base_url="https://example.atlassian.net/wiki",
+            space_cache=SpaceCache(ttl=0),
+        )
+
+        adapter._get_space_id("TEST")
+        adapter._get_space_id("TEST")
+
+        assert mock_session.get.call_count == 2
+
+    def test_update_page_uses_version_already_seen(self, v2_adapter, mock_session):
+        """Test an update after a read does not fetch the page again."""
+        get_response = Mock(status_code=200)
+        get_response.json.return_value = {
+            "id": "123",
+            "status": "current",
+            "title": "Page",
+            "spaceId": "789",
+            "version": {"number": 4},
+        }
+        mock_session.get.return_value = get_response
+        v2_adapter.space_cache.put("TEST", "789")
+        v2_adapter.get_page("123")
+
+        put_response = Mock(status_code=200)
+        put_response.json.return_value = {
+            "id": "123",
+            "title": "Page",
+            "spaceId": "789",
+            "version": {"number": 5},
+        }
+        mock_session.put.return_value = put_response
+
+        result = v2_adapter.update_page("123", "Page", "<p>new</p>")
+
+        assert mock_session.get.call_count == 1
+        assert mock_session.put.call_args.kwargs["json"]["version"] == {"number": 5}
+        assert result["space"]["key"] == "TEST"
+        assert v2_adapter._known_version("123") == 5
+
+    def test_update_page_with_caller_version(self, v2_adapter, mock_session):
+        """Test the version given by the caller is used without fetching."""
+        put_response = Mock(status_code=200)
+        put_response.json.return_value = {"id": "123", "version": {"number": 8}}
+        mock_session.put.return_value = put_response
+
+        v2_adapter.update_page("123", "Page", "<p>new</p>", version=7)
+
+        mock_session.get.assert_not_called()
+        assert mock_session.put.call_args.kwargs["json"]["version"] == {"number": 8}
+
+    def test_update_page_retries_on_conflict(self, v2_adapter, mock_session):
+        """Test a stale version is refreshed and the update retried once."""
+        conflict = Mock(status_code=409, text="Version conflict")
+        conflict.raise_for_status.side_effect = HTTPError(response=conflict)
+        success = Mock(status_code=200)
+        success.json.return_value = {"id": "123", "version": {"number": 10}}
+        mock_session.put.side_effect = [conflict, success]
+        current = Mock(status_code=200)
+        current.json.return_value = {"id": "123", "version": {"number": 9}}
+        mock_session.get.return_value = current
+
+        v2_adapter.update_page("123", "Page", "<p>new</p>", version=3)
+
+        mock_session.get.assert_called_once()
+        versions = [
+            call.kwargs["json"]["version"]["number"]
+            for call in mock_session.put.call_args_list
+        ]
+        assert versions == [4, 10]
+
+    def test_update_page_conflict_on_fresh_version_not_retried(
+        self, v2_adapter, mock_session
+    ):
+        """Test a conflict on a just fetched version is reported, not retried."""
+        current = Mock(status_code=200)
+        current.json.return_value = {"id": "123", "version": {"number": 9}}
+        mock_session.get.return_value = current
+        conflict = Mock(status_code=409, text="Version conflict")
+        conflict.raise_for_status.side_effect = HTTPError(response=conflict)
+        mock_session.put.return_value = conflict
+
+        with pytest.raises(ValueError, match="Failed to update page"):
+            v2_adapter.update_page("123", "Page", "<p>new</p>")
+
+        mock_session.put.assert_called_once()
@@ -0,0 +1,190 @@
+"""Tests for the native async Jira read operations."""
+
+import httpx
+import pytest
+
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
+from mcp_atlassian.jira import JiraConfig, JiraFetcher
+from mcp_atlassian.utils.async_http import AsyncTransport
+
+pytestmark = pytest.mark.anyio
+
+ISSUE = {
+    "id": "10001",
+    "key": "PROJ-1",
+    "fields": {
+        "summary": "Async issue",
+        "status": {"name": "Open"},
+        "issuetype": {"name": "Task"},
+        "comment": {"comments": [], "total": 2},
+    },
+}
+COMMENTS = {
+    "comments": [
+        {"id": "1", "body": "first", "author": {"displayName": "Ann"}},
+        {"id": "2", "body": "second", "author": {"displayName": "Bob"}},
+    ]
+}
+
+
+def _make_fetcher(url, routes, requests_seen=None, **config):
+    """Build a fetcher whose async transport is served by ``routes``."""
+    fetcher = JiraFetcher(
+        config=JiraConfig(
+            url=url,
+            auth_type="pat",
+            personal_token="token",
+            async_transport=True,
+            **config,
+        )
+    )
+    fetcher._field_ids_cache = []
+
+    def handler(request):
+        if requests_seen is not None:
+            requests_seen.append(request)
+        for path, response in routes.items():
+            if request.url.path.endswith(path):
+                if isinstance(response, int):
+                    return httpx.Response(response)
+                return httpx.Response(200, json=response)
+        return httpx.Response(404)
+
+    fetcher._async_transport = AsyncTransport(
+        base_url=fetcher.jira.url,
+        session=fetcher.jira._session,
+        service_name="Jira API",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    return fetcher
+
+
+async def test_get_issue_async_fetches_comments():
+    """The issue and its comments are fetched and combined."""
+    seen = []
+    fetcher = _make_fetcher(
+        "https://jira.example.com",
+        {"/issue/PROJ-1": ISSUE, "/issue/PROJ-1/comment": COMMENTS},
+        seen,
+    )
+
+    issue = await fetcher.get_issue_async("PROJ-1", comment_limit=1)
+
+    assert issue.key == "PROJ-1"
+    assert issue.summary == "Async issue"
+    assert [c.body for c in issue.comments] == ["first"]
+    assert seen[0].headers["Authorization"] == "Bearer token"
+    assert seen[0].url.params["updateHistory"] == "true"
+
+
+async def test_get_issue_async_without_comments():
+    """No comments request is sent when comments are not requested."""
+    seen = []
+    fetcher = _make_fetcher("https://jira.example.com", {"/issue/PROJ-1": ISSUE}, seen)
+
+    await fetcher.get_issue_async("PROJ-1", comment_limit=0)
+
+    assert [request.url.path for request in seen] == ["/rest/api/2/issue/PROJ-1"]
+
+
+async def test_get_issue_async_auth_error():
+    """Authentication failures are raised unchanged."""
+    fetcher = _make_fetcher("https://jira.example.com", {"/issue/PROJ-1": 401})
+
+    with pytest.raises(MCPAtlassianAuthenticationError):
+        await fetcher.get_issue_async("PROJ-1")
+
+
+async def test_search_issues_async_server():
+    """Server/DC search uses startAt pagination and caps maxResults at 50."""
+    seen = []
+    fetcher = _make_fetcher(
+        "https://jira.example.com",
+        {"/search": {"issues": [ISSUE], "total": 1, "startAt": 5, "maxResults": 50}},
+        seen,
+    )
+
+    result = await fetcher.search_issues_async("project = PROJ", start=5, limit=100)
+
+    assert result.total == 1
+    assert [issue.key for issue in result.issues] == ["PROJ-1"]
+    assert seen[0].url.params["startAt"] == "5"
+    assert seen[0].url.params["maxResults"] == "50"
+
+
+async def test_search_issues_async_cloud():
+    """Cloud search combines the total count with the enhanced search pages."""
+    fetcher = _make_fetcher(
+        "https://example.atlassian.net",
+        {
+            "/search/jql": {"issues": [ISSUE]},
+            "/search": {"total": 42},
+        },
+    )
+
+    result = await fetcher.search_issues_async("project = PROJ", limit=1)
+
+    assert result.total == 42
+    assert [issue.key for issue in result.issues] == ["PROJ-1"]
+
+
+async def test_search_issues_async_cloud_approximate_total():
+    """The approximate count is requested alongside the pages when configured."""
+    seen = []
+    fetcher = _make_fetcher(
+        "https://example.atlassian.net",
+        {
+            "/search/jql": {"issues": [ISSUE]},
+            "/search/approximate-count": {"count": 7},
+        },
+        seen,
+        search_total="approximate",
+    )
+
+    result = await fetcher.search_issues_async("project = PROJ", limit=1)
+
+    assert result.total == 7
+    assert {request.method for request in seen} == {"GET", "POST"}
+
+
+async def test_search_issues_async_cloud_skip_total():
+    """Only the issue pages are requested when totals are skipped."""
+    seen = []
+    fetcher = _make_fetcher(
+        "https://example.atlassian.net",
+        {"/search/jql": {"issues": [ISSUE]}},
+        seen,
+        search_total="skip",
+    )
+
+    result = await fetcher.search_issues_async("project = PROJ", limit=10)
+
+    assert result.total == 1
+    assert [request.url.path for request in seen] == ["/rest/api/2/search/jql"]
+
+
+async def test_get_available_transitions_async():
+    """Transitions match the synchronous implementation's output."""
+    fetcher = _make_fetcher(
+        "https://jira.example.com",
+        {
+            "/issue/PROJ-1/transitions": {
+                "transitions": [{"id": "11", "name": "Start", "to": {"name": "Doing"}}]
+            }
+        },
+    )
+
+    transitions = await fetcher.get_available_transitions_async("PROJ-1")
+
+    assert transitions == [{"id": 11, "name": "Start"}]
+
+
+async def test_get_issue_comments_async():
+    """Comments are processed like the synchronous implementation."""
+    fetcher = _make_fetcher(
+        "https://jira.example.com", {"/issue/PROJ-1/comment": COMMENTS}
+    )
+
+    comments = await fetcher.get_issue_comments_async("PROJ-1", limit=5)
+
+    assert [c["author"] for c in comments] == ["Ann", "Bob"]
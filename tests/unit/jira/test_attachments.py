@@ -1,11 +1,14 @@
 """Tests for the Jira attachments module."""
 
+import os
+from datetime import datetime
 from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
+import requests
 
 from mcp_atlassian.jira import JiraFetcher
-from mcp_atlassian.jira.attachments import AttachmentsMixin
+from mcp_atlassian.jira.attachments import AttachmentsMixin, MultipartFileStream
 
 # Test scenarios for AttachmentsMixin
 #
@@ -28,6 +31,11 @@ from mcp_atlassian.jira.attachments import AttachmentsMixin
 #      - Some attachments fail to download
 #      - Attachment has missing URL
 #
+# 2b. Resume and integrity:
+#    - A .part file is resumed with a Range request, or restarted on a 200
+#    - A short download fails and keeps the .part file
+#    - Up-to-date files are skipped and throughput is reported
+#
 # 3. Single Attachment Upload (upload_attachment method):
 #    - Success case: Uploads file correctly
 #    - Path handling: Converts relative file path to absolute path
@@ -44,6 +52,7 @@ from mcp_atlassian.jira.attachments import AttachmentsMixin
 #    - Error cases:
 #      - Empty list of file paths
 #      - No issue key provided
+#    - Concurrent uploads keep file order; batches share one streamed request
 
 
 class TestAttachmentsMixin:
@@ -72,6 +81,7 @@ class TestAttachmentsMixin:
             patch("os.path.exists") as mock_exists,
             patch("os.path.getsize") as mock_getsize,
             patch("os.makedirs") as mock_makedirs,
+            patch("os.replace") as mock_replace,
         ):
             mock_exists.return_value = True
             mock_getsize.return_value = 12  # Length of "test content"
@@ -86,8 +96,11 @@ class TestAttachmentsMixin:
             attachments_mixin.jira._session.get.assert_called_once_with(
                 "https://test.url/attachment", stream=True
             )
-            mock_file.assert_called_once_with("/tmp/test_file.txt", "wb")
+            mock_file.assert_called_once_with("/tmp/test_file.txt.part", "wb")
             mock_file().write.assert_called_once_with(b"test content")
+            mock_replace.assert_called_once_with(
+                "/tmp/test_file.txt.part", "/tmp/test_file.txt"
+            )
             mock_makedirs.assert_called_once()
 
     def test_download_attachment_relative_path(
@@ -108,6 +121,7 @@ class TestAttachmentsMixin:
             patch("os.makedirs") as mock_makedirs,
             patch("os.path.abspath") as mock_abspath,
             patch("os.path.isabs") as mock_isabs,
+            patch("os.replace"),
         ):
             mock_exists.return_value = True
             mock_getsize.return_value = 12
@@ -123,7 +137,7 @@ class TestAttachmentsMixin:
             assert result is True
             mock_isabs.assert_called_once_with("test_file.txt")
             mock_abspath.assert_called_once_with("test_file.txt")
-            mock_file.assert_called_once_with("/absolute/path/test_file.txt", "wb")
+            mock_file.assert_called_once_with("/absolute/path/test_file.txt.part", "wb")
 
     def test_download_attachment_no_url(self, attachments_mixin: AttachmentsMixin):
         """Test attachment download with no URL."""
@@ -343,9 +357,11 @@ class TestAttachmentsMixin:
         assert "Could not retrieve issue" in result["error"]
 
     def test_download_issue_attachments_some_failures(
-        self, attachments_mixin: AttachmentsMixin
+        self, attachments_mixin: AttachmentsMixin, monkeypatch: pytest.MonkeyPatch
     ):
         """Test download when some attachments fail to download."""
+        # One worker so the mocked results are consumed in attachment order
+        monkeypatch.setenv("JIRA_ATTACHMENT_DOWNLOAD_WORKERS", "1")
         # Mock the issue data
         mock_issue = {
             "fields": {
@@ -442,6 +458,190 @@ class TestAttachmentsMixin:
             assert result["failed"][0]["filename"] == "test1.txt"
             assert "No URL available" in result["failed"][0]["error"]
 
+    def test_download_attachment_resumes_partial_file(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test a leftover .part file is resumed with a Range request."""
+        target = tmp_path / "log.txt"
+        (tmp_path / "log.txt.part").write_bytes(b"hello ")
+        mock_response = MagicMock(status_code=206)
+        mock_response.iter_content.return_value = [b"world"]
+        attachments_mixin.jira._session.get.return_value = mock_response
+
+        result = attachments_mixin.download_attachment(
+            "https://test.url/attachment", str(target), expected_size=11
+        )
+
+        assert result is True
+        attachments_mixin.jira._session.get.assert_called_once_with(
+            "https://test.url/attachment",
+            stream=True,
+            headers={"Range": "bytes=6-"},
+        )
+        assert target.read_bytes() == b"hello world"
+        assert not (tmp_path / "log.txt.part").exists()
+
+    def test_download_attachment_restarts_when_range_ignored(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test the partial file is overwritten when the server sends it all."""
+        target = tmp_path / "log.txt"
+        (tmp_path / "log.txt.part").write_bytes(b"stale")
+        mock_response = MagicMock(status_code=200)
+        mock_response.iter_content.return_value = [b"hello world"]
+        attachments_mixin.jira._session.get.return_value = mock_response
+
+        result = attachments_mixin.download_attachment(
+            "https://test.url/attachment", str(target), expected_size=11
+        )
+
+        assert result is True
+        assert target.read_bytes() == b"hello world"
+
+    def test_download_attachment_size_mismatch(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test a truncated download fails and is kept for resuming."""
+        target = tmp_path / "log.txt"
+        mock_response = MagicMock(status_code=200)
+        mock_response.iter_content.return_value = [b"hello"]
+        attachments_mixin.jira._session.get.return_value = mock_response
+
+        result = attachments_mixin.download_attachment(
+            "https://test.url/attachment", str(target), expected_size=11
+        )
+
+        assert result is False
+        assert not target.exists()
+        assert (tmp_path / "log.txt.part").read_bytes() == b"hello"
+
+    def test_download_attachment_sets_mtime(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test the downloaded file gets the requested modification time."""
+        target = tmp_path / "log.txt"
+        mock_response = MagicMock(status_code=200)
+        mock_response.iter_content.return_value = [b"hello"]
+        attachments_mixin.jira._session.get.return_value = mock_response
+
+        result = attachments_mixin.download_attachment(
+            "https://test.url/attachment", str(target), mtime=1_700_000_000.0
+        )
+
+        assert result is True
+        assert target.stat().st_mtime == 1_700_000_000.0
+
+    def test_download_issue_attachments_parallel_and_skip(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test concurrent downloads skip up-to-date files and report throughput."""
+        created = "2024-01-01T10:00:00.000+0000"
+        attachments_mixin.jira.issue.return_value = {
+            "fields": {
+                "attachment": [
+                    {
+                        "filename": f"shot{i}.png",
+                        "content": f"https://test.url/attachment{i}",
+                        "size": 5,
+                        "created": created,
+                    }
+                    for i in range(4)
+                ]
+            }
+        }
+        # shot0.png is already present with the attachment's size and time
+        existing = tmp_path / "shot0.png"
+        existing.write_bytes(b"12345")
+        timestamp = datetime.fromisoformat("2024-01-01T10:00:00+00:00").timestamp()
+        os.utime(existing, (timestamp, timestamp))
+
+        def get(url, **kwargs):
+            response = MagicMock(status_code=200)
+            response.iter_content.return_value = [b"abcde"]
+            return response
+
+        attachments_mixin.jira._session.get.side_effect = get
+
+        result = attachments_mixin.download_issue_attachments("TEST-123", str(tmp_path))
+
+        assert result["success"] is True
+        assert [item["filename"] for item in result["skipped"]] == ["shot0.png"]
+        assert [item["filename"] for item in result["downloaded"]] == [
+            "shot1.png",
+            "shot2.png",
+            "shot3.png",
+        ]
+        assert result["failed"] == []
+        assert result["bytes_downloaded"] == 15
+        assert "throughput_bytes_per_second" in result
+        assert attachments_mixin.jira._session.get.call_count == 3
+        assert existing.read_bytes() == b"12345"
+        assert (tmp_path / "shot3.png").stat().st_mtime == timestamp
+
+        # A second run finds every file up to date
+        result = attachments_mixin.download_issue_attachments("TEST-123", str(tmp_path))
+        assert len(result["skipped"]) == 4
+        assert result["downloaded"] == []
+
+    def test_download_issue_attachments_duplicate_filenames(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test attachments sharing a filename are saved to separate files."""
+        attachments_mixin.jira.issue.return_value = {
+            "fields": {
+                "attachment": [
+                    {
+                        "id": attachment_id,
+                        "filename": "report.pdf",
+                        "content": f"https://test.url/attachment{attachment_id}",
+                        "size": 2,
+                    }
+                    for attachment_id in ("10", "11")
+                ]
+            }
+        }
+
+        def get(url, **kwargs):
+            response = MagicMock(status_code=200)
+            response.iter_content.return_value = [url[-2:].encode()]
+            return response
+
+        attachments_mixin.jira._session.get.side_effect = get
+
+        result = attachments_mixin.download_issue_attachments("TEST-123", str(tmp_path))
+
+        assert [item["path"] for item in result["downloaded"]] == [
+            str(tmp_path / "report.pdf"),
+            str(tmp_path / "report (11).pdf"),
+        ]
+        assert (tmp_path / "report.pdf").read_bytes() == b"10"
+        assert (tmp_path / "report (11).pdf").read_bytes() == b"11"
+
+    def test_download_issue_attachments_counts_resumed_bytes(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test a resumed download only counts the bytes it transferred."""
+        attachments_mixin.jira.issue.return_value = {
+            "fields": {
+                "attachment": [
+                    {
+                        "filename": "log.txt",
+                        "content": "https://test.url/attachment",
+                        "size": 11,
+                    }
+                ]
+            }
+        }
+        (tmp_path / "log.txt.part").write_bytes(b"hello ")
+        mock_response = MagicMock(status_code=206)
+        mock_response.iter_content.return_value = [b"world"]
+        attachments_mixin.jira._session.get.return_value = mock_response
+
+        result = attachments_mixin.download_issue_attachments("TEST-123", str(tmp_path))
+
+        assert len(result["downloaded"]) == 1
+        assert result["bytes_downloaded"] == 5
+
     # Tests for upload_attachment method
 
     def test_upload_attachment_success(self, attachments_mixin: AttachmentsMixin):
@@ -452,7 +652,9 @@ class TestAttachmentsMixin:
             "filename": "test_file.txt",
             "size": 100,
         }
-        attachments_mixin.jira.add_attachment.return_value = mock_attachment_response
+        attachments_mixin.jira._session.post.return_value.json.return_value = [
+            mock_attachment_response
+        ]
 
         # Mock file operations
         with (
@@ -480,9 +682,9 @@ class TestAttachmentsMixin:
             assert result["filename"] == "test_file.txt"
             assert result["size"] == 100
             assert result["id"] == "12345"
-            attachments_mixin.jira.add_attachment.assert_called_once_with(
-                issue_key="TEST-123", filename="/absolute/path/test_file.txt"
-            )
+            attachments_mixin.jira._session.post.assert_called_once()
+            body = attachments_mixin.jira._session.post.call_args.kwargs["data"]
+            assert body.paths == ["/absolute/path/test_file.txt"]
 
     def test_upload_attachment_relative_path(self, attachments_mixin: AttachmentsMixin):
         """Test attachment upload with a relative path."""
@@ -492,7 +694,9 @@ class TestAttachmentsMixin:
             "filename": "test_file.txt",
             "size": 100,
         }
-        attachments_mixin.jira.add_attachment.return_value = mock_attachment_response
+        attachments_mixin.jira._session.post.return_value.json.return_value = [
+            mock_attachment_response
+        ]
 
         # Mock file operations
         with (
@@ -516,9 +720,9 @@ class TestAttachmentsMixin:
             assert result["success"] is True
             mock_isabs.assert_called_once_with("test_file.txt")
             mock_abspath.assert_called_once_with("test_file.txt")
-            attachments_mixin.jira.add_attachment.assert_called_once_with(
-                issue_key="TEST-123", filename="/absolute/path/test_file.txt"
-            )
+            attachments_mixin.jira._session.post.assert_called_once()
+            body = attachments_mixin.jira._session.post.call_args.kwargs["data"]
+            assert body.paths == ["/absolute/path/test_file.txt"]
 
     def test_upload_attachment_no_issue_key(self, attachments_mixin: AttachmentsMixin):
         """Test attachment upload with no issue key."""
@@ -527,7 +731,7 @@ class TestAttachmentsMixin:
         # Assertions
         assert result["success"] is False
         assert "No issue key provided" in result["error"]
-        attachments_mixin.jira.add_attachment.assert_not_called()
+        attachments_mixin.jira._session.post.assert_not_called()
 
     def test_upload_attachment_no_file_path(self, attachments_mixin: AttachmentsMixin):
         """Test attachment upload with no file path."""
@@ -536,7 +740,7 @@ class TestAttachmentsMixin:
         # Assertions
         assert result["success"] is False
         assert "No file path provided" in result["error"]
-        attachments_mixin.jira.add_attachment.assert_not_called()
+        attachments_mixin.jira._session.post.assert_not_called()
 
     def test_upload_attachment_file_not_found(
         self, attachments_mixin: AttachmentsMixin
@@ -560,12 +764,12 @@ class TestAttachmentsMixin:
             # Assertions
             assert result["success"] is False
             assert "File not found" in result["error"]
-            attachments_mixin.jira.add_attachment.assert_not_called()
+            attachments_mixin.jira._session.post.assert_not_called()
 
     def test_upload_attachment_api_error(self, attachments_mixin: AttachmentsMixin):
         """Test attachment upload with an API error."""
         # Mock the Jira API to raise an exception
-        attachments_mixin.jira.add_attachment.side_effect = Exception("API Error")
+        attachments_mixin.jira._session.post.side_effect = Exception("API Error")
 
         # Mock file operations
         with (
@@ -590,8 +794,8 @@ class TestAttachmentsMixin:
 
     def test_upload_attachment_no_response(self, attachments_mixin: AttachmentsMixin):
         """Test attachment upload when API returns no response."""
-        # Mock the Jira API to return None
-        attachments_mixin.jira.add_attachment.return_value = None
+        # Mock the Jira API to return no attachments
+        attachments_mixin.jira._session.post.return_value.json.return_value = []
 
         # Mock file operations
         with (
@@ -616,8 +820,12 @@ class TestAttachmentsMixin:
 
     # Tests for upload_attachments method
 
-    def test_upload_attachments_success(self, attachments_mixin: AttachmentsMixin):
+    def test_upload_attachments_success(
+        self, attachments_mixin: AttachmentsMixin, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test successful upload of multiple attachments."""
+        # One worker so the mocked results are consumed in file order
+        monkeypatch.setenv("JIRA_ATTACHMENT_UPLOAD_WORKERS", "1")
         # Set up mock for upload_attachment method to simulate successful uploads
         file_paths = [
             "/path/to/file1.txt",
@@ -668,9 +876,11 @@ class TestAttachmentsMixin:
             assert result["uploaded"][2]["id"] == "id3"
 
     def test_upload_attachments_mixed_results(
-        self, attachments_mixin: AttachmentsMixin
+        self, attachments_mixin: AttachmentsMixin, monkeypatch: pytest.MonkeyPatch
     ):
         """Test upload of multiple attachments with mixed success and failure."""
+        # One worker so the mocked results are consumed in file order
+        monkeypatch.setenv("JIRA_ATTACHMENT_UPLOAD_WORKERS", "1")
         # Set up mock for upload_attachment method to simulate mixed results
         file_paths = [
             "/path/to/file1.txt",  # Will succeed
@@ -744,3 +954,114 @@ class TestAttachmentsMixin:
         # Assertions
         assert result["success"] is False
         assert "No issue key provided" in result["error"]
+
+    def test_multipart_file_stream(self, tmp_path):
+        """Test the streamed body matches its length and carries every file."""
+        first = tmp_path / "build.log"
+        first.write_bytes(b"log line\n" * 1000)
+        second = tmp_path / 'we"ird.bin'
+        second.write_bytes(bytes(range(256)))
+        body = MultipartFileStream([str(first), str(second)], chunk_size=1024)
+
+        content = b"".join(body)
+
+        assert len(content) == len(body)
+        assert content == b"".join(body)  # the body can be sent again
+        assert b'name="file"; filename="build.log"' in content
+        assert b'filename="we%22ird.bin"' in content
+        assert b"log line\n" * 1000 in content
+        assert bytes(range(256)) in content
+        assert content.endswith(f"--{body.boundary}--\r\n".encode())
+
+        request = requests.Request(
+            "POST", "https://test.url/upload", data=body
+        ).prepare()
+        assert request.headers["Content-Length"] == str(len(body))
+        assert "Transfer-Encoding" not in request.headers
+
+    def test_upload_attachments_concurrent(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test concurrent uploads report results in file order."""
+        paths = []
+        for i in range(6):
+            path = tmp_path / f"artifact{i}.zip"
+            path.write_bytes(b"x" * (i + 1))
+            paths.append(str(path))
+
+        def post(url, data, headers, timeout):
+            response = MagicMock()
+            response.json.return_value = [
+                {"id": os.path.basename(path)} for path in data.paths
+            ]
+            return response
+
+        attachments_mixin.jira._session.post.side_effect = post
+
+        result = attachments_mixin.upload_attachments("TEST-123", paths)
+
+        assert [item["id"] for item in result["uploaded"]] == [
+            f"artifact{i}.zip" for i in range(6)
+        ]
+        assert result["bytes_uploaded"] == 21
+        assert attachments_mixin.jira._session.post.call_count == 6
+        headers = attachments_mixin.jira._session.post.call_args.kwargs["headers"]
+        assert headers["X-Atlassian-Token"] == "no-check"
+        assert headers["Content-Type"].startswith("multipart/form-data; boundary=")
+
+    def test_upload_attachments_batched(
+        self,
+        attachments_mixin: AttachmentsMixin,
+        tmp_path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test batched uploads send several files in one request."""
+        monkeypatch.setenv("JIRA_ATTACHMENT_UPLOAD_BATCH_SIZE", "3")
+        first = tmp_path / "a.txt"
+        first.write_bytes(b"aaa")
+        second = tmp_path / "b.txt"
+        second.write_bytes(b"bb")
+        missing = tmp_path / "missing.txt"
+        # Jira does not return the attachments in the order they were sent
+        attachments_mixin.jira._session.post.return_value.json.return_value = [
+            {"id": "2", "filename": "b.txt"},
+            {"id": "1", "filename": "a.txt"},
+        ]
+
+        result = attachments_mixin.upload_attachments(
+            "TEST-123", [str(first), str(missing), str(second)]
+        )
+
+        attachments_mixin.jira._session.post.assert_called_once()
+        call_kwargs = attachments_mixin.jira._session.post.call_args.kwargs
+        assert call_kwargs["data"].paths == [str(first), str(second)]
+        assert call_kwargs["timeout"] is attachments_mixin.jira.timeout
+        assert result["uploaded"] == [
+            {"filename": "a.txt", "size": 3, "id": "1"},
+            {"filename": "b.txt", "size": 2, "id": "2"},
+        ]
+        assert result["failed"][0]["filename"] == "missing.txt"
+        assert "File not found" in result["failed"][0]["error"]
+
+    def test_upload_attachments_batch_error(
+        self,
+        attachments_mixin: AttachmentsMixin,
+        tmp_path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test a rejected batch marks each of its files as failed."""
+        monkeypatch.setenv("JIRA_ATTACHMENT_UPLOAD_BATCH_SIZE", "2")
+        paths = []
+        for name in ("a.txt", "b.txt"):
+            path = tmp_path / name
+            path.write_bytes(b"data")
+            paths.append(str(path))
+        attachments_mixin.jira._session.post.side_effect = Exception("413 Too Large")
+
+        result = attachments_mixin.upload_attachments("TEST-123", paths)
+
+        assert result["uploaded"] == []
+        assert [item["error"] for item in result["failed"]] == [
+            "413 Too Large",
+            "413 Too Large",
+        ]
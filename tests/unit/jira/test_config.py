@@ -203,3 +203,25 @@ def test_is_cloud_oauth_with_cloud_id():
         oauth_config=oauth_config,
     )
     assert config.is_cloud is True
+
+
+@pytest.mark.parametrize(
+    "env,expected",
+    [
+        ({}, ("exact", 0)),
+        (
+            {"JIRA_SEARCH_TOTAL": "Approximate", "JIRA_SEARCH_TOTAL_CACHE_TTL": "60"},
+            ("approximate", 60),
+        ),
+        ({"JIRA_SEARCH_TOTAL": "bogus"}, ("exact", 0)),
+    ],
+)
+def test_from_env_search_total(env, expected):
+    """Test that the search total mode and cache TTL are read from the environment."""
+    with patch.dict(
+        os.environ,
+        {"JIRA_URL": "https://jira.example.com", "JIRA_PERSONAL_TOKEN": "t", **env},
+        clear=True,
+    ):
+        config = JiraConfig.from_env()
+        assert (config.search_total, config.search_total_cache_ttl) == expected
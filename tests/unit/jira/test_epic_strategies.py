@@ -0,0 +1,115 @@
+"""Tests for the epic issue strategy cache."""
+
+from mcp_atlassian.jira.epic_strategies import (
+    EpicStrategyCache,
+    project_of,
+    strategy_jql,
+)
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_strategy_jql():
+    """Each strategy builds its JQL for the epic."""
+    assert strategy_jql("parent", "P-1") == 'parent = "P-1"'
+    assert (
+        strategy_jql("issueFunction", "P-1")
+        == 'issueFunction in issuesScopedToEpic("P-1")'
+    )
+    assert strategy_jql("epicLinkName", "P-1") == '"Epic Link" = "P-1"'
+    assert (
+        strategy_jql("issueLink:blocks", "P-1")
+        == 'issueLink = "blocks" and issueLink = "P-1"'
+    )
+    assert strategy_jql("field:customfield_10014", "P-1") == (
+        '"customfield_10014" = "P-1"'
+    )
+
+
+def test_project_of():
+    """The project key is everything before the last dash."""
+    assert project_of("PROJ-123") == "PROJ"
+    assert project_of("my-proj-7") == "MY-PROJ"
+
+
+def test_success_is_cached_per_project_and_site():
+    """A working strategy is cached for its project and as the site default."""
+    cache = EpicStrategyCache()
+
+    cache.record_success("ALPHA", "parent")
+    cache.record_success("BETA", "field:customfield_10014")
+
+    assert cache.get("ALPHA") == "parent"
+    assert cache.get("BETA") == "field:customfield_10014"
+    assert cache.get("GAMMA") is None
+    assert cache.get_site_default() == "field:customfield_10014"
+
+    cache.forget("ALPHA")
+    assert cache.get("ALPHA") is None
+
+
+def test_strategy_is_confirmed_by_a_second_epic():
+    """A project's strategy is trusted once it found the issues of two epics."""
+    cache = EpicStrategyCache()
+
+    cache.record_success("ALPHA", "parent", "ALPHA-1")
+    cache.record_success("ALPHA", "parent", "alpha-1")
+    assert not cache.is_confirmed("ALPHA")
+
+    cache.record_success("ALPHA", "parent", "ALPHA-2")
+    assert cache.is_confirmed("ALPHA")
+
+    # Switching strategies starts over
+    cache.record_success("ALPHA", "epicLinkName", "ALPHA-3")
+    assert not cache.is_confirmed("ALPHA")
+
+    cache.record_success("ALPHA", "epicLinkName", "ALPHA-4")
+    cache.forget("ALPHA")
+    assert not cache.is_confirmed("ALPHA")
+
+
+def test_rejected_strategy_is_dropped_everywhere():
+    """A rejected strategy is skipped and no longer served for any project."""
+    cache = EpicStrategyCache()
+    cache.record_success("ALPHA", "issueFunction")
+
+    cache.record_rejected("issueFunction")
+
+    assert cache.is_rejected("issueFunction")
+    assert cache.get("ALPHA") is None
+    assert cache.get_site_default() is None
+
+
+def test_entries_expire():
+    """Strategies, rejections and verified epics expire after their TTLs."""
+    timer = FakeTimer()
+    cache = EpicStrategyCache(ttl=100, negative_ttl=10, timer=timer)
+    cache.record_success("ALPHA", "parent")
+    cache.record_rejected("issueFunction")
+    cache.add_epic("alpha-1")
+
+    assert cache.is_epic("ALPHA-1")
+    timer.now = 11
+    assert not cache.is_rejected("issueFunction")
+    assert cache.get("ALPHA") == "parent"
+    timer.now = 101
+    assert cache.get("ALPHA") is None
+    assert not cache.is_epic("ALPHA-1")
+
+
+def test_from_env(monkeypatch):
+    """TTLs come from the environment; a zero TTL disables the cache."""
+    monkeypatch.setenv("JIRA_EPIC_STRATEGY_CACHE_TTL", "0")
+    monkeypatch.setenv("JIRA_EPIC_STRATEGY_CACHE_NEGATIVE_TTL", "0")
+
+    cache = EpicStrategyCache.from_env()
+
+    assert not cache.enabled
+    cache.record_rejected("parent")
+    assert not cache.is_rejected("parent")
@@ -3,6 +3,7 @@
 from unittest.mock import MagicMock, call
 
 import pytest
+from requests.exceptions import HTTPError
 
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.epics import EpicsMixin
@@ -754,6 +755,133 @@ class TestEpicsMixin:
         assert last_call_kwargs.get("start") == 3
         assert last_call_kwargs.get("limit") == 10
 
+    def test_get_epic_issues_caches_strategy(self, epics_mixin):
+        """Test the working strategy is reused: one search per later lookup."""
+        epics_mixin.jira.get_issue.return_value = {
+            "key": "EPIC-123",
+            "fields": {"issuetype": {"name": "Epic"}},
+        }
+        epics_mixin.get_field_ids_to_epic = MagicMock(
+            return_value={"epic_link": "customfield_10014"}
+        )
+        children = [JiraIssue(key="CHILD-1", summary="Child 1")]
+
+        def search_side_effect(jql, **kwargs):
+            if "customfield_10014" in jql:
+                return MagicMock(issues=children)
+            raise HTTPError(response=MagicMock(status_code=400))
+
+        epics_mixin.search_issues = MagicMock(side_effect=search_side_effect)
+
+        assert epics_mixin.get_epic_issues("EPIC-123") == children
+        assert epics_mixin.search_issues.call_count == 3
+
+        epics_mixin.search_issues.reset_mock()
+        epics_mixin.get_field_ids_to_epic.reset_mock()
+        epics_mixin.jira.get_issue.reset_mock()
+
+        assert epics_mixin.get_epic_issues("EPIC-123", start=50) == children
+        epics_mixin.search_issues.assert_called_once_with(
+            '"customfield_10014" = "EPIC-123"', start=50, limit=50
+        )
+        epics_mixin.get_field_ids_to_epic.assert_not_called()
+        epics_mixin.jira.get_issue.assert_not_called()
+
+    def test_get_epic_issues_skips_rejected_strategies(self, epics_mixin):
+        """Test strategies rejected as invalid JQL are not tried again."""
+        epics_mixin.jira.get_issue.return_value = {
+            "fields": {"issuetype": {"name": "Epic"}},
+        }
+        epics_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+        epics_mixin._find_epic_link_field = MagicMock(return_value=None)
+        queries = []
+
+        def search_side_effect(jql, **kwargs):
+            queries.append(jql)
+            if jql.startswith("parent"):
+                return MagicMock(issues=[])
+            raise HTTPError(response=MagicMock(status_code=400))
+
+        epics_mixin.search_issues = MagicMock(side_effect=search_side_effect)
+
+        assert epics_mixin.get_epic_issues("ALPHA-1") == []
+        first_run = len(queries)
+        queries.clear()
+
+        # Another project: only the strategy that did not fail is tried again
+        assert epics_mixin.get_epic_issues("BETA-1") == []
+        assert queries == ['parent = "BETA-1"']
+        assert first_run > 1
+
+    def test_get_epic_issues_empty_epic_with_known_strategy(self, epics_mixin):
+        """Test an empty epic takes one search once two epics confirmed the strategy."""
+        epics_mixin.jira.get_issue.return_value = {
+            "fields": {"issuetype": {"name": "Epic"}},
+        }
+        epics_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+        children = [JiraIssue(key="PROJ-2", summary="Child")]
+        epics_mixin.search_issues = MagicMock(
+            side_effect=[
+                Exception("issueFunction unavailable"),
+                MagicMock(issues=children),
+                MagicMock(issues=children),
+                MagicMock(issues=[]),
+            ]
+        )
+
+        assert epics_mixin.get_epic_issues("PROJ-1") == children
+        assert epics_mixin.get_epic_issues("PROJ-3") == children
+        assert epics_mixin.get_epic_issues("PROJ-5") == []
+        assert epics_mixin.search_issues.call_count == 4
+        assert epics_mixin.search_issues.call_args[0][0] == 'parent = "PROJ-5"'
+
+    def test_get_epic_issues_unconfirmed_strategy_falls_back(self, epics_mixin):
+        """Test an empty result from a strategy only one epic used tries the others."""
+        epics_mixin.jira.get_issue.return_value = {
+            "fields": {"issuetype": {"name": "Epic"}},
+        }
+        epics_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+        epics_mixin._find_epic_link_field = MagicMock(return_value=None)
+        children = [JiraIssue(key="PROJ-2", summary="Child")]
+
+        def search_side_effect(jql, **kwargs):
+            if jql.startswith("issueFunction"):
+                raise Exception("issueFunction unavailable")
+            if jql == 'parent = "PROJ-1"':
+                return MagicMock(issues=children)
+            if jql == '"Epic Link" = "PROJ-5"':
+                return MagicMock(issues=children)
+            return MagicMock(issues=[])
+
+        epics_mixin.search_issues = MagicMock(side_effect=search_side_effect)
+
+        assert epics_mixin.get_epic_issues("PROJ-1") == children
+        # parent found nothing for PROJ-5, and only PROJ-1 confirmed it
+        assert epics_mixin.get_epic_issues("PROJ-5") == children
+        cache = epics_mixin._get_epic_strategy_cache()
+        assert cache.get("PROJ") == "epicLinkName"
+
+    def test_get_epic_issues_cache_disabled(self, epics_mixin, monkeypatch):
+        """Test every lookup walks the strategies when caching is disabled."""
+        monkeypatch.setenv("JIRA_EPIC_STRATEGY_CACHE_TTL", "0")
+        epics_mixin.jira.get_issue.return_value = {
+            "fields": {"issuetype": {"name": "Epic"}},
+        }
+        epics_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+
+        def search_side_effect(jql, **kwargs):
+            if jql.startswith("issueFunction"):
+                raise Exception("issueFunction unavailable")
+            return MagicMock(issues=[JiraIssue(key="PROJ-2")])
+
+        epics_mixin.search_issues = MagicMock(side_effect=search_side_effect)
+
+        epics_mixin.get_epic_issues("PROJ-1")
+        epics_mixin.get_epic_issues("PROJ-1")
+
+        assert epics_mixin.search_issues.call_count == 4
+        assert epics_mixin.jira.get_issue.call_count == 2
+
     def test_get_epic_issues_api_error(self, epics_mixin: EpicsMixin):
         """Test get_epic_issues with API error."""
         # Setup mocks - simulate API error
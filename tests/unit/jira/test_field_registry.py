@@ -0,0 +1,252 @@
+"""Tests for the shared Jira field registry."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_atlassian.jira.field_registry import FieldIndex, FieldRegistry
+
+FIELDS = [
+    {
+        "id": "summary",
+        "name": "Summary",
+        "clauseNames": ["summary"],
+        "schema": {"type": "string"},
+    },
+    {
+        "id": "customfield_10010",
+        "name": "Epic Link",
+        "clauseNames": ["cf[10010]", "Epic Link"],
+        "schema": {
+            "type": "any",
+            "custom": "com.pyxis.greenhopper.jira:gh-epic-link",
+        },
+    },
+    {
+        "id": "customfield_10020",
+        "name": "Team Link",
+        "clauseNames": ["cf[10020]"],
+        "schema": {
+            "type": "any",
+            "custom": "com.pyxis.greenhopper.jira:gh-epic-link",
+        },
+    },
+]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def registry(clock):
+    return FieldRegistry(ttl=60, stale_ttl=600, clock=clock)
+
+
+def test_build_indexes():
+    """All lookup indexes are built from the field list."""
+    index = FieldIndex.build(FIELDS, fetched_at=0.0)
+
+    assert index.name_to_id["epic link"] == "customfield_10010"
+    assert index.name_to_id["customfield_10010"] == "customfield_10010"
+    assert index.by_id["summary"] is FIELDS[0]
+    assert index.clause_to_id["cf[10020]"] == "customfield_10020"
+    assert index.custom_type_to_ids["com.pyxis.greenhopper.jira:gh-epic-link"] == [
+        "customfield_10010",
+        "customfield_10020",
+    ]
+
+
+def test_fields_are_loaded_once_per_site(registry):
+    """Fresh entries are served without calling the loader again."""
+    loader = MagicMock(return_value=FIELDS)
+
+    first = registry.get("https://jira.example.com", loader)
+    second = registry.get("https://jira.example.com", loader)
+    registry.get("https://other.example.com", loader)
+
+    assert first is second
+    assert loader.call_count == 2
+
+
+def test_refresh_reloads(registry):
+    """refresh=True bypasses the cached entry."""
+    loader = MagicMock(return_value=FIELDS)
+
+    first = registry.get("site", loader)
+    second = registry.get("site", loader, refresh=True)
+
+    assert first is not second
+    assert loader.call_count == 2
+
+
+def test_stale_entry_is_served_while_refreshing(registry, clock):
+    """A stale entry is returned immediately and refreshed in the background."""
+    registry.get("site", MagicMock(return_value=FIELDS))
+    release = threading.Event()
+    refreshed = [{"id": "new", "name": "New"}]
+
+    def slow_loader():
+        release.wait(5)
+        return refreshed
+
+    clock.now += 61
+    stale = registry.get("site", slow_loader)
+    # A second stale read does not start another refresh
+    assert registry.get("site", MagicMock(side_effect=AssertionError)) is stale
+    assert stale.fields == FIELDS
+
+    release.set()
+    for thread in threading.enumerate():
+        if thread.name.startswith("jira-fields-refresh-"):
+            thread.join(5)
+    assert registry.peek("site").fields == refreshed
+
+
+def test_failed_background_refresh_keeps_stale_entry(registry, clock):
+    """Errors during a background refresh keep the stale snapshot."""
+    index = registry.get("site", MagicMock(return_value=FIELDS))
+
+    clock.now += 61
+    registry.get("site", MagicMock(side_effect=RuntimeError("down")))
+    for thread in threading.enumerate():
+        if thread.name.startswith("jira-fields-refresh-"):
+            thread.join(5)
+
+    assert registry.peek("site") is index
+
+
+def test_expired_entry_is_reloaded_synchronously(registry, clock):
+    """Entries past the stale window are reloaded before returning."""
+    registry.get("site", MagicMock(return_value=FIELDS))
+    refreshed = [{"id": "new", "name": "New"}]
+
+    clock.now += 61 + 600
+    index = registry.get("site", MagicMock(return_value=refreshed))
+
+    assert index.fields == refreshed
+
+
+def test_invalidate(registry):
+    """Invalidation drops one site or every site."""
+    loader = MagicMock(return_value=FIELDS)
+    registry.get("a", loader)
+    registry.get("b", loader)
+
+    registry.invalidate("a")
+    assert registry.peek("a") is None
+    assert registry.peek("b") is not None
+
+    registry.invalidate()
+    assert registry.peek("b") is None
+
+
+def test_zero_ttl_disables_sharing(clock):
+    """With a TTL of 0 every call loads the fields."""
+    registry = FieldRegistry(ttl=0, clock=clock)
+    loader = MagicMock(return_value=FIELDS)
+
+    registry.get("site", loader)
+    registry.get("site", loader)
+
+    assert loader.call_count == 2
+    assert registry.peek("site") is None
+
+
+def test_unexpected_loader_result(registry):
+    """Non-list payloads raise TypeError and are not cached."""
+    with pytest.raises(TypeError):
+        registry.get("site", MagicMock(return_value={"error": "nope"}))
+
+    assert registry.peek("site") is None
+
+
+def test_concurrent_cold_loads_are_coalesced(registry):
+    """Concurrent misses for the same site issue a single request."""
+    calls = 0
+    lock = threading.Lock()
+
+    def loader():
+        nonlocal calls
+        with lock:
+            calls += 1
+        threading.Event().wait(0.05)
+        return FIELDS
+
+    threads = [
+        threading.Thread(target=registry.get, args=("site", loader)) for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == 1
+
+
+def test_from_env(monkeypatch):
+    """TTLs are read from the environment."""
+    monkeypatch.setenv("JIRA_FIELDS_CACHE_TTL", "10")
+    monkeypatch.setenv("JIRA_FIELDS_CACHE_STALE_TTL", "20")
+
+    registry = FieldRegistry.from_env()
+
+    assert (registry.ttl, registry.stale_ttl) == (10, 20)
+
+
+class TestFieldSearchIndex:
+    """Tests for the trigram-pruned fuzzy field search."""
+
+    @pytest.fixture
+    def catalog(self):
+        fields = [
+            {"id": f"customfield_{10100 + i}", "name": f"Noise Field {i}"}
+            for i in range(300)
+        ]
+        fields.insert(150, {"id": "customfield_99999", "name": "Story Points"})
+        return fields
+
+    def test_exact_name_ranks_first(self, catalog):
+        """A field containing the keyword is found among many others."""
+        index = FieldIndex.build(catalog, fetched_at=0.0)
+
+        result = index.search.search("story point", limit=3)
+
+        assert result[0]["id"] == "customfield_99999"
+        assert len(result) == 3
+
+    def test_matches_clause_names_case_insensitively(self):
+        """Clause names are searchable and matching ignores case."""
+        index = FieldIndex.build(FIELDS, fetched_at=0.0)
+
+        assert index.search.search("CF[10020]", limit=1)[0]["id"] == (
+            "customfield_10020"
+        )
+
+    def test_short_keyword_scans_catalog(self):
+        """Keywords shorter than a trigram are scored against every field."""
+        index = FieldIndex.build(FIELDS, fetched_at=0.0)
+
+        assert len(index.search.search("ep", limit=10)) == len(FIELDS)
+
+    def test_fills_limit_when_shortlist_is_small(self, catalog):
+        """Results are padded from the full catalog when few fields match."""
+        index = FieldIndex.build(catalog, fetched_at=0.0)
+
+        assert len(index.search.search("zzzqqq", limit=5)) == 5
+
+    def test_index_is_built_once_per_snapshot(self):
+        """The search index is cached on the field snapshot."""
+        index = FieldIndex.build(FIELDS, fetched_at=0.0)
+
+        assert index.search is index.search
@@ -7,6 +7,11 @@ import pytest
 
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.fields import FieldsMixin
+from mcp_atlassian.utils.metadata_cache import (
+    MetadataCache,
+    configure_metadata_cache,
+    metadata_scope,
+)
 
 
 class TestFieldsMixin:
@@ -79,6 +84,26 @@ class TestFieldsMixin:
         # Verify cache was updated
         assert fields_mixin._field_ids_cache == mock_fields
 
+    def test_get_fields_warm_start_from_metadata_cache(
+        self, fields_mixin: FieldsMixin, mock_fields, tmp_path
+    ):
+        """Test a cold process uses persisted fields and refreshes update them."""
+        cache = MetadataCache(tmp_path)
+        cache.put(metadata_scope(fields_mixin.config), "fields", mock_fields)
+        configure_metadata_cache(cache)
+        try:
+            assert fields_mixin.get_fields() == mock_fields
+            fields_mixin.jira.get_all_fields.assert_not_called()
+
+            fresh = [{"id": "summary", "name": "Summary"}]
+            fields_mixin.jira.get_all_fields.return_value = fresh
+            assert fields_mixin.get_fields(refresh=True) == fresh
+            persisted = cache.get(metadata_scope(fields_mixin.config), "fields")
+        finally:
+            configure_metadata_cache(None)
+
+        assert persisted.value == fresh
+
     def test_get_fields_from_api(
         self, fields_mixin: FieldsMixin, mock_fields: list[dict[str, Any]]
     ):
@@ -540,3 +565,72 @@ class TestFieldsMixin:
 
         # Verify empty list is returned on error
         assert result == []
+
+    def test_get_fields_shared_across_fetchers(
+        self, fields_mixin: FieldsMixin, mock_fields
+    ):
+        """Fetchers for the same Jira URL share one download of the fields."""
+        fields_mixin.jira.get_all_fields.return_value = mock_fields
+        other = MagicMock(spec=FieldsMixin)
+        other.jira = fields_mixin.jira
+        other._field_ids_cache = None
+        other._field_index = None
+
+        fields_mixin.get_fields()
+        result = FieldsMixin.get_fields(other)
+
+        assert result == mock_fields
+        fields_mixin.jira.get_all_fields.assert_called_once()
+
+    def test_invalidate_field_cache(self, fields_mixin: FieldsMixin, mock_fields):
+        """Invalidation forces the next lookup to fetch fields again."""
+        fields_mixin.jira.get_all_fields.return_value = mock_fields
+        fields_mixin.get_fields()
+
+        fields_mixin.invalidate_field_cache()
+        fields_mixin.get_fields()
+
+        assert fields_mixin.jira.get_all_fields.call_count == 2
+
+    def test_invalidation_reaches_other_fetchers(
+        self, fields_mixin: FieldsMixin, mock_fields
+    ):
+        """A fetcher that already loaded fields sees another fetcher's invalidation."""
+        fields_mixin.jira.get_all_fields.return_value = mock_fields
+        fields_mixin.get_fields()
+        other = MagicMock(spec=FieldsMixin)
+        other.jira = fields_mixin.jira
+
+        FieldsMixin.invalidate_field_cache(other)
+        updated = [*mock_fields, {"id": "customfield_99999", "name": "New Field"}]
+        fields_mixin.jira.get_all_fields.return_value = updated
+
+        assert fields_mixin.get_fields() == updated
+        assert fields_mixin.get_field_id("New Field") == "customfield_99999"
+
+    def test_indexed_lookups(self, fields_mixin: FieldsMixin, mock_fields):
+        """Lookups use the registry's prebuilt indexes."""
+        mock_fields[4]["clauseNames"] = ["cf[10010]", "Epic Link"]
+        fields_mixin.jira.get_all_fields.return_value = mock_fields
+
+        assert fields_mixin.get_field_by_id("customfield_10012") is mock_fields[6]
+        assert fields_mixin.get_field_id("cf[10010]") == "customfield_10010"
+        assert fields_mixin.get_field_id("epic link") == "customfield_10010"
+
+    def test_epic_discovery_uses_warm_registry(
+        self, fields_mixin: FieldsMixin, mock_fields
+    ):
+        """Epic field discovery reads the indexed fields instead of refetching."""
+        mock_fields[4]["name"] = "Parent Epic"
+        mock_fields[5]["name"] = "Label"
+        fields_mixin.jira.get_all_fields.return_value = mock_fields
+        fields_mixin.get_fields()
+        fields_mixin.jira.jql.return_value = {"issues": []}
+
+        field_ids = fields_mixin.get_field_ids_to_epic()
+        link_field = fields_mixin._find_epic_link_field({})
+
+        assert field_ids["epic_link"] == "customfield_10010"
+        assert field_ids["epic_name"] == "customfield_10011"
+        assert link_field == "customfield_10010"
+        fields_mixin.jira.get_all_fields.assert_called_once()
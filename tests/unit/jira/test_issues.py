@@ -1,5 +1,6 @@
 """Tests for the Jira Issues mixin."""
 
+import re
 from unittest.mock import ANY, MagicMock, patch
 
 import pytest
@@ -208,6 +209,109 @@ class TestIssuesMixin:
         ):
             issues_mixin.get_issue("TEST-123")
 
+    def test_batch_get_issues_single_search(self, issues_mixin: IssuesMixin):
+        """Issues are fetched with one search and returned in input order."""
+        issues_mixin.config = MagicMock(is_cloud=False, projects_filter=None)
+        issues_mixin.jira.jql.return_value = {
+            "issues": [
+                {"id": str(i), "key": f"TEST-{i}", "fields": {"summary": f"S{i}"}}
+                for i in (2, 1)
+            ],
+            "total": 2,
+        }
+
+        result = issues_mixin.batch_get_issues(
+            ["TEST-1", "test-2", "TEST-1"], fields="summary"
+        )
+
+        assert [issue.key for issue in result] == ["TEST-1", "TEST-2", "TEST-1"]
+        issues_mixin.jira.jql.assert_called_once_with(
+            'key in ("TEST-1", "test-2")',
+            fields="summary",
+            start=None,
+            limit=2,
+            expand=None,
+        )
+        issues_mixin.jira.get_issue.assert_not_called()
+
+    def test_batch_get_issues_chunks_keys(self, issues_mixin: IssuesMixin):
+        """Key lists longer than a page are split across searches."""
+        issues_mixin.config = MagicMock(is_cloud=False, projects_filter=None)
+        issues_mixin.jira.jql.return_value = {"issues": [], "total": 0}
+        issues_mixin.jira.get_issue.side_effect = lambda key, **kwargs: {
+            "id": key,
+            "key": key,
+            "fields": {},
+        }
+
+        result = issues_mixin.batch_get_issues([f"TEST-{i}" for i in range(120)])
+
+        assert issues_mixin.jira.jql.call_count == 3
+        assert [issue.key for issue in result] == [f"TEST-{i}" for i in range(120)]
+
+    def test_batch_get_issues_per_key_errors(self, issues_mixin: IssuesMixin):
+        """A rejected search falls back to per-key fetches with per-key errors."""
+        issues_mixin.config = MagicMock(is_cloud=False, projects_filter=None)
+        issues_mixin.jira.jql.side_effect = Exception("Issue does not exist")
+
+        def get_issue(key, **kwargs):
+            if key == "TEST-404":
+                raise Exception("Not found")
+            return {"id": "1", "key": key, "fields": {"summary": "Found"}}
+
+        issues_mixin.jira.get_issue.side_effect = get_issue
+
+        result = issues_mixin.batch_get_issues(["TEST-404", "TEST-1"])
+
+        assert isinstance(result[0], Exception)
+        assert "TEST-404" in str(result[0])
+        assert result[1].summary == "Found"
+
+    def test_batch_get_issues_isolates_invalid_key(self, issues_mixin: IssuesMixin):
+        """A key that does not exist is narrowed down instead of failing its chunk."""
+        issues_mixin.config = MagicMock(is_cloud=False, projects_filter=None)
+        keys = [f"TEST-{i}" for i in range(50)]
+
+        def jql(query, **kwargs):
+            chunk = re.findall(r'"([^"]+)"', query)
+            if "TEST-13" in chunk:
+                raise Exception("An issue with key 'TEST-13' does not exist")
+            return {
+                "issues": [{"id": key, "key": key, "fields": {}} for key in chunk],
+                "total": len(chunk),
+            }
+
+        issues_mixin.jira.jql.side_effect = jql
+        issues_mixin.jira.get_issue.side_effect = Exception("Not found")
+
+        result = issues_mixin.batch_get_issues(keys)
+
+        assert isinstance(result[13], Exception)
+        assert [issue.key for i, issue in enumerate(result) if i != 13] == [
+            key for key in keys if key != "TEST-13"
+        ]
+        issues_mixin.jira.get_issue.assert_called_once()
+        assert issues_mixin.jira.get_issue.call_args.args[0] == "TEST-13"
+
+    def test_batch_get_issues_fetches_comments(self, issues_mixin: IssuesMixin):
+        """Comments are fetched for each issue when requested."""
+        issues_mixin.config = MagicMock(is_cloud=True, projects_filter=None)
+        issues_mixin.jira.get.return_value = {
+            "issues": [
+                {"id": "1", "key": "TEST-1", "fields": {"comment": {"comments": []}}}
+            ]
+        }
+        issues_mixin.jira.issue_get_comments.return_value = {
+            "comments": [{"id": "1", "body": "Hi"}, {"id": "2", "body": "There"}]
+        }
+
+        result = issues_mixin.batch_get_issues(
+            ["TEST-1"], fields="comment", comment_limit=1
+        )
+
+        assert [comment.body for comment in result[0].comments] == ["Hi"]
+        issues_mixin.jira.issue_get_comments.assert_called_once_with("TEST-1")
+
     def test_normalize_comment_limit(self, issues_mixin: IssuesMixin):
         """Test normalizing comment limit."""
         # Test with None
@@ -1050,6 +1154,74 @@ class TestIssuesMixin:
         assert call_args[0]["fields"]["summary"] == "Test Issue 1"
         assert call_args[1]["fields"]["summary"] == "Test Issue 2"
 
+    def test_batch_create_issues_chunks_and_hydrates(self, issues_mixin: IssuesMixin):
+        """Large batches are chunked and created issues fetched by search."""
+        issues = [
+            {
+                "project_key": "TEST",
+                "summary": f"Issue {i}",
+                "issue_type": "Task",
+                "assignee": "john.doe" if i % 2 else "jane.doe",
+            }
+            for i in range(120)
+        ]
+        counter = iter(range(120))
+        issues_mixin.jira.create_issues.side_effect = lambda chunk: {
+            "issues": [{"key": f"TEST-{next(counter)}"} for _ in chunk],
+            "errors": [],
+        }
+        issues_mixin.config = MagicMock(is_cloud=True, url="https://test.atlassian.net")
+
+        def search(url, params):
+            keys = params["jql"][len("key in (") : -1].replace('"', "").split(", ")
+            # The newest issue is not searchable yet
+            return {
+                "issues": [
+                    {"id": key, "key": key, "fields": {"summary": key}}
+                    for key in keys
+                    if key != "TEST-119"
+                ]
+            }
+
+        issues_mixin.jira.get.side_effect = search
+        issues_mixin.jira.get_issue.return_value = {
+            "id": "119",
+            "key": "TEST-119",
+            "fields": {},
+        }
+
+        result = issues_mixin.batch_create_issues(issues)
+
+        assert [
+            len(c.args[0]) for c in issues_mixin.jira.create_issues.call_args_list
+        ] == [
+            50,
+            50,
+            20,
+        ]
+        assert [issue.key for issue in result] == [f"TEST-{i}" for i in range(120)]
+        assert issues_mixin.jira.get.call_count == 3
+        issues_mixin.jira.get_issue.assert_called_once_with("TEST-119")
+        assert issues_mixin._get_account_id.call_count == 2
+
+    def test_batch_create_issues_later_chunk_fails(self, issues_mixin: IssuesMixin):
+        """A failing chunk after the first names the issues already created."""
+        issues = [
+            {"project_key": "TEST", "summary": f"Issue {i}", "issue_type": "Task"}
+            for i in range(60)
+        ]
+        issues_mixin.jira.create_issues.side_effect = [
+            {"issues": [{"key": f"TEST-{i}"} for i in range(50)], "errors": []},
+            Exception("Bulk create failed"),
+        ]
+        issues_mixin.jira.get.return_value = {"issues": []}
+
+        with pytest.raises(Exception, match="issues 51-60 of 60") as exc_info:
+            issues_mixin.batch_create_issues(issues)
+
+        assert "TEST-0, TEST-1" in str(exc_info.value)
+        assert "TEST-49" in str(exc_info.value)
+
     def test_batch_create_issues_validate_only(self, issues_mixin: IssuesMixin):
         """Test batch_create_issues with validate_only=True."""
         # Setup test data
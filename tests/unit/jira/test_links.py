@@ -6,6 +6,7 @@ from requests.exceptions import HTTPError
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.jira.links import LinksMixin
 from mcp_atlassian.models.jira import JiraIssueLinkType
+from mcp_atlassian.utils.metadata_cache import MetadataCache, configure_metadata_cache
 
 
 class TestLinksMixin:
@@ -50,6 +51,32 @@ class TestLinksMixin:
         assert result[1].name == "Duplicate"
         links_mixin.jira.get.assert_called_once_with("rest/api/2/issueLinkType")
 
+    def test_get_issue_link_types_persisted(
+        self, links_mixin, mock_config, mock_atlassian_jira, tmp_path
+    ):
+        """Test link types fetched once are served from the metadata cache."""
+        links_mixin.jira.get.return_value = {
+            "issueLinkTypes": [{"id": "10000", "name": "Blocks"}]
+        }
+        configure_metadata_cache(MetadataCache(tmp_path))
+        try:
+            links_mixin.get_issue_link_types()
+
+            # A fresh process loads the cache at startup
+            restarted = MetadataCache(tmp_path)
+            restarted.load()
+            configure_metadata_cache(restarted)
+            mock_atlassian_jira.get.reset_mock()
+            fresh_mixin = LinksMixin(config=mock_config)
+            fresh_mixin.jira = mock_atlassian_jira
+
+            link_types = fresh_mixin.get_issue_link_types()
+        finally:
+            configure_metadata_cache(None)
+
+        assert [link_type.name for link_type in link_types] == ["Blocks"]
+        mock_atlassian_jira.get.assert_not_called()
+
     def test_get_issue_link_types_authentication_error(self, links_mixin):
         links_mixin.jira.get.side_effect = HTTPError(response=Mock(status_code=401))
 
@@ -4,12 +4,16 @@ from typing import Any
 from unittest.mock import MagicMock, call, patch
 
 import pytest
+from requests.exceptions import HTTPError
 
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.config import JiraConfig
+from mcp_atlassian.jira.project_catalog import ProjectCatalog
 from mcp_atlassian.jira.projects import ProjectsMixin
 from mcp_atlassian.models.jira.issue import JiraIssue
 from mcp_atlassian.models.jira.search import JiraSearchResult
+from mcp_atlassian.utils.metadata_cache import MetadataCache, configure_metadata_cache
 
 
 @pytest.fixture
@@ -132,6 +136,109 @@ def test_get_all_projects_non_list_response(projects_mixin: ProjectsMixin):
     projects_mixin.jira.projects.assert_called_once()
 
 
+def test_get_all_projects_cached(
+    projects_mixin: ProjectsMixin, mock_projects: list[dict]
+):
+    """Test the project listing is fetched once until refreshed."""
+    projects_mixin.jira.projects.return_value = mock_projects
+
+    assert projects_mixin.get_all_projects() == mock_projects
+    result = projects_mixin.get_all_projects()
+    assert result == mock_projects
+    projects_mixin.jira.projects.assert_called_once()
+
+    # Callers can modify what they get without corrupting the catalog
+    result[0]["key"] = "CHANGED"
+    assert projects_mixin.get_all_projects()[0]["key"] == "PROJ1"
+
+    projects_mixin.get_all_projects(refresh=True)
+    assert projects_mixin.jira.projects.call_count == 2
+
+
+def test_get_all_projects_filter_pushed_down_on_cloud(
+    projects_mixin: ProjectsMixin, mock_projects: list[dict]
+):
+    """Test only the filtered projects are fetched from project/search on Cloud."""
+    projects_mixin.config.projects_filter = "proj1, PROJ2"
+    projects_mixin.jira.resource_url.return_value = "rest/api/2/project/search"
+    projects_mixin.jira.get.side_effect = [
+        {"values": mock_projects[:1], "isLast": False},
+        {"values": mock_projects[1:], "isLast": True},
+    ]
+
+    result = projects_mixin.get_all_projects()
+
+    assert [project["key"] for project in result] == ["PROJ1", "PROJ2"]
+    projects_mixin.jira.projects.assert_not_called()
+    first, second = projects_mixin.jira.get.call_args_list
+    assert first.kwargs["params"]["keys"] == ["PROJ1", "PROJ2"]
+    assert second.kwargs["params"]["startAt"] == 1
+
+
+def test_get_all_projects_revalidated_with_etag(
+    projects_mixin: ProjectsMixin, mock_projects: list[dict]
+):
+    """Test an expired Server/DC listing is revalidated with its ETag."""
+    clock = MagicMock(return_value=1000.0)
+    projects_mixin.config.is_cloud = False
+    projects_mixin._project_catalog = ProjectCatalog(ttl=60, timer=clock)
+    projects_mixin.jira.get.side_effect = [
+        MagicMock(
+            status_code=200, headers={"ETag": '"v1"'}, json=lambda: mock_projects
+        ),
+        MagicMock(status_code=304, headers={}),
+    ]
+
+    assert projects_mixin.get_all_projects() == mock_projects
+    clock.return_value = 1100.0
+    assert projects_mixin.get_all_projects() == mock_projects
+
+    first, second = projects_mixin.jira.get.call_args_list
+    assert first.kwargs["headers"] is None
+    assert second.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    # The revalidated listing is fresh again
+    assert projects_mixin.get_all_projects() == mock_projects
+    assert projects_mixin.jira.get.call_count == 2
+
+
+def test_get_all_projects_filtered_locally_on_server(
+    projects_mixin: ProjectsMixin, mock_projects: list[dict]
+):
+    """Test Server/DC caches the full listing and applies the filter to it."""
+    projects_mixin.config.is_cloud = False
+    projects_mixin.jira.get.return_value = MagicMock(
+        status_code=200, headers={}, json=lambda: mock_projects
+    )
+
+    result = projects_mixin.get_all_projects(projects_filter="PROJ2")
+    assert [project["key"] for project in result] == ["PROJ2"]
+    assert projects_mixin.get_all_projects() == mock_projects
+    projects_mixin.jira.get.assert_called_once()
+
+
+def test_project_exists_uses_catalog(
+    projects_mixin: ProjectsMixin, mock_projects: list[dict]
+):
+    """Test project_exists answers from a fresh listing without fetching."""
+    projects_mixin.jira.projects.return_value = mock_projects
+    projects_mixin.get_all_projects()
+
+    assert projects_mixin.project_exists("proj1")
+    projects_mixin.jira.project.assert_not_called()
+
+
+def test_get_project_cached(projects_mixin: ProjectsMixin, mock_projects: list[dict]):
+    """Test project details are fetched once until refreshed."""
+    projects_mixin.jira.project.return_value = mock_projects[0]
+
+    assert projects_mixin.get_project("PROJ1") == mock_projects[0]
+    assert projects_mixin.get_project("proj1") == mock_projects[0]
+    projects_mixin.jira.project.assert_called_once()
+
+    projects_mixin.get_project("PROJ1", refresh=True)
+    assert projects_mixin.jira.project.call_count == 2
+
+
 def test_get_project(projects_mixin: ProjectsMixin, mock_projects: list[dict]):
     """Test get_project method."""
     project = mock_projects[0]
@@ -420,44 +527,142 @@ def test_get_project_issue_types(
     projects_mixin: ProjectsMixin, mock_issue_types: list[dict]
 ):
     """Test get_project_issue_types method."""
-    createmeta = {
+    projects_mixin.jira.issue_createmeta_issuetypes.return_value = {
+        "issueTypes": mock_issue_types,
+        "total": len(mock_issue_types),
+    }
+
+    result = projects_mixin.get_project_issue_types("PROJ1")
+    assert result == mock_issue_types
+    projects_mixin.jira.issue_createmeta_issuetypes.assert_called_once_with("PROJ1")
+    projects_mixin.jira.issue_createmeta.assert_not_called()
+
+
+def test_get_project_issue_types_paginated(projects_mixin: ProjectsMixin):
+    """Test get_project_issue_types collects every page (Server/DC format)."""
+    projects_mixin.jira.issue_createmeta_issuetypes.side_effect = [
+        {"values": [{"id": "1"}, {"id": "2"}], "isLast": False},
+        {"values": [{"id": "3"}], "isLast": True},
+    ]
+
+    result = projects_mixin.get_project_issue_types("PROJ1")
+    assert [issue_type["id"] for issue_type in result] == ["1", "2", "3"]
+    projects_mixin.jira.issue_createmeta_issuetypes.assert_has_calls(
+        [call("PROJ1"), call("PROJ1", start=2)]
+    )
+
+
+def test_get_project_issue_types_legacy_fallback(
+    projects_mixin: ProjectsMixin, mock_issue_types: list[dict]
+):
+    """Test get_project_issue_types uses the legacy createmeta before Jira 8.4."""
+    projects_mixin.jira.issue_createmeta_issuetypes.side_effect = HTTPError(
+        response=MagicMock(status_code=404)
+    )
+    projects_mixin.jira.issue_createmeta.return_value = {
         "projects": [
             {"key": "PROJ1", "name": "Project One", "issuetypes": mock_issue_types}
         ]
     }
-    projects_mixin.jira.issue_createmeta.return_value = createmeta
 
     result = projects_mixin.get_project_issue_types("PROJ1")
     assert result == mock_issue_types
-    projects_mixin.jira.issue_createmeta.assert_called_once_with(project="PROJ1")
+    projects_mixin.jira.issue_createmeta.assert_called_once_with(
+        project="PROJ1", expand="projects.issuetypes"
+    )
 
 
 def test_get_project_issue_types_empty_response(projects_mixin: ProjectsMixin):
     """Test get_project_issue_types method with empty response."""
-    # Empty projects list
-    projects_mixin.jira.issue_createmeta.return_value = {"projects": []}
-
-    result = projects_mixin.get_project_issue_types("PROJ1")
-    assert result == []
-    projects_mixin.jira.issue_createmeta.assert_called_once()
-
-    # No issuetypes field
-    projects_mixin.jira.issue_createmeta.reset_mock()
-    projects_mixin.jira.issue_createmeta.return_value = {
-        "projects": [{"key": "PROJ1", "name": "Project One"}]
+    projects_mixin.jira.issue_createmeta_issuetypes.return_value = {
+        "issueTypes": [],
+        "total": 0,
     }
 
     result = projects_mixin.get_project_issue_types("PROJ1")
     assert result == []
+    projects_mixin.jira.issue_createmeta_issuetypes.assert_called_once()
 
 
 def test_get_project_issue_types_exception(projects_mixin: ProjectsMixin):
     """Test get_project_issue_types method with exception."""
-    projects_mixin.jira.issue_createmeta.side_effect = Exception("API error")
+    projects_mixin.jira.issue_createmeta_issuetypes.side_effect = Exception("API error")
 
     result = projects_mixin.get_project_issue_types("PROJ1")
     assert result == []
-    projects_mixin.jira.issue_createmeta.assert_called_once()
+    projects_mixin.jira.issue_createmeta_issuetypes.assert_called_once()
+
+
+def test_get_project_issue_types_memoized(
+    projects_mixin: ProjectsMixin, mock_issue_types: list[dict]
+):
+    """Test issue types are fetched once per project until refreshed."""
+    projects_mixin.jira.issue_createmeta_issuetypes.return_value = {
+        "issueTypes": mock_issue_types
+    }
+
+    projects_mixin.get_project_issue_types("PROJ1")
+    assert projects_mixin.get_project_issue_types("proj1") == mock_issue_types
+    projects_mixin.jira.issue_createmeta_issuetypes.assert_called_once()
+
+    projects_mixin.get_project_issue_types("PROJ1", refresh=True)
+    assert projects_mixin.jira.issue_createmeta_issuetypes.call_count == 2
+
+
+def test_get_issue_type_fields(projects_mixin: ProjectsMixin):
+    """Test get_issue_type_fields fetches and memoizes one issue type's fields."""
+    projects_mixin.jira.issue_createmeta_fieldtypes.return_value = {
+        "fields": [{"fieldId": "summary", "required": True}],
+        "total": 1,
+    }
+
+    result = projects_mixin.get_issue_type_fields("PROJ1", "10001")
+    assert result == [{"fieldId": "summary", "required": True}]
+    assert projects_mixin.get_issue_type_fields("PROJ1", "10001") == result
+    projects_mixin.jira.issue_createmeta_fieldtypes.assert_called_once_with(
+        project="PROJ1", issue_type_id="10001"
+    )
+
+
+def test_get_issue_type_fields_legacy_fallback(projects_mixin: ProjectsMixin):
+    """Test get_issue_type_fields narrows the legacy createmeta to one type."""
+    projects_mixin.jira.issue_createmeta_fieldtypes.side_effect = HTTPError(
+        response=MagicMock(status_code=404)
+    )
+    projects_mixin.jira.get.return_value = {
+        "projects": [
+            {"issuetypes": [{"id": "10001", "fields": {"summary": {"required": True}}}]}
+        ]
+    }
+
+    result = projects_mixin.get_issue_type_fields("PROJ1", "10001")
+    assert result == [{"fieldId": "summary", "required": True}]
+    params = projects_mixin.jira.get.call_args.kwargs["params"]
+    assert params["issuetypeIds"] == "10001"
+
+
+def test_refresh_project_createmeta(
+    projects_mixin: ProjectsMixin, mock_issue_types: list[dict], tmp_path
+):
+    """Test an explicit refresh drops memoized and persisted createmeta."""
+    projects_mixin.jira.issue_createmeta_issuetypes.return_value = {
+        "issueTypes": mock_issue_types
+    }
+    projects_mixin.jira.issue_createmeta_fieldtypes.return_value = {"fields": []}
+    configure_metadata_cache(MetadataCache(tmp_path))
+    try:
+        issue_type_id = mock_issue_types[0]["id"]
+        projects_mixin.get_project_issue_types("PROJ1")
+        projects_mixin.get_issue_type_fields("PROJ1", issue_type_id)
+
+        projects_mixin.refresh_project_createmeta("PROJ1")
+        projects_mixin.get_project_issue_types("PROJ1")
+        projects_mixin.get_issue_type_fields("PROJ1", issue_type_id)
+    finally:
+        configure_metadata_cache(None)
+
+    assert projects_mixin.jira.issue_createmeta_issuetypes.call_count == 2
+    assert projects_mixin.jira.issue_createmeta_fieldtypes.call_count == 2
 
 
 def test_get_project_issues_count(projects_mixin: ProjectsMixin):
@@ -636,12 +841,14 @@ def test_get_user_accessible_projects(
     """Test get_user_accessible_projects method."""
     # Mock the get_all_projects method
     with patch.object(projects_mixin, "get_all_projects", return_value=mock_projects):
-        # Set up the browse permission responses
-        browse_users_responses = [
-            [{"name": "test_user"}],  # User has access to PROJ1
-            [],  # User doesn't have access to PROJ2
-        ]
-        projects_mixin.jira.get_users_with_browse_permission_to_a_project.side_effect = browse_users_responses
+        # Set up the browse permission responses (probes run concurrently)
+        browse_users_responses = {
+            "PROJ1": [{"name": "test_user"}],  # User has access to PROJ1
+            "PROJ2": [],  # User doesn't have access to PROJ2
+        }
+        projects_mixin.jira.get_users_with_browse_permission_to_a_project.side_effect = (
+            lambda username, project_key, limit: browse_users_responses[project_key]
+        )
 
         result = projects_mixin.get_user_accessible_projects("test_user")
 
@@ -658,7 +865,8 @@ def test_get_user_accessible_projects(
             [
                 call(username="test_user", project_key="PROJ1", limit=1),
                 call(username="test_user", project_key="PROJ2", limit=1),
-            ]
+            ],
+            any_order=True,
         )
 
 
@@ -668,11 +876,13 @@ def test_get_user_accessible_projects_with_permissions_exception(
     """Test get_user_accessible_projects method with exception in permissions check."""
     # Mock the get_all_projects method
     with patch.object(projects_mixin, "get_all_projects", return_value=mock_projects):
-        # First call succeeds, second call raises exception
-        projects_mixin.jira.get_users_with_browse_permission_to_a_project.side_effect = [
-            [{"name": "test_user"}],  # User has access to PROJ1
-            Exception("Permission error"),  # Error checking PROJ2
-        ]
+        # PROJ1 succeeds, PROJ2 raises exception
+        def browse_users(username, project_key, limit):
+            if project_key == "PROJ2":
+                raise Exception("Permission error")
+            return [{"name": "test_user"}]
+
+        projects_mixin.jira.get_users_with_browse_permission_to_a_project.side_effect = browse_users
 
         result = projects_mixin.get_user_accessible_projects("test_user")
 
@@ -680,6 +890,13 @@ def test_get_user_accessible_projects_with_permissions_exception(
         assert len(result) == 1
         assert result[0]["key"] == "PROJ1"
 
+        # An answer with a failed probe is not cached
+        projects_mixin.get_user_accessible_projects("test_user")
+        assert (
+            projects_mixin.jira.get_users_with_browse_permission_to_a_project.call_count
+            == 4
+        )
+
 
 def test_get_user_accessible_projects_exception(projects_mixin: ProjectsMixin):
     """Test get_user_accessible_projects method with main exception."""
@@ -693,6 +910,73 @@ def test_get_user_accessible_projects_exception(projects_mixin: ProjectsMixin):
         projects_mixin.jira.get_users_with_browse_permission_to_a_project.assert_not_called()
 
 
+def test_get_user_accessible_projects_cached(
+    projects_mixin: ProjectsMixin, mock_projects: list[dict[str, Any]]
+):
+    """Test accessible projects are cached until the project set changes."""
+    probe = projects_mixin.jira.get_users_with_browse_permission_to_a_project
+    probe.return_value = [{"name": "test_user"}]
+
+    with patch.object(projects_mixin, "get_all_projects", return_value=mock_projects):
+        first = projects_mixin.get_user_accessible_projects("test_user")
+        second = projects_mixin.get_user_accessible_projects("test_user")
+    assert first == second == mock_projects
+    assert probe.call_count == len(mock_projects)
+
+    # Another user is probed separately
+    with patch.object(projects_mixin, "get_all_projects", return_value=mock_projects):
+        projects_mixin.get_user_accessible_projects("other_user")
+    assert probe.call_count == 2 * len(mock_projects)
+
+    # A new project changes the project set version
+    new_project = {"id": "10099", "key": "NEW", "name": "New"}
+    with patch.object(
+        projects_mixin, "get_all_projects", return_value=[*mock_projects, new_project]
+    ):
+        result = projects_mixin.get_user_accessible_projects("test_user")
+    assert [project["key"] for project in result] == ["PROJ1", "PROJ2", "NEW"]
+    assert probe.call_count == 3 * len(mock_projects) + 1
+
+
+def test_get_user_accessible_projects_cancels_on_auth_error(
+    projects_mixin: ProjectsMixin,
+):
+    """Test rejected credentials raise and cancel the queued permission probes."""
+    projects = [{"id": str(i), "key": f"P{i}"} for i in range(50)]
+    probe = projects_mixin.jira.get_users_with_browse_permission_to_a_project
+    probe.side_effect = HTTPError(response=MagicMock(status_code=401))
+
+    with (
+        patch.object(projects_mixin, "get_all_projects", return_value=projects),
+        pytest.raises(MCPAtlassianAuthenticationError),
+    ):
+        projects_mixin.get_user_accessible_projects("test_user", max_workers=1)
+
+    assert probe.call_count < len(projects)
+
+
+def test_get_user_accessible_projects_skips_forbidden_projects(
+    projects_mixin: ProjectsMixin, mock_projects: list[dict[str, Any]]
+):
+    """Test a 403 on one project skips it without caching the partial answer."""
+
+    def browse_users(username, project_key, limit):
+        if project_key == "PROJ1":
+            raise HTTPError(response=MagicMock(status_code=403))
+        return [{"name": username}]
+
+    probe = projects_mixin.jira.get_users_with_browse_permission_to_a_project
+    probe.side_effect = browse_users
+
+    with patch.object(projects_mixin, "get_all_projects", return_value=mock_projects):
+        first = projects_mixin.get_user_accessible_projects("test_user")
+        second = projects_mixin.get_user_accessible_projects("test_user")
+
+    assert [project["key"] for project in first] == ["PROJ2"]
+    assert second == first
+    assert probe.call_count == 2 * len(mock_projects)
+
+
 def test_create_project_version_minimal(projects_mixin: ProjectsMixin) -> None:
     """Test create_project_version with only required fields."""
     mock_response = {"id": "201", "name": "v4.0"}
@@ -5,6 +5,7 @@ from unittest.mock import ANY, MagicMock
 import pytest
 import requests
 
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.search import SearchMixin
 from mcp_atlassian.models.jira import JiraIssue, JiraSearchResult
@@ -26,6 +27,8 @@ class TestSearchMixin:
         mixin.config.is_cloud = False
         mixin.config.projects_filter = None
         mixin.config.url = "https://example.atlassian.net"
+        mixin.config.search_total = "exact"
+        mixin.config.search_total_cache_ttl = 0
 
         return mixin
 
@@ -257,6 +260,80 @@ class TestSearchMixin:
         assert len(result.issues) == 0
         assert result.total == -1
 
+    @pytest.fixture
+    def cloud_search_mixin(self, search_mixin: SearchMixin, mock_issues_response):
+        """Configure the mixin for Cloud with a full page of 10 issues."""
+        search_mixin.config.is_cloud = True
+        search_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = (
+            mock_issues_response["issues"] * 10
+        )
+        search_mixin.jira.get.return_value = {"total": 42}
+        search_mixin.jira.approximate_issue_count.return_value = {"count": 40}
+        return search_mixin
+
+    def test_search_issues_cloud_exact_total(self, cloud_search_mixin: SearchMixin):
+        """The exact total is fetched with a maxResults=0 search."""
+        result = cloud_search_mixin.search_issues("project = TEST", limit=10)
+
+        assert result.total == 42
+        cloud_search_mixin.jira.get.assert_called_once_with(
+            ANY, params={"jql": "project = TEST", "maxResults": 0}
+        )
+        cloud_search_mixin.jira.approximate_issue_count.assert_not_called()
+
+    def test_search_issues_cloud_approximate_total(
+        self, cloud_search_mixin: SearchMixin
+    ):
+        """The approximate-count endpoint is used when configured."""
+        cloud_search_mixin.config.search_total = "approximate"
+
+        result = cloud_search_mixin.search_issues("project = TEST", limit=10)
+
+        assert result.total == 40
+        cloud_search_mixin.jira.approximate_issue_count.assert_called_once_with(
+            "project = TEST"
+        )
+        cloud_search_mixin.jira.get.assert_not_called()
+
+    def test_search_issues_cloud_skip_total(self, cloud_search_mixin: SearchMixin):
+        """No count request is made when totals are skipped."""
+        cloud_search_mixin.config.search_total = "skip"
+
+        result = cloud_search_mixin.search_issues("project = TEST", limit=10)
+
+        assert result.total == -1
+        cloud_search_mixin.jira.get.assert_not_called()
+        cloud_search_mixin.jira.approximate_issue_count.assert_not_called()
+
+    def test_search_issues_cloud_short_page_total(
+        self, cloud_search_mixin: SearchMixin
+    ):
+        """A page smaller than the limit is the complete result."""
+        cloud_search_mixin.config.search_total = "skip"
+
+        result = cloud_search_mixin.search_issues("project = TEST", limit=20)
+
+        assert result.total == 10
+
+    def test_search_issues_cloud_cached_total(self, cloud_search_mixin: SearchMixin):
+        """Totals are reused from the cache within the TTL."""
+        cloud_search_mixin.config.search_total_cache_ttl = 60
+
+        first = cloud_search_mixin.search_issues("project = TEST", limit=10)
+        second = cloud_search_mixin.search_issues("project = TEST", limit=10)
+
+        assert first.total == second.total == 42
+        cloud_search_mixin.jira.get.assert_called_once()
+
+    def test_search_issues_cloud_total_error(self, cloud_search_mixin: SearchMixin):
+        """Errors while counting yield an unknown total, not a failed search."""
+        cloud_search_mixin.jira.get.side_effect = Exception("count failed")
+
+        result = cloud_search_mixin.search_issues("project = TEST", limit=10)
+
+        assert result.total == -1
+        assert len(result.issues) == 10
+
     def test_search_issues_with_error(self, search_mixin: SearchMixin):
         """Test search with API error."""
         # Setup mock to raise exception
@@ -788,3 +865,96 @@ class TestSearchMixin:
         api_method_mock.assert_called_with(
             'project = "PROJ1"   ORDER BY priority DESC  ', **expected_kwargs
         )
+
+
+class TestIterIssues:
+    """Tests for streaming JQL search results."""
+
+    @pytest.fixture
+    def search_mixin(self, jira_fetcher: JiraFetcher) -> SearchMixin:
+        """Create a SearchMixin with a Server/DC config."""
+        mixin = jira_fetcher
+        mixin.config = MagicMock()
+        mixin.config.is_cloud = False
+        mixin.config.projects_filter = None
+        mixin.config.url = "https://jira.example.com"
+        return mixin
+
+    @staticmethod
+    def _issues(first: int, count: int) -> list[dict]:
+        return [
+            {"id": str(i), "key": f"TEST-{i}", "fields": {"summary": f"Issue {i}"}}
+            for i in range(first, first + count)
+        ]
+
+    def test_server_pages_with_start_at(self, search_mixin: SearchMixin):
+        """Server/DC pages are followed with startAt until the total is reached."""
+        search_mixin.jira.jql.side_effect = lambda jql, start, limit, **kwargs: {
+            "issues": self._issues(start, min(limit, 5 - start)),
+            "total": 5,
+        }
+
+        keys = [
+            issue.key for issue in search_mixin.iter_issues("project = TEST", None, 2)
+        ]
+
+        assert keys == [f"TEST-{i}" for i in range(5)]
+        starts = [c.kwargs["start"] for c in search_mixin.jira.jql.call_args_list]
+        assert starts == [0, 2, 4]
+
+    def test_cloud_pages_with_next_page_token(self, search_mixin: SearchMixin):
+        """Cloud pages are followed with nextPageToken."""
+        search_mixin.config.is_cloud = True
+        pages = {
+            None: {"issues": self._issues(0, 2), "nextPageToken": "t1"},
+            "t1": {"issues": self._issues(2, 1)},
+        }
+        search_mixin.jira.get.side_effect = lambda url, params: pages[
+            params.get("nextPageToken")
+        ]
+
+        result = list(search_mixin.iter_issue_pages("project = TEST", page_size=2))
+
+        assert [[issue.key for issue in page] for page in result] == [
+            ["TEST-0", "TEST-1"],
+            ["TEST-2"],
+        ]
+        assert search_mixin.jira.get.call_count == 2
+
+    def test_max_issues_limits_requests(self, search_mixin: SearchMixin):
+        """No more issues than max_issues are requested or returned."""
+        search_mixin.jira.jql.side_effect = lambda jql, start, limit, **kwargs: {
+            "issues": self._issues(start, limit),
+            "total": 100,
+        }
+
+        issues = list(
+            search_mixin.iter_issues("project = TEST", page_size=4, max_issues=6)
+        )
+
+        assert len(issues) == 6
+        limits = [c.kwargs["limit"] for c in search_mixin.jira.jql.call_args_list]
+        assert limits == [4, 2]
+
+    def test_without_prefetch_requests_lazily(self, search_mixin: SearchMixin):
+        """Without prefetch the next page is only requested when needed."""
+        search_mixin.jira.jql.side_effect = lambda jql, start, limit, **kwargs: {
+            "issues": self._issues(start, limit),
+            "total": 100,
+        }
+
+        pages = search_mixin.iter_issue_pages(
+            "project = TEST", page_size=10, prefetch=False
+        )
+        next(pages)
+        pages.close()
+
+        assert search_mixin.jira.jql.call_count == 1
+
+    def test_auth_error(self, search_mixin: SearchMixin):
+        """401 responses raise MCPAtlassianAuthenticationError."""
+        response = MagicMock(status_code=401)
+        search_mixin.jira.jql.side_effect = requests.HTTPError(response=response)
+
+        with pytest.raises(MCPAtlassianAuthenticationError):
+            list(search_mixin.iter_issues("project = TEST"))
@@ -0,0 +1,89 @@
+"""Tests for the resolved Jira user cache."""
+
+from mcp_atlassian.jira.user_directory import UserDirectory
+
+USER = {
+    "accountId": "acc-1",
+    "name": "jdoe",
+    "key": "JIRAUSER1",
+    "emailAddress": "John.Doe@example.com",
+    "displayName": "John Doe",
+}
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_all_identifiers_share_one_record():
+    """Identifiers and aliases map to the same record, case-insensitively."""
+    directory = UserDirectory()
+
+    directory.add(USER, "John Doe")
+
+    for identifier in (
+        "acc-1",
+        "JDOE",
+        "jirauser1",
+        "john.doe@example.com",
+        "john doe",
+    ):
+        assert directory.get(identifier) is USER
+    assert directory.get("someone else") is None
+
+
+def test_entries_expire():
+    """Users and unknown identifiers expire after their TTLs."""
+    timer = FakeTimer()
+    directory = UserDirectory(ttl=60, negative_ttl=10, timer=timer)
+    directory.add(USER)
+    directory.add_missing("ghost")
+
+    timer.now = 11
+    assert directory.get("jdoe") is USER
+    assert not directory.is_missing("ghost")
+
+    timer.now = 61
+    assert directory.get("jdoe") is None
+
+
+def test_adding_a_user_clears_negative_entry():
+    """A user found later is no longer reported missing."""
+    directory = UserDirectory()
+    directory.add_missing("jdoe")
+
+    directory.add(USER)
+
+    assert not directory.is_missing("jdoe")
+
+
+def test_negative_caching_can_be_disabled():
+    """A negative TTL of 0 never remembers unknown identifiers."""
+    directory = UserDirectory(negative_ttl=0)
+
+    directory.add_missing("ghost")
+
+    assert not directory.is_missing("ghost")
+
+
+def test_size_is_bounded():
+    """The least recently used identifiers are evicted."""
+    directory = UserDirectory(maxsize=2)
+
+    directory.add({"accountId": "a"})
+    directory.add({"accountId": "b"})
+    directory.add({"accountId": "c"})
+
+    assert directory.get("a") is None
+    assert directory.get("c") is not None
+
+
+def test_from_env(monkeypatch):
+    """Settings are read from the environment."""
+    monkeypatch.setenv("JIRA_USER_CACHE_TTL", "0")
+
+    assert not UserDirectory.from_env().enabled
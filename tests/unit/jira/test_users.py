@@ -625,3 +625,79 @@ class TestUsersMixin:
             Exception, match="Error processing user profile for 'error_user'"
         ):
             users_mixin.get_user_profile_by_identifier("error_user")
+
+    def test_get_account_id_is_cached_under_all_identifiers(self, users_mixin):
+        """A resolved user is reused for its name, email and lookup string."""
+        users_mixin.config = MagicMock(is_cloud=True)
+        users_mixin.jira.user_find_by_user_string.return_value = [
+            {
+                "accountId": "acc-123",
+                "displayName": "Test User",
+                "emailAddress": "test@example.com",
+            }
+        ]
+
+        assert users_mixin._get_account_id("Test User") == "acc-123"
+        assert users_mixin._get_account_id("test user") == "acc-123"
+        assert users_mixin._get_account_id("TEST@example.com") == "acc-123"
+
+        users_mixin.jira.user_find_by_user_string.assert_called_once()
+
+    def test_get_account_id_caches_unknown_users(self, users_mixin):
+        """Users that could not be found are not looked up again."""
+        with (
+            patch.object(
+                users_mixin, "_lookup_user_directly", return_value=None
+            ) as mock_direct,
+            patch.object(users_mixin, "_lookup_user_by_permissions", return_value=None),
+        ):
+            for _ in range(2):
+                with pytest.raises(ValueError, match="Could not find account ID"):
+                    users_mixin._get_account_id("ghost")
+
+        mock_direct.assert_called_once_with("ghost")
+
+    def test_get_account_id_cache_disabled(self, users_mixin, monkeypatch):
+        """JIRA_USER_CACHE_TTL=0 looks users up on every call."""
+        monkeypatch.setenv("JIRA_USER_CACHE_TTL", "0")
+        with patch.object(
+            users_mixin, "_lookup_user_directly", return_value="acc-1"
+        ) as mock_direct:
+            users_mixin._get_account_id("someone")
+            users_mixin._get_account_id("someone")
+
+        assert mock_direct.call_count == 2
+
+    def test_get_user_profile_by_identifier_is_cached(self, users_mixin):
+        """Profiles are served from the cache by any of their identifiers."""
+        users_mixin.config = MagicMock(is_cloud=False)
+        users_mixin.jira.user = MagicMock(
+            return_value={
+                "name": "jdoe",
+                "key": "JIRAUSER10100",
+                "displayName": "John Doe",
+                "emailAddress": "jdoe@example.com",
+            }
+        )
+
+        first = users_mixin.get_user_profile_by_identifier("jdoe")
+        second = users_mixin.get_user_profile_by_identifier("jdoe@example.com")
+
+        assert first.display_name == second.display_name == "John Doe"
+        users_mixin.jira.user.assert_called_once_with(username="jdoe")
+
+    def test_get_account_ids_resolves_each_user_once(self, users_mixin):
+        """Distinct identifiers are resolved once; unknown users map to None."""
+
+        def get_account_id(identifier):
+            if identifier == "missing":
+                raise ValueError(f"Could not find account ID for user: {identifier}")
+            return f"id-{identifier}"
+
+        with patch.object(
+            users_mixin, "_get_account_id", side_effect=get_account_id
+        ) as mock_get:
+            result = users_mixin._get_account_ids(["ann", "missing", "ann", "bob"])
+
+        assert result == {"ann": "id-ann", "missing": None, "bob": "id-bob"}
+        assert mock_get.call_count == 3
@@ -550,6 +550,59 @@ class TestConfluencePage:
             == "https://wiki.corp.example.com/pages/viewpage.action?pageId=123456"
         )
 
+    def test_content_loader_is_called_once_on_first_access(self):
+        """Deferred content is loaded when first read and then memoized."""
+        calls = []
+
+        def load():
+            calls.append(1)
+            return "Converted"
+
+        page = ConfluencePage.from_api_response(
+            {"id": "123456", "title": "Test Page"}, content_loader=load
+        )
+
+        assert page.title == "Test Page"
+        assert not page.is_content_loaded
+        assert calls == []
+
+        assert page.to_simplified_dict()["content"]["value"] == "Converted"
+        assert page.content == "Converted"
+        assert page.is_content_loaded
+        assert calls == [1]
+
+    def test_to_simplified_dict_without_content_skips_loader(self):
+        """Leaving out the content never runs the loader."""
+        page = ConfluencePage.from_api_response(
+            {"id": "123456", "title": "Test Page"},
+            content_loader=lambda: pytest.fail("loader called"),
+        )
+
+        simplified = page.to_simplified_dict(include_content=False)
+
+        assert simplified["title"] == "Test Page"
+        assert "content" not in simplified
+        assert not page.is_content_loaded
+
+    def test_content_override_takes_precedence_over_loader(self):
+        """An explicit content override is used as is."""
+        page = ConfluencePage.from_api_response(
+            {"id": "123456"},
+            content_override="Given",
+            content_loader=lambda: pytest.fail("loader called"),
+        )
+
+        assert page.content == "Given"
+
+    def test_content_assignment_discards_loader(self):
+        """Assigning content replaces a pending loader."""
+        page = ConfluencePage(content_loader=lambda: pytest.fail("loader called"))
+
+        page.content = "Assigned"
+
+        assert page.content == "Assigned"
+        assert page.model_dump()["content"] == "Assigned"
+
 
 class TestConfluenceSearchResult:
     """Tests for the ConfluenceSearchResult model."""
@@ -357,6 +357,8 @@ async def test_get_page_children(client, mock_confluence_fetcher):
     assert "results" in result_data
     assert len(result_data["results"]) > 0
     assert result_data["results"][0]["title"] == "Test Page Mock Title"
+    (child_page,) = mock_confluence_fetcher.get_page_children.return_value
+    child_page.to_simplified_dict.assert_called_once_with(include_content=False)
 
 
 @pytest.mark.anyio
@@ -14,6 +14,8 @@ from mcp_atlassian.servers.dependencies import (
     get_confluence_fetcher,
     get_jira_fetcher,
 )
+from mcp_atlassian.servers.fetcher_pool import FetcherPool
+from mcp_atlassian.servers.token_cache import TokenValidationCache
 from mcp_atlassian.utils.oauth import OAuthConfig
 from tests.utils.assertions import assert_mock_called_with_partial
 from tests.utils.factories import AuthConfigFactory
@@ -527,6 +529,113 @@ class TestGetJiraFetcher:
             mock_jira_fetcher_class.reset_mock()
             mock_get_http_request.reset_mock()
 
+    @patch("mcp_atlassian.servers.dependencies.get_http_request")
+    @patch("mcp_atlassian.servers.dependencies.JiraFetcher")
+    async def test_global_fetcher_reused_from_pool(
+        self,
+        mock_jira_fetcher_class,
+        mock_get_http_request,
+        mock_context,
+        config_factory,
+    ):
+        """Test that the global JiraFetcher is built once and reused via the pool."""
+        mock_get_http_request.side_effect = RuntimeError("No HTTP context")
+        app_context = config_factory.create_app_context(fetcher_pool=FetcherPool())
+        _setup_mock_context(mock_context, app_context)
+        mock_jira_fetcher_class.side_effect = lambda config: _create_mock_fetcher(
+            JiraFetcher
+        )
+
+        first = await get_jira_fetcher(mock_context)
+        second = await get_jira_fetcher(mock_context)
+
+        assert first is second
+        mock_jira_fetcher_class.assert_called_once()
+
+    @patch("mcp_atlassian.servers.dependencies.get_http_request")
+    @patch("mcp_atlassian.servers.dependencies.JiraFetcher")
+    async def test_user_fetcher_pooled_per_token(
+        self,
+        mock_jira_fetcher_class,
+        mock_get_http_request,
+        mock_context,
+        config_factory,
+        auth_scenarios,
+    ):
+        """Test that user fetchers are pooled per token and dropped on failure."""
+        pool = FetcherPool()
+        app_context = config_factory.create_app_context(
+            config_factory.create_jira_config(auth_type="pat"), fetcher_pool=pool
+        )
+        _setup_mock_context(mock_context, app_context)
+        mock_jira_fetcher_class.side_effect = lambda config: _create_mock_fetcher(
+            JiraFetcher
+        )
+
+        fetchers = []
+        for token in ["token-a", "token-a", "token-b"]:
+            request = MockFastMCP.create_request()
+            _setup_mock_request_state(
+                request, {**auth_scenarios["pat"], "token": token}
+            )
+            mock_get_http_request.return_value = request
+            fetchers.append(await get_jira_fetcher(mock_context))
+
+        assert fetchers[0] is fetchers[1]
+        assert fetchers[0] is not fetchers[2]
+        assert len(pool) == 2
+
+        # A failing validation removes the pooled fetcher
+        fetchers[2].get_current_user_account_id.side_effect = Exception("401")
+        request = MockFastMCP.create_request()
+        _setup_mock_request_state(
+            request, {**auth_scenarios["pat"], "token": "token-b"}
+        )
+        mock_get_http_request.return_value = request
+        with pytest.raises(ValueError, match="Invalid user Jira token"):
+            await get_jira_fetcher(mock_context)
+        assert len(pool) == 1
+
+    @patch("mcp_atlassian.servers.dependencies.get_http_request")
+    @patch("mcp_atlassian.servers.dependencies.JiraFetcher")
+    async def test_validated_token_cached(
+        self,
+        mock_jira_fetcher_class,
+        mock_get_http_request,
+        mock_context,
+        config_factory,
+        auth_scenarios,
+    ):
+        """Test that a validated token is not validated again on later requests."""
+        token_cache = TokenValidationCache()
+        app_context = config_factory.create_app_context(
+            config_factory.create_jira_config(auth_type="pat"),
+            token_cache=token_cache,
+        )
+        _setup_mock_context(mock_context, app_context)
+        mock_jira_fetcher_class.side_effect = lambda config: _create_mock_fetcher(
+            JiraFetcher
+        )
+
+        fetchers = []
+        for token in ["token-a", "token-a", "token-b"]:
+            request = MockFastMCP.create_request()
+            _setup_mock_request_state(
+                request, {**auth_scenarios["pat"], "token": token}
+            )
+            request.state.user_atlassian_cloud_id = None
+            mock_get_http_request.return_value = request
+            fetchers.append(await get_jira_fetcher(mock_context))
+            assert request.state.jira_fetcher is fetchers[-1]
+
+        assert fetchers[0] is fetchers[1]
+        assert fetchers[0] is not fetchers[2]
+        fetchers[0].get_current_user_account_id.assert_called_once()
+        assert token_cache.stats()["hits"] == 1
+        assert token_cache.get(next(iter(token_cache._entries))).identity == (
+            "test-account-id"
+        )
+
     @pytest.mark.parametrize(
         "error_scenario,expected_error_match",
         [
@@ -755,6 +864,41 @@ class TestGetConfluenceFetcher:
         assert mock_request.state.confluence_fetcher == mock_fetcher
         assert mock_request.state.user_atlassian_email == expected_email
 
+    @patch("mcp_atlassian.servers.dependencies.get_http_request")
+    @patch("mcp_atlassian.servers.dependencies.ConfluenceFetcher")
+    async def test_validated_token_cached(
+        self,
+        mock_confluence_fetcher_class,
+        mock_get_http_request,
+        mock_context,
+        config_factory,
+        auth_scenarios,
+    ):
+        """Test that cached validations reuse the fetcher and derived email."""
+        app_context = config_factory.create_app_context(
+            confluence_config=config_factory.create_confluence_config(auth_type="pat"),
+            token_cache=TokenValidationCache(),
+        )
+        _setup_mock_context(mock_context, app_context)
+        mock_fetcher = _create_mock_fetcher(ConfluenceFetcher)
+        mock_confluence_fetcher_class.return_value = mock_fetcher
+
+        requests = []
+        for _ in range(2):
+            request = MockFastMCP.create_request()
+            _setup_mock_request_state(request, {**auth_scenarios["pat"], "email": None})
+            request.state.user_atlassian_cloud_id = None
+            mock_get_http_request.return_value = request
+            assert await get_confluence_fetcher(mock_context) is mock_fetcher
+            requests.append(request)
+
+        mock_confluence_fetcher_class.assert_called_once()
+        mock_fetcher.get_current_user_info.assert_called_once()
+        assert [r.state.user_atlassian_email for r in requests] == [
+            "user@example.com",
+            "user@example.com",
+        ]
+
     @pytest.mark.parametrize(
         "error_scenario,expected_error_match",
         [
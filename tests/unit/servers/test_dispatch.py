@@ -0,0 +1,203 @@
+"""Tests for the per-service worker-pool dispatcher."""
+
+import threading
+from unittest.mock import MagicMock
+
+import anyio
+import pytest
+import requests
+
+from mcp_atlassian.exceptions import MCPAtlassianBackpressureError
+from mcp_atlassian.servers.context import MainAppContext
+from mcp_atlassian.servers.dispatch import (
+    ServiceDispatcher,
+    create_dispatchers,
+    dispatch,
+    get_dispatcher,
+    get_native_async,
+)
+from mcp_atlassian.servers.token_cache import TokenValidationCache
+
+
+def _make_ctx(app_context=None):
+    ctx = MagicMock()
+    ctx.request_context.lifespan_context = (
+        {"app_lifespan_context": app_context} if app_context is not None else {}
+    )
+    return ctx
+
+
+class TestServiceDispatcher:
+    """Tests for ServiceDispatcher."""
+
+    @pytest.mark.anyio
+    async def test_runs_in_worker_thread(self):
+        """Calls run off the event loop thread and pass arguments through."""
+        dispatcher = ServiceDispatcher("jira")
+        loop_thread = threading.get_ident()
+
+        def work(a, b, *, c):
+            return threading.get_ident(), a + b + c
+
+        thread_id, result = await dispatcher.run(work, 1, 2, c=3)
+
+        assert result == 6
+        assert thread_id != loop_thread
+        assert dispatcher.pending == 0
+
+    @pytest.mark.anyio
+    async def test_concurrency_is_bounded(self):
+        """No more than max_workers calls run at the same time."""
+        dispatcher = ServiceDispatcher("jira", max_workers=2, max_queue=10)
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def work():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            threading.Event().wait(0.02)
+            with lock:
+                running -= 1
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(6):
+                tg.start_soon(dispatcher.run, work)
+
+        assert peak == 2
+
+    @pytest.mark.anyio
+    async def test_rejects_when_queue_full(self):
+        """Calls beyond workers + queue are rejected with backpressure."""
+        dispatcher = ServiceDispatcher("confluence", max_workers=1, max_queue=1)
+        release = threading.Event()
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(dispatcher.run, release.wait)
+            tg.start_soon(dispatcher.run, release.wait)
+            while dispatcher.pending < 2:
+                await anyio.sleep(0.001)
+
+            with pytest.raises(MCPAtlassianBackpressureError, match="confluence"):
+                await dispatcher.run(lambda: None)
+
+            release.set()
+
+        assert dispatcher.pending == 0
+
+    @pytest.mark.parametrize(
+        "env,expected",
+        [
+            ({}, (10, 100)),
+            ({"JIRA_MAX_WORKERS": "4", "JIRA_MAX_QUEUE": "0"}, (4, 0)),
+            ({"JIRA_MAX_WORKERS": "0", "JIRA_MAX_QUEUE": "bad"}, (1, 100)),
+        ],
+    )
+    def test_from_env(self, monkeypatch, env, expected):
+        """Limits are read from <SERVICE>_MAX_WORKERS and <SERVICE>_MAX_QUEUE."""
+        monkeypatch.delenv("JIRA_MAX_WORKERS", raising=False)
+        monkeypatch.delenv("JIRA_MAX_QUEUE", raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+
+        dispatcher = ServiceDispatcher.from_env("jira")
+
+        assert (dispatcher.max_workers, dispatcher.max_queue) == expected
+
+
+class TestGetDispatcher:
+    """Tests for dispatcher lookup from the request context."""
+
+    def test_uses_lifespan_dispatchers(self):
+        """Dispatchers from the lifespan context are preferred."""
+        dispatchers = create_dispatchers()
+        ctx = _make_ctx(MainAppContext(dispatchers=dispatchers))
+
+        assert get_dispatcher(ctx, "jira") is dispatchers["jira"]
+        assert get_dispatcher(ctx, "confluence") is dispatchers["confluence"]
+
+    def test_falls_back_without_lifespan_dispatchers(self):
+        """A shared fallback dispatcher is used when none is configured."""
+        first = get_dispatcher(_make_ctx(MainAppContext()), "jira")
+        second = get_dispatcher(_make_ctx(), "jira")
+
+        assert first is second
+
+    @pytest.mark.anyio
+    async def test_dispatch(self):
+        """dispatch() runs the callable on the service's pool."""
+        ctx = _make_ctx(MainAppContext(dispatchers=create_dispatchers()))
+
+        assert await dispatch(ctx, "jira", sorted, [3, 1, 2]) == [1, 2, 3]
+
+
+class _RejectedFetcher:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+    def get_issue(self, key):
+        response = requests.Response()
+        response.status_code = self.status_code
+        raise requests.HTTPError(response=response)
+
+
+class TestTokenInvalidation:
+    """Tests for dropping cached token validations on rejected calls."""
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("status_code,invalidated", [(401, True), (404, False)])
+    async def test_dispatch_invalidates_rejected_token(self, status_code, invalidated):
+        """A 401 from a fetcher call forgets the fetcher's validated token."""
+        token_cache = TokenValidationCache()
+        fetcher = _RejectedFetcher(status_code)
+        token_cache.put("key", fetcher)
+        ctx = _make_ctx(
+            MainAppContext(dispatchers=create_dispatchers(), token_cache=token_cache)
+        )
+
+        with pytest.raises(requests.HTTPError):
+            await dispatch(ctx, "jira", fetcher.get_issue, "A-1")
+
+        assert (token_cache.get("key") is None) is invalidated
+
+
+class _Fetcher:
+    def __init__(self, async_transport):
+        self.config = MagicMock(async_transport=async_transport)
+
+    def get_issue(self, key):
+        return f"sync:{key}"
+
+    async def get_issue_async(self, key):
+        return f"async:{key}"
+
+    def create_issue(self, key):
+        return f"sync:{key}"
+
+
+class TestNativeAsync:
+    """Tests for routing to native async fetcher methods."""
+
+    def test_get_native_async(self):
+        """Async variants are only used when enabled and implemented."""
+        enabled = _Fetcher(async_transport=True)
+        disabled = _Fetcher(async_transport=False)
+
+        assert get_native_async(enabled.get_issue) == enabled.get_issue_async
+        assert get_native_async(enabled.create_issue) is None
+        assert get_native_async(disabled.get_issue) is None
+        assert get_native_async(MagicMock().get_issue) is None
+
+    @pytest.mark.anyio
+    async def test_dispatch_prefers_native_async(self):
+        """dispatch() awaits the async variant instead of using a worker."""
+        ctx = _make_ctx(MainAppContext(dispatchers=create_dispatchers()))
+
+        assert await dispatch(
+            ctx, "jira", _Fetcher(async_transport=True).get_issue, "A-1"
+        ) == ("async:A-1")
+        assert await dispatch(
+            ctx, "jira", _Fetcher(async_transport=False).get_issue, "A-1"
+        ) == ("sync:A-1")
@@ -0,0 +1,153 @@
+"""Tests for the lifespan fetcher pool."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_atlassian.jira import JiraConfig
+from mcp_atlassian.servers.fetcher_pool import FetcherPool, fetcher_key
+from mcp_atlassian.utils.oauth import OAuthConfig
+
+
+def _make_fetcher():
+    fetcher = MagicMock()
+    fetcher.config.oauth_config = None
+    return fetcher
+
+
+class TestFetcherKey:
+    """Tests for fetcher_key."""
+
+    def test_same_config_same_key(self):
+        """Equal configurations map to the same key."""
+        config_a = JiraConfig(url="https://a.atlassian.net", auth_type="pat")
+        config_a.personal_token = "token-1"
+        config_b = JiraConfig(
+            url="https://a.atlassian.net", auth_type="pat", personal_token="token-1"
+        )
+        assert fetcher_key("jira", config_a) == fetcher_key("jira", config_b)
+
+    def test_different_tokens_different_keys(self):
+        """Different credentials or services produce different keys."""
+        config_a = JiraConfig(
+            url="https://a.atlassian.net", auth_type="pat", personal_token="token-1"
+        )
+        config_b = JiraConfig(
+            url="https://a.atlassian.net", auth_type="pat", personal_token="token-2"
+        )
+        assert fetcher_key("jira", config_a) != fetcher_key("jira", config_b)
+        assert fetcher_key("jira", config_a) != fetcher_key("confluence", config_a)
+
+    def test_key_does_not_leak_token(self):
+        """Raw secrets never appear in the key."""
+        config = JiraConfig(
+            url="https://a.atlassian.net", auth_type="pat", personal_token="secret"
+        )
+        assert "secret" not in fetcher_key("jira", config)
+
+    def test_refreshable_oauth_key_survives_token_rotation(self):
+        """Refreshable OAuth configs are keyed by app, not access token."""
+        oauth_config = OAuthConfig(
+            client_id="client",
+            client_secret="secret",
+            redirect_uri="http://localhost",
+            scope="read",
+            cloud_id="cloud",
+            refresh_token="refresh",
+            access_token="access-1",
+        )
+        config = JiraConfig(url=None, auth_type="oauth", oauth_config=oauth_config)
+        key_before = fetcher_key("jira", config)
+        oauth_config.access_token = "access-2"
+        assert fetcher_key("jira", config) == key_before
+
+
+class TestFetcherPool:
+    """Tests for FetcherPool."""
+
+    def test_reuses_fetcher(self):
+        """The factory is only called once per key."""
+        pool = FetcherPool()
+        factory = MagicMock(side_effect=_make_fetcher)
+
+        first = pool.get_or_create("k", factory)
+        second = pool.get_or_create("k", factory)
+
+        assert first is second
+        factory.assert_called_once()
+
+    def test_lru_eviction_closes_session(self):
+        """The least recently used fetcher is evicted and closed when full."""
+        pool = FetcherPool(max_size=2)
+        fetcher_a = pool.get_or_create("a", _make_fetcher)
+        pool.get_or_create("b", _make_fetcher)
+        pool.get_or_create("a", _make_fetcher)  # touch "a"
+        pool.get_or_create("c", _make_fetcher)
+
+        assert "a" in pool
+        assert "b" not in pool
+        assert len(pool) == 2
+        fetcher_a.jira._session.close.assert_not_called()
+
+    def test_idle_eviction(self):
+        """Fetchers idle longer than the TTL are evicted."""
+        pool = FetcherPool(idle_ttl=10)
+        fetcher = pool.get_or_create("a", _make_fetcher)
+        pool._entries["a"].last_used = time.monotonic() - 11
+
+        assert pool.evict_idle() == 1
+        assert "a" not in pool
+        fetcher.jira._session.close.assert_called_once()
+
+    def test_expired_oauth_fetcher_is_rebuilt(self):
+        """A fetcher whose refreshable OAuth token expired is rebuilt."""
+        pool = FetcherPool()
+        expired = MagicMock()
+        expired.config.oauth_config = OAuthConfig(
+            client_id="client",
+            client_secret="secret",
+            redirect_uri="http://localhost",
+            scope="read",
+            refresh_token="refresh",
+            access_token="access",
+            expires_at=time.time() - 1,
+        )
+        pool.get_or_create("a", lambda: expired)
+
+        fresh = pool.get_or_create("a", _make_fetcher)
+
+        assert fresh is not expired
+        expired.jira._session.close.assert_called_once()
+
+    def test_discard_and_close(self):
+        """discard() and close() close the dropped fetchers."""
+        pool = FetcherPool()
+        fetcher_a = pool.get_or_create("a", _make_fetcher)
+        fetcher_b = pool.get_or_create("b", _make_fetcher)
+
+        pool.discard("a")
+        assert "a" not in pool
+        fetcher_a.jira._session.close.assert_called_once()
+
+        pool.close()
+        assert len(pool) == 0
+        fetcher_b.confluence._session.close.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "env,expected",
+        [
+            ({}, (32, 900)),
+            ({"FETCHER_POOL_MAX_SIZE": "4", "FETCHER_POOL_IDLE_TTL": "60"}, (4, 60)),
+        ],
+    )
+    def test_from_env(self, monkeypatch, env, expected):
+        """Pool limits are read from the environment."""
+        monkeypatch.delenv("FETCHER_POOL_MAX_SIZE", raising=False)
+        monkeypatch.delenv("FETCHER_POOL_IDLE_TTL", raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+
+        pool = FetcherPool.from_env()
+
+        assert (pool.max_size, pool.idle_ttl) == expected
@@ -10,6 +10,7 @@ import pytest
 from fastmcp import Client, FastMCP
 from fastmcp.client import FastMCPTransport
 from fastmcp.exceptions import ToolError
+from requests.exceptions import HTTPError
 from starlette.requests import Request
 
 from src.mcp_atlassian.jira import JiraFetcher
@@ -279,6 +280,7 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
         batch_create_issues,
         batch_create_versions,
         batch_get_changelogs,
+        batch_get_issues,
         create_issue,
         create_issue_link,
         delete_issue,
@@ -298,6 +300,7 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
         link_to_epic,
         remove_issue_link,
         search,
+        search_all,
         search_fields,
         transition_issue,
         update_issue,
@@ -306,7 +309,9 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
 
     jira_sub_mcp = FastMCP(name="TestJiraSubMCP")
     jira_sub_mcp.tool()(get_issue)
+    jira_sub_mcp.tool()(batch_get_issues)
     jira_sub_mcp.tool()(search)
+    jira_sub_mcp.tool()(search_all)
     jira_sub_mcp.tool()(search_fields)
     jira_sub_mcp.tool()(get_project_issues)
     jira_sub_mcp.tool()(get_project_versions)
@@ -428,6 +433,34 @@ async def test_get_issue(jira_client, mock_jira_fetcher):
     )
 
 
+@pytest.mark.anyio
+async def test_batch_get_issues(jira_client, mock_jira_fetcher):
+    """Test the batch_get_issues tool keeps input order and per-key errors."""
+    issue = MagicMock()
+    issue.to_simplified_dict.return_value = {"key": "TEST-1", "summary": "One"}
+    mock_jira_fetcher.batch_get_issues.return_value = [
+        issue,
+        ValueError("Issue does not exist"),
+    ]
+
+    response = await jira_client.call_tool(
+        "jira_batch_get_issues",
+        {"issue_keys": ["TEST-1", "TEST-404"], "fields": "summary"},
+    )
+
+    content = json.loads(response[0].text)
+    assert content == [
+        {"key": "TEST-1", "summary": "One"},
+        {"key": "TEST-404", "error": "Issue does not exist"},
+    ]
+    mock_jira_fetcher.batch_get_issues.assert_called_once_with(
+        issue_keys=["TEST-1", "TEST-404"],
+        fields=["summary"],
+        expand=None,
+        comment_limit=10,
+    )
+
+
 @pytest.mark.anyio
 async def test_search(jira_client, mock_jira_fetcher):
     """Test the search tool with fixture data."""
@@ -463,6 +496,61 @@ async def test_search(jira_client, mock_jira_fetcher):
     )
 
 
+@pytest.mark.anyio
+async def test_search_all(jira_client, mock_jira_fetcher):
+    """Test the search_all tool streams pages into one result."""
+    closed = []
+
+    def mock_iter_issue_pages(jql, **kwargs):
+        try:
+            for issue_data in MOCK_JIRA_JQL_RESPONSE_SIMPLIFIED["issues"]:
+                mock_issue = MagicMock()
+                mock_issue.to_simplified_dict.return_value = issue_data
+                yield [mock_issue]
+        finally:
+            closed.append(True)
+
+    mock_jira_fetcher.iter_issue_pages.side_effect = mock_iter_issue_pages
+    response = await jira_client.call_tool(
+        "jira_search_all",
+        {"jql": "project = TEST", "fields": "summary,status", "max_results": 100},
+    )
+
+    content = json.loads(response[0].text)
+    expected = MOCK_JIRA_JQL_RESPONSE_SIMPLIFIED["issues"]
+    assert content["returned"] == len(expected)
+    assert [issue["key"] for issue in content["issues"]] == [
+        issue["key"] for issue in expected
+    ]
+    assert closed == [True]
+    mock_jira_fetcher.iter_issue_pages.assert_called_once_with(
+        "project = TEST",
+        fields=["summary", "status"],
+        page_size=50,
+        max_issues=100,
+        projects_filter=None,
+        prefetch=False,
+    )
+
+
+@pytest.mark.anyio
+async def test_search_all_page_error(jira_client, mock_jira_fetcher):
+    """Test a failing page request fails the search_all tool and closes the pages."""
+    closed = []
+
+    def mock_iter_issue_pages(jql, **kwargs):
+        try:
+            yield [MagicMock(**{"to_simplified_dict.return_value": {"key": "A-1"}})]
+            raise HTTPError("page failed")
+        finally:
+            closed.append(True)
+
+    mock_jira_fetcher.iter_issue_pages.side_effect = mock_iter_issue_pages
+    with pytest.raises(ToolError, match="search_all"):
+        await jira_client.call_tool("jira_search_all", {"jql": "project = TEST"})
+    assert closed == [True]
+
+
 @pytest.mark.anyio
 async def test_create_issue(jira_client, mock_jira_fetcher):
     """Test the create_issue tool with fixture data."""
@@ -802,7 +890,6 @@ async def test_get_all_projects_tool_with_archived(jira_client, mock_jira_fetche
     data = json.loads(msg.text)
     assert isinstance(data, list)
     assert len(data) == 2
-    # Project keys should always be uppercase in the response
     assert data[0]["key"] == "PROJ1"
     assert data[1]["key"] == "ARCHIVED"
 
@@ -837,10 +924,11 @@ async def test_get_all_projects_tool_with_projects_filter(
         },
     ]
 
-    # Set up the mock to return all projects
+    # Set up the mock to return the projects allowed by the filter, as the
+    # fetcher applies JIRA_PROJECTS_FILTER itself
     mock_jira_fetcher.get_all_projects.reset_mock()
     mock_jira_fetcher.get_all_projects.side_effect = (
-        lambda include_archived=False: all_mock_projects
+        lambda include_archived=False: all_mock_projects[:2]
     )
 
     # Set up the projects filter in the config
@@ -860,15 +948,14 @@ async def test_get_all_projects_tool_with_projects_filter(
     data = json.loads(msg.text)
     assert isinstance(data, list)
 
-    # Should only return projects in the filter (PROJ1, PROJ2), not OTHER
+    # Should return the projects from the fetcher without filtering them again
     assert len(data) == 2
     returned_keys = [project["key"] for project in data]
-    # Project keys should always be uppercase in the response
     assert "PROJ1" in returned_keys
     assert "PROJ2" in returned_keys
     assert "OTHER" not in returned_keys
 
-    # Verify the underlying method was called (still gets all projects, but then filters)
+    # Verify the underlying method was called
     mock_jira_fetcher.get_all_projects.assert_called_once_with(include_archived=False)
 
 
@@ -917,7 +1004,6 @@ async def test_get_all_projects_tool_no_projects_filter(jira_client, mock_jira_f
     # Should return all projects when no filter is configured
     assert len(data) == 2
     returned_keys = [project["key"] for project in data]
-    # Project keys should always be uppercase in the response
     assert "PROJ1" in returned_keys
     assert "OTHER" in returned_keys
 
@@ -925,68 +1011,6 @@ async def test_get_all_projects_tool_no_projects_filter(jira_client, mock_jira_f
     mock_jira_fetcher.get_all_projects.assert_called_once_with(include_archived=False)
 
 
-@pytest.mark.anyio
-async def test_get_all_projects_tool_case_insensitive_filter(
-    jira_client, mock_jira_fetcher
-):
-    """Test the jira_get_all_projects tool handles case-insensitive filtering and whitespace."""
-    # Prepare mock project data with mixed case
-    all_mock_projects = [
-        {
-            "id": "10000",
-            "key": "proj1",  # lowercase
-            "name": "Project One",
-            "description": "First project",
-        },
-        {
-            "id": "10001",
-            "key": "PROJ2",  # uppercase
-            "name": "Project Two",
-            "description": "Second project",
-        },
-        {
-            "id": "10002",
-            "key": "other",  # should be filtered out
-            "name": "Other Project",
-            "description": "Should be filtered out",
-        },
-    ]
-
-    # Set up the mock to return all projects
-    mock_jira_fetcher.get_all_projects.reset_mock()
-    mock_jira_fetcher.get_all_projects.side_effect = (
-        lambda include_archived=False: all_mock_projects
-    )
-
-    # Set up projects filter with mixed case and whitespace
-    mock_jira_fetcher.config.projects_filter = " PROJ1 , proj2 "
-
-    # Call the tool
-    response = await jira_client.call_tool(
-        "jira_get_all_projects",
-        {},
-    )
-
-    assert isinstance(response, list)
-    assert len(response) == 1
-    msg = response[0]
-    assert msg.type == "text"
-
-    data = json.loads(msg.text)
-    assert isinstance(data, list)
-
-    # Should return projects matching the filter (case-insensitive)
-    assert len(data) == 2
-    returned_keys = [project["key"] for project in data]
-    # Project keys should always be uppercase in the response, regardless of input case
-    assert "PROJ1" in returned_keys  # lowercase input converted to uppercase
-    assert "PROJ2" in returned_keys  # uppercase stays uppercase
-    assert "OTHER" not in returned_keys  # not in filter
-
-    # Verify the underlying method was called
-    mock_jira_fetcher.get_all_projects.assert_called_once_with(include_archived=False)
-
-
 @pytest.mark.anyio
 async def test_get_all_projects_tool_empty_response(jira_client, mock_jira_fetcher):
     """Test tool handles empty list of projects from API."""
@@ -0,0 +1,146 @@
+"""Tests for the validated user token cache."""
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
+from mcp_atlassian.servers.token_cache import (
+    TokenValidationCache,
+    is_unauthorized,
+    token_cache_key,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _http_error(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(response=response)
+
+
+class TestTokenCacheKey:
+    """Tests for token_cache_key."""
+
+    def test_key_hides_token(self):
+        """The token does not appear in the key."""
+        key = token_cache_key("jira", "https://x.atlassian.net", "pat", "secret")
+
+        assert "secret" not in key
+        assert len(key) == 64
+
+    def test_key_identity(self):
+        """Service, URL, auth type, token and cloud ID all change the key."""
+        base = ("jira", "https://x.atlassian.net", "oauth", "token", "cloud-1")
+        variants = [
+            ("confluence", *base[1:]),
+            (base[0], "https://y.atlassian.net", *base[2:]),
+            (*base[:2], "pat", *base[3:]),
+            (*base[:3], "other-token", base[4]),
+            (*base[:4], "cloud-2"),
+        ]
+
+        keys = {token_cache_key(*args) for args in variants}
+
+        assert token_cache_key(*base) == token_cache_key(*base)
+        assert token_cache_key(*base) not in keys
+        assert len(keys) == len(variants)
+
+
+class TestTokenValidationCache:
+    """Tests for TokenValidationCache."""
+
+    def test_hits_misses_and_expiry(self):
+        """Validations are served until the TTL elapses and counted."""
+        clock = _Clock()
+        cache = TokenValidationCache(ttl=60, timer=clock)
+        fetcher = MagicMock()
+
+        assert cache.get("key") is None
+        cache.put("key", fetcher, "account-id")
+        entry = cache.get("key")
+        clock.now = 61
+        expired = cache.get("key")
+
+        assert entry.fetcher is fetcher
+        assert entry.identity == "account-id"
+        assert expired is None
+        assert cache.stats() == {
+            "size": 0,
+            "hits": 1,
+            "misses": 2,
+            "invalidations": 0,
+            "hit_rate": pytest.approx(1 / 3),
+        }
+
+    def test_bounded(self):
+        """The least recently used token is evicted when the cache is full."""
+        cache = TokenValidationCache(max_size=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, MagicMock())
+
+        assert len(cache) == 2
+        assert cache.get("a") is None
+
+    def test_disabled(self):
+        """A TTL of 0 disables the cache."""
+        cache = TokenValidationCache(ttl=0)
+        cache.put("key", MagicMock())
+
+        assert not cache.enabled
+        assert cache.get("key") is None
+        assert cache.stats()["misses"] == 0
+
+    def test_invalidate_fetcher(self):
+        """Every token validated with a rejected fetcher is forgotten."""
+        cache = TokenValidationCache()
+        rejected, other = MagicMock(), MagicMock()
+        cache.put("a", rejected)
+        cache.put("b", rejected)
+        cache.put("c", other)
+
+        assert cache.invalidate_fetcher(rejected) == 2
+        assert cache.get("a") is None
+        assert cache.get("c").fetcher is other
+        assert cache.stats()["invalidations"] == 2
+
+    @pytest.mark.parametrize(
+        "env,expected",
+        [({}, (300, 100)), ({"TOKEN_VALIDATION_CACHE_TTL": "0"}, (0, 100))],
+    )
+    def test_from_env(self, monkeypatch, env, expected):
+        """TTL and size are read from the environment."""
+        monkeypatch.delenv("TOKEN_VALIDATION_CACHE_TTL", raising=False)
+        monkeypatch.delenv("TOKEN_VALIDATION_CACHE_SIZE", raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+
+        cache = TokenValidationCache.from_env()
+
+        assert (cache.ttl, cache._entries.maxsize) == expected
+
+
+class TestIsUnauthorized:
+    """Tests for is_unauthorized."""
+
+    def test_unauthorized_errors(self):
+        """Authentication errors and 401 responses, also as causes, match."""
+        wrapped = ValueError("failed")
+        wrapped.__cause__ = _http_error(401)
+
+        assert is_unauthorized(MCPAtlassianAuthenticationError("denied"))
+        assert is_unauthorized(_http_error(401))
+        assert is_unauthorized(wrapped)
+
+    def test_other_errors(self):
+        """Other errors keep cached validations."""
+        assert not is_unauthorized(_http_error(404))
+        assert not is_unauthorized(ValueError("boom"))
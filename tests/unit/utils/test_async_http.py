@@ -0,0 +1,130 @@
+"""Tests for the native async HTTP transport."""
+
+import anyio
+import httpx
+import pytest
+import requests
+from requests import Session
+
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
+from mcp_atlassian.utils.async_http import AsyncTransport, gather
+
+pytestmark = pytest.mark.anyio
+
+
+def _make_transport(handler, session=None):
+    session = session or Session()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncTransport(
+        base_url="https://example.atlassian.net/",
+        session=session,
+        service_name="Jira API",
+        client=client,
+    )
+
+
+async def test_get_json_uses_session_credentials():
+    """Headers and basic auth are taken from the requests session."""
+    seen = {}
+
+    def handler(request):
+        seen["url"] = str(request.url)
+        seen["headers"] = request.headers
+        return httpx.Response(200, json={"ok": True})
+
+    session = Session()
+    session.auth = ("user", "token")
+    session.headers["X-Custom"] = "value"
+    transport = _make_transport(handler, session)
+
+    result = await transport.get_json("/rest/api/2/issue/PROJ-1", params={"a": "b"})
+
+    assert result == {"ok": True}
+    assert seen["url"] == "https://example.atlassian.net/rest/api/2/issue/PROJ-1?a=b"
+    assert seen["headers"]["X-Custom"] == "value"
+    assert seen["headers"]["Authorization"].startswith("Basic ")
+    assert "python-requests" not in seen["headers"].get("User-Agent", "")
+
+
+async def test_header_changes_are_picked_up_per_request():
+    """A rotated Authorization header on the session is used immediately."""
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(200, json={})
+
+    session = Session()
+    session.headers["Authorization"] = "Bearer old"
+    transport = _make_transport(handler, session)
+
+    await transport.get_json("rest/api/2/myself")
+    session.headers["Authorization"] = "Bearer new"
+    await transport.get_json("rest/api/2/myself")
+
+    assert seen == ["Bearer old", "Bearer new"]
+
+
+@pytest.mark.parametrize("status", [401, 403])
+async def test_auth_errors_raise_authentication_error(status):
+    """401/403 responses raise MCPAtlassianAuthenticationError."""
+    transport = _make_transport(lambda request: httpx.Response(status))
+
+    with pytest.raises(MCPAtlassianAuthenticationError, match=str(status)):
+        await transport.get_json("rest/api/2/myself")
+
+
+async def test_other_errors_raise_requests_http_error():
+    """Other error responses raise the requests.HTTPError the sync path raises."""
+    transport = _make_transport(lambda request: httpx.Response(404, text="missing"))
+
+    with pytest.raises(requests.HTTPError) as exc_info:
+        await transport.get_json("rest/api/2/issue/NOPE-1")
+
+    assert exc_info.value.response.status_code == 404
+    assert exc_info.value.response.text == "missing"
+
+
+async def test_network_errors_raise_requests_errors():
+    """Transport failures raise requests.ConnectionError (an OSError)."""
+
+    def handler(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    transport = _make_transport(handler)
+
+    with pytest.raises(requests.ConnectionError):
+        await transport.get_json("rest/api/2/myself")
+
+
+async def test_empty_body_returns_none():
+    """An empty response body decodes to None."""
+    transport = _make_transport(lambda request: httpx.Response(204))
+
+    assert await transport.get_json("rest/api/2/issue/PROJ-1") is None
+
+
+async def test_gather_preserves_order():
+    """Results are returned in call order regardless of completion order."""
+
+    async def slow():
+        await anyio.sleep(0.02)
+        return "slow"
+
+    async def fast():
+        return "fast"
+
+    assert await gather(slow, fast) == ["slow", "fast"]
+
+
+async def test_gather_reraises_first_error_unwrapped():
+    """The first failure is raised as-is, not as an exception group."""
+
+    async def fail():
+        raise ValueError("boom")
+
+    async def wait():
+        await anyio.sleep(10)
+
+    with pytest.raises(ValueError, match="boom"):
+        await gather(fail, wait)
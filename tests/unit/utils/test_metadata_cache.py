@@ -0,0 +1,205 @@
+"""Tests for the persistent metadata cache."""
+
+import json
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from mcp_atlassian.utils.metadata_cache import (
+    EPHEMERAL_SCOPE_PREFIX,
+    MAX_EPHEMERAL_SCOPES,
+    PRUNE_AFTER,
+    MetadataCache,
+    configure_metadata_cache,
+    get_metadata_cache,
+    metadata_scope,
+)
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_config(**overrides):
+    values = {
+        "url": "https://example.atlassian.net",
+        "auth_type": "basic",
+        "username": "alice@example.com",
+        "personal_token": None,
+        "oauth_config": None,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def test_scope_is_per_site_and_principal():
+    """Scopes differ by site and principal and never contain credentials."""
+    alice = metadata_scope(make_config())
+    bob = metadata_scope(make_config(username="bob@example.com"))
+    other_site = metadata_scope(make_config(url="https://other.atlassian.net"))
+    pat = metadata_scope(make_config(auth_type="pat", personal_token="secret-pat"))
+
+    assert len({alice, bob, other_site, pat}) == 4
+    assert metadata_scope(make_config(url="https://example.atlassian.net/")) == alice
+    assert "secret" not in pat
+
+
+def test_oauth_scope_survives_token_rotation():
+    """Server-managed OAuth is keyed by app and site, not the access token."""
+    first = make_config(
+        auth_type="oauth",
+        oauth_config=SimpleNamespace(
+            client_id="app", cloud_id="cloud", refresh_token="r", access_token="a1"
+        ),
+    )
+    rotated = make_config(
+        auth_type="oauth",
+        oauth_config=SimpleNamespace(
+            client_id="app", cloud_id="cloud", refresh_token="r", access_token="a2"
+        ),
+    )
+    byo = make_config(
+        auth_type="oauth",
+        oauth_config=SimpleNamespace(
+            cloud_id="cloud", refresh_token=None, access_token="user-token"
+        ),
+    )
+
+    assert metadata_scope(first) == metadata_scope(rotated)
+    assert metadata_scope(byo) != metadata_scope(first)
+
+
+def test_token_scopes_are_not_persisted(tmp_path):
+    """Scopes of bare access tokens stay in memory, bounded in number."""
+    byo = make_config(
+        auth_type="oauth",
+        oauth_config=SimpleNamespace(
+            cloud_id="cloud", refresh_token=None, access_token="user-token"
+        ),
+    )
+    scope = metadata_scope(byo)
+    cache = MetadataCache(tmp_path)
+
+    cache.put(scope, "fields", [{"id": "summary"}])
+    for i in range(MAX_EPHEMERAL_SCOPES):
+        cache.put(f"{EPHEMERAL_SCOPE_PREFIX}{i}", "fields", [])
+
+    assert scope.startswith(EPHEMERAL_SCOPE_PREFIX)
+    assert list(tmp_path.iterdir()) == []
+    assert cache.get(scope, "fields") is None
+    assert cache.get(f"{EPHEMERAL_SCOPE_PREFIX}0", "fields") is not None
+
+
+def test_unused_files_are_pruned(tmp_path):
+    """Scope files not written for PRUNE_AFTER seconds are deleted at load."""
+    MetadataCache(tmp_path).put("old", "fields", [])
+    MetadataCache(tmp_path).put("recent", "fields", [])
+    unused = time.time() - PRUNE_AFTER - 1
+    os.utime(tmp_path / "old.json", (unused, unused))
+
+    cache = MetadataCache(tmp_path)
+
+    assert cache.load() == 1
+    assert not (tmp_path / "old.json").exists()
+    assert cache.get("recent", "fields") is not None
+
+
+def test_entries_survive_restart(tmp_path):
+    """A new cache instance loads what a previous process stored."""
+    MetadataCache(tmp_path).put("scope", "fields", [{"id": "summary"}])
+
+    restarted = MetadataCache(tmp_path)
+    assert restarted.get("scope", "fields") is None
+    assert restarted.load() == 1
+
+    loader = MagicMock()
+    assert restarted.get_or_load("scope", "fields", loader) == [{"id": "summary"}]
+    loader.assert_not_called()
+
+
+def test_stale_entries_are_reloaded(tmp_path):
+    """Entries older than the TTL are fetched again and rewritten."""
+    timer = FakeTimer()
+    cache = MetadataCache(tmp_path, ttl=60, timer=timer)
+    cache.put("scope", "link_types", ["old"])
+
+    timer.now += 61
+    assert cache.get_or_load("scope", "link_types", lambda: ["new"]) == ["new"]
+
+    with (tmp_path / "scope.json").open() as file:
+        assert json.load(file)["link_types"]["value"] == ["new"]
+
+
+def test_get_json_revalidates_with_etag(tmp_path):
+    """A stale entry is revalidated with its ETag and reused on 304."""
+    timer = FakeTimer()
+    cache = MetadataCache(tmp_path, ttl=60, timer=timer)
+    session = MagicMock()
+    session.get.return_value = MagicMock(
+        status_code=200,
+        json=MagicMock(return_value={"results": [{"id": "1"}]}),
+        headers={"ETag": '"v1"'},
+    )
+    url = "https://example.atlassian.net/wiki/api/v2/spaces"
+
+    first = cache.get_json("scope", "space:DEV", session, url, {"keys": "DEV"})
+    assert cache.get_json("scope", "space:DEV", session, url) == first
+    assert session.get.call_count == 1
+
+    timer.now += 61
+    session.get.return_value = MagicMock(status_code=304)
+    assert cache.get_json("scope", "space:DEV", session, url) == first
+    assert session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert cache.is_fresh(cache.get("scope", "space:DEV"))
+
+
+def test_unreadable_files_are_skipped(tmp_path):
+    """Corrupt scope files are ignored at load."""
+    (tmp_path / "broken.json").write_text("{not json")
+    MetadataCache(tmp_path).put("scope", "fields", [])
+
+    cache = MetadataCache(tmp_path)
+
+    assert cache.load() == 1
+    assert cache.get("broken", "fields") is None
+
+
+def test_invalidate(tmp_path):
+    """Invalidated entries are dropped from memory and disk."""
+    cache = MetadataCache(tmp_path)
+    cache.put("scope", "space:DEV", {"results": []})
+
+    cache.invalidate("scope", "space:DEV")
+
+    assert cache.get("scope", "space:DEV") is None
+    restarted = MetadataCache(tmp_path)
+    restarted.load()
+    assert restarted.get("scope", "space:DEV") is None
+
+
+def test_from_env(monkeypatch, tmp_path):
+    """The cache is only enabled when a directory is configured."""
+    monkeypatch.delenv("METADATA_CACHE_DIR", raising=False)
+    assert MetadataCache.from_env() is None
+
+    monkeypatch.setenv("METADATA_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("METADATA_CACHE_TTL", "120")
+    cache = MetadataCache.from_env()
+    assert cache.directory == tmp_path
+    assert cache.ttl == 120
+
+
+def test_configure_metadata_cache(tmp_path):
+    """The process-wide cache can be installed and removed."""
+    cache = MetadataCache(tmp_path)
+    configure_metadata_cache(cache)
+    try:
+        assert get_metadata_cache() is cache
+    finally:
+        configure_metadata_cache(None)
+    assert get_metadata_cache() is None
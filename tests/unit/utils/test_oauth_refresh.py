@@ -0,0 +1,196 @@
+"""Tests for background OAuth token renewal."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from mcp_atlassian.utils.oauth import OAuthConfig, configure_oauth_session
+from mcp_atlassian.utils.oauth_refresh import (
+    RETRY_DELAY,
+    OAuthTokenRefresher,
+    client_lock,
+)
+
+
+class _Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _config(**overrides):
+    defaults = {
+        "client_id": "refresh-test-client",
+        "client_secret": "secret",
+        "redirect_uri": "https://example.com/callback",
+        "scope": "read:jira-work",
+        "cloud_id": "cloud",
+        "refresh_token": "refresh-1",
+        "access_token": "access-1",
+        "expires_at": time.time() + 3600,
+    }
+    return OAuthConfig(**{**defaults, **overrides})
+
+
+def _token_response(access_token, refresh_token="refresh-2", expires_in=3600):
+    response = MagicMock()
+    response.json.return_value = {
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "expires_in": expires_in,
+    }
+    return response
+
+
+@pytest.fixture
+def refresher():
+    """Replace the process-wide refresher with a fresh one."""
+    refresher = OAuthTokenRefresher()
+    with (
+        patch("mcp_atlassian.utils.oauth.get_token_refresher", return_value=refresher),
+        patch.object(OAuthConfig, "_save_tokens"),
+    ):
+        yield refresher
+
+
+def test_client_lock_per_client_id():
+    """Each OAuth app has one lock."""
+    assert client_lock("a") is client_lock("a")
+    assert client_lock("a") is not client_lock("b")
+
+
+@patch("requests.post")
+def test_concurrent_refreshes_are_single_flight(mock_post, refresher):
+    """Concurrent requests with an expired token redeem it once and share it."""
+
+    def post(*args, **kwargs):
+        time.sleep(0.05)
+        return _token_response("access-2")
+
+    mock_post.side_effect = post
+    configs = [_config(expires_at=time.time() - 1) for _ in range(2)]
+    sessions = [requests.Session() for _ in configs]
+    for config, session in zip(configs, sessions, strict=True):
+        refresher.register(config, session)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda c=c: results.append(c.ensure_valid_token()))
+        for c in configs
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [True, True]
+    mock_post.assert_called_once()
+    assert [c.refresh_token for c in configs] == ["refresh-2", "refresh-2"]
+    assert [s.headers["Authorization"] for s in sessions] == [
+        "Bearer access-2",
+        "Bearer access-2",
+    ]
+
+
+@patch("requests.post")
+def test_other_grants_are_not_updated(mock_post, refresher):
+    """A refresh is only shared with holders of the same refresh token."""
+    mock_post.return_value = _token_response("access-2")
+    config = _config()
+    other = _config(refresh_token="other-user", access_token="other-access")
+    other_session = requests.Session()
+    other_session.headers["Authorization"] = "Bearer other-access"
+    refresher.register(other, other_session)
+
+    assert config.refresh_access_token()
+
+    assert other.access_token == "other-access"
+    assert other_session.headers["Authorization"] == "Bearer other-access"
+
+
+@patch("requests.post")
+def test_refresh_due_renews_at_configured_fraction(mock_post):
+    """Tokens are renewed once the configured share of their lifetime elapsed."""
+    clock = _Clock(1000.0)
+    refresher = OAuthTokenRefresher(refresh_at_percent=80, timer=clock)
+    config = _config(expires_at=2000.0)
+    session = MagicMock(headers={})
+    mock_post.return_value = _token_response("access-2")
+
+    with (
+        patch("mcp_atlassian.utils.oauth.get_token_refresher", return_value=refresher),
+        patch.object(OAuthConfig, "_save_tokens"),
+    ):
+        refresher.register(config, session)
+        assert refresher.next_deadline() == 1800.0
+
+        clock.now = 1799.0
+        assert refresher.refresh_due() == 0
+        clock.now = 1800.0
+        assert refresher.refresh_due() == 1
+
+    mock_post.assert_called_once()
+    assert session.headers["Authorization"] == "Bearer access-2"
+    # The renewed token is scheduled from its own lifetime
+    assert refresher.next_deadline() > 1800.0
+
+
+def test_registering_another_session_keeps_the_deadline():
+    """A new session of an already scheduled token does not delay its renewal."""
+    clock = _Clock(1000.0)
+    refresher = OAuthTokenRefresher(refresh_at_percent=80, timer=clock)
+    config = _config(expires_at=2000.0)
+    first, second = MagicMock(headers={}), MagicMock(headers={})
+
+    refresher.register(config, first)
+    clock.now = 1500.0
+    refresher.register(config, second)
+
+    assert refresher.next_deadline() == 1800.0
+    assert set(refresher._registrations[id(config)].sessions) == {first, second}
+
+
+@patch("requests.post")
+def test_failed_renewal_is_retried(mock_post):
+    """A failed background renewal is retried after a delay."""
+    clock = _Clock(1000.0)
+    refresher = OAuthTokenRefresher(refresh_at_percent=50, timer=clock)
+    config = _config(expires_at=1100.0)
+    mock_post.side_effect = requests.ConnectionError("offline")
+
+    with patch("mcp_atlassian.utils.oauth.get_token_refresher", return_value=refresher):
+        refresher.register(config, MagicMock(headers={}))
+        clock.now = 1050.0
+        assert refresher.refresh_due() == 0
+
+    assert refresher.next_deadline() == 1050.0 + RETRY_DELAY
+
+
+def test_background_renewal_disabled(monkeypatch):
+    """A percentage of 0 only keeps sessions in sync, without a thread."""
+    monkeypatch.setenv("OAUTH_REFRESH_AT_PERCENT", "0")
+    refresher = OAuthTokenRefresher.from_env()
+
+    refresher.register(_config(), MagicMock(headers={}))
+    refresher.start()
+
+    assert not refresher.enabled
+    assert refresher.next_deadline() is None
+    assert refresher._thread is None
+
+
+def test_configure_oauth_session_registers_session(refresher):
+    """Sessions configured with a refreshable token are kept in sync."""
+    config = _config()
+    session = requests.Session()
+
+    assert configure_oauth_session(session, config)
+
+    assert refresher.next_deadline() is not None
+    del config
+    assert refresher.next_deadline() is None